@@ -4,29 +4,111 @@ FastAPI application for Career Orchestrator.
 
 Endpoints:
 - POST /analyze: Main entry point for JD-Resume analysis
+- POST /analyze/stream: /analyze as Server-Sent Events (partial results as they arrive)
+- POST /analyze/batch: Score N resumes × M JDs (vectorized)
+- POST /match/postings: Parse a JD and add it to the local job index
+- DELETE /match/postings/{posting_id}: Remove a JD from the job index
+- POST /match/jobs: Top-k indexed JDs for a resume (inverted index + MaxScore)
+- POST /sessions: Analyze and keep the state for keyword review (checkpointed session)
+- GET /sessions/{session_id}: Current state of a review session
+- POST /sessions/{session_id}/review: Apply keyword toggles / preferences, recompute the gap,
+  and resume into project generation (no re-parsing)
+- POST /sessions/{session_id}/review/stream: /review as Server-Sent Events (one event per plan)
+- POST /sessions/{session_id}/reanalyze: Edited Resume/JD → re-parse only the changed lines
+- DELETE /sessions/{session_id}: Drop a review session
+- GET /documents/{doc_id}: Stored source text (or a [start, end) slice) by content hash
+- POST /jobs: Queue an /analyze run on the local worker pool (returns a job ID, optional webhook)
+- GET /jobs/{job_id}: Job status, per-stage progress and the GapSummary once done
 - GET /health: Health check
+- GET /stats: Parse cache / in-flight coalescing counters
+- GET /metrics: Prometheus metrics (stage latency, LLM tokens/cost, cache, concurrency)
 """
 from __future__ import annotations
 
+import asyncio
+import json
 import os
-from typing import Literal
+import time
+import uuid
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import AsyncIterator, Literal
 
 from dotenv import load_dotenv
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel, Field
 
 # Load environment variables
 load_dotenv()
 
 # Import tools
-from packages.tools.jd_parse import jd_parse_tool
-from packages.tools.resume_parse import resume_parse_tool
+from packages.core import metrics
+from packages.core.checkpoint import get_checkpointer
+from packages.core.docstore import get_docstore
+from packages.core.jobs import (
+    JOB_WORKERS,
+    Job,
+    JobProgress,
+    JobQueueFull,
+    JobStatus,
+    WebhookNotAllowed,
+    WorkerPool,
+    check_webhook_url,
+    get_job_store,
+)
+from packages.core.metrics import Gauge, Histogram
+from packages.core.project_cache import ProjectCacheMode, get_project_cache, project_cache_mode
+from packages.core.ratelimit import Priority, get_scheduler, llm_scheduling
+from packages.core.resilience import REQUEST_BUDGET_SECONDS, LLMUnavailable, request_deadline
+from packages.core.schemas import (
+    DocRef,
+    GapSummary,
+    JDKeyword,
+    JDProfile,
+    Preferences,
+    ProjectIdea,
+    ProjectOutput,
+    ProjectPlan,
+    ResumeKeyword,
+    ResumeProfile,
+)
+from packages.core.schemas.utils import norm_text, normalize_keyword
+from packages.core.tracing import stage, trace
+from packages.graph.main import apply_review, areanalyze_updates, build_graph, session_input
+from packages.tools.gap_compute import compute_gap
+from packages.tools.jd_parse import (
+    JD_PARSE_MODE,
+    JDParseMode,
+    aparse_jd,
+    attribute_category,
+    merge_sections,
+    with_category,
+)
+from packages.tools.jd_parse import parse_stats as jd_parse_stats
+from packages.tools.job_match import get_job_index
+from packages.tools.preprocess import preprocess_stats, prune_sections
+from packages.tools.resume_parse import aparse_resume
+from packages.tools.resume_parse import parse_stats as resume_parse_stats
+from packages.tools.score import score_matrix, top_k
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 이전 프로세스가 남긴 queued 작업도 바로 실행한다
+    pool = _job_pool()
+    if pool.workers:
+        pool.ensure_started()
+    yield
+    await pool.stop()
+
 
 app = FastAPI(
     title="Career Orchestrator API",
     description="JD matching score (0-100) + portfolio project plans",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 # CORS middleware
@@ -40,7 +122,72 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Trace-Id"],
+)
+
+REQUEST_SECONDS = Histogram(
+    "orchestrator_http_request_duration_seconds",
+    "HTTP handler latency (streaming responses: until headers are sent)",
+    ("method", "route", "status"),
 )
+REQUESTS_IN_FLIGHT = Gauge("orchestrator_http_requests_in_flight", "HTTP requests being handled")
+
+
+def _request_budget(request: Request) -> float:
+    try:
+        budget = float(request.headers.get("x-request-budget", ""))
+    except ValueError:
+        return REQUEST_BUDGET_SECONDS
+    return min(budget, REQUEST_BUDGET_SECONDS) if budget > 0 else REQUEST_BUDGET_SECONDS
+
+
+# 이 경로의 LLM 호출은 batch class (interactive 요청 뒤로)
+BATCH_ROUTES = ("/analyze/batch",)
+
+
+def _scheduling(request: Request) -> tuple[str, Priority]:
+    """(tenant, priority). tenant는 `X-Tenant-Id` 헤더, 없으면 client 주소."""
+    tenant = request.headers.get("x-tenant-id") or (
+        request.client.host if request.client else "default"
+    )
+    batch = request.url.path.startswith(BATCH_ROUTES) or (
+        request.headers.get("x-priority") == "batch"
+    )
+    return tenant, "batch" if batch else "interactive"
+
+
+@app.middleware("http")
+async def observe_requests(request: Request, call_next):
+    """
+    요청별 latency / 동시 요청 수 기록.
+    TRACE_ENABLED=1 또는 `X-Trace: 1` 헤더면 trace span을 남기고 X-Trace-Id로 돌려준다.
+    요청 안의 LLM 호출은 REQUEST_BUDGET_SECONDS (`X-Request-Budget` 헤더가 더 짧으면 그 값)
+    안에 끝나야 한다 (스트리밍 응답은 body를 다 보낼 때까지 같은 deadline).
+    LLM 호출은 tenant / priority class로 rate-limit 큐에 들어간다 (_scheduling).
+    """
+    start = time.perf_counter()
+    status = "500"
+    force = request.headers.get("x-trace") == "1"
+    tenant, priority = _scheduling(request)
+    with (
+        REQUESTS_IN_FLIGHT.track_inprogress(),
+        request_deadline(_request_budget(request)),
+        llm_scheduling(tenant, priority),
+    ):
+        with trace(f"{request.method} {request.url.path}", force=force) as span:
+            try:
+                response = await call_next(request)
+                status = str(response.status_code)
+            finally:
+                route = getattr(request.scope.get("route"), "path", "unmatched")
+                REQUEST_SECONDS.observe(
+                    time.perf_counter() - start, method=request.method, route=route, status=status
+                )
+                if span is not None:
+                    span.set(route=route, status=int(status))
+    if span is not None:
+        response.headers["X-Trace-Id"] = span.trace_id
+    return response
 
 
 # Request/Response schemas
@@ -60,31 +207,417 @@ class AnalyzeRequest(BaseModel):
     jd_inputs: list[JDInputItem] = Field(
         ..., min_length=1, description="List of JD sections with categories"
     )
+    jd_parse_mode: JDParseMode | None = Field(
+        default=None,
+        description="per_section: one parallel LLM call per section / "
+        "single_call: all sections in one call (default: JD_PARSE_MODE)",
+    )
+
+
+class AnalyzeResponse(BaseModel):
+    """Response body for /analyze endpoint."""
+
+    gap_summary: GapSummary
+
 
+class ResumeEvent(BaseModel):
+    """/analyze/stream `resume` event."""
 
-class KeywordInfo(BaseModel):
-    """Keyword information."""
+    keywords: list[ResumeKeyword]
 
-    keyword_text: str
+
+class SectionEvent(BaseModel):
+    """/analyze/stream `jd_section` event."""
+
+    section: int
     category: str
-    evidence: str | None = None
-    importance: int | None = None
+    keywords: list[JDKeyword]
 
 
-class GapSummaryResponse(BaseModel):
-    """Gap summary response."""
+class MissingEvent(BaseModel):
+    """/analyze/stream `missing` event."""
 
-    match_score: float = Field(default=0.0, description="Match score (0-100)")
-    keyword_matches: list[dict] = Field(default_factory=list)
-    missing_keywords: list[KeywordInfo] = Field(default_factory=list)
-    validated_missing_keywords: list[KeywordInfo] = Field(default_factory=list)
-    notes: str = Field(default="")
+    section: int
+    category: str
+    missing_keywords: list[JDKeyword]
+    match_score: float
+    sections_done: int
+    sections_total: int
 
 
-class AnalyzeResponse(BaseModel):
-    """Response body for /analyze endpoint."""
+class BatchResumeInput(BaseModel):
+    """Resume in a batch request."""
+
+    id: str | None = Field(default=None, description="Caller-side ID (default: index)")
+    resume_text: str = Field(..., min_length=10, description="Resume text (paste)")
+
+
+class BatchJDInput(BaseModel):
+    """JD (posting) in a batch request."""
+
+    id: str | None = Field(default=None, description="Caller-side ID (default: index)")
+    jd_inputs: list[JDInputItem] = Field(
+        ..., min_length=1, description="List of JD sections with categories"
+    )
+
+
+class BatchAnalyzeRequest(BaseModel):
+    """Request body for /analyze/batch endpoint."""
+
+    resumes: list[BatchResumeInput] = Field(..., min_length=1)
+    jds: list[BatchJDInput] = Field(..., min_length=1)
+    top_k: int = Field(default=5, ge=1, le=100, description="Matches per ranked item")
+    rank_by: Literal["resume", "jd"] = Field(
+        default="resume", description="resume: best JDs per resume / jd: best resumes per JD"
+    )
+
+
+class BatchMatch(BaseModel):
+    """One (resume, jd) score."""
+
+    resume_id: str
+    jd_id: str
+    match_score: float
+
+
+class BatchRanking(BaseModel):
+    """Top-k matches for one resume (or one JD)."""
+
+    id: str
+    matches: list[BatchMatch]
+
+
+class BatchAnalyzeResponse(BaseModel):
+    """Response body for /analyze/batch endpoint."""
+
+    rank_by: Literal["resume", "jd"]
+    rankings: list[BatchRanking]
+
+
+class PostingRequest(BaseModel):
+    """Request body for /match/postings endpoint."""
+
+    id: str = Field(..., min_length=1, description="Posting ID (re-posting replaces it)")
+    jd_inputs: list[JDInputItem] = Field(
+        ..., min_length=1, description="List of JD sections with categories"
+    )
+    jd_parse_mode: JDParseMode | None = Field(
+        default=None, description="per_section / single_call (default: JD_PARSE_MODE)"
+    )
+
+
+class PostingResponse(BaseModel):
+    """Response body for /match/postings endpoints."""
+
+    id: str
+    keyword_count: int = 0
+    indexed_postings: int
+
+
+class MatchJobsRequest(BaseModel):
+    """Request body for /match/jobs endpoint."""
+
+    resume_text: str = Field(..., min_length=10, description="Resume text (paste)")
+    top_k: int = Field(default=10, ge=1, le=100, description="Number of postings to return")
+
+
+class JobMatch(BaseModel):
+    """One indexed posting and its match score."""
+
+    job_id: str
+    match_score: float
+
+
+class MatchJobsResponse(BaseModel):
+    """Response body for /match/jobs endpoint."""
+
+    matches: list[JobMatch]
+    indexed_postings: int
+
+
+class ReviewRequest(BaseModel):
+    """Request body for /sessions/{session_id}/review (Step 3: User Interrupt)."""
+
+    keyword_toggles: dict[str, bool] = Field(
+        default_factory=dict,
+        description="{keyword: checked}. false = the user already knows it (no longer missing)",
+    )
+    preferences: Preferences | None = Field(
+        default=None, description="Project preferences (stack, constraints, role)"
+    )
+    generate: bool = Field(
+        default=True, description="Resume into project generation after recomputing the gap"
+    )
+    project_cache: ProjectCacheMode | None = Field(
+        default=None,
+        description="serve: reuse plans of a near-identical gap, seed: use them as a few-shot "
+        "example, off: always generate fresh (default: PROJECT_CACHE_MODE)",
+    )
+
+
+class SessionResponse(BaseModel):
+    """Response body for /sessions endpoints."""
+
+    session_id: str
+    next: list[str] = Field(default_factory=list, description="Pending graph nodes")
+    gap_summary: GapSummary | None = None
+    known_keywords: list[str] = Field(default_factory=list)
+    preferences: Preferences | None = None
+    project_output: ProjectOutput | None = None
+    expires_at: float | None = Field(default=None, description="Unix time of TTL eviction")
+    changes: dict | None = Field(
+        default=None, description="What was re-parsed (/sessions/{session_id}/reanalyze only)"
+    )
+
+
+class IdeaEvent(BaseModel):
+    """/sessions/{session_id}/review/stream `idea` event."""
+
+    index: int
+    idea: ProjectIdea
+
+
+class PlanEvent(BaseModel):
+    """/sessions/{session_id}/review/stream `plan` event."""
+
+    index: int
+    plan: ProjectPlan
+
+
+class JobRequest(AnalyzeRequest):
+    """Request body for POST /jobs (same input as /analyze)."""
+
+    webhook_url: str | None = Field(
+        default=None,
+        pattern=r"^https?://",
+        description=(
+            "POSTed the GET /jobs/{job_id} body once the job succeeds or fails "
+            "(host must be in JOB_WEBHOOK_ALLOWED_HOSTS)"
+        ),
+    )
+
+
+class StageProgress(BaseModel):
+    """Units of one pipeline stage done so far (e.g. JD sections parsed)."""
+
+    done: int
+    total: int
+
+
+class JobResponse(BaseModel):
+    """Response body for /jobs endpoints."""
+
+    job_id: str
+    kind: str
+    status: JobStatus
+    progress: dict[str, StageProgress] = Field(
+        default_factory=dict, description="Pipeline stage → done / total (in pipeline order)"
+    )
+    attempts: int = 0
+    error: str | None = Field(
+        default=None, description="Failure reason (or the last transient error of a retried job)"
+    )
+    webhook_status: str | None = Field(
+        default=None,
+        description="pending / delivered / rejected (4xx) / failed / blocked (host not allowed)",
+    )
+    created_at: float
+    started_at: float | None = None
+    finished_at: float | None = None
+    gap_summary: GapSummary | None = Field(
+        default=None, description="Same as /analyze (succeeded jobs only)"
+    )
+
+
+class DocumentResponse(BaseModel):
+    """Response body for /documents/{doc_id} (a slice of a stored source text)."""
+
+    doc_id: str
+    start: int
+    end: int
+    text: str
+
+
+def _json_response(model: BaseModel) -> Response:
+    """
+    pydantic-core로 한 번만 JSON 직렬화한다.
+    (model을 그대로 반환하면 FastAPI가 dict 변환 → response_model 재검증 → jsonable_encoder를 거친다)
+    """
+    return Response(model.model_dump_json(), media_type="application/json")
+
+
+async def _parse_resume(resume_text: str) -> ResumeProfile:
+    return await aparse_resume(resume_text)
+
+
+def _preprocess_jd_inputs(jd_inputs: list[JDInputItem]) -> list[JDInputItem]:
+    """
+    boilerplate 제거 + 요청 단위 JD 토큰 예산 (섹션 간 중복 문단 포함).
+    index는 그대로 두고, 다 지워진 섹션은 text가 빈 문자열이 된다 (파싱 생략).
+    """
+    with stage("compute", "preprocess_jd"):
+        sections, _ = prune_sections((jd_input.category, jd_input.text) for jd_input in jd_inputs)
+    if not any(text for _, text in sections):
+        return jd_inputs
+    return [
+        jd_input.model_copy(update={"text": text})
+        for jd_input, (_, text) in zip(jd_inputs, sections)
+    ]
+
+
+async def _parse_jd_section(jd_input: JDInputItem) -> list[JDKeyword]:
+    """JD 섹션 1개 파싱. 키워드 category는 사용자가 지정한 category로 덮어쓴다."""
+    if not jd_input.text:
+        return []
+    result = await aparse_jd({jd_input.category: jd_input.text})
+    return [with_category(kw, jd_input.category) for kw in result.keywords]
+
+
+async def _parse_jd_all(jd_inputs: list[JDInputItem]) -> list[JDKeyword]:
+    """모든 JD 섹션을 한 번에 파싱 (category 태그별로 키워드가 귀속되어 돌아온다)."""
+    sections = merge_sections(
+        (jd_input.category, jd_input.text) for jd_input in jd_inputs if jd_input.text
+    )
+    return (await aparse_jd(sections)).keywords
+
+
+async def _parse_jd_inputs(
+    jd_inputs: list[JDInputItem], mode: JDParseMode | None, progress: JobProgress | None = None
+) -> list[list[JDKeyword]]:
+    jd_inputs = _preprocess_jd_inputs(jd_inputs)
+    if (mode or JD_PARSE_MODE) == "single_call":
+        parses = [_parse_jd_all(jd_inputs)]
+    else:
+        parses = [_parse_jd_section(jd_input) for jd_input in jd_inputs]
+    if progress is not None:
+        parses = [progress.track("jd_parse", parse) for parse in parses]
+    if len(parses) == 1:
+        return [await parses[0]]
+    return list(await asyncio.gather(*parses))
+
+
+def _merge_jd_sections(sections: list[list[JDKeyword]]) -> JDProfile:
+    # 키워드는 이미 검증된 JDKeyword라 다시 검증/복사하지 않고 섹션 간 중복 제거만 한다
+    with stage("validate", "JDProfile"):
+        return JDProfile(keywords=[kw for section in sections for kw in section])
+
+
+def _sse(event: str, data: dict | BaseModel) -> str:
+    if isinstance(data, BaseModel):
+        payload = data.model_dump_json()
+    else:
+        payload = json.dumps(data, ensure_ascii=False)
+    return f"event: {event}\ndata: {payload}\n\n"
+
+
+def _streamed_keyword(kw: dict) -> dict:
+    """스트리밍 중 완성된 raw 키워드 (validator 전이라 여기서 canonical로 맞춘다)."""
+    return {
+        "keyword_text": normalize_keyword(kw.get("keyword_text") or ""),
+        "evidence": kw.get("evidence"),
+    }
+
+
+@lru_cache(maxsize=1)
+def _session_graph():
+    """리뷰 세션용 그래프 (SQLite checkpointer, project_generate 앞에서 interrupt)."""
+    return build_graph(checkpointer=get_checkpointer())
+
+
+def _session_config(session_id: str) -> dict:
+    return {"configurable": {"thread_id": session_id}}
+
+
+async def _analyze_job(payload: dict, progress: JobProgress) -> str:
+    """POST /jobs worker: /analyze 파이프라인 + 단계별 진행 보고. 결과는 GapSummary JSON."""
+    request = AnalyzeRequest.model_validate(payload)
+    single_call = (request.jd_parse_mode or JD_PARSE_MODE) == "single_call"
+    await progress.plan(
+        {
+            "resume_parse": 1,
+            "jd_parse": 1 if single_call else len(request.jd_inputs),
+            "gap_compute": 1,
+        }
+    )
+    resume_profile, jd_sections = await asyncio.gather(
+        progress.track("resume_parse", _parse_resume(request.resume_text)),
+        _parse_jd_inputs(request.jd_inputs, request.jd_parse_mode, progress),
+    )
+    gap = compute_gap(resume_profile, _merge_jd_sections(jd_sections))
+    await progress.advance("gap_compute")
+    return gap.model_dump_json()
+
+
+@lru_cache(maxsize=1)
+def _job_pool() -> WorkerPool:
+    """POST /jobs 작업을 실행하는 worker pool (ORCHESTRATOR_DATA_DIR/jobs.sqlite3)."""
+    return WorkerPool(
+        get_job_store(),
+        {"analyze": _analyze_job},
+        workers=JOB_WORKERS,
+        webhook_body=lambda job: _job_model(job).model_dump_json(),
+    )
+
+
+def _job_model(job: Job) -> JobResponse:
+    return JobResponse(
+        job_id=job.id,
+        kind=job.kind,
+        status=job.status,
+        progress=job.progress,
+        attempts=job.attempts,
+        error=job.error,
+        webhook_status=job.webhook_status,
+        created_at=job.created_at,
+        started_at=job.started_at,
+        finished_at=job.finished_at,
+        gap_summary=GapSummary.model_validate_json(job.result) if job.result else None,
+    )
 
-    gap_summary: GapSummaryResponse
+
+def _jd_text(jd_inputs: list[JDInputItem]) -> dict[str, str]:
+    """JD 입력 목록 → 그래프 입력 {category: text} (같은 category는 이어 붙인다)."""
+    sections: dict[str, list[str]] = {}
+    for item in jd_inputs:
+        sections.setdefault(item.category, []).append(item.text)
+    return {category: "\n\n".join(texts) for category, texts in sections.items()}
+
+
+async def _load_session(session_id: str):
+    """세션 snapshot. 없거나 TTL이 지났으면 404."""
+    checkpointer = get_checkpointer()
+    expires_at = await asyncio.to_thread(checkpointer.session_expires_at, session_id)
+    if expires_at is None or expires_at <= time.time():
+        if expires_at is not None:
+            await checkpointer.adelete_thread(session_id)
+        raise HTTPException(status_code=404, detail=f"Unknown session: {session_id}")
+    return await _session_graph().aget_state(_session_config(session_id))
+
+
+def _session_model(session_id: str, snapshot, changes: dict | None = None) -> SessionResponse:
+    values = snapshot.values
+    return SessionResponse(
+        session_id=session_id,
+        next=list(snapshot.next),
+        gap_summary=values.get("gap_summary"),
+        known_keywords=values.get("known_keywords") or [],
+        preferences=values.get("preferences"),
+        project_output=values.get("project_output"),
+        expires_at=get_checkpointer().session_expires_at(session_id),
+        changes=changes,
+    )
+
+
+def _session_response(session_id: str, snapshot, changes: dict | None = None) -> Response:
+    return _json_response(_session_model(session_id, snapshot, changes))
+
+
+async def _reviewable_session(session_id: str):
+    """review / reanalyze 대상 세션 snapshot (분석이 끝나지 않았으면 409)."""
+    snapshot = await _load_session(session_id)
+    if snapshot.values.get("gap_summary") is None:
+        raise HTTPException(status_code=409, detail="Session has no completed analysis")
+    return snapshot
 
 
 @app.get("/health")
@@ -93,102 +626,546 @@ async def health_check():
     return {"status": "healthy", "version": "0.1.0"}
 
 
+@app.get("/stats")
+async def stats():
+    """
+    Parse cache hit rates, in-flight coalescing counters, preprocessing tokens saved,
+    the LLM rate-limit queues (per model, only when RPM/TPM limits are configured)
+    and the job queue (jobs by status).
+    """
+    project_cache = get_project_cache()
+    return {
+        "resume_parse": resume_parse_stats(),
+        "jd_parse": jd_parse_stats(),
+        "preprocess": preprocess_stats(),
+        "docstore": get_docstore().stats.as_dict(),
+        "project_cache": {**project_cache.stats.as_dict(), "entries": len(project_cache)},
+        "sessions": {
+            "active": get_checkpointer().session_count(),
+            "evicted": get_checkpointer().evictions,
+        },
+        "llm_scheduler": get_scheduler().stats(),
+        "jobs": {**get_job_store().counts(), "workers_busy": _job_pool().busy},
+    }
+
+
+@app.get("/metrics")
+async def prometheus_metrics():
+    """Prometheus text exposition of in-process metrics."""
+    return Response(metrics.render(), media_type=metrics.CONTENT_TYPE)
+
+
 @app.post("/analyze", response_model=AnalyzeResponse)
 async def analyze(request: AnalyzeRequest):
     """
     Main entry point for JD-Resume analysis.
 
-    1. Parse Resume to extract keywords
-    2. Parse JD sections to extract keywords
-    3. Compute gap and score (simplified for now)
+    1. Parse Resume + JD concurrently (per-section fan-out, or one multi-section call)
+    2. Merge JD keywords with their user-specified category
+    3. Compute gap and score (gap_compute, OR groups 포함)
 
     Returns:
         AnalyzeResponse with GapSummary
     """
     try:
-        # Step 1: Parse Resume
-        resume_result = resume_parse_tool.invoke({"resume_text": request.resume_text})
-        resume_keywords = set(
-            kw.get("keyword_text", "").lower()
-            for kw in resume_result.get("keywords", [])
+        # Step 1: Parse Resume and JD concurrently
+        # (per_section: 섹션별 병렬 호출 / single_call: 모든 섹션을 한 번에)
+        resume_profile, jd_sections = await asyncio.gather(
+            _parse_resume(request.resume_text),
+            _parse_jd_inputs(request.jd_inputs, request.jd_parse_mode),
         )
 
-        # Step 2: Combine and parse JD sections
-        jd_keywords_by_category: dict[str, list[dict]] = {
-            "required": [],
-            "preferred": [],
-            "responsibility": [],
-            "context": [],
-        }
+        # Step 2: Merge JD sections (category = user-specified category)
+        jd_profile = _merge_jd_sections(jd_sections)
+
+        # Step 3: Compute gap + score (OR groups from gap_instruction 반영)
+        gap = compute_gap(resume_profile, jd_profile)
+
+        return _json_response(AnalyzeResponse(gap_summary=gap))
+
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal error: {str(e)}")
+
+
+@app.post("/analyze/stream")
+async def analyze_stream(request: AnalyzeRequest):
+    """
+    /analyze as Server-Sent Events. Events (in arrival order):
+
+    - resume_keyword / jd_keyword: one keyword as soon as the LLM finishes emitting it
+    - resume: all resume keywords (resume_parse_tool done)
+    - jd_section: one JD section's keywords
+    - missing: that section's missing keywords + running match score (once the resume is ready)
+    - gap_summary: final GapSummary (same as /analyze)
+    - error: pipeline failure (stream ends)
+    """
+    return StreamingResponse(
+        _analyze_events(request),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _analyze_events(request: AnalyzeRequest) -> AsyncIterator[str]:
+    # 모든 parse가 결과/부분 결과를 하나의 queue로 보내고, 도착 순서대로 event를 만든다
+    queue: asyncio.Queue[tuple[str, int, object]] = asyncio.Queue()
+    jd_inputs = _preprocess_jd_inputs(request.jd_inputs)
+
+    async def run(kind: str, index: int, coro) -> None:
+        try:
+            queue.put_nowait((kind, index, await coro))
+        except Exception as e:
+            queue.put_nowait(("error", index, e))
+
+    async def parse_section(index: int, jd_input: JDInputItem) -> list[JDKeyword]:
+        def on_keyword(kw: dict) -> None:
+            data = {"section": index, "category": jd_input.category, **_streamed_keyword(kw)}
+            queue.put_nowait(("jd_keyword", index, data))
+
+        if not jd_input.text:
+            return []
+        result = await aparse_jd({jd_input.category: jd_input.text}, on_keyword=on_keyword)
+        return [with_category(kw, jd_input.category) for kw in result.keywords]
+
+    # single_call: category → 그 category의 첫 섹션 index
+    first_index: dict[str, int] = {}
+    for i, jd_input in enumerate(jd_inputs):
+        first_index.setdefault(jd_input.category, i)
+
+    async def parse_all() -> list[JDKeyword]:
+        sections = merge_sections((i.category, i.text) for i in jd_inputs if i.text)
 
-        for jd_input in request.jd_inputs:
-            jd_result = jd_parse_tool.invoke({"jd_text": jd_input.text})
-            for kw in jd_result.get("keywords", []):
-                # Override category with user-specified category
-                kw_copy = dict(kw)
-                kw_copy["category"] = jd_input.category
-                jd_keywords_by_category[jd_input.category].append(kw_copy)
-
-        # Step 3: Compute gap (simplified)
-        all_jd_keywords = []
-        missing_keywords = []
-
-        for category, keywords in jd_keywords_by_category.items():
-            for kw in keywords:
-                keyword_text = kw.get("keyword_text", "").lower()
-                all_jd_keywords.append(kw)
-                if keyword_text and keyword_text not in resume_keywords:
-                    missing_keywords.append(
-                        KeywordInfo(
-                            keyword_text=keyword_text,
-                            category=category,
-                            evidence=kw.get("evidence"),
-                            importance=kw.get("importance"),
-                        )
-                    )
-
-        # Step 4: Calculate score (simplified)
-        total_required = len(jd_keywords_by_category["required"])
-        total_preferred = len(jd_keywords_by_category["preferred"])
-
-        matched_required = sum(
-            1
-            for kw in jd_keywords_by_category["required"]
-            if kw.get("keyword_text", "").lower() in resume_keywords
+        def on_keyword(kw: dict) -> None:
+            category = attribute_category(kw.get("category"), kw.get("evidence"), sections)
+            data = {"section": first_index.get(category, -1), "category": category}
+            queue.put_nowait(("jd_keyword", -1, {**data, **_streamed_keyword(kw)}))
+
+        return (await aparse_jd(sections, on_keyword=on_keyword)).keywords
+
+    def on_resume_keyword(kw: dict) -> None:
+        queue.put_nowait(("resume_keyword", -1, _streamed_keyword(kw)))
+
+    tasks = [
+        asyncio.ensure_future(
+            run("resume", -1, aparse_resume(request.resume_text, on_keyword=on_resume_keyword))
         )
-        matched_preferred = sum(
-            1
-            for kw in jd_keywords_by_category["preferred"]
-            if kw.get("keyword_text", "").lower() in resume_keywords
+    ]
+    if (request.jd_parse_mode or JD_PARSE_MODE) == "single_call":
+        tasks.append(asyncio.ensure_future(run("jd_all", -1, parse_all())))
+    else:
+        tasks.extend(
+            asyncio.ensure_future(run("jd_section", i, parse_section(i, jd_input)))
+            for i, jd_input in enumerate(jd_inputs)
+        )
+
+    resume_profile: ResumeProfile | None = None
+    sections: dict[int, list[JDKeyword]] = {}
+
+    def section_events(index: int) -> list[str]:
+        events = [
+            _sse(
+                "jd_section",
+                SectionEvent(
+                    section=index, category=jd_inputs[index].category, keywords=sections[index]
+                ),
+            )
+        ]
+        if resume_profile is not None:
+            events.append(missing_event(index))
+        return events
+
+    def missing_event(index: int) -> str:
+        section_gap = compute_gap(resume_profile, _merge_jd_sections([sections[index]]))
+        running = compute_gap(resume_profile, _merge_jd_sections(list(sections.values())))
+        return _sse(
+            "missing",
+            MissingEvent(
+                section=index,
+                category=jd_inputs[index].category,
+                missing_keywords=section_gap.missing_keywords,
+                match_score=running.match_score,
+                sections_done=len(sections),
+                sections_total=len(jd_inputs),
+            ),
+        )
+
+    try:
+        remaining = len(tasks)
+        while remaining:
+            kind, index, payload = await queue.get()
+            if kind == "error":
+                status = 400 if isinstance(payload, ValueError) else 500
+                yield _sse("error", {"status": status, "detail": str(payload)})
+                return
+            if kind in ("resume_keyword", "jd_keyword"):
+                yield _sse(kind, payload)
+                continue
+
+            remaining -= 1
+            if kind == "resume":
+                resume_profile = payload
+                yield _sse("resume", ResumeEvent(keywords=resume_profile.keywords))
+                # resume보다 먼저 끝난 JD 섹션들의 missing
+                for done_index in sorted(sections):
+                    yield missing_event(done_index)
+            elif kind == "jd_section":
+                sections[index] = payload
+                for event in section_events(index):
+                    yield event
+            else:
+                # single_call: 섹션 category로 귀속된 키워드를 섹션별 event로 나눈다
+                by_category: dict[str, list[JDKeyword]] = {}
+                for kw in payload:
+                    category = kw.category if kw.category in first_index else None
+                    by_category.setdefault(category or jd_inputs[0].category, []).append(kw)
+                for i, jd_input in enumerate(jd_inputs):
+                    sections[i] = by_category.pop(jd_input.category, [])
+                    for event in section_events(i):
+                        yield event
+
+        jd_profile = _merge_jd_sections([sections[i] for i in range(len(jd_inputs))])
+        gap = compute_gap(resume_profile, jd_profile)
+        yield _sse("gap_summary", gap)
+
+    except ValueError as e:
+        yield _sse("error", {"status": 400, "detail": str(e)})
+    except Exception as e:
+        yield _sse("error", {"status": 500, "detail": f"Internal error: {str(e)}"})
+    finally:
+        # client가 끊었거나 에러로 끝나면 남은 parse 취소
+        for task in tasks:
+            task.cancel()
+
+
+@app.post("/analyze/batch", response_model=BatchAnalyzeResponse)
+async def analyze_batch(request: BatchAnalyzeRequest):
+    """
+    Score a pool of resumes against a pool of JDs.
+
+    1. Parse each unique resume / JD section once (concurrently)
+    2. Build the full N × M score matrix in one vectorized pass
+    3. Return top-k JDs per resume (or resumes per JD)
+    """
+    try:
+        # Step 1: 중복 문서는 한 번만 파싱
+        resume_tasks: dict[str, asyncio.Task] = {}
+        section_tasks: dict[tuple[str, str], asyncio.Task] = {}
+        for item in request.resumes:
+            key = norm_text(item.resume_text)
+            if key not in resume_tasks:
+                resume_tasks[key] = asyncio.ensure_future(_parse_resume(item.resume_text))
+        jd_inputs = [_preprocess_jd_inputs(jd.jd_inputs) for jd in request.jds]
+        for inputs in jd_inputs:
+            for jd_input in inputs:
+                key = (jd_input.category, norm_text(jd_input.text))
+                if key not in section_tasks:
+                    section_tasks[key] = asyncio.ensure_future(_parse_jd_section(jd_input))
+        await asyncio.gather(*resume_tasks.values(), *section_tasks.values())
+
+        resumes = [resume_tasks[norm_text(item.resume_text)].result() for item in request.resumes]
+        jds = [
+            _merge_jd_sections(
+                [
+                    section_tasks[(jd_input.category, norm_text(jd_input.text))].result()
+                    for jd_input in inputs
+                ]
+            )
+            for inputs in jd_inputs
+        ]
+
+        # Step 2: N × M score matrix
+        scores = score_matrix(resumes, jds)
+
+        # Step 3: top-k
+        resume_ids = [item.id or str(i) for i, item in enumerate(request.resumes)]
+        jd_ids = [jd.id or str(j) for j, jd in enumerate(request.jds)]
+        rankings = []
+        if request.rank_by == "resume":
+            for i, best in enumerate(top_k(scores, request.top_k, by="resume")):
+                matches = [
+                    BatchMatch(resume_id=resume_ids[i], jd_id=jd_ids[j], match_score=sc)
+                    for j, sc in best
+                ]
+                rankings.append(BatchRanking(id=resume_ids[i], matches=matches))
+        else:
+            for j, best in enumerate(top_k(scores, request.top_k, by="jd")):
+                matches = [
+                    BatchMatch(resume_id=resume_ids[i], jd_id=jd_ids[j], match_score=sc)
+                    for i, sc in best
+                ]
+                rankings.append(BatchRanking(id=jd_ids[j], matches=matches))
+
+        return _json_response(BatchAnalyzeResponse(rank_by=request.rank_by, rankings=rankings))
+
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal error: {str(e)}")
+
+
+@app.post("/match/postings", response_model=PostingResponse)
+async def add_posting(request: PostingRequest):
+    """
+    Parse a JD and add it to the local job index (incremental, persisted).
+    """
+    try:
+        jd_sections = await _parse_jd_inputs(request.jd_inputs, request.jd_parse_mode)
+        jd_profile = _merge_jd_sections(jd_sections)
+        index = get_job_index()
+        await asyncio.to_thread(index.add, request.id, jd_profile)
+        return _json_response(
+            PostingResponse(
+                id=request.id, keyword_count=len(jd_profile.keywords), indexed_postings=len(index)
+            )
         )
 
-        # Weighted score calculation
-        required_weight = 0.7
-        preferred_weight = 0.3
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal error: {str(e)}")
+
+
+@app.delete("/match/postings/{posting_id}", response_model=PostingResponse)
+async def remove_posting(posting_id: str):
+    """Remove a JD from the job index."""
+    index = get_job_index()
+    if not await asyncio.to_thread(index.remove, posting_id):
+        raise HTTPException(status_code=404, detail=f"Unknown posting: {posting_id}")
+    return PostingResponse(id=posting_id, indexed_postings=len(index))
+
+
+@app.post("/sessions", response_model=SessionResponse)
+async def create_session(request: AnalyzeRequest):
+    """
+    Analyze a Resume against a JD and keep the state for keyword review.
+
+    Runs parse → normalize → gap_compute with a SQLite checkpointer and stops before
+    project generation. Use the returned `session_id` with /sessions/{session_id}/review.
+    """
+    session_id = uuid.uuid4().hex
+    config = _session_config(session_id)
+    graph = _session_graph()
+    try:
+        # checkpoint에는 원문 대신 DocRef만 남는다 (RAW_TEXT_RETENTION)
+        with session_input(request.resume_text, _jd_text(request.jd_inputs)) as inputs:
+            await graph.ainvoke({**inputs, "jd_parse_mode": request.jd_parse_mode}, config)
+        return _session_response(session_id, await graph.aget_state(config))
+
+    except ValueError as e:
+        await get_checkpointer().adelete_thread(session_id)
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        await get_checkpointer().adelete_thread(session_id)
+        raise HTTPException(status_code=500, detail=f"Internal error: {str(e)}")
+
+
+@app.get("/sessions/{session_id}", response_model=SessionResponse)
+async def get_session(session_id: str):
+    """Current state of a review session (gap, toggled keywords, generated projects)."""
+    return _session_response(session_id, await _load_session(session_id))
+
+
+@app.post("/sessions/{session_id}/review", response_model=SessionResponse)
+async def review_session(session_id: str, request: ReviewRequest):
+    """
+    Step 3 (User Interrupt): apply keyword toggles and preferences to a stored session.
+
+    1. Recompute gap + score from the stored profiles (no LLM calls, milliseconds)
+    2. If `generate`, resume the graph into project generation (Step 4)
+
+    Can be called repeatedly; reviewing again after generation regenerates the projects.
+    """
+    snapshot = await _reviewable_session(session_id)
+    config = _session_config(session_id)
+    graph = _session_graph()
+    try:
+        update = apply_review(snapshot.values, request.keyword_toggles, request.preferences)
+        # gap_compute가 쓴 것처럼 기록 → 다음 노드는 다시 project_generate
+        await graph.aupdate_state(config, update, as_node="gap_compute")
+        if request.generate:
+            with project_cache_mode(request.project_cache):
+                await graph.ainvoke(None, config)
+        return _session_response(session_id, await graph.aget_state(config))
+
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except LLMUnavailable as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal error: {str(e)}")
+
+
+@app.post("/sessions/{session_id}/review/stream")
+async def review_session_stream(session_id: str, request: ReviewRequest):
+    """
+    /sessions/{session_id}/review as Server-Sent Events. Events (in arrival order):
+
+    - gap_summary: recomputed GapSummary (right after the toggles are applied)
+    - idea: one project idea (both arrive after the single ideation call)
+    - plan: one complete ProjectPlan (idea + architecture + 7-day plan) as soon as it is ready
+    - session: final session state (same body as /sessions/{session_id}/review)
+    - error: failure (stream ends)
+    """
+    snapshot = await _reviewable_session(session_id)
+    return StreamingResponse(
+        _review_events(session_id, snapshot, request),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
 
-        required_score = (
-            (matched_required / total_required * required_weight)
-            if total_required > 0
-            else required_weight
+async def _review_events(session_id: str, snapshot, request: ReviewRequest) -> AsyncIterator[str]:
+    config = _session_config(session_id)
+    graph = _session_graph()
+    try:
+        update = apply_review(snapshot.values, request.keyword_toggles, request.preferences)
+        await graph.aupdate_state(config, update, as_node="gap_compute")
+        yield _sse("gap_summary", update["gap_summary"])
+        if request.generate:
+            # project_generate 노드가 get_stream_writer로 흘려보내는 아이디어 / plan
+            with project_cache_mode(request.project_cache):
+                async for chunk in graph.astream(None, config, stream_mode="custom"):
+                    if chunk["event"] == "idea":
+                        yield _sse("idea", IdeaEvent(index=chunk["index"], idea=chunk["idea"]))
+                    elif chunk["event"] == "plan":
+                        yield _sse("plan", PlanEvent(index=chunk["index"], plan=chunk["plan"]))
+        yield _sse("session", _session_model(session_id, await graph.aget_state(config)))
+
+    except ValueError as e:
+        yield _sse("error", {"status": 400, "detail": str(e)})
+    except LLMUnavailable as e:
+        yield _sse("error", {"status": 503, "detail": str(e)})
+    except Exception as e:
+        yield _sse("error", {"status": 500, "detail": f"Internal error: {str(e)}"})
+
+
+@app.post("/sessions/{session_id}/reanalyze", response_model=SessionResponse)
+async def reanalyze_session(session_id: str, request: AnalyzeRequest):
+    """
+    Incremental re-analysis of an edited Resume / JD for an existing session.
+
+    1. Diff the new inputs against the stored ones (JD per section, then per line)
+    2. Re-parse only the changed lines; keep keywords of unchanged lines
+    3. Splice, dedupe (JD category priority), recompute gap + score
+
+    Keyword toggles from earlier reviews still apply. Generated projects are cleared;
+    the session stops before project generation again.
+    """
+    snapshot = await _reviewable_session(session_id)
+    config = _session_config(session_id)
+    graph = _session_graph()
+    try:
+        update, changes = await areanalyze_updates(
+            snapshot.values, request.resume_text, _jd_text(request.jd_inputs)
         )
-        preferred_score = (
-            (matched_preferred / total_preferred * preferred_weight)
-            if total_preferred > 0
-            else preferred_weight
+        await graph.aupdate_state(config, update, as_node="gap_compute")
+        return _session_response(
+            session_id, await graph.aget_state(config), changes=changes.as_dict()
         )
 
-        match_score = round((required_score + preferred_score) * 100, 1)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except LLMUnavailable as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal error: {str(e)}")
+
+
+@app.delete("/sessions/{session_id}", status_code=204)
+async def delete_session(session_id: str):
+    """Drop a review session and its checkpoints."""
+    await _load_session(session_id)
+    await get_checkpointer().adelete_thread(session_id)
+    return Response(status_code=204)
+
 
-        # Build response
-        gap_summary = GapSummaryResponse(
-            match_score=match_score,
-            keyword_matches=[],  # Simplified for now
-            missing_keywords=missing_keywords,
-            validated_missing_keywords=missing_keywords,  # Simplified for now
-            notes=f"Found {len(resume_keywords)} resume keywords. Missing {len(missing_keywords)} JD keywords.",
+@app.get("/documents/{doc_id}", response_model=DocumentResponse)
+async def get_document(doc_id: str, start: int = 0, end: int | None = None):
+    """
+    Read a retained source text (RAW_TEXT_RETENTION=reference) by its content hash.
+
+    `start` / `end` select a character slice, e.g. a keyword's `source_span`.
+    """
+    if start < 0 or (end is not None and end < start):
+        raise HTTPException(status_code=400, detail="Invalid range")
+    store = get_docstore()
+    if end is None:
+        text = await asyncio.to_thread(store.get, doc_id)
+        text = text[start:] if text is not None else None
+    else:
+        text = await asyncio.to_thread(store.slice, DocRef(doc_id=doc_id, start=start, end=end))
+    if text is None:
+        raise HTTPException(status_code=404, detail=f"Unknown document: {doc_id}")
+    return _json_response(
+        DocumentResponse(doc_id=doc_id, start=start, end=start + len(text), text=text)
+    )
+
+
+@app.post("/jobs", response_model=JobResponse, status_code=202)
+async def create_job(request: JobRequest, http_request: Request):
+    """
+    Queue an /analyze run and return immediately (202 + job ID).
+
+    The job runs on the local worker pool (JOB_WORKERS) behind interactive requests
+    (batch priority, same tenant as this request). Poll GET /jobs/{job_id} or pass
+    `webhook_url` to be notified. 400 when the webhook host is not in
+    JOB_WEBHOOK_ALLOWED_HOSTS, 429 when JOB_MAX_QUEUED jobs are already waiting.
+    """
+    if request.webhook_url is not None:
+        try:
+            check_webhook_url(request.webhook_url)
+        except WebhookNotAllowed as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    tenant, _ = _scheduling(http_request)
+    payload = request.model_dump(mode="json", exclude={"webhook_url"})
+    try:
+        job = await asyncio.to_thread(
+            get_job_store().submit,
+            "analyze",
+            payload,
+            tenant=tenant,
+            webhook_url=request.webhook_url,
         )
+    except JobQueueFull as e:
+        raise HTTPException(status_code=429, detail=f"Job queue is full: {e}")
+    pool = _job_pool()
+    pool.ensure_started()
+    pool.notify()
+    response = _json_response(_job_model(job))
+    response.status_code = 202
+    response.headers["Location"] = f"/jobs/{job.id}"
+    return response
+
+
+@app.get("/jobs/{job_id}", response_model=JobResponse)
+async def get_job(job_id: str):
+    """Job status, per-stage progress and (once succeeded) the GapSummary."""
+    job = await asyncio.to_thread(get_job_store().get, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown job: {job_id}")
+    return _json_response(_job_model(job))
 
-        return AnalyzeResponse(gap_summary=gap_summary)
+
+@app.post("/match/jobs", response_model=MatchJobsResponse)
+async def match_jobs(request: MatchJobsRequest):
+    """
+    Find the indexed JDs that best fit a resume.
+
+    1. Parse Resume (canonical keywords)
+    2. Walk only the postings of those keywords (MaxScore top-k)
+    """
+    try:
+        resume_profile = await _parse_resume(request.resume_text)
+        index = get_job_index()
+        results = index.search((k.keyword_text for k in resume_profile.keywords), request.top_k)
+        return _json_response(
+            MatchJobsResponse(
+                matches=[JobMatch(job_id=job_id, match_score=score) for job_id, score in results],
+                indexed_postings=len(index),
+            )
+        )
 
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -0,0 +1,21 @@
+# benchmarks/__init__.py
+"""
+Offline 벤치마크 (`python -m benchmarks`).
+
+LLM은 FakeChatModel(fake_llm.py)로 바꿔 끼우므로 네트워크 / API key 없이 돌아간다.
+"""
+
+from .fake_llm import FakeChatModel, LatencyModel, use_fake_llm
+from .harness import BenchResult, bench_async, bench_sync, compare, load_results, save_results
+
+__all__ = [
+    "FakeChatModel",
+    "LatencyModel",
+    "use_fake_llm",
+    "BenchResult",
+    "bench_async",
+    "bench_sync",
+    "compare",
+    "load_results",
+    "save_results",
+]
@@ -0,0 +1,88 @@
+# benchmarks/__main__.py
+"""
+python -m benchmarks [--suite core|analyze|all] [--latency SPEC] [--save PATH] [--compare PATH]
+
+예:
+    python -m benchmarks --suite core --save benchmarks/baselines/baseline.json
+    python -m benchmarks --latency lognormal:0.8,0.4 --concurrency 1,8,32,128
+    python -m benchmarks --compare benchmarks/baselines/baseline.json   # regression이면 exit 1
+    python -m benchmarks --suite analyze --backend server --error-rate 0.1 --stall-rate 0.02
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+from . import bench_analyze, bench_core
+from .fake_llm import LatencyModel
+from .harness import compare, load_results, save_results
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baselines" / "baseline.json"
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--suite", choices=("core", "analyze", "all"), default="all")
+    parser.add_argument("--min-time", type=float, default=1.0,
+                        help="core 벤치마크 하나당 측정 시간 (초)")
+    parser.add_argument("--latency", default="lognormal:0.05,0.5",
+                        help="fake LLM 호출 지연: none | fixed:S | uniform:A,B | lognormal:MEDIAN,SIGMA")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--concurrency", default="1,8,32,128",
+                        help="/analyze 동시 요청 수 (쉼표 구분)")
+    parser.add_argument("--requests", type=int, default=64,
+                        help="concurrency 단계별 /analyze 요청 수 (최소 concurrency)")
+    parser.add_argument("--jd-parse-mode", choices=("per_section", "single_call"),
+                        default="per_section")
+    parser.add_argument("--backend", choices=("fake", "server"), default="fake",
+                        help="fake: FakeChatModel / server: 로컬 OpenAI stand-in 서버 (실제 HTTP)")
+    parser.add_argument("--error-rate", type=float, default=0.0,
+                        help="server backend: 429 / 500 / 503으로 실패하는 요청 비율")
+    parser.add_argument("--stall-rate", type=float, default=0.0,
+                        help="server backend: 응답하지 않는(stall) 요청 비율")
+    parser.add_argument("--save", type=Path, nargs="?", const=DEFAULT_BASELINE,
+                        help=f"결과 JSON 저장 (경로 생략 시 {DEFAULT_BASELINE})")
+    parser.add_argument("--compare", type=Path, nargs="?", const=DEFAULT_BASELINE,
+                        help="baseline JSON과 비교, regression이 있으면 exit 1")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="regression 판정 비율 (ops/sec 감소 또는 p95 증가)")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    latency = LatencyModel.parse(args.latency, seed=args.seed)
+
+    results = []
+    if args.suite in ("core", "all"):
+        results += bench_core.run(min_time=args.min_time)
+    if args.suite in ("analyze", "all"):
+        levels = [int(c) for c in args.concurrency.split(",") if c.strip()]
+        results += bench_analyze.run(
+            latency, levels, args.requests, args.jd_parse_mode,
+            args.backend, args.error_rate, args.stall_rate,
+        )
+
+    for result in results:
+        print(result.row())
+
+    exit_code = 0
+    if args.compare is not None:
+        comparisons = compare(results, load_results(args.compare), args.tolerance)
+        print(f"\ncompared with {args.compare} (tolerance {args.tolerance:.0%})")
+        for comparison in comparisons:
+            print(comparison.row())
+        if any(c.regressed for c in comparisons):
+            exit_code = 1
+
+    if args.save is not None:
+        save_results(results, args.save, latency=latency.describe(), seed=args.seed)
+        print(f"\nsaved {len(results)} results to {args.save}")
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,115 @@
+# benchmarks/bench_analyze.py
+"""
+/analyze 전체 파이프라인 벤치마크 (FastAPI app in-process, LLM은 FakeChatModel).
+
+- 요청마다 Resume/JD 텍스트를 조금씩 바꿔서 캐시 / single-flight / lexicon fast path에
+  걸리지 않게 한다 (모든 parse가 LLM 경로를 탄다 = 최악의 경우).
+- concurrency 단계별로 ops/sec와 요청 latency 분포를 잰다.
+  fake latency가 있으면 LLM_MAX_CONCURRENCY 같은 동시성 한도가 그대로 드러난다.
+- backend="server": FakeChatModel 대신 로컬 OpenAI stand-in 서버(fake_openai_server)를 거친다
+  (실제 HTTP + resilience layer, error_rate / stall_rate로 오류와 stall 주입).
+"""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import contextmanager
+from typing import Any, Iterator, Sequence
+
+import httpx
+
+from packages.core.cache import bypass_cache
+from packages.core.llm import LLM_MAX_CONCURRENCY
+from packages.tools import keyword_normalize
+
+from .fake_llm import LatencyModel, use_fake_llm
+from .fake_openai_server import use_openai_server
+from .harness import BenchResult, bench_async
+from .samples import jd_inputs, load_samples
+
+
+def _payload(i: int, jd_parse_mode: str) -> dict:
+    samples = load_samples()
+    resume = samples["resume"][i % len(samples["resume"])]
+    jd = samples["jd"][i % len(samples["jd"])]
+    # 요청마다 다른 content key
+    tag = f"\n\nref #{i}"
+    return {
+        "resume_text": resume + tag,
+        "jd_inputs": [{**item, "text": item["text"] + tag} for item in jd_inputs(jd)],
+        "jd_parse_mode": jd_parse_mode,
+    }
+
+
+@contextmanager
+def _backend(
+    backend: str, latency: LatencyModel, error_rate: float, stall_rate: float
+) -> Iterator[Any]:
+    """LLM backend (yield하는 객체의 .calls = LLM 호출 / 요청 수)."""
+    if backend == "server":
+        with use_openai_server(latency, error_rate=error_rate, stall_rate=stall_rate) as server:
+            yield server
+    else:
+        with use_fake_llm(latency) as model:
+            yield model
+
+
+async def _run(
+    latency: LatencyModel,
+    concurrency_levels: Sequence[int],
+    requests: int,
+    jd_parse_mode: str,
+    backend: str,
+    error_rate: float,
+    stall_rate: float,
+) -> list[BenchResult]:
+    from apps.api.main import app
+
+    results = []
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+        async def analyze(i: int) -> None:
+            response = await client.post("/analyze", json=_payload(i, jd_parse_mode))
+            response.raise_for_status()
+
+        # warmup (import / lexicon automaton / pydantic schema build)
+        await analyze(-1)
+        suffix, faults = "", {}
+        if backend == "server":
+            suffix, faults = ".server", {"error_rate": error_rate, "stall_rate": stall_rate}
+        for concurrency in concurrency_levels:
+            with _backend(backend, latency, error_rate, stall_rate) as model:
+                result = await bench_async(
+                    f"analyze.{jd_parse_mode}{suffix}.c{concurrency}",
+                    analyze,
+                    requests=max(requests, concurrency),
+                    concurrency=concurrency,
+                    latency=latency.describe(),
+                    llm_max_concurrency=LLM_MAX_CONCURRENCY,
+                    **faults,
+                )
+                result.params["llm_calls"] = model.calls
+            results.append(result)
+    return results
+
+
+def run(
+    latency: LatencyModel,
+    concurrency_levels: Sequence[int] = (1, 8, 32, 128),
+    requests: int = 64,
+    jd_parse_mode: str = "per_section",
+    backend: str = "fake",
+    error_rate: float = 0.0,
+    stall_rate: float = 0.0,
+) -> list[BenchResult]:
+    previous = keyword_normalize.FAST_PATH_MODE
+    keyword_normalize.FAST_PATH_MODE = "off"
+    try:
+        with _backend(backend, latency, error_rate, stall_rate), bypass_cache():
+            return asyncio.run(_run(
+                latency, concurrency_levels, requests, jd_parse_mode,
+                backend, error_rate, stall_rate,
+            ))
+    finally:
+        keyword_normalize.FAST_PATH_MODE = previous
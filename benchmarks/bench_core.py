@@ -0,0 +1,141 @@
+# benchmarks/bench_core.py
+"""
+Pure-Python hot path 벤치마크 (LLM 없음).
+
+- dedupe_jd_keywords / _dedupe_keywords_by_priority
+- JDProfile / ResumeProfile validator (canonical 변환 + 중복 제거)
+- ProjectOutput validation
+- scoring: weighted_match_score, compute_gap, score_matrix + top_k
+"""
+
+from __future__ import annotations
+
+import random
+
+from packages.core.schemas import JDKeyword, JDProfile, ProjectOutput, ResumeProfile
+from packages.core.schemas.utils import _dedupe_keywords_by_priority, dedupe_jd_keywords
+from packages.tools.gap_compute import compute_gap
+from packages.tools.score import score_matrix, top_k, weighted_match_score
+
+from .fake_llm import canned_jd, canned_project_output, canned_resume
+from .harness import BenchResult, bench_sync
+from .samples import load_samples, split_jd_sections
+
+# 정규화 전 표기 변형 (LLM 출력에서 흔한 대소문자/공백 차이)
+_VARIANTS = (str, str.upper, str.title, lambda s: f"  {s} ")
+
+
+def _raw_jd(text: str) -> dict:
+    tagged = "\n\n".join(
+        f'<section category="{c}">\n{t}\n</section>' for c, t in split_jd_sections(text)
+    )
+    return canned_jd(tagged)
+
+
+def _fixtures(seed: int = 0) -> dict:
+    samples = load_samples()
+    raw_jds = [_raw_jd(text) for text in samples["jd"]]
+    raw_resumes = [canned_resume(text) for text in samples["resume"]]
+
+    # 중복이 섞인 JD 키워드 (섹션 간 중복 + 표기 변형)
+    raw_keywords = [
+        {**kw, "keyword_text": variant(kw["keyword_text"])}
+        for raw in raw_jds
+        for kw in raw["keywords"]
+        for variant in _VARIANTS
+    ]
+
+    # score_matrix용: 샘플 키워드를 섞어 만든 profile들
+    rng = random.Random(seed)
+    jd_pool = [kw for raw in raw_jds for kw in raw["keywords"]]
+    resume_pool = [kw for raw in raw_resumes for kw in raw["keywords"]]
+    jds = [
+        JDProfile.model_validate({"keywords": rng.sample(jd_pool, min(len(jd_pool), 25))})
+        for _ in range(200)
+    ]
+    resumes = [
+        ResumeProfile.model_validate(
+            {"keywords": rng.sample(resume_pool, min(len(resume_pool), 30))}
+        )
+        for _ in range(50)
+    ]
+    return {
+        "raw_jd": {"keywords": raw_keywords},
+        "raw_resume": {
+            "keywords": [kw for raw in raw_resumes for kw in raw["keywords"]] * 2
+        },
+        "raw_keywords": raw_keywords,
+        "project_output": canned_project_output(
+            "\n\n".join(f'<section category="required">\n{t}\n</section>' for t in samples["jd"])
+        ),
+        "jds": jds,
+        "resumes": resumes,
+    }
+
+
+def run(min_time: float = 1.0) -> list[BenchResult]:
+    fx = _fixtures()
+    raw_keywords = fx["raw_keywords"]
+    n_keywords = len(raw_keywords)
+
+    def fresh_keywords() -> list[JDKeyword]:
+        # dedupe는 keyword_text를 in-place로 바꾸므로 매번 새 객체
+        return [JDKeyword.model_construct(**kw) for kw in raw_keywords]
+
+    jd_priority = {"context": 0, "preferred": 1, "responsibility": 2, "required": 3}
+    resume, jd = fx["resumes"][0], fx["jds"][0]
+
+    results = [
+        bench_sync(
+            "core.dedupe_jd_keywords",
+            dedupe_jd_keywords,
+            setup=fresh_keywords,
+            min_time=min_time,
+            keywords=n_keywords,
+        ),
+        bench_sync(
+            "core.dedupe_keywords_by_priority",
+            lambda items: _dedupe_keywords_by_priority(items, jd_priority),
+            setup=fresh_keywords,
+            min_time=min_time,
+            keywords=n_keywords,
+        ),
+        bench_sync(
+            "core.jd_profile_validate",
+            lambda _: JDProfile.model_validate(fx["raw_jd"]),
+            min_time=min_time,
+            keywords=len(fx["raw_jd"]["keywords"]),
+        ),
+        bench_sync(
+            "core.resume_profile_validate",
+            lambda _: ResumeProfile.model_validate(fx["raw_resume"]),
+            min_time=min_time,
+            keywords=len(fx["raw_resume"]["keywords"]),
+        ),
+        bench_sync(
+            "core.project_output_validate",
+            lambda _: ProjectOutput.model_validate(fx["project_output"]),
+            min_time=min_time,
+        ),
+        bench_sync(
+            "core.weighted_match_score",
+            lambda _: weighted_match_score(7, 10, 2, 5),
+            min_time=min_time,
+        ),
+        bench_sync(
+            "core.compute_gap",
+            lambda _: compute_gap(resume, jd),
+            min_time=min_time,
+            resume_keywords=len(resume.keywords),
+            jd_keywords=len(jd.keywords),
+        ),
+        bench_sync(
+            "core.score_matrix_50x200",
+            lambda _: top_k(score_matrix(fx["resumes"], fx["jds"]), 5),
+            min_time=min_time,
+            warmup=2,
+            resumes=len(fx["resumes"]),
+            jds=len(fx["jds"]),
+        ),
+    ]
+    return results
@@ -0,0 +1,311 @@
+# benchmarks/fake_llm.py
+"""
+Deterministic fake chat model (네트워크 / API key 없이 파이프라인 전체를 돌리기 위한 것).
+
+- structured output: ResumeProfile / JDProfile은 입력 텍스트에서 lexicon으로 뽑은 키워드,
+  ProjectOutput은 prompt에 나온 키워드로 만든 고정 2안을 돌려준다
+  (project_agent 파이프라인의 ProjectIdeas / ArchitectureSpec / SprintPlan도 같은 2안에서 나눠 만든다).
+  같은 입력이면 항상 같은 출력 (data/samples/*.txt는 그대로 canned 응답이 된다).
+- JSON schema(dict)로 바인딩하면 astream이 키워드를 하나씩 늘려가며 누적 partial dict를 흘려준다
+  (llm.ainvoke_structured의 스트리밍 경로와 같은 모양).
+- latency: 호출마다 LatencyModel에서 뽑은 시간만큼 sleep (sync는 time.sleep, async는 asyncio.sleep).
+  per_item > 0이면 출력 키워드 1개당 그만큼 더 기다린다 (출력 길이에 비례하는 생성 시간).
+
+사용:
+    with use_fake_llm(LatencyModel.parse("lognormal:0.8,0.4")):
+        ...  # packages.core.llm을 거치는 모든 호출이 FakeChatModel로 간다
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import math
+import random
+import re
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, AsyncIterator, Iterator, Optional
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.runnables import Runnable, RunnableConfig
+from pydantic import BaseModel, ConfigDict
+
+from packages.core.llm import chat_model_factory
+from packages.tools.keyword_normalize import extract_jd_keywords, extract_resume_keywords
+
+_SECTION_RE = re.compile(r'<section category="([^"]+)">\n(.*?)\n</section>', re.DOTALL)
+# 스트리밍 시 첫 chunk까지의 시간 비율 (나머지는 키워드 수만큼 나눠서 흘림)
+FIRST_CHUNK_FRACTION = 0.3
+
+
+@dataclass
+class LatencyModel:
+    """
+    호출 1번의 지연 시간 분포 (초).
+
+    kind:
+        none: 0
+        fixed: a
+        uniform: [a, b]
+        lognormal: 중앙값 a, 로그 표준편차 b (긴 꼬리)
+    """
+
+    kind: str = "none"
+    a: float = 0.0
+    b: float = 0.0
+    seed: int = 0
+
+    def __post_init__(self) -> None:
+        if self.kind not in ("none", "fixed", "uniform", "lognormal"):
+            raise ValueError(f"unknown latency kind: {self.kind}")
+        # dataclass field가 아니라 인스턴스 속성 (pydantic이 field로 검사하지 않도록)
+        self._rng = random.Random(self.seed)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def parse(cls, spec: str, seed: int = 0) -> "LatencyModel":
+        """'none' | 'fixed:0.5' | 'uniform:0.2,0.8' | 'lognormal:0.8,0.4'."""
+        kind, _, args = spec.partition(":")
+        values = [float(v) for v in args.split(",") if v.strip()]
+        return cls(kind.strip(), *values[:2], seed=seed)
+
+    def sample(self) -> float:
+        with self._lock:
+            if self.kind == "fixed":
+                return self.a
+            if self.kind == "uniform":
+                return self._rng.uniform(self.a, self.b)
+            if self.kind == "lognormal":
+                return self.a * math.exp(self._rng.gauss(0.0, self.b))
+            return 0.0
+
+    def describe(self) -> str:
+        if self.kind == "none":
+            return "none"
+        if self.kind == "fixed":
+            return f"fixed:{self.a:g}"
+        return f"{self.kind}:{self.a:g},{self.b:g}"
+
+
+# --------- canned 응답 ---------
+
+
+def _prompt_text(messages: Any) -> str:
+    """마지막 user message의 content."""
+    if isinstance(messages, str):
+        return messages
+    for message in reversed(list(messages)):
+        if isinstance(message, BaseMessage):
+            if message.type == "human":
+                return str(message.content)
+        elif isinstance(message, dict) and message.get("role") == "user":
+            return str(message.get("content", ""))
+    return ""
+
+
+def _after_header(text: str) -> str:
+    # "Parse this Resume:\n\n{text}" 같은 지시문 줄을 떼어낸다
+    head, sep, body = text.partition("\n\n")
+    return body if sep and head.rstrip().endswith((":", ".")) else text
+
+
+@lru_cache(maxsize=4096)
+def canned_resume(text: str) -> dict:
+    body = _after_header(text)
+    return {
+        "keywords": [
+            kw.model_dump(include={"keyword_text", "evidence"})
+            for kw in extract_resume_keywords(body)
+        ]
+    }
+
+
+@lru_cache(maxsize=4096)
+def canned_jd(text: str) -> dict:
+    sections = _SECTION_RE.findall(text) or [("context", _after_header(text))]
+    return {
+        "keywords": [
+            kw.model_dump(include={"keyword_text", "category", "evidence", "gap_instruction"})
+            for category, body in sections
+            for kw in extract_jd_keywords(body, category)
+        ]
+    }
+
+
+@lru_cache(maxsize=1024)
+def canned_project_output(text: str) -> dict:
+    keywords = list(dict.fromkeys(kw["keyword_text"] for kw in canned_jd(text)["keywords"]))
+    keywords = keywords[:6] or ["python"]
+
+    def plan(n: int, focus: list[str]) -> dict:
+        return {
+            "idea": {
+                "title": f"Project {n}: {' + '.join(focus[:2])}",
+                "one_liner": f"Ship a small service built on {', '.join(focus)}",
+                "reasoning": "Covers the missing keywords with a deployable demo",
+                "covers_keywords": [{"keyword_text": k, "category": "required"} for k in focus],
+                "tech_stack": focus,
+            },
+            "architecture": {"summary": "API + worker + database", "components": focus},
+            "weekly_plan": [
+                {"day": d, "goals": [f"D{d} milestone"], "tasks": [f"task {d}"]}
+                for d in range(1, 8)
+            ],
+        }
+
+    half = max(1, len(keywords) // 2)
+    return {
+        "project_ideas": [plan(1, keywords[:half]), plan(2, keywords[half:] or keywords)],
+        "notes": "fake",
+    }
+
+
+@lru_cache(maxsize=1024)
+def canned_project_ideas(text: str) -> dict:
+    output = canned_project_output(text)
+    return {"ideas": [plan["idea"] for plan in output["project_ideas"]], "notes": output["notes"]}
+
+
+@lru_cache(maxsize=1024)
+def canned_project_idea(text: str) -> dict:
+    # 다시 만든 아이디어: 이미 쓰인 제목과 겹치지 않게 "(alt)"를 붙인다
+    idea = canned_project_ideas(text)["ideas"][-1]
+    return {**idea, "title": f"{idea['title']} (alt)"}
+
+
+@lru_cache(maxsize=1024)
+def canned_architecture(text: str) -> dict:
+    plan = canned_project_output(text)["project_ideas"][0]
+    return plan["architecture"]
+
+
+@lru_cache(maxsize=1024)
+def canned_sprint_plan(text: str) -> dict:
+    plan = canned_project_output(text)["project_ideas"][0]
+    return {
+        "weekly_plan": plan["weekly_plan"],
+        "downside": ["unfamiliar tools"],
+        "workaround": ["timebox spikes"],
+    }
+
+
+_CANNED = {
+    "ResumeProfile": canned_resume,
+    "JDProfile": canned_jd,
+    "ProjectOutput": canned_project_output,
+    "ProjectIdeas": canned_project_ideas,
+    "ProjectIdea": canned_project_idea,
+    "ArchitectureSpec": canned_architecture,
+    "SprintPlan": canned_sprint_plan,
+}
+
+
+def _schema_name(schema: Any) -> str:
+    if isinstance(schema, dict):
+        return str(schema.get("title", ""))
+    return getattr(schema, "__name__", str(schema))
+
+
+def canned_response(schema: Any, messages: Any) -> dict:
+    name = _schema_name(schema)
+    builder = _CANNED.get(name)
+    if builder is None:
+        raise ValueError(f"FakeChatModel has no canned output for schema {name!r}")
+    return builder(_prompt_text(messages))
+
+
+# --------- model ---------
+
+
+class _FakeStructured(Runnable):
+    """with_structured_output 결과. pydantic schema면 model 객체, dict schema면 dict."""
+
+    def __init__(self, model: "FakeChatModel", schema: Any) -> None:
+        self.model = model
+        self.schema = schema
+
+    def _output(self, data: dict) -> Any:
+        if isinstance(self.schema, type) and issubclass(self.schema, BaseModel):
+            return self.schema.model_validate(data)
+        return data
+
+    def invoke(self, input: Any, config: Optional[RunnableConfig] = None, **kwargs: Any) -> Any:
+        data = canned_response(self.schema, input)
+        time.sleep(self.model.delay(data))
+        self.model.count_call()
+        return self._output(data)
+
+    async def ainvoke(
+        self, input: Any, config: Optional[RunnableConfig] = None, **kwargs: Any
+    ) -> Any:
+        data = canned_response(self.schema, input)
+        await asyncio.sleep(self.model.delay(data))
+        self.model.count_call()
+        return self._output(data)
+
+    async def astream(
+        self, input: Any, config: Optional[RunnableConfig] = None, **kwargs: Any
+    ) -> AsyncIterator[Any]:
+        data = canned_response(self.schema, input)
+        delay = self.model.delay(data)
+        items = data.get("keywords")
+        await asyncio.sleep(delay * FIRST_CHUNK_FRACTION)
+        self.model.count_call()
+        if not isinstance(items, list) or not items:
+            await asyncio.sleep(delay * (1 - FIRST_CHUNK_FRACTION))
+            yield self._output(data)
+            return
+        step = delay * (1 - FIRST_CHUNK_FRACTION) / len(items)
+        for i in range(1, len(items) + 1):
+            yield {**data, "keywords": items[:i]}
+            await asyncio.sleep(step)
+
+
+class FakeChatModel(BaseChatModel):
+    """packages.core.llm의 chat model 자리에 끼우는 offline model."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    model_name: str = "fake"
+    latency: LatencyModel = LatencyModel()
+    per_item: float = 0.0
+    calls: int = 0
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-structured"
+
+    def delay(self, data: dict) -> float:
+        items = data.get("keywords") or data.get("project_ideas") or ()
+        return self.latency.sample() + self.per_item * len(items)
+
+    def count_call(self) -> None:
+        # 통계용이라 정확한 원자성은 필요 없다
+        self.calls += 1
+
+    def _generate(
+        self, messages: list[BaseMessage], stop: Optional[list[str]] = None, **kwargs: Any
+    ) -> ChatResult:
+        time.sleep(self.latency.sample())
+        self.count_call()
+        content = json.dumps(canned_resume(_prompt_text(messages)))
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=content))])
+
+    def with_structured_output(self, schema: Any, *, include_raw: bool = False, **kwargs: Any):
+        return _FakeStructured(self, schema)
+
+
+@contextmanager
+def use_fake_llm(
+    latency: Optional[LatencyModel] = None, per_item: float = 0.0
+) -> Iterator[FakeChatModel]:
+    """이 context 안에서 packages.core.llm의 모든 모델을 FakeChatModel 하나로 바꾼다."""
+    model = FakeChatModel(latency=latency or LatencyModel(), per_item=per_item)
+    with chat_model_factory(lambda name, temperature: model):
+        yield model
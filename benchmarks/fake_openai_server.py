@@ -0,0 +1,366 @@
+# benchmarks/fake_openai_server.py
+"""
+로컬 OpenAI 호환 stand-in 서버 (POST /v1/chat/completions, stdlib http.server).
+
+FakeChatModel이 chat model 자리를 바꿔 끼우는 것과 달리, 이 서버는 실제 ChatOpenAI / openai SDK /
+공용 httpx client를 그대로 거치게 한다 → packages.core.resilience의 timeout / hedge / retry /
+circuit breaker를 실제 HTTP 오류와 지연으로 시험할 수 있다.
+
+- 응답 내용: fake_llm.canned_response (response_format.json_schema.name 또는 tool 이름이 schema)
+- latency: 요청마다 LatencyModel에서 뽑은 시간만큼 기다린 뒤 응답 (stream=True면 chunk로 나눠서)
+- error_rate: 그 비율만큼 429(Retry-After 포함) / 500 / 503 중 하나로 실패
+- stall_rate: 그 비율만큼 stall초 동안 응답하지 않는다 (client timeout / hedge 시험용)
+- down_models: 이 모델 요청은 항상 503 (모델 하나의 장애 → circuit breaker / fallback model 시험용)
+- rpm_limit: 분당 요청 한도. provider처럼 초 단위로 나눠 적용한다 (1초 분량 bucket):
+  넘으면 429 + Retry-After (ratelimit scheduler 시험용)
+
+사용:
+    python -m benchmarks.fake_openai_server --port 8808 --latency lognormal:0.3,0.5 \\
+        --error-rate 0.1 --stall-rate 0.02
+    OPENAI_BASE_URL=http://127.0.0.1:8808/v1 OPENAI_API_KEY=fake uvicorn apps.api.main:app
+
+    with use_openai_server(LatencyModel.parse("fixed:0.2"), error_rate=0.2) as server:
+        ...  # packages.core.llm의 OpenAI 모델이 이 서버로 간다 (server.calls = 받은 요청 수)
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import threading
+import time
+import uuid
+from collections import Counter
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Iterable, Iterator, Optional
+
+from packages.core.llm import set_chat_model_factory
+from packages.core.resilience import reset_resilience
+
+from .fake_llm import FIRST_CHUNK_FRACTION, LatencyModel, canned_response
+
+# 스트리밍 응답 chunk 하나의 content 길이 (문자)
+STREAM_CHUNK_CHARS = 48
+_ERROR_STATUSES = (429, 500, 503)
+
+
+class FaultInjection:
+    """요청마다 지연 / 오류 / stall을 정한다 (seed로 재현 가능)."""
+
+    def __init__(
+        self,
+        latency: Optional[LatencyModel] = None,
+        error_rate: float = 0.0,
+        stall_rate: float = 0.0,
+        stall: float = 30.0,
+        retry_after: float = 0.2,
+        seed: int = 0,
+        down_models: Iterable[str] = (),
+        rpm_limit: int = 0,
+    ) -> None:
+        self.latency = latency or LatencyModel()
+        self.error_rate = error_rate
+        self.stall_rate = stall_rate
+        self.stall = stall
+        self.retry_after = retry_after
+        self.down_models = set(down_models)
+        self.rpm_limit = rpm_limit
+        # rpm_limit용 bucket (1초 분량)
+        self._level = max(1.0, rpm_limit / 60.0)
+        self._updated = time.monotonic()
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.counts: Counter[str] = Counter()
+
+    def _over_rpm(self) -> Optional[float]:
+        """RPM 한도를 넘었으면 Retry-After (초). lock 안에서 호출."""
+        if self.rpm_limit <= 0:
+            return None
+        rate = self.rpm_limit / 60.0
+        now = time.monotonic()
+        self._level = min(max(1.0, rate), self._level + (now - self._updated) * rate)
+        self._updated = now
+        if self._level < 1.0:
+            return (1.0 - self._level) / rate
+        self._level -= 1.0
+        return None
+
+    def decide(self, model: str) -> tuple[str, float]:
+        """(ok | stall | 429 | 500 | 503 | rate_limited, 기다릴 시간)."""
+        with self._lock:
+            roll = self._rng.random()
+            wait = self._over_rpm()
+            if wait is not None:
+                self.counts["requests"] += 1
+                self.counts["rate_limited"] += 1
+                return "rate_limited", wait
+            if model in self.down_models:
+                outcome = "503"
+            elif roll < self.error_rate:
+                outcome = str(self._rng.choice(_ERROR_STATUSES))
+            elif roll < self.error_rate + self.stall_rate:
+                outcome = "stall"
+            else:
+                outcome = "ok"
+            self.counts["requests"] += 1
+            self.counts[outcome] += 1
+        if outcome == "stall":
+            return outcome, self.stall
+        delay = self.latency.sample()
+        # 오류 응답은 보통 정상 응답보다 빨리 온다
+        return outcome, delay * 0.2 if outcome != "ok" else delay
+
+
+def _schema_name(body: dict) -> str:
+    response_format = body.get("response_format") or {}
+    if isinstance(response_format, dict) and response_format.get("type") == "json_schema":
+        return str(response_format.get("json_schema", {}).get("name", ""))
+    for tool in body.get("tools") or ():
+        return str(tool.get("function", {}).get("name", ""))
+    return ""
+
+
+def _usage(body: dict, content: str) -> dict:
+    # 대략적인 token 수 (4 chars / token)
+    prompt = max(1, len(json.dumps(body.get("messages", []), ensure_ascii=False)) // 4)
+    completion = max(1, len(content) // 4)
+    return {"prompt_tokens": prompt, "completion_tokens": completion,
+            "total_tokens": prompt + completion}
+
+
+def _message(body: dict, content: str) -> dict:
+    if body.get("tools"):
+        # function calling 방식: 결과는 tool call arguments로
+        return {
+            "role": "assistant",
+            "content": None,
+            "tool_calls": [{
+                "id": f"call_{uuid.uuid4().hex[:12]}",
+                "type": "function",
+                "function": {"name": _schema_name(body), "arguments": content},
+            }],
+        }
+    return {"role": "assistant", "content": content, "refusal": None}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: "FakeOpenAIServer"
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def _send_json(self, status: int, payload: dict, headers: Optional[dict] = None) -> None:
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_POST(self) -> None:
+        try:
+            self._handle()
+        except (BrokenPipeError, ConnectionResetError):
+            # client가 timeout / hedge 취소로 연결을 끊었다
+            self.close_connection = True
+
+    def _handle(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length) or b"{}")
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            self._send_json(404, {"error": {"message": f"unknown path {self.path}"}})
+            return
+        faults = self.server.faults
+        outcome, delay = faults.decide(str(body.get("model", "")))
+        if outcome == "rate_limited":
+            # provider처럼 즉시 429, Retry-After는 window가 비는 시각까지
+            error = {"message": "rate limit reached (requests per minute)",
+                     "type": "requests", "code": "rate_limit_exceeded"}
+            self._send_json(429, {"error": error}, {"Retry-After": f"{delay:.3f}"})
+            return
+        if outcome != "ok":
+            time.sleep(delay)
+            if outcome == "stall":
+                self._send_json(504, {"error": {"message": "stalled", "type": "timeout"}})
+                return
+            headers = {"Retry-After": f"{faults.retry_after:g}"} if outcome == "429" else None
+            error = {"message": f"injected {outcome}", "type": "server_error", "code": outcome}
+            self._send_json(int(outcome), {"error": error}, headers)
+            return
+
+        try:
+            content = json.dumps(canned_response({"title": _schema_name(body)},
+                                                 body.get("messages", [])))
+        except ValueError as e:
+            self._send_json(400, {"error": {"message": str(e), "type": "invalid_request_error"}})
+            return
+        completion_id = f"chatcmpl-{uuid.uuid4().hex[:12]}"
+        base = {"id": completion_id, "created": int(time.time()), "model": body.get("model")}
+        if body.get("stream"):
+            self._stream(body, base, content, delay)
+            return
+        time.sleep(delay)
+        self._send_json(200, {
+            **base,
+            "object": "chat.completion",
+            "choices": [{"index": 0, "message": _message(body, content),
+                         "finish_reason": "stop", "logprobs": None}],
+            "usage": _usage(body, content),
+        })
+
+    def _stream(self, body: dict, base: dict, content: str, delay: float) -> None:
+        pieces = [content[i:i + STREAM_CHUNK_CHARS]
+                  for i in range(0, len(content), STREAM_CHUNK_CHARS)] or [""]
+        time.sleep(delay * FIRST_CHUNK_FRACTION)
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        def send(payload: Any) -> None:
+            data = f"data: {payload if isinstance(payload, str) else json.dumps(payload)}\n\n"
+            raw = data.encode()
+            self.wfile.write(f"{len(raw):x}\r\n".encode() + raw + b"\r\n")
+            self.wfile.flush()
+
+        chunk = {**base, "object": "chat.completion.chunk"}
+        step = delay * (1 - FIRST_CHUNK_FRACTION) / len(pieces)
+        for i, piece in enumerate(pieces):
+            delta = {"content": piece}
+            if i == 0:
+                delta["role"] = "assistant"
+            send({**chunk, "choices": [{"index": 0, "delta": delta, "finish_reason": None}]})
+            time.sleep(step)
+        send({**chunk, "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}]})
+        if (body.get("stream_options") or {}).get("include_usage"):
+            send({**chunk, "choices": [], "usage": _usage(body, content)})
+        send("[DONE]")
+        self.wfile.write(b"0\r\n\r\n")
+        self.wfile.flush()
+
+
+class FakeOpenAIServer(ThreadingHTTPServer):
+    """요청마다 thread 하나 (stall이 다른 요청을 막지 않도록)."""
+
+    daemon_threads = True
+
+    def __init__(self, faults: FaultInjection, host: str = "127.0.0.1", port: int = 0) -> None:
+        super().__init__((host, port), _Handler)
+        self.faults = faults
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    @property
+    def calls(self) -> int:
+        """받은 chat completion 요청 수 (오류 / stall 포함)."""
+        return self.faults.counts["requests"]
+
+
+@contextmanager
+def serve_in_thread(faults: FaultInjection) -> Iterator[FakeOpenAIServer]:
+    """임의 port에서 서버를 background thread로 띄운다."""
+    server = FakeOpenAIServer(faults)
+    thread = threading.Thread(target=server.serve_forever, name="fake-openai", daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@contextmanager
+def use_openai_server(
+    latency: Optional[LatencyModel] = None,
+    *,
+    error_rate: float = 0.0,
+    stall_rate: float = 0.0,
+    stall: float = 30.0,
+    down_models: Iterable[str] = (),
+    rpm_limit: int = 0,
+    seed: int = 0,
+) -> Iterator[FakeOpenAIServer]:
+    """이 context 안에서 packages.core.llm의 OpenAI 모델이 로컬 stand-in 서버로 간다."""
+    faults = FaultInjection(
+        latency,
+        error_rate,
+        stall_rate,
+        stall,
+        seed=seed,
+        down_models=down_models,
+        rpm_limit=rpm_limit,
+    )
+    with serve_in_thread(faults) as server:
+        previous = {key: os.environ.get(key) for key in ("OPENAI_BASE_URL", "OPENAI_API_KEY")}
+        os.environ["OPENAI_BASE_URL"] = server.base_url
+        os.environ["OPENAI_API_KEY"] = "fake"
+        # 기본 factory(init_chat_model)로 되돌리면서 model 캐시를 비운다 → 새 base URL로 생성
+        set_chat_model_factory(None)
+        reset_resilience()
+        try:
+            yield server
+        finally:
+            for key, value in previous.items():
+                if value is None:
+                    os.environ.pop(key, None)
+                else:
+                    os.environ[key] = value
+            set_chat_model_factory(None)
+            reset_resilience()
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.fake_openai_server",
+                                     description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8808)
+    parser.add_argument("--latency", default="lognormal:0.3,0.5",
+                        help="응답 지연: none | fixed:S | uniform:A,B | lognormal:MEDIAN,SIGMA")
+    parser.add_argument("--error-rate", type=float, default=0.0,
+                        help="429 / 500 / 503으로 실패하는 비율")
+    parser.add_argument("--stall-rate", type=float, default=0.0,
+                        help="--stall초 동안 응답하지 않는 비율")
+    parser.add_argument("--stall", type=float, default=30.0)
+    parser.add_argument("--retry-after", type=float, default=0.2,
+                        help="429 응답의 Retry-After (초)")
+    parser.add_argument("--down-model", action="append", default=[],
+                        help="항상 503으로 응답할 모델 (여러 번 지정 가능)")
+    parser.add_argument("--rpm-limit", type=int, default=0,
+                        help="분당 요청 한도 (1초 분량 bucket, 넘으면 429, 0이면 없음)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    faults = FaultInjection(
+        LatencyModel.parse(args.latency, seed=args.seed),
+        args.error_rate,
+        args.stall_rate,
+        args.stall,
+        args.retry_after,
+        seed=args.seed,
+        down_models=args.down_model,
+        rpm_limit=args.rpm_limit,
+    )
+    server = FakeOpenAIServer(faults, args.host, args.port)
+    print(f"fake OpenAI server on {server.base_url} ({args.latency}, "
+          f"errors {args.error_rate:.0%}, stalls {args.stall_rate:.0%})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(dict(faults.counts))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+# benchmarks/harness.py
+"""
+측정 / 결과 저장 / baseline 비교.
+
+- bench_sync: 함수 1회 호출 단위로 반복 측정 (min_time 동안, setup은 시간에서 제외)
+- bench_async: coroutine N개를 concurrency 제한으로 동시에 실행
+- 결과: ops/sec, p50/p95/p99 (ms). JSON으로 저장하고 이전 baseline과 비교한다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import platform
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Optional
+
+import numpy as np
+
+BASELINE_VERSION = 1
+
+
+@dataclass
+class BenchResult:
+    name: str
+    ops: int
+    seconds: float
+    ops_per_sec: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    params: dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_latencies(
+        cls, name: str, latencies: list[float], seconds: float, **params: Any
+    ) -> "BenchResult":
+        p50, p95, p99 = np.percentile(np.asarray(latencies) * 1000.0, [50, 95, 99])
+        return cls(
+            name=name,
+            ops=len(latencies),
+            seconds=round(seconds, 4),
+            ops_per_sec=round(len(latencies) / seconds, 2) if seconds else 0.0,
+            p50_ms=round(float(p50), 4),
+            p95_ms=round(float(p95), 4),
+            p99_ms=round(float(p99), 4),
+            params=params,
+        )
+
+    def row(self) -> str:
+        return (
+            f"{self.name:<36} {self.ops_per_sec:>12,.1f} ops/s   "
+            f"p50 {self.p50_ms:>9.3f}  p95 {self.p95_ms:>9.3f}  p99 {self.p99_ms:>9.3f} ms"
+            f"   (n={self.ops})"
+        )
+
+
+def bench_sync(
+    name: str,
+    fn: Callable[[Any], Any],
+    *,
+    setup: Optional[Callable[[], Any]] = None,
+    min_time: float = 1.0,
+    max_ops: int = 200_000,
+    warmup: int = 20,
+    **params: Any,
+) -> BenchResult:
+    """fn(setup())을 min_time초 동안 반복. setup 시간은 측정에서 제외."""
+    for _ in range(warmup):
+        fn(setup() if setup else None)
+
+    latencies: list[float] = []
+    total = 0.0
+    while total < min_time and len(latencies) < max_ops:
+        arg = setup() if setup else None
+        start = time.perf_counter()
+        fn(arg)
+        elapsed = time.perf_counter() - start
+        latencies.append(elapsed)
+        total += elapsed
+    return BenchResult.from_latencies(name, latencies, total, **params)
+
+
+async def bench_async(
+    name: str,
+    make: Callable[[int], Awaitable[Any]],
+    *,
+    requests: int,
+    concurrency: int,
+    **params: Any,
+) -> BenchResult:
+    """make(i)로 만든 coroutine requests개를 동시에 최대 concurrency개씩 실행."""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+
+    async def one(i: int) -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            await make(i)
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(requests)))
+    seconds = time.perf_counter() - start
+    return BenchResult.from_latencies(name, latencies, seconds, concurrency=concurrency, **params)
+
+
+# --------- baseline ---------
+
+
+def save_results(results: list[BenchResult], path: Path, **meta: Any) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "version": BASELINE_VERSION,
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        **meta,
+        "results": {r.name: asdict(r) for r in results},
+    }
+    path.write_text(json.dumps(payload, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+
+
+def load_results(path: Path) -> dict[str, BenchResult]:
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    return {name: BenchResult(**data) for name, data in payload.get("results", {}).items()}
+
+
+@dataclass
+class Comparison:
+    name: str
+    ops_ratio: float  # current / baseline (1.0 미만이면 느려짐)
+    p95_ratio: float  # current / baseline (1.0 초과면 느려짐)
+    regressed: bool
+
+    def row(self) -> str:
+        flag = "REGRESSION" if self.regressed else "ok"
+        return (
+            f"{self.name:<36} ops/s x{self.ops_ratio:>6.2f}   p95 x{self.p95_ratio:>6.2f}   {flag}"
+        )
+
+
+def compare(
+    results: list[BenchResult], baseline: dict[str, BenchResult], tolerance: float = 0.2
+) -> list[Comparison]:
+    """
+    baseline에 있는 벤치마크만 비교한다.
+    ops/sec가 tolerance 이상 줄거나 p95가 tolerance 이상 늘면 regression.
+    """
+    comparisons = []
+    for result in results:
+        base = baseline.get(result.name)
+        if base is None:
+            continue
+        ops_ratio = result.ops_per_sec / base.ops_per_sec if base.ops_per_sec else 1.0
+        p95_ratio = result.p95_ms / base.p95_ms if base.p95_ms else 1.0
+        comparisons.append(
+            Comparison(
+                name=result.name,
+                ops_ratio=ops_ratio,
+                p95_ratio=p95_ratio,
+                regressed=ops_ratio < 1 - tolerance or p95_ratio > 1 + tolerance,
+            )
+        )
+    return comparisons
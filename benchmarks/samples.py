@@ -0,0 +1,59 @@
+# benchmarks/samples.py
+"""
+벤치마크 입력: data/samples/*.txt.
+
+- resume_*.txt: Resume 원문
+- jd_*.txt: JD 원문 (헤딩 기준으로 required/preferred/responsibility/context 섹션으로 나눈다)
+"""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from pathlib import Path
+
+SAMPLES_DIR = Path(__file__).resolve().parent.parent / "data" / "samples"
+
+# 헤딩 줄 → JD 카테고리 (위에서부터 먼저 맞는 것)
+_HEADINGS = (
+    (re.compile(r"^(minimum|basic|required)\s+qualifications\b", re.I), "required"),
+    (re.compile(r"^(preferred|desired|bonus)\s+qualifications\b", re.I), "preferred"),
+    (re.compile(r"^(requirements|what you.?ll need)\b", re.I), "required"),
+    (re.compile(r"^(nice to have|pluses)\b", re.I), "preferred"),
+    (re.compile(r"(responsibilities|what you.?ll do)\b", re.I), "responsibility"),
+    (re.compile(r"^(about (the job|the role|us|[A-Z]\w*)|benefits|compensation)\b", re.I), "context"),
+)
+
+
+@lru_cache(maxsize=1)
+def load_samples() -> dict[str, list[str]]:
+    """{"resume": [...], "jd": [...]} (파일명 순)."""
+    samples: dict[str, list[str]] = {"resume": [], "jd": []}
+    for path in sorted(SAMPLES_DIR.glob("*.txt")):
+        kind = "jd" if path.name.startswith("jd_") else "resume"
+        samples[kind].append(path.read_text(encoding="utf-8"))
+    if not samples["resume"] or not samples["jd"]:
+        raise FileNotFoundError(f"resume_*.txt / jd_*.txt samples not found in {SAMPLES_DIR}")
+    return samples
+
+
+def split_jd_sections(text: str) -> list[tuple[str, str]]:
+    """JD 원문 → [(category, text)]. 헤딩이 없는 앞부분은 context."""
+    sections: list[tuple[str, list[str]]] = [("context", [])]
+    for line in text.splitlines():
+        heading = line.strip().rstrip(":")
+        category = next((c for pattern, c in _HEADINGS if pattern.search(heading)), None)
+        if category is not None and len(heading) < 80:
+            sections.append((category, [line]))
+        else:
+            sections[-1][1].append(line)
+    return [
+        (category, "\n".join(lines).strip())
+        for category, lines in sections
+        if "\n".join(lines).strip()
+    ]
+
+
+def jd_inputs(text: str) -> list[dict]:
+    """/analyze request의 jd_inputs 형태."""
+    return [{"category": c, "text": t} for c, t in split_jd_sections(text)]
@@ -3,4 +3,267 @@
 Project Planner Agent.
 
 프로젝트 아이디어, 아키텍처, 7일 스프린트 계획 생성.
+검증된 missing keyword(GapSummary.validated_missing_keywords) + 유저 Preferences를 받아
+ProjectOutput(항상 2안)을 만드는 파이프라인:
+
+    project_ideation (1회, 아이디어 2개)
+      ├─ 아이디어 1: architecture ∥ sprint_plan → plan 1
+      └─ 아이디어 2: architecture ∥ sprint_plan → plan 2
+
+- 아이디어 뒤의 네 호출은 동시에 진행된다 (순차 생성 약 6번 → 왕복 2번 분량)
+- 두 제목이 겹치면(ensure_two_distinct_projects 기준) 두 번째 아이디어만 다시 만든다
+  (확장 전에 검사하므로 아키텍처 / 스프린트 계획은 버리지 않는다)
+- on_idea / on_plan으로 아이디어와 완성된 plan을 나오는 대로 넘긴다 (스트리밍용)
+- 생성 전에 유사도 캐시(packages.core.project_cache)를 본다: missing keyword 집합이 거의 같고
+  Preferences가 같은 이전 결과가 있으면 serve 모드는 그대로 돌려주고 (LLM 호출 없음),
+  seed 모드는 ideation의 few-shot 예시로 쓴다. 새로 만든 결과는 캐시에 저장한다.
+  serve 모드라도 이전 결과가 현재 missing keyword를 다 다루지 못하면 seed로 생성한다.
 """
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Optional
+
+from packages.core.project_cache import (
+    CachedProjects,
+    ProjectCacheMode,
+    current_mode,
+    get_project_cache,
+)
+from packages.core.schemas import (
+    ArchitectureSpec,
+    GapSummary,
+    Preferences,
+    ProjectIdea,
+    ProjectIdeas,
+    ProjectOutput,
+    ProjectPlan,
+    SprintPlan,
+)
+from packages.core.schemas.project import title_key
+from packages.core.tracing import annotate, instrumented
+from packages.tools.architecture import adesign_architecture, design_architecture
+from packages.tools.project_ideation import (
+    aideate_projects,
+    aregenerate_idea,
+    ideate_projects,
+    regenerate_idea,
+)
+from packages.tools.sprint_plan import aplan_sprint, plan_sprint
+
+# 제목이 겹친 아이디어를 다시 만드는 최대 횟수
+MAX_TITLE_RETRIES = 2
+
+# (plan index, 결과)를 받는 callback
+IdeaCallback = Callable[[int, ProjectIdea], None]
+PlanCallback = Callable[[int, ProjectPlan], None]
+
+
+def _duplicate_index(ideas: list[ProjectIdea]) -> Optional[int]:
+    """앞의 아이디어와 제목이 같은 첫 아이디어의 index (없으면 None)."""
+    seen: set[str] = set()
+    for i, idea in enumerate(ideas):
+        key = title_key(idea.title)
+        if key in seen:
+            return i
+        seen.add(key)
+    return None
+
+
+def _taken_titles(ideas: list[ProjectIdea], index: int) -> list[str]:
+    return [idea.title for i, idea in enumerate(ideas) if i != index]
+
+
+def _distinct_ideas(
+    gap: GapSummary, preferences: Optional[Preferences], result: ProjectIdeas
+) -> list[ProjectIdea]:
+    ideas = list(result.ideas)
+    for retry in range(MAX_TITLE_RETRIES + 1):
+        index = _duplicate_index(ideas)
+        if index is None:
+            annotate(title_retries=retry)
+            return ideas
+        if retry == MAX_TITLE_RETRIES:
+            break
+        ideas[index] = regenerate_idea(
+            gap, preferences, ideas[index], _taken_titles(ideas, index)
+        )
+    raise ValueError("project_ideas must contain two distinct project titles")
+
+
+async def _adistinct_ideas(
+    gap: GapSummary, preferences: Optional[Preferences], result: ProjectIdeas
+) -> list[ProjectIdea]:
+    ideas = list(result.ideas)
+    for retry in range(MAX_TITLE_RETRIES + 1):
+        index = _duplicate_index(ideas)
+        if index is None:
+            annotate(title_retries=retry)
+            return ideas
+        if retry == MAX_TITLE_RETRIES:
+            break
+        ideas[index] = await aregenerate_idea(
+            gap, preferences, ideas[index], _taken_titles(ideas, index)
+        )
+    raise ValueError("project_ideas must contain two distinct project titles")
+
+
+def _missing_keys(gap: GapSummary) -> list[str]:
+    return [kw.keyword_text for kw in gap.validated_missing_keywords]
+
+
+def _cache_lookup(
+    gap: GapSummary, preferences: Optional[Preferences]
+) -> tuple[ProjectCacheMode, Optional[CachedProjects]]:
+    """(캐시 모드, 비슷한 gap의 이전 결과)."""
+    mode = current_mode()
+    if mode == "off":
+        return mode, None
+    hit = get_project_cache().lookup(_missing_keys(gap), preferences)
+    if hit is not None and mode == "serve" and not _servable(gap, hit):
+        mode = "seed"
+    if hit is None:
+        annotate(project_cache="miss")
+    else:
+        annotate(project_cache=mode, project_cache_similarity=round(hit.similarity, 3))
+    return mode, hit
+
+
+def _servable(gap: GapSummary, hit: CachedProjects) -> bool:
+    """
+    캐시 결과를 그대로 돌려줘도 되는지.
+    keyword 집합이 같거나, 현재 missing을 빠짐없이 다루면서 이제 missing이 아닌 키워드가 없어야 한다
+    (아이디어 설명 / 아키텍처 / 주간 계획은 covers_keywords처럼 좁힐 수 없다).
+    """
+    missing = frozenset(_missing_keys(gap))
+    if hit.keywords == missing:
+        return True
+    covered = {
+        kw.keyword_text for plan in hit.output.project_ideas for kw in plan.idea.covers_keywords
+    }
+    return hit.keywords <= missing and missing <= covered
+
+
+def _seed(hit: Optional[CachedProjects]) -> dict:
+    """seed 모드: 캐시 결과의 아이디어를 ideation few-shot 예시로."""
+    if hit is None:
+        return {}
+    ideas = ProjectIdeas(
+        ideas=[plan.idea for plan in hit.output.project_ideas], notes=hit.output.notes
+    )
+    return {"example": ideas, "example_keywords": sorted(hit.keywords)}
+
+
+def _serve(
+    gap: GapSummary,
+    hit: CachedProjects,
+    on_idea: Optional[IdeaCallback],
+    on_plan: Optional[PlanCallback],
+) -> ProjectOutput:
+    """
+    serve 모드: 캐시 결과를 현재 gap에 맞춘다.
+    covers_keywords는 지금도 missing인 키워드만 남기고 category도 현재 gap 기준으로.
+    """
+    missing = {kw.keyword_text: kw for kw in gap.validated_missing_keywords}
+    plans = []
+    for i, plan in enumerate(hit.output.project_ideas):
+        covers = [
+            missing[kw.keyword_text]
+            for kw in plan.idea.covers_keywords
+            if kw.keyword_text in missing
+        ]
+        idea = plan.idea.model_copy(update={"covers_keywords": covers})
+        plan = plan.model_copy(update={"idea": idea})
+        if on_idea is not None:
+            on_idea(i, plan.idea)
+        if on_plan is not None:
+            on_plan(i, plan)
+        plans.append(plan)
+    return hit.output.model_copy(update={"project_ideas": plans})
+
+
+def _plan(idea: ProjectIdea, architecture: ArchitectureSpec, sprint: SprintPlan) -> ProjectPlan:
+    return ProjectPlan(
+        idea=idea,
+        architecture=architecture,
+        weekly_plan=sprint.weekly_plan,
+        downside=sprint.downside,
+        workaround=sprint.workaround,
+    )
+
+
+@instrumented("tool", "project_generate")
+def generate_projects(
+    gap: GapSummary,
+    preferences: Optional[Preferences] = None,
+    *,
+    on_idea: Optional[IdeaCallback] = None,
+    on_plan: Optional[PlanCallback] = None,
+) -> ProjectOutput:
+    """검증된 missing keyword + Preferences → 프로젝트 2안 (아이디어별 확장은 thread 병렬)."""
+    mode, hit = _cache_lookup(gap, preferences)
+    if hit is not None and mode == "serve":
+        return _serve(gap, hit, on_idea, on_plan)
+    result = ideate_projects(gap, preferences, **_seed(hit))
+    ideas = _distinct_ideas(gap, preferences, result)
+    if on_idea is not None:
+        for i, idea in enumerate(ideas):
+            on_idea(i, idea)
+
+    parts: list[dict] = [{} for _ in ideas]
+    plans: list[Optional[ProjectPlan]] = [None] * len(ideas)
+    with ThreadPoolExecutor(max_workers=2 * len(ideas)) as pool:
+        futures = {}
+        for i, idea in enumerate(ideas):
+            for part, fn in (("architecture", design_architecture), ("sprint", plan_sprint)):
+                ctx = contextvars.copy_context()
+                futures[pool.submit(ctx.run, fn, idea, preferences)] = (i, part)
+        # callback은 호출한 thread에서 plan이 완성되는 순서대로
+        for future in as_completed(futures):
+            i, part = futures[future]
+            parts[i][part] = future.result()
+            if len(parts[i]) == 2:
+                plans[i] = _plan(ideas[i], parts[i]["architecture"], parts[i]["sprint"])
+                if on_plan is not None:
+                    on_plan(i, plans[i])
+    output = ProjectOutput(project_ideas=plans, notes=result.notes)
+    if mode != "off":
+        get_project_cache().put(_missing_keys(gap), preferences, output)
+    return output
+
+
+@instrumented("tool", "project_generate")
+async def agenerate_projects(
+    gap: GapSummary,
+    preferences: Optional[Preferences] = None,
+    *,
+    on_idea: Optional[IdeaCallback] = None,
+    on_plan: Optional[PlanCallback] = None,
+) -> ProjectOutput:
+    """generate_projects의 async 버전 (아이디어별 architecture / sprint_plan을 동시에)."""
+    mode, hit = _cache_lookup(gap, preferences)
+    if hit is not None and mode == "serve":
+        return _serve(gap, hit, on_idea, on_plan)
+    result = await aideate_projects(gap, preferences, **_seed(hit))
+    ideas = await _adistinct_ideas(gap, preferences, result)
+    if on_idea is not None:
+        for i, idea in enumerate(ideas):
+            on_idea(i, idea)
+
+    async def expand(i: int, idea: ProjectIdea) -> ProjectPlan:
+        architecture, sprint = await asyncio.gather(
+            adesign_architecture(idea, preferences), aplan_sprint(idea, preferences)
+        )
+        plan = _plan(idea, architecture, sprint)
+        if on_plan is not None:
+            on_plan(i, plan)
+        return plan
+
+    plans = await asyncio.gather(*(expand(i, idea) for i, idea in enumerate(ideas)))
+    output = ProjectOutput(project_ideas=list(plans), notes=result.notes)
+    if mode != "off":
+        await asyncio.to_thread(get_project_cache().put, _missing_keys(gap), preferences, output)
+    return output
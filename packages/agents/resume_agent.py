@@ -8,9 +8,9 @@ Uses create_react_agent with jd_parse_tool.
 
 from __future__ import annotations
 
-from langchain.chat_models import init_chat_model
 from langgraph.prebuilt import create_react_agent
 
+from packages.core.llm import ScheduledChatModel
 from packages.tools.jd_parse import jd_parse_tool
 from packages.tools.resume_parse import resume_parse_tool
 
@@ -43,7 +43,8 @@ def create_resume_agent():
     Returns:
         CompiledGraph: A LangGraph agent that can parse JDs and analyze resumes
     """
-    llm = init_chat_model("gpt-4o-mini", temperature=0.1)
+    # agent step도 scheduler permit / 동시성 슬롯 / resilience를 거친다
+    llm = ScheduledChatModel(model="gpt-4o-mini", temperature=0.1)
 
     agent = create_react_agent(llm, tools=TOOLS, prompt=AGENT_PROMPT)
 
@@ -0,0 +1,297 @@
+# packages/core/cache.py
+"""
+파싱 결과 캐시.
+
+resume_parse_tool / jd_parse_tool의 LLM 결과를 content-addressed key로 저장한다.
+- 1단계: in-process LRU (hit 시 sub-millisecond)
+- 2단계: 로컬 SQLite (프로세스 재시작/다른 worker 간 공유)
+
+key = sha256(model, prompt_version, norm_text(text))
+"""
+
+from __future__ import annotations
+
+import contextvars
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Generic, Iterable, Iterator, Optional, TypeVar
+
+from pydantic import BaseModel
+
+from .metrics import Sample, register_collector
+from .schemas.utils import norm_text
+from .storage import data_path
+
+TModel = TypeVar("TModel", bound=BaseModel)
+
+# 환경변수 설정값
+CACHE_MAX_ENTRIES = int(os.getenv("PARSE_CACHE_MAX_ENTRIES", "1024"))
+CACHE_MAX_DISK_ENTRIES = int(os.getenv("PARSE_CACHE_MAX_DISK_ENTRIES", "50000"))
+CACHE_TTL_SECONDS = float(os.getenv("PARSE_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+CACHE_DISK_ENABLED = os.getenv("PARSE_CACHE_DISK", "1") != "0"
+CACHE_BYPASS = os.getenv("PARSE_CACHE_BYPASS", "0") == "1"
+
+_bypass_var: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "parse_cache_bypass", default=False
+)
+
+
+def prompt_fingerprint(prompt: str) -> str:
+    """SYSTEM_PROMPT 내용 기반 버전 문자열 (프롬프트 수정 시 자동으로 캐시 무효화)."""
+    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:12]
+
+
+def content_key(payload: str | dict, *, prompt_version: str, model: str) -> str:
+    """
+    입력 텍스트의 content-addressed key.
+    공백 차이만 있는 입력은 같은 key를 가진다.
+    dict 입력(섹션별 JD)은 섹션 순서와 무관하게 같은 key를 가진다.
+    """
+    if isinstance(payload, dict):
+        text = json.dumps(
+            {str(k): norm_text(str(v)) for k, v in payload.items()},
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+    else:
+        text = norm_text(payload)
+    raw = "\x00".join((model, prompt_version, text))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+@contextmanager
+def bypass_cache() -> Iterator[None]:
+    """이 context 안에서의 파싱 호출은 캐시를 읽지도 쓰지도 않는다."""
+    token = _bypass_var.set(True)
+    try:
+        yield
+    finally:
+        _bypass_var.reset(token)
+
+
+def cache_bypassed() -> bool:
+    return CACHE_BYPASS or _bypass_var.get()
+
+
+@dataclass
+class CacheStats:
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.memory_hits + self.disk_hits + self.misses
+        return (self.memory_hits + self.disk_hits) / total if total else 0.0
+
+    def as_dict(self) -> dict:
+        return {**asdict(self), "hit_rate": round(self.hit_rate, 4)}
+
+
+class ParseCache(Generic[TModel]):
+    """
+    Pydantic 모델(ResumeProfile/JDProfile) 2단계 캐시.
+
+    - 메모리 tier: 검증된 모델 객체를 그대로 보관 (역직렬화 비용 없음)
+    - 디스크 tier: JSON으로 저장, hit 시 메모리 tier로 승격
+    - 두 tier 모두 TTL/개수 기준으로 evict
+    """
+
+    def __init__(
+        self,
+        schema: type[TModel],
+        namespace: str,
+        *,
+        max_entries: int = CACHE_MAX_ENTRIES,
+        max_disk_entries: int = CACHE_MAX_DISK_ENTRIES,
+        ttl_seconds: float = CACHE_TTL_SECONDS,
+        db_path: Optional[Path | str] = None,
+        disk_enabled: bool = CACHE_DISK_ENABLED,
+    ) -> None:
+        self.schema = schema
+        self.namespace = namespace
+        self.max_entries = max_entries
+        self.max_disk_entries = max_disk_entries
+        self.ttl_seconds = ttl_seconds
+        self.stats = CacheStats()
+
+        self._memory: OrderedDict[str, tuple[float, TModel]] = OrderedDict()
+        self._lock = threading.Lock()
+
+        self._db_path = db_path
+        self._disk_enabled = disk_enabled
+        self._conn: Optional[sqlite3.Connection] = None
+        self._writes_since_prune = 0
+        _instances.add(self)
+
+    # --------- public API ---------
+
+    def get(self, key: str) -> Optional[TModel]:
+        """캐시된 모델을 반환 (없거나 만료되면 None, bypass 중이면 항상 None)."""
+        if cache_bypassed():
+            return None
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > now:
+                    self._memory.move_to_end(key)
+                    self.stats.memory_hits += 1
+                    return value
+                del self._memory[key]
+                self.stats.evictions += 1
+
+        value = self._disk_get(key, now)
+        if value is None:
+            with self._lock:
+                self.stats.misses += 1
+            return None
+
+        with self._lock:
+            self.stats.disk_hits += 1
+            self._memory_put(key, value, now)
+        return value
+
+    def set(self, key: str, value: TModel) -> None:
+        if cache_bypassed():
+            return
+        now = time.time()
+        with self._lock:
+            self._memory_put(key, value, now)
+        self._disk_set(key, value, now)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            conn = self._connection()
+            if conn is not None:
+                conn.execute("DELETE FROM parse_cache WHERE namespace = ?", (self.namespace,))
+                conn.commit()
+
+    # --------- memory tier ---------
+
+    def _memory_put(self, key: str, value: TModel, now: float) -> None:
+        # lock을 잡은 상태에서 호출
+        self._memory[key] = (now + self.ttl_seconds, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self.stats.evictions += 1
+
+    # --------- disk tier ---------
+
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        if not self._disk_enabled:
+            return None
+        if self._conn is None:
+            path = self._db_path or data_path("parse_cache.sqlite3")
+            conn = sqlite3.connect(str(path), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS parse_cache (
+                    key TEXT PRIMARY KEY,
+                    namespace TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    created_at REAL NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_parse_cache_ns_created "
+                "ON parse_cache (namespace, created_at)"
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def _disk_get(self, key: str, now: float) -> Optional[TModel]:
+        with self._lock:
+            conn = self._connection()
+            if conn is None:
+                return None
+            row = conn.execute(
+                "SELECT value, created_at FROM parse_cache WHERE key = ? AND namespace = ?",
+                (key, self.namespace),
+            ).fetchone()
+            if row is None:
+                return None
+            value, created_at = row
+            if created_at + self.ttl_seconds <= now:
+                conn.execute("DELETE FROM parse_cache WHERE key = ?", (key,))
+                conn.commit()
+                self.stats.evictions += 1
+                return None
+        return self.schema.model_validate_json(value)
+
+    def _disk_set(self, key: str, value: TModel, now: float) -> None:
+        payload = value.model_dump_json()
+        with self._lock:
+            conn = self._connection()
+            if conn is None:
+                return
+            conn.execute(
+                "INSERT OR REPLACE INTO parse_cache (key, namespace, value, created_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, self.namespace, payload, now),
+            )
+            self._writes_since_prune += 1
+            if self._writes_since_prune >= 100:
+                self._prune(conn, now)
+            conn.commit()
+
+    def _prune(self, conn: sqlite3.Connection, now: float) -> None:
+        """만료 항목 삭제 + max_disk_entries 초과분을 오래된 순으로 삭제."""
+        self._writes_since_prune = 0
+        cur = conn.execute(
+            "DELETE FROM parse_cache WHERE namespace = ? AND created_at <= ?",
+            (self.namespace, now - self.ttl_seconds),
+        )
+        cur2 = conn.execute(
+            """
+            DELETE FROM parse_cache WHERE key IN (
+                SELECT key FROM parse_cache WHERE namespace = ?
+                ORDER BY created_at DESC LIMIT -1 OFFSET ?
+            )
+            """,
+            (self.namespace, self.max_disk_entries),
+        )
+        self.stats.evictions += max(cur.rowcount, 0) + max(cur2.rowcount, 0)
+
+
+# /metrics: scrape 시점에 살아있는 캐시들의 카운터를 읽는다
+_instances: "weakref.WeakSet[ParseCache]" = weakref.WeakSet()
+
+
+def _collect() -> Iterable[Sample]:
+    for cache in list(_instances):
+        stats = cache.stats
+        labels = (("namespace", cache.namespace),)
+        for tier, hits in (("memory", stats.memory_hits), ("disk", stats.disk_hits)):
+            yield Sample(
+                "orchestrator_parse_cache_hits_total",
+                "counter",
+                "Parse cache hits",
+                labels + (("tier", tier),),
+                hits,
+            )
+        for name, kind, help, value in (
+            ("misses_total", "counter", "Parse cache misses", stats.misses),
+            ("evictions_total", "counter", "Parse cache evictions", stats.evictions),
+            ("hit_ratio", "gauge", "Parse cache hit ratio", stats.hit_rate),
+        ):
+            yield Sample(f"orchestrator_parse_cache_{name}", kind, help, labels, value)
+
+
+register_collector(_collect)
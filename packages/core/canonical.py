@@ -0,0 +1,162 @@
+# packages/core/canonical.py
+"""
+키워드 canonicalization index.
+
+- exact lookup: canonical/별칭/표기 변형 → canonical (dict, O(1))
+- squash lookup: 공백/하이픈/점 차이 흡수 ("scikit learn", "scikit_learn" → scikit-learn)
+- fuzzy fallback: SymSpell 방식 deletion index로 편집거리 제한 내 오타 보정.
+  길이가 같고 첫 / 마지막 글자가 같은 후보(단어 안쪽의 치환 / 자리 바뀜)만 받는다.
+  글자가 더 붙거나 빠진 이름은 별개 기술인 경우가 많아서 보정하지 않는다
+  (fastai ≠ fastapi, pydantic-ai ≠ pydantic, terraformer ≠ terraform, opencl ≠ opencv).
+  lexicon.DISTINCT_TERMS의 별개 기술명도 그대로 둔다 (nuxt.js ≠ next.js)
+
+ResumeProfile/JDProfile validator(dedupe_*_keywords)에서 키워드당 한 번만 적용되므로
+gap 계산 단계에서는 문자열 비교만 하면 된다.
+"""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from itertools import combinations
+from typing import Iterable, Optional
+
+from .lexicon import ALIASES, DISTINCT_TERMS, SURFACE_FORMS, TERMS
+
+_SQUASH_RE = re.compile(r"[\s\-_.]+")
+
+# fuzzy 보정을 시도할 최소 길이 (짧은 단어는 오탐이 많음: java ↔ lava)
+MIN_FUZZY_LENGTH = 6
+# 이 길이 이상이면 편집거리 2까지 허용
+LONG_TERM_LENGTH = 10
+
+
+def squash(term: str) -> str:
+    """공백/하이픈/밑줄/점을 제거한 비교용 key."""
+    return _SQUASH_RE.sub("", term)
+
+
+def _deletes(term: str, max_distance: int) -> set[str]:
+    """term에서 최대 max_distance개 문자를 지운 모든 문자열 (SymSpell)."""
+    out = {term}
+    for d in range(1, min(max_distance, len(term) - 1) + 1):
+        for idx in combinations(range(len(term)), d):
+            out.add("".join(ch for i, ch in enumerate(term) if i not in idx))
+    return out
+
+
+def _edit_distance(a: str, b: str, limit: int) -> int:
+    """Damerau-Levenshtein(OSA) 거리. limit 초과 시 limit + 1 반환."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    prev2: list[int] = []
+    prev = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        cur = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            cur[j] = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                cur[j] = min(cur[j], prev2[j - 2] + 1)
+        if min(cur) > limit:
+            return limit + 1
+        prev2, prev = prev, cur
+    return prev[-1]
+
+
+def _interior_typo(key: str, candidate: str) -> bool:
+    """key가 candidate의 안쪽 글자 치환 / 자리 바뀜일 수 있는지 (접두사 / 접미사 변형 제외)."""
+    if len(key) != len(candidate) or key[0] != candidate[0]:
+        return False
+    # 마지막 글자가 다르면 끝 두 글자의 자리 바뀜만 (opencl ≠ opencv)
+    return key[-1] == candidate[-1] or key[-2:] == candidate[:-3:-1]
+
+
+def _max_distance(term: str) -> int:
+    if len(term) < MIN_FUZZY_LENGTH:
+        return 0
+    return 2 if len(term) >= LONG_TERM_LENGTH else 1
+
+
+class CanonicalIndex:
+    """별칭/표기 변형/오타 → canonical keyword 매핑 (빌드 1회, 조회 O(1) + bounded fuzzy)."""
+
+    def __init__(
+        self,
+        canonicals: Iterable[str],
+        aliases: dict[str, str],
+        distinct: Iterable[str] = (),
+    ) -> None:
+        self._exact: dict[str, str] = {}
+        self._squashed: dict[str, str] = {}
+        self._deletes: dict[str, set[str]] = {}
+        # fuzzy 보정 대상이 아닌 별개 기술명 (squash key)
+        self._distinct = frozenset(squash(term) for term in distinct)
+
+        for term in canonicals:
+            self._add(term, term)
+        for alias, term in aliases.items():
+            self._add(alias.lower(), term)
+
+    def _add(self, form: str, canonical: str) -> None:
+        self._exact.setdefault(form, canonical)
+        key = squash(form)
+        self._squashed.setdefault(key, canonical)
+        for deleted in _deletes(key, _max_distance(key)):
+            self._deletes.setdefault(deleted, set()).add(key)
+
+    def lookup(self, term: str) -> Optional[str]:
+        """term의 canonical (모르는 키워드면 None). term은 소문자/공백 정리된 상태여야 한다."""
+        hit = self._exact.get(term)
+        if hit is not None:
+            return hit
+        key = squash(term)
+        hit = self._squashed.get(key)
+        if hit is not None:
+            return hit
+        if key in self._distinct:
+            return None
+        return self._fuzzy(key)
+
+    def _fuzzy(self, key: str) -> Optional[str]:
+        limit = _max_distance(key)
+        if not limit:
+            return None
+        best: Optional[str] = None
+        best_distance = limit + 1
+        ambiguous = False
+        seen: set[str] = set()
+        for deleted in _deletes(key, limit):
+            for candidate in self._deletes.get(deleted, ()):
+                if candidate in seen or not _interior_typo(key, candidate):
+                    continue
+                seen.add(candidate)
+                distance = _edit_distance(key, candidate, limit)
+                canonical = self._squashed[candidate]
+                if distance < best_distance:
+                    best, best_distance, ambiguous = canonical, distance, False
+                elif distance == best_distance and canonical != best:
+                    ambiguous = True
+        if best is None or ambiguous:
+            return None
+        return best
+
+
+@lru_cache(maxsize=1)
+def get_index() -> CanonicalIndex:
+    """프로세스당 한 번만 index를 빌드 (lexicon + 표기 변형 + 별칭)."""
+    canonicals = [term for terms in TERMS.values() for term in terms]
+    aliases = dict(ALIASES)
+    for term, forms in SURFACE_FORMS.items():
+        for form in forms:
+            aliases.setdefault(form.lower(), term)
+    return CanonicalIndex(canonicals, aliases, DISTINCT_TERMS)
+
+
+@lru_cache(maxsize=65536)
+def canonicalize(term: str) -> str:
+    """
+    정규화된(소문자, 공백 정리) 키워드 → canonical.
+    lexicon에 없는 키워드는 그대로 반환.
+    """
+    return get_index().lookup(term) or term
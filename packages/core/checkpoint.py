@@ -0,0 +1,421 @@
+# packages/core/checkpoint.py
+"""
+LangGraph checkpointer (로컬 SQLite) + 세션 TTL.
+
+ProjectState를 superstep마다 저장해서, User Interrupt(키워드 검토) 뒤에 파싱을 다시 하지 않고
+같은 thread_id(= 세션 ID)로 그래프를 이어서 실행할 수 있게 한다.
+
+- checkpoint / pending write는 graph serde(JsonPlusSerializer)로 직렬화해 BLOB으로 저장한다.
+- 세션(thread)마다 마지막 접근 시각을 기록하고, SESSION_TTL_SECONDS 동안 쓰이지 않은 세션은
+  write 100번마다 한 번씩 통째로 지운다.
+- langgraph-checkpoint-sqlite의 SqliteSaver와 같은 역할이지만 추가 의존성 없이
+  ParseCache / DocStore와 같은 방식(WAL, lock, check_same_thread=False)으로 구현.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import random
+import sqlite3
+import threading
+import time
+from collections.abc import AsyncIterator, Iterable, Iterator, Sequence
+from pathlib import Path
+from typing import Any, Optional
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    get_checkpoint_id,
+    get_checkpoint_metadata,
+)
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+from . import schemas
+from .metrics import Sample, register_collector
+from .storage import data_path
+
+# 환경변수 설정값
+SESSION_TTL_SECONDS = float(os.getenv("SESSION_TTL_SECONDS", str(24 * 3600)))
+
+# checkpoint에서 역직렬화를 허용할 state 타입 (msgpack allowlist)
+STATE_TYPES = tuple(
+    (cls.__module__, cls.__name__)
+    for cls in (getattr(schemas, name) for name in schemas.__all__)
+)
+
+
+class SqliteCheckpointSaver(BaseCheckpointSaver[str]):
+    """thread_id(세션) 단위로 checkpoint를 저장하는 SQLite checkpointer."""
+
+    def __init__(
+        self, db_path: Optional[Path | str] = None, *, ttl_seconds: float = SESSION_TTL_SECONDS
+    ) -> None:
+        super().__init__(serde=JsonPlusSerializer(allowed_msgpack_modules=STATE_TYPES))
+        self.ttl_seconds = ttl_seconds
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._writes_since_prune = 0
+        self._conn = sqlite3.connect(
+            str(db_path or data_path("sessions.sqlite3")), check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS sessions (
+                thread_id TEXT PRIMARY KEY,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_sessions_accessed ON sessions (accessed_at);
+            CREATE TABLE IF NOT EXISTS checkpoints (
+                thread_id TEXT NOT NULL,
+                checkpoint_ns TEXT NOT NULL DEFAULT '',
+                checkpoint_id TEXT NOT NULL,
+                parent_checkpoint_id TEXT,
+                type TEXT,
+                checkpoint BLOB,
+                metadata_type TEXT,
+                metadata BLOB,
+                PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id)
+            );
+            CREATE TABLE IF NOT EXISTS writes (
+                thread_id TEXT NOT NULL,
+                checkpoint_ns TEXT NOT NULL DEFAULT '',
+                checkpoint_id TEXT NOT NULL,
+                task_id TEXT NOT NULL,
+                idx INTEGER NOT NULL,
+                channel TEXT NOT NULL,
+                type TEXT,
+                value BLOB,
+                task_path TEXT NOT NULL DEFAULT '',
+                PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, idx)
+            );
+            """
+        )
+        self._conn.commit()
+
+    # --------- 읽기 ---------
+
+    def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        checkpoint_id = get_checkpoint_id(config)
+        query = (
+            "SELECT thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, type, "
+            "checkpoint, metadata_type, metadata FROM checkpoints "
+            "WHERE thread_id = ? AND checkpoint_ns = ?"
+        )
+        params: tuple = (thread_id, checkpoint_ns)
+        if checkpoint_id:
+            query += " AND checkpoint_id = ?"
+            params += (checkpoint_id,)
+        else:
+            query += " ORDER BY checkpoint_id DESC LIMIT 1"
+        with self._lock:
+            row = self._conn.execute(query, params).fetchone()
+            if row is None:
+                return None
+            self._touch(thread_id)
+            writes = self._writes(row[0], row[1], row[2])
+        return self._tuple(row, writes)
+
+    def list(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[CheckpointTuple]:
+        clauses: list[str] = []
+        params: list[Any] = []
+        if config is not None:
+            clauses.append("thread_id = ?")
+            params.append(config["configurable"]["thread_id"])
+            checkpoint_ns = config["configurable"].get("checkpoint_ns")
+            if checkpoint_ns is not None:
+                clauses.append("checkpoint_ns = ?")
+                params.append(checkpoint_ns)
+            if checkpoint_id := get_checkpoint_id(config):
+                clauses.append("checkpoint_id = ?")
+                params.append(checkpoint_id)
+        if before is not None and (before_id := get_checkpoint_id(before)):
+            clauses.append("checkpoint_id < ?")
+            params.append(before_id)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, type, "
+                f"checkpoint, metadata_type, metadata FROM checkpoints{where} "
+                "ORDER BY checkpoint_id DESC",
+                params,
+            ).fetchall()
+        for row in rows:
+            if limit is not None and limit <= 0:
+                break
+            # metadata filter는 역직렬화 후 비교 (세션당 checkpoint 수가 적다)
+            metadata = self.serde.loads_typed((row[6], row[7]))
+            if filter and not all(metadata.get(k) == v for k, v in filter.items()):
+                continue
+            if limit is not None:
+                limit -= 1
+            with self._lock:
+                writes = self._writes(row[0], row[1], row[2])
+            yield self._tuple(row, writes, metadata)
+
+    def _writes(self, thread_id: str, checkpoint_ns: str, checkpoint_id: str) -> list[tuple]:
+        # get_delta_channel_history가 writes_sort_key 순서(task_path, task_id, idx)를 기대한다
+        return self._conn.execute(
+            "SELECT task_id, channel, type, value FROM writes "
+            "WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ? "
+            "ORDER BY task_path, task_id, idx",
+            (thread_id, checkpoint_ns, checkpoint_id),
+        ).fetchall()
+
+    def _tuple(
+        self, row: tuple, writes: list[tuple], metadata: Optional[CheckpointMetadata] = None
+    ) -> CheckpointTuple:
+        thread_id, checkpoint_ns, checkpoint_id, parent_id, type_, blob, meta_type, meta = row
+        return CheckpointTuple(
+            config={
+                "configurable": {
+                    "thread_id": thread_id,
+                    "checkpoint_ns": checkpoint_ns,
+                    "checkpoint_id": checkpoint_id,
+                }
+            },
+            checkpoint=self.serde.loads_typed((type_, blob)),
+            metadata=metadata if metadata is not None else self.serde.loads_typed((meta_type, meta)),
+            parent_config=(
+                {
+                    "configurable": {
+                        "thread_id": thread_id,
+                        "checkpoint_ns": checkpoint_ns,
+                        "checkpoint_id": parent_id,
+                    }
+                }
+                if parent_id
+                else None
+            ),
+            pending_writes=[
+                (task_id, channel, self.serde.loads_typed((wtype, value)))
+                for task_id, channel, wtype, value in writes
+            ],
+        )
+
+    # --------- 쓰기 ---------
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        type_, blob = self.serde.dumps_typed(checkpoint)
+        meta_type, meta = self.serde.dumps_typed(get_checkpoint_metadata(config, metadata))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO checkpoints (thread_id, checkpoint_ns, checkpoint_id, "
+                "parent_checkpoint_id, type, checkpoint, metadata_type, metadata) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    thread_id,
+                    checkpoint_ns,
+                    checkpoint["id"],
+                    config["configurable"].get("checkpoint_id"),
+                    type_,
+                    blob,
+                    meta_type,
+                    meta,
+                ),
+            )
+            self._touch(thread_id)
+            self._after_write()
+        return {
+            "configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": checkpoint["id"],
+            }
+        }
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        checkpoint_id = config["configurable"]["checkpoint_id"]
+        # 특수 channel(__error__, __interrupt__ ...)은 덮어쓰고, 일반 write는 처음 것을 유지
+        verb = "REPLACE" if all(channel in WRITES_IDX_MAP for channel, _ in writes) else "IGNORE"
+        rows = [
+            (
+                thread_id,
+                checkpoint_ns,
+                checkpoint_id,
+                task_id,
+                WRITES_IDX_MAP.get(channel, idx),
+                channel,
+                *self.serde.dumps_typed(value),
+                task_path,
+            )
+            for idx, (channel, value) in enumerate(writes)
+        ]
+        with self._lock:
+            self._conn.executemany(
+                f"INSERT OR {verb} INTO writes (thread_id, checkpoint_ns, checkpoint_id, "
+                "task_id, idx, channel, type, value, task_path) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._touch(thread_id)
+            self._after_write()
+
+    def delete_thread(self, thread_id: str) -> None:
+        with self._lock:
+            self._delete_threads([thread_id])
+            self._conn.commit()
+
+    def get_next_version(self, current: Optional[str], channel: None) -> str:
+        # InMemorySaver와 같은 형식 ("{n:032}.{random:016}")
+        if current is None:
+            current_v = 0
+        elif isinstance(current, int):
+            current_v = current
+        else:
+            current_v = int(current.split(".")[0])
+        return f"{current_v + 1:032}.{random.random():016}"
+
+    # --------- async (SQLite 호출은 thread에서) ---------
+
+    async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        return await asyncio.to_thread(self.get_tuple, config)
+
+    async def alist(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        items = await asyncio.to_thread(
+            lambda: list(self.list(config, filter=filter, before=before, limit=limit))
+        )
+        for item in items:
+            yield item
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        return await asyncio.to_thread(self.put, config, checkpoint, metadata, new_versions)
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        await asyncio.to_thread(self.put_writes, config, writes, task_id, task_path)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        await asyncio.to_thread(self.delete_thread, thread_id)
+
+    # --------- 세션 TTL ---------
+
+    def session_count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
+
+    def session_expires_at(self, thread_id: str) -> Optional[float]:
+        """세션 만료 시각 (unix time, 없으면 None)."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT accessed_at FROM sessions WHERE thread_id = ?", (thread_id,)
+            ).fetchone()
+        return row[0] + self.ttl_seconds if row else None
+
+    def prune_sessions(self, now: Optional[float] = None) -> int:
+        """TTL이 지난 세션의 checkpoint / write를 모두 지운다. 지운 세션 수를 돌려준다."""
+        with self._lock:
+            removed = self._prune(time.time() if now is None else now)
+            self._conn.commit()
+        return removed
+
+    def _touch(self, thread_id: str) -> None:
+        now = time.time()
+        self._conn.execute(
+            "INSERT INTO sessions (thread_id, created_at, accessed_at) VALUES (?, ?, ?) "
+            "ON CONFLICT(thread_id) DO UPDATE SET accessed_at = excluded.accessed_at",
+            (thread_id, now, now),
+        )
+        self._conn.commit()
+
+    def _after_write(self) -> None:
+        self._writes_since_prune += 1
+        if self._writes_since_prune >= 100:
+            self._prune(time.time())
+            self._conn.commit()
+
+    def _prune(self, now: float) -> int:
+        self._writes_since_prune = 0
+        expired = [
+            row[0]
+            for row in self._conn.execute(
+                "SELECT thread_id FROM sessions WHERE accessed_at <= ?", (now - self.ttl_seconds,)
+            )
+        ]
+        self._delete_threads(expired)
+        self.evictions += len(expired)
+        return len(expired)
+
+    def _delete_threads(self, thread_ids: Iterable[str]) -> None:
+        params = [(thread_id,) for thread_id in thread_ids]
+        for table in ("writes", "checkpoints", "sessions"):
+            self._conn.executemany(f"DELETE FROM {table} WHERE thread_id = ?", params)
+
+
+_saver: Optional[SqliteCheckpointSaver] = None
+_saver_lock = threading.Lock()
+
+
+def get_checkpointer() -> SqliteCheckpointSaver:
+    """프로세스 공용 checkpointer (ORCHESTRATOR_DATA_DIR/sessions.sqlite3)."""
+    global _saver
+    with _saver_lock:
+        if _saver is None:
+            _saver = SqliteCheckpointSaver()
+        return _saver
+
+
+def _collect() -> Iterable[Sample]:
+    if _saver is None:
+        return
+    yield Sample(
+        "orchestrator_sessions_evicted_total",
+        "counter",
+        "Review sessions removed after SESSION_TTL_SECONDS without access",
+        (),
+        _saver.evictions,
+    )
+
+
+register_collector(_collect)
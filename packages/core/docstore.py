@@ -0,0 +1,297 @@
+# packages/core/docstore.py
+"""
+Content-addressed 원문 저장소 (로컬 SQLite) + 원문 보관 정책.
+
+profile(ResumeProfile / JDProfile)에 원문 전체를 싣는 대신 DocStore에 한 번 저장하고
+DocRef(sha256 + 문자 offset)만 들고 다닌다. 같은 원문은 한 번만 저장된다.
+
+RAW_TEXT_RETENTION:
+- full: profile.raw_text에 원문을 그대로 싣는다 (profile은 DocStore 미사용, 이전 동작)
+- reference: DocStore에 저장하고 profile에는 DocRef만 (기본)
+- none: 원문을 어디에도 남기지 않는다
+
+리뷰 세션(graph state / checkpoint)에는 입력 원문 대신 input_ref의 DocRef만 넣는다.
+실행 중인 노드는 hold_texts로 잡아 둔 프로세스 메모리의 원문을 읽고, 실행이 끝난 뒤
+(재분석)에는 DocStore에 남아 있을 때만 다시 읽는다 (none이면 hash만 남는다).
+
+keyword.source_span은 원문 offset이므로 DocRef.doc_id와 합치면 근거 위치를 다시 읽을 수 있다
+(DocStore.slice는 SQLite substr로 필요한 구간만 읽는다).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Iterable, Iterator, Literal, Optional, cast
+
+from .metrics import Sample, register_collector
+from .schemas import DocRef
+from .storage import data_path
+
+RetentionMode = Literal["full", "reference", "none"]
+
+# 환경변수 설정값
+RAW_TEXT_RETENTION = cast(RetentionMode, os.getenv("RAW_TEXT_RETENTION", "reference"))
+DOCSTORE_MAX_DOCUMENTS = int(os.getenv("DOCSTORE_MAX_DOCUMENTS", "100000"))
+DOCSTORE_TTL_SECONDS = float(os.getenv("DOCSTORE_TTL_SECONDS", str(30 * 24 * 3600)))
+# 최근 저장한 doc_id (같은 원문 반복 저장 시 SQLite write 생략)
+_RECENT_IDS = 4096
+
+
+def doc_id(text: str) -> str:
+    """원문의 content hash (공백까지 그대로: offset이 원문 기준이므로 정규화하지 않는다)."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class DocStoreStats:
+    writes: int = 0
+    dedup_hits: int = 0
+    reads: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+class DocStore:
+    """sha256 → 원문. 오래 안 읽힌 문서부터 TTL / 개수 기준으로 evict."""
+
+    def __init__(
+        self,
+        db_path: Optional[Path | str] = None,
+        *,
+        max_documents: int = DOCSTORE_MAX_DOCUMENTS,
+        ttl_seconds: float = DOCSTORE_TTL_SECONDS,
+    ) -> None:
+        self.max_documents = max_documents
+        self.ttl_seconds = ttl_seconds
+        self.stats = DocStoreStats()
+        self._lock = threading.Lock()
+        self._recent: OrderedDict[str, None] = OrderedDict()
+        self._writes_since_prune = 0
+        self._conn = sqlite3.connect(
+            str(db_path or data_path("documents.sqlite3")), check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS documents (
+                doc_id TEXT PRIMARY KEY,
+                text TEXT NOT NULL,
+                length INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_documents_accessed ON documents (accessed_at)"
+        )
+        self._conn.commit()
+
+    def put(self, text: str, *, section: Optional[str] = None) -> DocRef:
+        """원문 저장 (이미 있으면 접근 시각만 갱신) → 문서 전체를 가리키는 DocRef."""
+        key = doc_id(text)
+        ref = DocRef(doc_id=key, start=0, end=len(text), section=section)
+        now = time.time()
+        with self._lock:
+            if key in self._recent:
+                self._recent.move_to_end(key)
+                self.stats.dedup_hits += 1
+                return ref
+            cur = self._conn.execute(
+                "INSERT OR IGNORE INTO documents (doc_id, text, length, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, text, len(text), now, now),
+            )
+            if cur.rowcount:
+                self.stats.writes += 1
+                self._writes_since_prune += 1
+                if self._writes_since_prune >= 100:
+                    self._prune(now)
+            else:
+                self.stats.dedup_hits += 1
+                self._conn.execute(
+                    "UPDATE documents SET accessed_at = ? WHERE doc_id = ?", (now, key)
+                )
+            self._conn.commit()
+            self._recent[key] = None
+            while len(self._recent) > _RECENT_IDS:
+                self._recent.popitem(last=False)
+        return ref
+
+    def get(self, key: str) -> Optional[str]:
+        """문서 전체 (없으면 None)."""
+        return self._read("SELECT text FROM documents WHERE doc_id = ?", (key,), key)
+
+    def slice(self, ref: DocRef) -> Optional[str]:
+        """DocRef 구간만 읽는다 (문서 전체를 메모리에 올리지 않음)."""
+        return self._read(
+            "SELECT substr(text, ?, ?) FROM documents WHERE doc_id = ?",
+            (ref.start + 1, max(ref.length, 0), ref.doc_id),
+            ref.doc_id,
+        )
+
+    def delete(self, key: str) -> bool:
+        with self._lock:
+            cur = self._conn.execute("DELETE FROM documents WHERE doc_id = ?", (key,))
+            self._conn.commit()
+            self._recent.pop(key, None)
+            return cur.rowcount > 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+
+    def _read(self, sql: str, params: tuple, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(sql, params).fetchone()
+            if row is None:
+                self.stats.misses += 1
+                return None
+            self.stats.reads += 1
+            self._conn.execute(
+                "UPDATE documents SET accessed_at = ? WHERE doc_id = ?", (time.time(), key)
+            )
+            self._conn.commit()
+            return row[0]
+
+    def _prune(self, now: float) -> None:
+        """TTL 지난 문서 + max_documents 초과분을 오래 안 읽힌 순으로 삭제 (lock 안에서 호출)."""
+        self._writes_since_prune = 0
+        cur = self._conn.execute(
+            "DELETE FROM documents WHERE accessed_at <= ?", (now - self.ttl_seconds,)
+        )
+        cur2 = self._conn.execute(
+            """
+            DELETE FROM documents WHERE doc_id IN (
+                SELECT doc_id FROM documents ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+            )
+            """,
+            (self.max_documents,),
+        )
+        self.stats.evictions += max(cur.rowcount, 0) + max(cur2.rowcount, 0)
+        # 지워진 문서가 _recent에 남아 있으면 put이 write를 건너뛰므로 비운다
+        self._recent.clear()
+
+
+_store: Optional[DocStore] = None
+_store_lock = threading.Lock()
+
+
+def get_docstore() -> DocStore:
+    """프로세스 공용 DocStore (ORCHESTRATOR_DATA_DIR/documents.sqlite3)."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = DocStore()
+        return _store
+
+
+# --------- 보관 정책 ---------
+
+
+def retain_text(text: str, mode: Optional[RetentionMode] = None) -> dict:
+    """ResumeProfile에 넣을 {raw_text, source} (mode 생략 시 RAW_TEXT_RETENTION)."""
+    mode = mode or RAW_TEXT_RETENTION
+    if mode == "full":
+        return {"raw_text": text, "source": None}
+    if mode == "reference":
+        return {"raw_text": None, "source": get_docstore().put(text)}
+    return {"raw_text": None, "source": None}
+
+
+def retain_sections(sections: dict, mode: Optional[RetentionMode] = None) -> dict:
+    """JDProfile에 넣을 {raw_text, sources} (섹션마다 DocRef 1개)."""
+    mode = mode or RAW_TEXT_RETENTION
+    sections = {str(category): str(text) for category, text in sections.items()}
+    if mode == "full":
+        return {"raw_text": sections, "sources": []}
+    if mode == "reference":
+        store = get_docstore()
+        return {
+            "raw_text": None,
+            "sources": [store.put(text, section=category) for category, text in sections.items()],
+        }
+    return {"raw_text": None, "sources": []}
+
+
+def resolve_text(ref: Optional[DocRef]) -> Optional[str]:
+    """DocRef → 원문 구간 (저장소에서 evict됐으면 None)."""
+    if ref is None:
+        return None
+    return get_docstore().slice(ref)
+
+
+# --------- 세션 입력 원문 ---------
+
+# 실행 중인 요청의 입력 원문: doc_id → [원문, 참조 수] (저장하지 않음)
+_held: dict[str, list] = {}
+_held_lock = threading.Lock()
+
+
+def input_ref(
+    text: str, *, section: Optional[str] = None, mode: Optional[RetentionMode] = None
+) -> DocRef:
+    """state에 넣을 입력 원문 참조 (reference / full이면 DocStore에 저장, none이면 hash만)."""
+    if (mode or RAW_TEXT_RETENTION) == "none":
+        return DocRef(doc_id=doc_id(text), start=0, end=len(text), section=section)
+    return get_docstore().put(text, section=section)
+
+
+@contextmanager
+def hold_texts(texts: Iterable[str]) -> Iterator[None]:
+    """블록 안에서는 보관 정책과 무관하게 read_input이 이 원문들을 읽을 수 있다."""
+    keys = []
+    with _held_lock:
+        for text in texts:
+            key = doc_id(text)
+            _held.setdefault(key, [text, 0])[1] += 1
+            keys.append(key)
+    try:
+        yield
+    finally:
+        with _held_lock:
+            for key in keys:
+                entry = _held[key]
+                entry[1] -= 1
+                if not entry[1]:
+                    del _held[key]
+
+
+def read_input(ref: Optional[DocRef]) -> Optional[str]:
+    """input_ref → 원문 (hold_texts로 잡힌 것 → DocStore 순, 어디에도 없으면 None)."""
+    if ref is None:
+        return None
+    with _held_lock:
+        entry = _held.get(ref.doc_id)
+    if entry is not None:
+        return entry[0][ref.start : ref.end]
+    return resolve_text(ref)
+
+
+def _collect() -> Iterable[Sample]:
+    if _store is None:
+        return
+    stats = _store.stats
+    for name, help, value in (
+        ("writes_total", "Documents written to the document store", stats.writes),
+        ("dedup_hits_total", "Document writes skipped (already stored)", stats.dedup_hits),
+        ("reads_total", "Document store reads", stats.reads),
+        ("misses_total", "Document store reads of unknown/evicted documents", stats.misses),
+        ("evictions_total", "Documents evicted (TTL / max documents)", stats.evictions),
+    ):
+        yield Sample(f"orchestrator_docstore_{name}", "counter", help, (), value)
+
+
+register_collector(_collect)
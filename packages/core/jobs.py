@@ -0,0 +1,609 @@
+# packages/core/jobs.py
+"""
+비동기 작업 큐 (로컬 SQLite) + worker pool.
+
+요청 수락(POST /jobs)과 실행을 분리한다. 수락은 SQLite에 한 행을 쓰고 바로 돌아가고,
+같은 프로세스의 worker JOB_WORKERS개가 큐에서 하나씩 꺼내 실행한다.
+
+- durable: 작업은 SQLite에 있으므로 프로세스가 재시작해도 queued 작업은 그대로 실행된다.
+  실행 중이던 작업은 lease(JOB_TIMEOUT_SECONDS + 여유)가 지나면 다시 queued로 돌아가고,
+  JOB_MAX_ATTEMPTS번을 넘으면 failed. 여러 프로세스가 같은 파일을 써도 claim은
+  UPDATE ... RETURNING 한 문장이라 한 작업을 두 worker가 가져가지 않는다.
+- 공정성: 실행 중인 작업이 적은 tenant의 작업부터 꺼낸다 (같으면 먼저 들어온 순서).
+  작업 안의 LLM 호출은 batch class로 rate-limit 큐에 들어간다 (interactive 요청 뒤로).
+- 진행 상황: handler가 JobProgress로 pipeline 단계별 done / total을 보고하면 바로 기록한다.
+- retry: handler가 LLMUnavailable을 올리거나, parse tool이 LLM 대신 lexicon 추출(degraded)로
+  응답했으면 backoff 뒤 다시 queued (JOB_MAX_ATTEMPTS까지). 마지막 시도의 degraded 결과는
+  그대로 성공으로 남긴다 (interactive 요청과 같은 결과).
+- webhook: 끝나면 (성공 / 실패) webhook_url로 결과를 POST한다. host가 JOB_WEBHOOK_ALLOWED_HOSTS에
+  있는 URL만 받는다 (비어 있으면 webhook 사용 안 함, redirect는 따라가지 않음).
+  JOB_WEBHOOK_SECRET이 있으면 body의 HMAC-SHA256을 X-Orchestrator-Signature 헤더로 보낸다.
+- 입력(payload, Resume / JD 원문)은 실행에만 필요하므로 작업이 끝나면 바로 지운다
+  (RAW_TEXT_RETENTION과 무관하게 queued / running 동안만 남는다). 결과는 남는다.
+- 끝난 작업은 JOB_TTL_SECONDS 뒤 submit 100번마다 한 번씩 지운다.
+
+ParseCache / DocStore / checkpointer와 같은 방식(WAL, lock, check_same_thread=False).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import hmac
+import json
+import os
+import random
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Iterable, Literal, Optional
+
+import httpx
+
+from .metrics import Counter, Histogram, Sample, register_collector
+from .ratelimit import llm_scheduling
+from .resilience import LLMUnavailable, request_deadline, track_degraded
+from .storage import data_path
+
+JobStatus = Literal["queued", "running", "succeeded", "failed"]
+JOB_STATUSES: tuple[JobStatus, ...] = ("queued", "running", "succeeded", "failed")
+
+# 환경변수 설정값
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "2"))
+# 작업 1개의 최대 실행 시간 (LLM 호출 deadline도 이 값)
+JOB_TIMEOUT_SECONDS = float(os.getenv("JOB_TIMEOUT_SECONDS", "300"))
+JOB_MAX_ATTEMPTS = int(os.getenv("JOB_MAX_ATTEMPTS", "3"))
+# queued 작업이 이만큼이면 더 받지 않는다 (JobQueueFull)
+JOB_MAX_QUEUED = int(os.getenv("JOB_MAX_QUEUED", "1000"))
+JOB_TTL_SECONDS = float(os.getenv("JOB_TTL_SECONDS", str(24 * 3600)))
+# 다른 프로세스가 넣은 작업 / lease 만료를 확인하는 주기 (같은 프로세스 submit은 바로 깨운다)
+JOB_POLL_SECONDS = float(os.getenv("JOB_POLL_SECONDS", "1"))
+JOB_RETRY_DELAY = float(os.getenv("JOB_RETRY_DELAY", "5"))
+JOB_WEBHOOK_TIMEOUT = float(os.getenv("JOB_WEBHOOK_TIMEOUT", "10"))
+JOB_WEBHOOK_RETRIES = int(os.getenv("JOB_WEBHOOK_RETRIES", "3"))
+JOB_WEBHOOK_SECRET = os.getenv("JOB_WEBHOOK_SECRET", "")
+# webhook을 보낼 수 있는 host (쉼표 구분, ".example.com"은 하위 domain 전체). 비어 있으면 거부
+JOB_WEBHOOK_ALLOWED_HOSTS = tuple(
+    host.strip().lower()
+    for host in os.getenv("JOB_WEBHOOK_ALLOWED_HOSTS", "").split(",")
+    if host.strip()
+)
+
+# lease = 실행 시간 한도 + 이 여유 (timeout 처리 / 결과 기록 시간)
+_LEASE_GRACE = 30.0
+_COLUMNS = (
+    "id, kind, status, tenant, webhook_url, webhook_status, progress, result, error, "
+    "attempts, created_at, started_at, finished_at"
+)
+
+# --------- 메트릭 ---------
+
+JOBS_SUBMITTED = Counter(
+    "orchestrator_jobs_submitted_total", "Jobs accepted by POST /jobs", ("kind",)
+)
+JOBS_FINISHED = Counter(
+    "orchestrator_jobs_finished_total",
+    "Job executions by outcome (retried: requeued after a transient failure)",
+    ("kind", "status"),
+)
+JOB_QUEUE_WAIT = Histogram(
+    "orchestrator_job_queue_wait_seconds", "Time from submit to a worker picking the job", ("kind",)
+)
+JOB_SECONDS = Histogram(
+    "orchestrator_job_duration_seconds", "Job execution time (one attempt)", ("kind", "status")
+)
+JOB_WEBHOOKS = Counter(
+    "orchestrator_job_webhooks_total", "Completion webhook deliveries", ("outcome",)
+)
+
+
+class JobQueueFull(RuntimeError):
+    """queued 작업이 JOB_MAX_QUEUED개라 더 받을 수 없다."""
+
+
+class WebhookNotAllowed(ValueError):
+    """webhook_url이 http(s)가 아니거나 host가 JOB_WEBHOOK_ALLOWED_HOSTS에 없다."""
+
+
+@dataclass
+class Job:
+    id: str
+    kind: str
+    status: JobStatus
+    tenant: str
+    webhook_url: Optional[str]
+    webhook_status: Optional[str]
+    progress: dict[str, dict[str, int]]
+    # handler가 돌려준 결과 (JSON 문자열, 해석은 kind별로 호출하는 쪽이)
+    result: Optional[str]
+    error: Optional[str]
+    attempts: int
+    created_at: float
+    started_at: Optional[float]
+    finished_at: Optional[float]
+    # claim 때만 채운다 (GET에서는 읽지 않음)
+    payload: dict = field(default_factory=dict)
+
+    @classmethod
+    def from_row(cls, row: tuple, payload: Optional[str] = None) -> "Job":
+        return cls(
+            *row[:6],
+            json.loads(row[6]),
+            *row[7:],
+            payload=json.loads(payload) if payload else {},
+        )
+
+
+class JobStore:
+    """작업 큐 + 상태 / 결과 저장소."""
+
+    def __init__(
+        self,
+        db_path: Optional[Path | str] = None,
+        *,
+        max_queued: int = JOB_MAX_QUEUED,
+        max_attempts: int = JOB_MAX_ATTEMPTS,
+        lease_seconds: float = JOB_TIMEOUT_SECONDS + _LEASE_GRACE,
+        ttl_seconds: float = JOB_TTL_SECONDS,
+    ) -> None:
+        self.max_queued = max_queued
+        self.max_attempts = max_attempts
+        self.lease_seconds = lease_seconds
+        self.ttl_seconds = ttl_seconds
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._writes_since_prune = 0
+        self._conn = sqlite3.connect(
+            str(db_path or data_path("jobs.sqlite3")), check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        # 다른 프로세스가 write 중이면 잠깐 기다린다
+        self._conn.execute("PRAGMA busy_timeout=5000")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                id TEXT PRIMARY KEY,
+                kind TEXT NOT NULL,
+                status TEXT NOT NULL,
+                tenant TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                webhook_url TEXT,
+                webhook_status TEXT,
+                progress TEXT NOT NULL DEFAULT '{}',
+                result TEXT,
+                error TEXT,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                created_at REAL NOT NULL,
+                run_after REAL NOT NULL,
+                lease_until REAL,
+                started_at REAL,
+                finished_at REAL
+            );
+            CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status, run_after);
+            CREATE INDEX IF NOT EXISTS idx_jobs_tenant ON jobs (tenant, status);
+            CREATE INDEX IF NOT EXISTS idx_jobs_finished ON jobs (finished_at);
+            """
+        )
+        self._conn.commit()
+
+    # --------- public API ---------
+
+    def submit(
+        self,
+        kind: str,
+        payload: dict,
+        *,
+        tenant: str,
+        webhook_url: Optional[str] = None,
+    ) -> Job:
+        """작업을 큐에 넣는다. queued가 max_queued개면 JobQueueFull."""
+        now = time.time()
+        job_id = uuid.uuid4().hex
+        with self._lock:
+            (queued,) = self._conn.execute(
+                "SELECT COUNT(*) FROM jobs WHERE status = 'queued'"
+            ).fetchone()
+            if queued >= self.max_queued:
+                raise JobQueueFull(f"{queued} jobs already queued")
+            self._conn.execute(
+                "INSERT INTO jobs (id, kind, status, tenant, payload, webhook_url, "
+                "webhook_status, created_at, run_after) VALUES (?, ?, 'queued', ?, ?, ?, ?, ?, ?)",
+                (
+                    job_id,
+                    kind,
+                    tenant,
+                    json.dumps(payload, ensure_ascii=False),
+                    webhook_url,
+                    "pending" if webhook_url else None,
+                    now,
+                    now,
+                ),
+            )
+            self._writes_since_prune += 1
+            if self._writes_since_prune >= 100:
+                self._prune(now)
+            self._conn.commit()
+        JOBS_SUBMITTED.inc(kind=kind)
+        return Job(
+            job_id, kind, "queued", tenant, webhook_url, "pending" if webhook_url else None,
+            {}, None, None, 0, now, None, None, payload,
+        )
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {_COLUMNS} FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        return Job.from_row(row) if row is not None else None
+
+    def claim(self) -> Optional[Job]:
+        """
+        실행할 작업 1개를 running으로 바꿔서 가져온다 (없으면 None).
+        lease가 지난 running 작업은 먼저 queued로 돌리거나 (attempt가 남았으면) failed로 끝낸다.
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET "
+                "status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'queued' END, "
+                "finished_at = CASE WHEN attempts >= ? THEN ? END, "
+                "payload = CASE WHEN attempts >= ? THEN '{}' ELSE payload END, "
+                "error = 'worker lost (lease expired)', progress = '{}', lease_until = NULL, "
+                "run_after = ? "
+                "WHERE status = 'running' AND lease_until <= ?",
+                (self.max_attempts, self.max_attempts, now, self.max_attempts, now, now),
+            )
+            row = self._conn.execute(
+                f"""
+                UPDATE jobs SET status = 'running', attempts = attempts + 1,
+                    started_at = ?, lease_until = ?
+                WHERE id = (
+                    SELECT id FROM jobs AS j
+                    WHERE status = 'queued' AND run_after <= ?
+                    ORDER BY (
+                        SELECT COUNT(*) FROM jobs AS r
+                        WHERE r.tenant = j.tenant AND r.status = 'running'
+                    ), run_after
+                    LIMIT 1
+                )
+                RETURNING {_COLUMNS}, payload
+                """,
+                (now, now + self.lease_seconds, now),
+            ).fetchone()
+            self._conn.commit()
+        if row is None:
+            return None
+        return Job.from_row(row[:-1], row[-1])
+
+    def set_progress(self, job_id: str, progress: dict) -> None:
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET progress = ? WHERE id = ? AND status = 'running'",
+                (json.dumps(progress), job_id),
+            )
+            self._conn.commit()
+
+    def finish(
+        self, job_id: str, *, result: Optional[str] = None, error: Optional[str] = None
+    ) -> None:
+        """성공(result) / 실패(error)로 끝낸다. 입력 원문(payload)은 지운다."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, result = ?, error = ?, finished_at = ?, "
+                "payload = '{}', lease_until = NULL WHERE id = ?",
+                ("failed" if error is not None else "succeeded", result, error, time.time(),
+                 job_id),
+            )
+            self._conn.commit()
+
+    def requeue(self, job_id: str, *, delay: float = 0.0, error: Optional[str] = None) -> None:
+        """다시 queued로 (delay초 뒤부터 claim 가능)."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = 'queued', error = ?, progress = '{}', "
+                "lease_until = NULL, run_after = ? WHERE id = ?",
+                (error, time.time() + delay, job_id),
+            )
+            self._conn.commit()
+
+    def release(self, job_id: str) -> None:
+        """실행을 중단한 작업을 바로 다시 queued로 (attempt로 세지 않는다)."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = 'queued', attempts = attempts - 1, progress = '{}', "
+                "lease_until = NULL, run_after = ? WHERE id = ? AND status = 'running'",
+                (time.time(), job_id),
+            )
+            self._conn.commit()
+
+    def set_webhook_status(self, job_id: str, status: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET webhook_status = ? WHERE id = ?", (status, job_id)
+            )
+            self._conn.commit()
+
+    def counts(self) -> dict[str, int]:
+        """status별 작업 수."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT status, COUNT(*) FROM jobs GROUP BY status"
+            ).fetchall()
+        counts = dict.fromkeys(JOB_STATUSES, 0)
+        counts.update(rows)
+        return counts
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM jobs")
+            self._conn.commit()
+
+    # --------- 내부 (lock 안에서 호출) ---------
+
+    def _prune(self, now: float) -> None:
+        """끝난 지 ttl_seconds가 지난 작업 삭제."""
+        self._writes_since_prune = 0
+        cursor = self._conn.execute(
+            "DELETE FROM jobs WHERE finished_at IS NOT NULL AND finished_at <= ?",
+            (now - self.ttl_seconds,),
+        )
+        self.evictions += cursor.rowcount
+
+
+class JobProgress:
+    """handler가 pipeline 단계별 진행(done / total)을 보고한다. 바뀔 때마다 바로 기록."""
+
+    def __init__(self, store: JobStore, job_id: str) -> None:
+        self.stages: dict[str, dict[str, int]] = {}
+        self._store = store
+        self._job_id = job_id
+        self._write_lock = asyncio.Lock()
+
+    async def plan(self, totals: dict[str, int]) -> None:
+        """실행할 단계와 단계별 단위 수 (예: JD 섹션 수)."""
+        for stage, total in totals.items():
+            self.stages[stage] = {"done": 0, "total": total}
+        await self._save()
+
+    async def advance(self, stage: str, n: int = 1) -> None:
+        entry = self.stages.setdefault(stage, {"done": 0, "total": n})
+        entry["done"] = min(entry["total"], entry["done"] + n)
+        await self._save()
+
+    async def track(self, stage: str, awaitable: Awaitable[Any]) -> Any:
+        """awaitable이 끝나면 stage를 1 진행."""
+        result = await awaitable
+        await self.advance(stage)
+        return result
+
+    async def _save(self) -> None:
+        # 동시에 끝난 단계들의 write가 순서가 바뀌어 옛 snapshot으로 덮지 않도록
+        async with self._write_lock:
+            await asyncio.to_thread(self._store.set_progress, self._job_id, self.stages)
+
+
+# (payload, progress) → 결과 JSON 문자열
+JobHandler = Callable[[dict, JobProgress], Awaitable[str]]
+
+
+def check_webhook_url(url: str, allowed: Iterable[str] | None = None) -> None:
+    """허용된 host의 http(s) URL이 아니면 WebhookNotAllowed (내부 주소로의 요청 차단)."""
+    allowed = JOB_WEBHOOK_ALLOWED_HOSTS if allowed is None else tuple(allowed)
+    try:
+        parsed = httpx.URL(url)
+    except httpx.InvalidURL as e:
+        raise WebhookNotAllowed(f"invalid webhook_url: {e}") from None
+    host = parsed.host.lower().rstrip(".")
+    if parsed.scheme not in ("http", "https") or not host or parsed.userinfo:
+        raise WebhookNotAllowed("webhook_url must be an http(s) URL without credentials")
+    if not allowed:
+        raise WebhookNotAllowed("webhooks are disabled (JOB_WEBHOOK_ALLOWED_HOSTS is empty)")
+    if not any(
+        host == entry or (entry.startswith(".") and host.endswith(entry)) for entry in allowed
+    ):
+        raise WebhookNotAllowed(f"webhook host not allowed: {host}")
+
+
+def sign(body: bytes, secret: str = JOB_WEBHOOK_SECRET) -> str:
+    """webhook body 서명 (X-Orchestrator-Signature 헤더 값)."""
+    return "sha256=" + hmac.new(secret.encode("utf-8"), body, hashlib.sha256).hexdigest()
+
+
+def _default_webhook_body(job: Job) -> str:
+    return json.dumps(
+        {
+            "job_id": job.id,
+            "kind": job.kind,
+            "status": job.status,
+            "result": json.loads(job.result) if job.result else None,
+            "error": job.error,
+        },
+        ensure_ascii=False,
+    )
+
+
+class WorkerPool:
+    """
+    JobStore를 소비하는 asyncio worker N개 (이 프로세스의 event loop에서 돈다).
+    LLM 클라이언트가 loop에 묶여 있으므로 thread가 아니라 task로 돌린다.
+    """
+
+    def __init__(
+        self,
+        store: JobStore,
+        handlers: dict[str, JobHandler],
+        *,
+        workers: int = JOB_WORKERS,
+        timeout: float = JOB_TIMEOUT_SECONDS,
+        webhook_body: Callable[[Job], str] = _default_webhook_body,
+    ) -> None:
+        self.store = store
+        self.handlers = handlers
+        self.workers = workers
+        self.timeout = timeout
+        self.webhook_body = webhook_body
+        self.busy = 0
+        self._tasks: list[asyncio.Task] = []
+        self._webhooks: set[asyncio.Task] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+
+    def ensure_started(self) -> None:
+        """현재 event loop에서 worker를 띄운다 (이미 돌고 있으면 그대로)."""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and any(not task.done() for task in self._tasks):
+            return
+        self._loop = loop
+        self._wakeup = asyncio.Event()
+        self.busy = 0
+        self._tasks = [
+            loop.create_task(self._worker(), name=f"job-worker-{i}") for i in range(self.workers)
+        ]
+
+    def notify(self) -> None:
+        """새 작업이 들어왔다 (대기 중인 worker를 깨운다)."""
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def stop(self) -> None:
+        """worker 종료. 실행 중이던 작업은 queued로 돌려서 다음 프로세스가 이어받는다."""
+        tasks = self._tasks + list(self._webhooks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks = []
+
+    # --------- 내부 ---------
+
+    async def _worker(self) -> None:
+        assert self._wakeup is not None
+        while True:
+            # claim 전에 clear해야 그 사이에 들어온 notify를 놓치지 않는다
+            self._wakeup.clear()
+            job = await asyncio.to_thread(self.store.claim)
+            if job is None:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), JOB_POLL_SECONDS)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            self.busy += 1
+            try:
+                await self._run(job)
+            finally:
+                self.busy -= 1
+
+    async def _run(self, job: Job) -> None:
+        if job.started_at is not None and job.attempts == 1:
+            JOB_QUEUE_WAIT.observe(job.started_at - job.created_at, kind=job.kind)
+        handler = self.handlers.get(job.kind)
+        start = time.perf_counter()
+        status = "failed"
+        try:
+            if handler is None:
+                raise ValueError(f"No handler for job kind: {job.kind}")
+            progress = JobProgress(self.store, job.id)
+            with (
+                llm_scheduling(job.tenant, "batch"),
+                request_deadline(self.timeout),
+                track_degraded() as degraded,
+            ):
+                result = await asyncio.wait_for(handler(job.payload, progress), self.timeout)
+            if degraded and job.attempts < self.store.max_attempts:
+                # LLM 없이 만든 결과: 기다릴 수 있는 작업이므로 버리고 다시 실행
+                raise LLMUnavailable(f"degraded result: {degraded[0]}")
+            status = "succeeded"
+            await asyncio.to_thread(self.store.finish, job.id, result=result)
+        except asyncio.CancelledError:
+            # 종료 중: 다른 worker / 다음 프로세스가 처음부터 다시 실행
+            self.store.release(job.id)
+            status = "cancelled"
+            raise
+        except LLMUnavailable as e:
+            if job.attempts < self.store.max_attempts:
+                status = "retried"
+                delay = random.uniform(0, JOB_RETRY_DELAY * 2 ** (job.attempts - 1))
+                await asyncio.to_thread(self.store.requeue, job.id, delay=delay, error=str(e))
+                asyncio.get_running_loop().call_later(delay, self.notify)
+            else:
+                await asyncio.to_thread(self.store.finish, job.id, error=str(e))
+        except asyncio.TimeoutError:
+            await asyncio.to_thread(
+                self.store.finish, job.id, error=f"Job exceeded {self.timeout:g}s"
+            )
+        except Exception as e:
+            await asyncio.to_thread(self.store.finish, job.id, error=f"{type(e).__name__}: {e}")
+        finally:
+            JOB_SECONDS.observe(time.perf_counter() - start, kind=job.kind, status=status)
+            JOBS_FINISHED.inc(kind=job.kind, status=status)
+        if job.webhook_url and status in ("succeeded", "failed"):
+            task = asyncio.create_task(self._deliver(job.id, job.webhook_url))
+            self._webhooks.add(task)
+            task.add_done_callback(self._webhooks.discard)
+
+    async def _deliver(self, job_id: str, url: str) -> None:
+        """완료 webhook (5xx / 연결 오류는 JOB_WEBHOOK_RETRIES번까지 backoff 후 재시도)."""
+        job = await asyncio.to_thread(self.store.get, job_id)
+        if job is None:
+            return
+        try:
+            # 받은 뒤 allowlist가 바뀌었을 수 있다 (다른 프로세스가 넣은 작업 포함)
+            check_webhook_url(url)
+        except WebhookNotAllowed:
+            JOB_WEBHOOKS.inc(outcome="blocked")
+            await asyncio.to_thread(self.store.set_webhook_status, job_id, "blocked")
+            return
+        body = self.webhook_body(job).encode("utf-8")
+        headers = {"Content-Type": "application/json", "X-Job-Id": job_id}
+        if JOB_WEBHOOK_SECRET:
+            headers["X-Orchestrator-Signature"] = sign(body)
+        outcome = "failed"
+        async with httpx.AsyncClient(timeout=JOB_WEBHOOK_TIMEOUT) as client:
+            for attempt in range(JOB_WEBHOOK_RETRIES + 1):
+                if attempt:
+                    await asyncio.sleep(random.uniform(0, min(30.0, 2.0**attempt)))
+                try:
+                    response = await client.post(url, content=body, headers=headers)
+                except httpx.HTTPError:
+                    continue
+                if response.status_code < 500:
+                    outcome = "delivered" if response.is_success else "rejected"
+                    break
+        JOB_WEBHOOKS.inc(outcome=outcome)
+        await asyncio.to_thread(self.store.set_webhook_status, job_id, outcome)
+
+
+_store: Optional[JobStore] = None
+_store_lock = threading.Lock()
+
+
+def get_job_store() -> JobStore:
+    """프로세스 공용 JobStore (ORCHESTRATOR_DATA_DIR/jobs.sqlite3)."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = JobStore()
+        return _store
+
+
+def _collect() -> Iterable[Sample]:
+    if _store is None:
+        return
+    for status, count in _store.counts().items():
+        yield Sample(
+            "orchestrator_jobs", "gauge", "Jobs by status", (("status", status),), count
+        )
+    yield Sample(
+        "orchestrator_jobs_evicted_total",
+        "counter",
+        "Finished jobs removed after JOB_TTL_SECONDS",
+        (),
+        _store.evictions,
+    )
+
+
+register_collector(_collect)
@@ -0,0 +1,217 @@
+# packages/core/lexicon.py
+"""
+기술 키워드 lexicon.
+
+jd_parse.py SYSTEM_PROMPT의 카테고리(언어/프레임워크/ML/툴/클라우드/DB/방법론/프로토콜/기술)를
+기준으로 정리한 curated 목록. keyword_normalize의 로컬 추출기가 사용한다.
+
+- TERMS: lexicon 카테고리 → canonical keyword 목록 (소문자)
+- SURFACE_FORMS: canonical → 원문에 등장할 수 있는 다른 표기
+- ALIASES: 약어/별칭 → canonical (예: k8s → kubernetes, postgres → postgresql)
+- AMBIGUOUS_TERMS: 일반 영어 단어와 겹쳐서 대문자 표기일 때만 인정하는 canonical
+- DISTINCT_TERMS: lexicon 용어와 철자가 비슷하지만 다른 기술 (오타 보정 대상에서 제외)
+"""
+
+from __future__ import annotations
+
+TERMS: dict[str, tuple[str, ...]] = {
+    "language": (
+        "python", "java", "javascript", "typescript", "c++", "c#", "go", "rust",
+        "sql", "kotlin", "scala", "ruby", "php", "swift", "r", "matlab", "bash",
+        "perl", "haskell", "elixir", "dart", "lua", "julia", "objective-c", "html",
+        "css", "solidity", "cuda",
+    ),
+    "framework": (
+        "react", "vue", "angular", "angularjs", "svelte", "next.js", "nestjs", "node.js",
+        "express", "fastapi", "django", "flask", "spring", "spring boot", ".net", "rails",
+        "laravel", "langchain", "langgraph", "llamaindex", "pandas", "numpy",
+        "scipy", "scikit-learn", "tensorflow", "pytorch", "keras", "jax",
+        "hugging face", "pyspark", "polars", "dask", "ray", "celery", "pydantic",
+        "sqlalchemy", "graphql", "redux", "tailwind css", "jquery", "flutter",
+        "react native", "opencv", "matplotlib", "seaborn", "plotly", "streamlit",
+        "junit", "pytest", "selenium", "playwright", "cypress", "jest",
+    ),
+    "ml": (
+        "linear regression", "logistic regression", "random forest", "xgboost",
+        "lightgbm", "catboost", "neural network", "transformers", "bert", "gpt",
+        "llm", "rag", "cnn", "rnn", "lstm", "gan", "reinforcement learning",
+        "nlp", "computer vision", "mlflow", "kubeflow", "onnx", "vllm",
+    ),
+    "tool": (
+        "git", "github", "gitlab", "bitbucket", "docker", "kubernetes", "helm",
+        "jenkins", "github actions", "circleci", "argo cd", "terraform",
+        "ansible", "pulumi", "vs code", "intellij", "jupyter", "jira",
+        "confluence", "postman", "grafana", "prometheus", "datadog", "splunk",
+        "nginx", "webpack", "vite", "npm", "poetry", "tableau", "power bi",
+        "looker", "dbt", "figma",
+    ),
+    "cloud": (
+        "aws", "gcp", "azure", "s3", "ec2", "lambda", "ecs", "eks", "rds",
+        "dynamodb", "sagemaker", "cloudformation", "bigquery", "cloud run",
+        "vertex ai", "databricks", "snowflake", "redshift", "heroku", "vercel",
+        "firebase", "cloudflare", "openai",
+    ),
+    "database": (
+        "postgresql", "mysql", "mongodb", "redis", "elasticsearch", "sqlite",
+        "oracle", "sql server", "cassandra", "neo4j", "pinecone", "chroma",
+        "faiss", "milvus", "weaviate", "pgvector", "clickhouse", "mariadb",
+        "opensearch",
+    ),
+    "methodology": (
+        "ci/cd", "agile", "scrum", "kanban", "microservices", "tdd", "devops",
+        "mlops", "etl", "oop", "serverless", "event-driven",
+    ),
+    "protocol": (
+        "rest", "grpc", "json-rpc", "http", "https", "tcp/ip", "websocket",
+        "oauth", "jwt", "soap", "mqtt",
+    ),
+    "technology": (
+        "kafka", "spark", "hadoop", "airflow", "flink", "rabbitmq", "hive",
+        "presto", "trino", "kinesis", "pub/sub", "dagster", "prefect",
+    ),
+}
+
+# canonical → 다른 표기 (AMBIGUOUS_TERMS가 아니면 canonical 자체도 자동으로 포함됨)
+SURFACE_FORMS: dict[str, tuple[str, ...]] = {
+    "c++": ("cpp",),
+    "c#": ("c sharp", "csharp"),
+    "go": ("Go", "golang"),
+    "r": ("R",),
+    "swift": ("Swift",),
+    "next.js": ("nextjs", "next js"),
+    "node.js": ("nodejs", "node js"),
+    "express": ("express.js", "expressjs", "Express"),
+    "vue": ("vue.js", "vuejs"),
+    "react": ("react.js", "reactjs"),
+    # AngularJS(1.x)와 Angular(2+)는 별개 프레임워크
+    "angularjs": ("angular.js",),
+    "spring": ("Spring",),
+    "spring boot": ("springboot",),
+    ".net": ("dotnet", ".net core", "asp.net"),
+    "rails": ("ruby on rails", "Rails"),
+    "hugging face": ("huggingface",),
+    "tailwind css": ("tailwind", "tailwindcss"),
+    "scikit-learn": ("scikit learn",),
+    "neural network": ("neural networks",),
+    "transformers": ("transformer",),
+    "lambda": ("aws lambda", "Lambda"),
+    "sql server": ("mssql", "ms sql"),
+    "vs code": ("vscode", "visual studio code"),
+    "github actions": ("github action",),
+    "argo cd": ("argocd",),
+    "ci/cd": ("ci / cd", "cicd", "ci-cd"),
+    "microservices": ("microservice",),
+    "rest": ("REST", "restful"),
+    "websocket": ("websockets",),
+    "oauth": ("oauth2", "oauth 2.0"),
+    "power bi": ("powerbi",),
+    "event-driven": ("event driven",),
+    "ray": ("Ray",),
+    "rag": ("RAG",),
+    "gan": ("GAN", "GANs"),
+    "oracle": ("Oracle",),
+    "hive": ("Hive",),
+    "chroma": ("chromadb", "Chroma"),
+    "polars": ("Polars",),
+    "jax": ("JAX",),
+    "helm": ("Helm",),
+    "vite": ("Vite", "vitejs"),
+    "soap": ("SOAP",),
+    "gpt": ("GPT",),
+    "julia": ("Julia",),
+    "lua": ("Lua",),
+    "dart": ("Dart",),
+}
+
+# 약어/별칭 → canonical. 추출(keyword_normalize)과 정규화(canonical index) 모두에 사용.
+ALIASES: dict[str, str] = {
+    "k8s": "kubernetes",
+    "kube": "kubernetes",
+    "postgres": "postgresql",
+    "psql": "postgresql",
+    "sklearn": "scikit-learn",
+    "mongo": "mongodb",
+    "torch": "pytorch",
+    "js": "javascript",
+    "ecmascript": "javascript",
+    "ts": "typescript",
+    "python3": "python",
+    "nest.js": "nestjs",
+    "amazon web services": "aws",
+    "amazon s3": "s3",
+    "amazon ec2": "ec2",
+    "amazon rds": "rds",
+    "amazon dynamodb": "dynamodb",
+    "amazon sagemaker": "sagemaker",
+    "aws sagemaker": "sagemaker",
+    "google cloud": "gcp",
+    "google cloud platform": "gcp",
+    "google bigquery": "bigquery",
+    "microsoft azure": "azure",
+    "ms azure": "azure",
+    "elastic search": "elasticsearch",
+    "dynamo db": "dynamodb",
+    "gh actions": "github actions",
+    "hugging face transformers": "transformers",
+    "rest api": "rest",
+    "rest apis": "rest",
+    "restful api": "rest",
+    "restful apis": "rest",
+    "large language model": "llm",
+    "large language models": "llm",
+    "llms": "llm",
+    "retrieval augmented generation": "rag",
+    "retrieval-augmented generation": "rag",
+    "natural language processing": "nlp",
+    "continuous integration": "ci/cd",
+    "apache kafka": "kafka",
+    "apache spark": "spark",
+    "apache airflow": "airflow",
+    "apache flink": "flink",
+    "apache hadoop": "hadoop",
+    "xgb": "xgboost",
+    "lgbm": "lightgbm",
+}
+
+# 일반 영어 단어와 겹치는 canonical.
+# 소문자 표기로는 매칭하지 않고, SURFACE_FORMS의 대문자 표기는 대소문자가 정확히 같을 때만 인정
+# (소문자로만 된 표기 - golang, aws lambda 등 - 는 대소문자 무관).
+AMBIGUOUS_TERMS: frozenset[str] = frozenset(
+    {
+        "go", "r", "swift", "express", "spring", "rest", "lambda", "ray", "rag",
+        "gan", "oracle", "hive", "chroma", "polars", "jax", "helm", "rails",
+        "dart", "lua", "julia", "gpt", "soap", "vite",
+    }
+)
+
+
+# lexicon에 없지만 lexicon 용어와 편집거리 1~2인 별개의 기술명.
+# canonical index가 오타로 보고 다른 기술로 합치지 않도록 fuzzy 보정에서 제외한다.
+# 접두사 / 접미사 변형(fastai, mysqlx 등)은 canonical index가 따로 거르므로, 여기에는
+# 단어 안쪽 글자만 다른 이름이 필요하다 (예: nuxt.js ≠ next.js).
+DISTINCT_TERMS: frozenset[str] = frozenset(
+    {"openapi", "nuxt", "nuxt.js", "nuxtjs", "opencl", "vitess"}
+)
+
+
+def canonical_category() -> dict[str, str]:
+    """canonical keyword → lexicon 카테고리."""
+    return {term: category for category, terms in TERMS.items() for term in terms}
+
+
+def iter_surface_forms() -> list[tuple[str, str, bool]]:
+    """
+    (surface form, canonical, case_sensitive) 목록.
+    ambiguous하지 않은 canonical은 자기 자신도 surface form으로 포함한다.
+    """
+    forms: list[tuple[str, str, bool]] = []
+    for terms in TERMS.values():
+        for term in terms:
+            ambiguous = term in AMBIGUOUS_TERMS
+            if not ambiguous:
+                forms.append((term, term, False))
+            for form in SURFACE_FORMS.get(term, ()):
+                forms.append((form, term, ambiguous and form != form.lower()))
+    for alias, term in ALIASES.items():
+        forms.append((alias, term, False))
+    return forms
@@ -0,0 +1,521 @@
+# packages/core/llm.py
+"""
+LLM 클라이언트 레지스트리.
+
+(model, temperature, output schema) 조합별 runnable을 프로세스당 한 번만 만들고,
+모든 모델이 하나의 pooled HTTP client(keep-alive 유지)를 공유한다.
+Tool/Agent는 init_chat_model을 직접 호출하지 말고 이 모듈을 통해 모델을 얻는다.
+
+set_chat_model_factory / chat_model_factory로 모델 생성을 바꿔 끼울 수 있다
+(benchmarks/의 offline fake model 등).
+
+structured 호출마다 latency / token 수 / 비용 / 동시 호출 수를 메트릭으로 남긴다.
+token 수는 provider가 돌려준 usage를 쓰고, 없으면 tokens.py로 추정한다.
+
+시도(attempt)마다 deadline / hedge / retry / circuit breaker / fallback model은
+resilience.py가 맡는다 (모두 실패하면 LLMUnavailable).
+시도는 보내기 전에 ratelimit.py의 scheduler에서 RPM / TPM permit을 받는다
+(priority class / tenant 순서, 응답 후 실제 token 수로 정산).
+Agent에는 get_chat_model 대신 ScheduledChatModel을 넘겨야 같은 경로를 거친다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import threading
+import time
+import weakref
+from contextlib import asynccontextmanager, contextmanager
+from functools import lru_cache
+from typing import Any, AsyncIterator, Callable, Iterator, Optional, TypeVar
+
+import httpx
+from langchain.chat_models import init_chat_model
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult, LLMResult
+from langchain_core.runnables import Runnable
+from pydantic import BaseModel
+
+from .metrics import Counter, Gauge, Histogram
+from .ratelimit import get_scheduler
+from .resilience import acall_with_resilience, attempt_time_left, call_with_resilience
+from .tokens import count_message_tokens, count_tokens, estimate_cost_usd
+from .tracing import annotate, stage
+
+TModel = TypeVar("TModel", bound=BaseModel)
+
+# 스트리밍 중 누적된 partial JSON(dict)과 완료 여부를 받는 callback
+PartialCallback = Callable[[dict, bool], None]
+# (model, temperature) → chat model
+ChatModelFactory = Callable[[str, float], BaseChatModel]
+
+# 환경변수 설정값
+LLM_MAX_CONNECTIONS = int(os.getenv("LLM_MAX_CONNECTIONS", "100"))
+LLM_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("LLM_MAX_KEEPALIVE_CONNECTIONS", "20"))
+LLM_KEEPALIVE_EXPIRY = float(os.getenv("LLM_KEEPALIVE_EXPIRY", "60"))
+LLM_TIMEOUT = float(os.getenv("LLM_TIMEOUT", "60"))
+# 프로세스당 동시에 진행할 수 있는 LLM 호출 수
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "32"))
+
+_OPENAI_PREFIXES = ("gpt-", "o1", "o3", "o4", "openai:")
+# agent(ScheduledChatModel) 호출의 schema label
+AGENT_CALL = "AgentStep"
+
+# --------- 메트릭 ---------
+
+LLM_CALLS = Counter(
+    "orchestrator_llm_calls_total", "Structured LLM calls", ("model", "schema", "status")
+)
+LLM_TOKENS = Counter(
+    "orchestrator_llm_tokens_total",
+    "LLM tokens (type=prompt|completion, source=usage|estimate)",
+    ("model", "schema", "type", "source"),
+)
+LLM_COST = Counter("orchestrator_llm_cost_usd_total", "Estimated LLM cost in USD", ("model",))
+LLM_IN_FLIGHT = Gauge("orchestrator_llm_in_flight", "LLM calls currently holding a slot")
+LLM_SLOT_WAIT = Histogram(
+    "orchestrator_llm_slot_wait_seconds", "Time spent waiting for an LLM concurrency slot"
+)
+LLM_HTTP_RESPONSES = Counter(
+    "orchestrator_llm_http_responses_total", "HTTP responses from the LLM provider", ("status",)
+)
+LLM_HTTP_RETRIES = Counter(
+    "orchestrator_llm_http_retries_total", "HTTP requests that were SDK-level retries"
+)
+
+
+def _is_openai(model: str) -> bool:
+    return model.startswith(_OPENAI_PREFIXES)
+
+
+def _limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=LLM_MAX_CONNECTIONS,
+        max_keepalive_connections=LLM_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=LLM_KEEPALIVE_EXPIRY,
+    )
+
+
+def _on_request(request: httpx.Request) -> None:
+    # openai SDK는 재시도 요청에 x-stainless-retry-count(1, 2, ...)를 붙인다
+    if request.headers.get("x-stainless-retry-count", "0") not in ("", "0"):
+        LLM_HTTP_RETRIES.inc()
+    # 요청 timeout을 시도 deadline에 맞춘다 (hedge에서 진 sync 시도가 LLM_TIMEOUT까지 남지 않게)
+    left = attempt_time_left()
+    if left is not None:
+        request.extensions["timeout"] = httpx.Timeout(min(LLM_TIMEOUT, max(left, 0.001))).as_dict()
+
+
+def _on_response(response: httpx.Response) -> None:
+    LLM_HTTP_RESPONSES.inc(status=str(response.status_code))
+
+
+async def _aon_request(request: httpx.Request) -> None:
+    _on_request(request)
+
+
+async def _aon_response(response: httpx.Response) -> None:
+    _on_response(response)
+
+
+@lru_cache(maxsize=1)
+def get_http_client() -> httpx.Client:
+    """프로세스 공용 sync HTTP client (connection pool + keep-alive)."""
+    return httpx.Client(
+        limits=_limits(),
+        timeout=LLM_TIMEOUT,
+        event_hooks={"request": [_on_request], "response": [_on_response]},
+    )
+
+
+@lru_cache(maxsize=1)
+def get_async_http_client() -> httpx.AsyncClient:
+    """프로세스 공용 async HTTP client (connection pool + keep-alive)."""
+    return httpx.AsyncClient(
+        limits=_limits(),
+        timeout=LLM_TIMEOUT,
+        event_hooks={"request": [_aon_request], "response": [_aon_response]},
+    )
+
+
+_model_factory: Optional[ChatModelFactory] = None
+
+
+def set_chat_model_factory(factory: Optional[ChatModelFactory]) -> None:
+    """
+    init_chat_model 대신 factory로 chat model을 만든다 (None이면 기본 동작으로 복원).
+    이미 만들어 둔 model/runnable 캐시는 비운다.
+    """
+    global _model_factory
+    _model_factory = factory
+    get_chat_model.cache_clear()
+    get_structured_model.cache_clear()
+    get_streaming_structured_model.cache_clear()
+
+
+@contextmanager
+def chat_model_factory(factory: ChatModelFactory) -> Iterator[None]:
+    """이 context 안에서만 factory로 chat model을 만든다."""
+    previous = _model_factory
+    set_chat_model_factory(factory)
+    try:
+        yield
+    finally:
+        set_chat_model_factory(previous)
+
+
+@lru_cache(maxsize=None)
+def get_chat_model(model: str, temperature: float) -> BaseChatModel:
+    """(model, temperature)별 chat model을 한 번만 생성."""
+    if _model_factory is not None:
+        return _model_factory(model, temperature)
+    kwargs: dict = {"temperature": temperature}
+    if _is_openai(model):
+        kwargs["http_client"] = get_http_client()
+        kwargs["http_async_client"] = get_async_http_client()
+        # custom http client를 넘기면 기본값이 꺼지므로 스트리밍 usage를 명시적으로 켠다
+        kwargs["stream_usage"] = True
+        # 재시도는 resilience.py가 (deadline 안에서) 맡는다
+        kwargs["max_retries"] = 0
+    return init_chat_model(model, **kwargs)
+
+
+@lru_cache(maxsize=None)
+def get_structured_model(model: str, temperature: float, schema: type[BaseModel]) -> Runnable:
+    """(model, temperature, schema)별 structured-output runnable을 한 번만 생성."""
+    return get_chat_model(model, temperature).with_structured_output(schema)
+
+
+@lru_cache(maxsize=None)
+def get_streaming_structured_model(
+    model: str, temperature: float, schema: type[BaseModel]
+) -> Runnable:
+    """
+    토큰 스트리밍용 structured-output runnable.
+    JSON schema(dict)로 바인딩하면 JsonOutputParser가 누적 partial dict를 흘려준다.
+    """
+    return get_chat_model(model, temperature).with_structured_output(
+        schema.model_json_schema(), method="json_schema"
+    )
+
+
+# --------- 동시성 제한 ---------
+
+_sync_slots = threading.BoundedSemaphore(LLM_MAX_CONCURRENCY)
+# asyncio.Semaphore는 event loop에 묶이므로 loop별로 하나씩 만든다
+_async_slots: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+@contextmanager
+def llm_slot() -> Iterator[None]:
+    """sync 호출용 동시성 슬롯 (LLM_MAX_CONCURRENCY)."""
+    start = time.perf_counter()
+    with _sync_slots:
+        LLM_SLOT_WAIT.observe(time.perf_counter() - start)
+        with LLM_IN_FLIGHT.track_inprogress():
+            yield
+
+
+@asynccontextmanager
+async def allm_slot() -> AsyncIterator[None]:
+    """async 호출용 동시성 슬롯 (LLM_MAX_CONCURRENCY)."""
+    loop = asyncio.get_running_loop()
+    sem = _async_slots.get(loop)
+    if sem is None:
+        sem = _async_slots[loop] = asyncio.Semaphore(LLM_MAX_CONCURRENCY)
+    start = time.perf_counter()
+    async with sem:
+        LLM_SLOT_WAIT.observe(time.perf_counter() - start)
+        with LLM_IN_FLIGHT.track_inprogress():
+            yield
+
+
+# --------- 호출 계측 ---------
+
+
+class _UsageCallback(BaseCallbackHandler):
+    """호출 1번의 provider token usage를 모은다 (스트리밍이면 마지막 chunk에 실려 온다)."""
+
+    def __init__(self) -> None:
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.reported = False
+
+    def on_llm_end(self, response: LLMResult, **kwargs: Any) -> None:
+        for generations in response.generations:
+            for generation in generations:
+                usage = getattr(getattr(generation, "message", None), "usage_metadata", None)
+                if usage:
+                    self.prompt_tokens += usage.get("input_tokens", 0)
+                    self.completion_tokens += usage.get("output_tokens", 0)
+                    self.reported = True
+
+
+def _record_call(
+    name: str,
+    model: str,
+    messages: list[dict],
+    usage: _UsageCallback,
+    output: Any,
+    error: Optional[BaseException],
+) -> int:
+    """메트릭 기록 (name: schema 이름). 이번 시도의 token 수(prompt + completion)를 돌려준다."""
+    if error is None:
+        status = "ok"
+    elif isinstance(error, asyncio.CancelledError):
+        # hedge에서 진 시도 / timeout으로 버린 시도
+        status = "cancelled"
+    else:
+        status = "error"
+    LLM_CALLS.inc(model=model, schema=name, status=status)
+    if usage.reported:
+        prompt, completion, source = usage.prompt_tokens, usage.completion_tokens, "usage"
+    else:
+        prompt = count_message_tokens(messages, model)
+        if isinstance(output, BaseModel):
+            output = output.model_dump(exclude_none=True)
+        completion = count_tokens(json.dumps(output, ensure_ascii=False), model) if output else 0
+        source = "estimate"
+    LLM_TOKENS.inc(prompt, model=model, schema=name, type="prompt", source=source)
+    LLM_TOKENS.inc(completion, model=model, schema=name, type="completion", source=source)
+    LLM_COST.inc(estimate_cost_usd(model, prompt, completion), model=model)
+    annotate(model=model, prompt_tokens=prompt, completion_tokens=completion, token_source=source)
+    return prompt + completion
+
+
+def _invoke_once(
+    schema: type[TModel], messages: list[dict], model: str, temperature: float
+) -> TModel:
+    """시도 1번 (sync)."""
+    runnable = get_structured_model(model, temperature, schema)
+    # 큐에서 포기한 시도는 보내지 않았으므로 기록하지 않는다
+    permit = get_scheduler().acquire(model, messages)
+    usage = _UsageCallback()
+    result: Optional[TModel] = None
+    error: Optional[BaseException] = None
+    try:
+        with llm_slot():
+            result = runnable.invoke(messages, config={"callbacks": [usage]})
+        return result
+    except BaseException as e:
+        error = e
+        raise
+    finally:
+        permit.settle(_record_call(schema.__name__, model, messages, usage, result, error), error)
+
+
+async def _ainvoke_once(
+    schema: type[TModel], messages: list[dict], model: str, temperature: float
+) -> TModel:
+    """시도 1번 (async)."""
+    runnable = get_structured_model(model, temperature, schema)
+    permit = await get_scheduler().aacquire(model, messages)
+    usage = _UsageCallback()
+    result: Optional[TModel] = None
+    error: Optional[BaseException] = None
+    try:
+        async with allm_slot():
+            result = await runnable.ainvoke(messages, config={"callbacks": [usage]})
+        return result
+    except BaseException as e:
+        error = e
+        raise
+    finally:
+        permit.settle(_record_call(schema.__name__, model, messages, usage, result, error), error)
+
+
+def invoke_structured(
+    schema: type[TModel],
+    messages: list[dict],
+    *,
+    model: str,
+    temperature: float,
+) -> TModel:
+    """Structured-output 호출 (sync). 모델을 쓸 수 없으면 resilience.LLMUnavailable."""
+    with stage("llm", schema.__name__):
+        return call_with_resilience(
+            lambda m: _invoke_once(schema, messages, m, temperature), model, schema.__name__
+        )
+
+
+async def ainvoke_structured(
+    schema: type[TModel],
+    messages: list[dict],
+    *,
+    model: str,
+    temperature: float,
+    on_partial: Optional[PartialCallback] = None,
+) -> TModel:
+    """
+    Structured-output 호출 (async). 모델을 쓸 수 없으면 resilience.LLMUnavailable.
+
+    on_partial이 있으면 OpenAI 모델은 토큰 스트리밍으로 호출하고,
+    chunk마다 누적 partial dict를 넘긴다 (마지막 호출은 done=True).
+    스트리밍을 지원하지 않는 모델은 완성된 결과로 한 번만 호출된다.
+    스트리밍 호출은 hedge하지 않고, partial을 넘기기 시작한 뒤에는 다시 시도하지 않는다.
+    """
+    name = schema.__name__
+    with stage("llm", name):
+        if on_partial is None or not _is_openai(model):
+            output = await acall_with_resilience(
+                lambda m: _ainvoke_once(schema, messages, m, temperature), model, name
+            )
+            if on_partial is not None:
+                on_partial(output.model_dump(), True)
+            return output
+
+        started = False
+
+        async def stream_once(m: str) -> dict:
+            nonlocal started
+            if not _is_openai(m):
+                # 스트리밍을 지원하지 않는 fallback model
+                return (await _ainvoke_once(schema, messages, m, temperature)).model_dump()
+            runnable = get_streaming_structured_model(m, temperature, schema)
+            permit = await get_scheduler().aacquire(m, messages)
+            usage = _UsageCallback()
+            partial: dict = {}
+            error: Optional[BaseException] = None
+            try:
+                async with allm_slot():
+                    async for partial in runnable.astream(messages, config={"callbacks": [usage]}):
+                        started = True
+                        on_partial(partial, False)
+                return partial
+            except BaseException as e:
+                error = e
+                raise
+            finally:
+                permit.settle(_record_call(schema.__name__, m, messages, usage, partial, error), error)
+
+        partial = await acall_with_resilience(
+            stream_once, model, name, hedge=False, can_retry=lambda: not started
+        )
+        on_partial(partial, True)
+        with stage("validate", name):
+            return schema.model_validate(partial)
+
+
+def completed_items(field: str, on_item: Callable[[dict], None]) -> PartialCallback:
+    """
+    partial dict의 list field(예: keywords)에서 완성된 항목만 한 번씩 on_item으로 넘기는 callback.
+    스트리밍 중에는 다음 항목이 시작되어야 이전 항목이 완성된 것으로 본다.
+    """
+    emitted = 0
+
+    def on_partial(partial: dict, done: bool) -> None:
+        nonlocal emitted
+        items = partial.get(field) or []
+        ready = len(items) if done else len(items) - 1
+        while emitted < ready:
+            on_item(items[emitted])
+            emitted += 1
+
+    return on_partial
+
+
+# --------- agent용 chat model ---------
+
+
+def _message_dicts(messages: list[BaseMessage]) -> list[dict]:
+    # scheduler의 TPM 추정용 (content만 센다)
+    return [{"role": message.type, "content": message.content} for message in messages]
+
+
+def _chat_once(
+    model: str, temperature: float, messages: list[BaseMessage], kwargs: dict
+) -> BaseMessage:
+    """시도 1번 (sync, tool 호출이 있는 agent step)."""
+    prompt = _message_dicts(messages)
+    permit = get_scheduler().acquire(model, prompt)
+    usage = _UsageCallback()
+    result: Optional[BaseMessage] = None
+    error: Optional[BaseException] = None
+    try:
+        with llm_slot():
+            result = get_chat_model(model, temperature).invoke(
+                messages, config={"callbacks": [usage]}, **kwargs
+            )
+        return result
+    except BaseException as e:
+        error = e
+        raise
+    finally:
+        permit.settle(_record_call(AGENT_CALL, model, prompt, usage, result, error), error)
+
+
+async def _achat_once(
+    model: str, temperature: float, messages: list[BaseMessage], kwargs: dict
+) -> BaseMessage:
+    """시도 1번 (async)."""
+    prompt = _message_dicts(messages)
+    permit = await get_scheduler().aacquire(model, prompt)
+    usage = _UsageCallback()
+    result: Optional[BaseMessage] = None
+    error: Optional[BaseException] = None
+    try:
+        async with allm_slot():
+            result = await get_chat_model(model, temperature).ainvoke(
+                messages, config={"callbacks": [usage]}, **kwargs
+            )
+        return result
+    except BaseException as e:
+        error = e
+        raise
+    finally:
+        permit.settle(_record_call(AGENT_CALL, model, prompt, usage, result, error), error)
+
+
+class ScheduledChatModel(BaseChatModel):
+    """
+    create_react_agent 등 chat model을 직접 받는 곳에 넘기는 모델.
+    호출마다 structured 호출과 같은 경로(scheduler permit → 동시성 슬롯 → resilience)를 거친다.
+    bind_tools의 tool schema 변환은 실제 모델(get_chat_model)에 맡긴다.
+    """
+
+    model: str
+    temperature: float = 0.0
+
+    @property
+    def _llm_type(self) -> str:
+        return "scheduled"
+
+    def bind_tools(self, tools: Any, **kwargs: Any) -> Runnable:
+        bound = get_chat_model(self.model, self.temperature).bind_tools(tools, **kwargs)
+        return self.bind(**getattr(bound, "kwargs", {}))
+
+    def _generate(
+        self,
+        messages: list[BaseMessage],
+        stop: Optional[list[str]] = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        kwargs = {**kwargs, "stop": stop} if stop else kwargs
+        with stage("llm", AGENT_CALL):
+            message = call_with_resilience(
+                lambda m: _chat_once(m, self.temperature, messages, kwargs), self.model, AGENT_CALL
+            )
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    async def _agenerate(
+        self,
+        messages: list[BaseMessage],
+        stop: Optional[list[str]] = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        kwargs = {**kwargs, "stop": stop} if stop else kwargs
+        with stage("llm", AGENT_CALL):
+            message = await acall_with_resilience(
+                lambda m: _achat_once(m, self.temperature, messages, kwargs),
+                self.model,
+                AGENT_CALL,
+            )
+        return ChatResult(generations=[ChatGeneration(message=message)])
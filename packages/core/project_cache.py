@@ -0,0 +1,368 @@
+# packages/core/project_cache.py
+"""
+생성된 ProjectOutput 유사도 캐시 (MinHash + LSH, 로컬 SQLite).
+
+많은 유저가 거의 같은 validated_missing_keywords + Preferences로 프로젝트 생성을 요청한다.
+생성 결과를 (canonical missing keyword 집합, Preferences)로 저장해 두고,
+Jaccard 유사도가 threshold 이상인 이웃을 찾는다.
+
+- Preferences는 정규화한 fingerprint가 같아야 한다 (스택이 다른 안을 주지 않도록)
+- keyword 집합은 keyword ID(blake2b) 위의 MinHash signature (NUM_PERM개)로 요약하고,
+  BANDS개 band로 나눈 LSH bucket에서 후보만 찾는다 (전체 스캔 없음, sub-millisecond)
+- 후보는 저장된 keyword 집합으로 정확한 Jaccard를 다시 계산해서 threshold와 비교한다
+- BANDS × ROWS = 16 × 4 → Jaccard 0.5 근처부터 후보로 잡힌다 (threshold는 그 이상으로 둔다)
+
+PROJECT_CACHE_MODE:
+- serve: 이웃이 현재 missing keyword를 모두 다루면 생성 없이 그 결과를 돌려주고
+  (covers_keywords는 현재 missing으로 좁힘), 아니면 seed처럼 새로 생성한다
+- seed: 이웃을 ideation few-shot 예시로만 쓰고 새로 생성한다
+- off: 캐시를 읽지도 쓰지도 않는다
+요청 단위로는 project_cache_mode(...) context로 바꾼다.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, Iterator, Literal, Optional, cast
+
+import numpy as np
+
+from .metrics import Sample, register_collector
+from .schemas import Preferences, ProjectOutput
+from .schemas.utils import norm_text
+from .storage import data_path
+
+ProjectCacheMode = Literal["serve", "seed", "off"]
+
+# 환경변수 설정값
+PROJECT_CACHE_MODE = cast(ProjectCacheMode, os.getenv("PROJECT_CACHE_MODE", "serve"))
+PROJECT_CACHE_THRESHOLD = float(os.getenv("PROJECT_CACHE_THRESHOLD", "0.8"))
+PROJECT_CACHE_MAX_ENTRIES = int(os.getenv("PROJECT_CACHE_MAX_ENTRIES", "10000"))
+PROJECT_CACHE_TTL_SECONDS = float(os.getenv("PROJECT_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+
+# MinHash / LSH 파라미터
+NUM_PERM = 64
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+_PRIME = (1 << 31) - 1  # (a * x + b)가 uint64를 넘지 않도록 31bit Mersenne prime
+
+_rng = np.random.default_rng(0x5EED)
+_A = _rng.integers(1, _PRIME, size=NUM_PERM, dtype=np.uint64)
+_B = _rng.integers(0, _PRIME, size=NUM_PERM, dtype=np.uint64)
+
+_mode_var: contextvars.ContextVar[Optional[ProjectCacheMode]] = contextvars.ContextVar(
+    "project_cache_mode", default=None
+)
+
+
+@contextmanager
+def project_cache_mode(mode: Optional[ProjectCacheMode]) -> Iterator[None]:
+    """이 context 안의 프로젝트 생성은 mode로 캐시를 쓴다 (None이면 PROJECT_CACHE_MODE)."""
+    token = _mode_var.set(mode)
+    try:
+        yield
+    finally:
+        _mode_var.reset(token)
+
+
+def current_mode() -> ProjectCacheMode:
+    return _mode_var.get() or PROJECT_CACHE_MODE
+
+
+@lru_cache(maxsize=65536)
+def keyword_id(keyword: str) -> int:
+    """canonical keyword → MinHash용 정수 ID (프로세스와 무관하게 고정)."""
+    digest = hashlib.blake2b(keyword.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") % _PRIME
+
+
+def minhash(keywords: Iterable[str]) -> np.ndarray:
+    """keyword 집합의 MinHash signature (NUM_PERM개, 빈 집합은 호출하지 않는다)."""
+    ids = np.fromiter((keyword_id(k) for k in keywords), dtype=np.uint64)
+    return ((np.outer(ids, _A) + _B) % _PRIME).min(axis=0)
+
+
+def preferences_key(preferences: Optional[Preferences]) -> str:
+    """순서 / 대소문자 / 공백 차이를 무시한 Preferences fingerprint."""
+    prefs = preferences or Preferences()
+    payload = json.dumps(
+        {
+            "stack": sorted({norm_text(s).lower() for s in prefs.stack}),
+            "constraints": sorted({norm_text(c).lower() for c in prefs.constraints}),
+            "role": norm_text(prefs.role or "").lower(),
+        },
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def jaccard(a: frozenset[str], b: frozenset[str]) -> float:
+    return len(a & b) / len(a | b) if a or b else 1.0
+
+
+@dataclass
+class CachedProjects:
+    """lookup 결과: 이웃 항목의 keyword 집합, 유사도, 저장된 ProjectOutput."""
+
+    keywords: frozenset[str]
+    similarity: float
+    output: ProjectOutput
+
+
+@dataclass
+class ProjectCacheStats:
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def as_dict(self) -> dict:
+        return {**asdict(self), "hit_rate": round(self.hit_rate, 4)}
+
+
+@dataclass
+class _Entry:
+    prefs: str
+    keywords: frozenset[str]
+    bands: tuple[bytes, ...]
+    accessed_at: float
+
+
+def _entry_key(prefs: str, keywords: frozenset[str]) -> str:
+    raw = prefs + "\x00" + "\x00".join(sorted(keywords))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _bands(signature: np.ndarray) -> tuple[bytes, ...]:
+    return tuple(signature[i * ROWS : (i + 1) * ROWS].tobytes() for i in range(BANDS))
+
+
+class ProjectCache:
+    """
+    (missing keyword 집합, Preferences) → ProjectOutput.
+
+    메모리에는 LSH bucket + 항목 메타데이터(keyword 집합)만 두고 (시작 시 SQLite에서 한 번 로드),
+    결과 JSON은 SQLite에만 둔다 (hit 때 primary key로 한 행만 읽는다).
+    오래 안 쓰인 항목부터 TTL / 개수 기준으로 evict.
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[Path | str] = None,
+        *,
+        threshold: float = PROJECT_CACHE_THRESHOLD,
+        max_entries: int = PROJECT_CACHE_MAX_ENTRIES,
+        ttl_seconds: float = PROJECT_CACHE_TTL_SECONDS,
+    ) -> None:
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.stats = ProjectCacheStats()
+        self._lock = threading.Lock()
+        self._entries: dict[str, _Entry] = {}
+        # (prefs, band index, band hash) → entry keys
+        self._buckets: dict[tuple[str, int, bytes], set[str]] = {}
+        # hit으로 바뀐 accessed_at (다음 write 때 한 번에 기록)
+        self._touched: dict[str, float] = {}
+        self._writes_since_prune = 0
+        self._conn = sqlite3.connect(
+            str(db_path or data_path("project_cache.sqlite3")), check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS project_cache (
+                key TEXT PRIMARY KEY,
+                prefs TEXT NOT NULL,
+                keywords TEXT NOT NULL,
+                output TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_project_cache_accessed ON project_cache (accessed_at)"
+        )
+        self._conn.commit()
+        self._load()
+
+    def _load(self) -> None:
+        now = time.time()
+        with self._lock:
+            for key, prefs, keywords, accessed_at in self._conn.execute(
+                "SELECT key, prefs, keywords, accessed_at FROM project_cache WHERE accessed_at > ?",
+                (now - self.ttl_seconds,),
+            ):
+                kws = frozenset(json.loads(keywords))
+                self._index(key, _Entry(prefs, kws, _bands(minhash(kws)), accessed_at))
+
+    # --------- public API ---------
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(
+        self, keywords: Iterable[str], preferences: Optional[Preferences] = None
+    ) -> Optional[CachedProjects]:
+        """Jaccard 유사도가 threshold 이상인 가장 가까운 항목 (없으면 None)."""
+        kws = frozenset(keywords)
+        if not kws:
+            return None
+        prefs = preferences_key(preferences)
+        bands = _bands(minhash(kws))
+        now = time.time()
+        with self._lock:
+            candidates: set[str] = set()
+            for i, band in enumerate(bands):
+                candidates |= self._buckets.get((prefs, i, band), set())
+            best_key, best = None, 0.0
+            for key in candidates:
+                entry = self._entries[key]
+                if entry.accessed_at + self.ttl_seconds <= now:
+                    continue
+                similarity = jaccard(kws, entry.keywords)
+                if similarity > best:
+                    best_key, best = key, similarity
+            if best_key is None or best < self.threshold:
+                self.stats.misses += 1
+                return None
+            row = self._conn.execute(
+                "SELECT output FROM project_cache WHERE key = ?", (best_key,)
+            ).fetchone()
+            if row is None:
+                self._unindex(best_key)
+                self.stats.misses += 1
+                return None
+            entry = self._entries[best_key]
+            entry.accessed_at = self._touched[best_key] = now
+            self.stats.hits += 1
+        return CachedProjects(entry.keywords, best, ProjectOutput.model_validate_json(row[0]))
+
+    def put(
+        self,
+        keywords: Iterable[str],
+        preferences: Optional[Preferences],
+        output: ProjectOutput,
+    ) -> None:
+        """생성 결과 저장 (같은 keyword 집합 + Preferences면 교체)."""
+        kws = frozenset(keywords)
+        if not kws:
+            return
+        prefs = preferences_key(preferences)
+        key = _entry_key(prefs, kws)
+        payload = output.model_dump_json()
+        now = time.time()
+        entry = _Entry(prefs, kws, _bands(minhash(kws)), now)
+        with self._lock:
+            self._unindex(key)
+            self._index(key, entry)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO project_cache "
+                "(key, prefs, keywords, output, created_at, accessed_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (key, prefs, json.dumps(sorted(kws)), payload, now, now),
+            )
+            self._flush_touched()
+            self.stats.writes += 1
+            self._writes_since_prune += 1
+            if self._writes_since_prune >= 100 or len(self._entries) > self.max_entries:
+                self._prune(now)
+            self._conn.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._buckets.clear()
+            self._touched.clear()
+            self._conn.execute("DELETE FROM project_cache")
+            self._conn.commit()
+
+    # --------- 내부 (lock 안에서 호출) ---------
+
+    def _index(self, key: str, entry: _Entry) -> None:
+        self._entries[key] = entry
+        for i, band in enumerate(entry.bands):
+            self._buckets.setdefault((entry.prefs, i, band), set()).add(key)
+
+    def _unindex(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        self._touched.pop(key, None)
+        if entry is None:
+            return
+        for i, band in enumerate(entry.bands):
+            bucket = self._buckets.get((entry.prefs, i, band))
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self._buckets[(entry.prefs, i, band)]
+
+    def _flush_touched(self) -> None:
+        if self._touched:
+            self._conn.executemany(
+                "UPDATE project_cache SET accessed_at = ? WHERE key = ?",
+                [(accessed_at, key) for key, accessed_at in self._touched.items()],
+            )
+            self._touched.clear()
+
+    def _prune(self, now: float) -> None:
+        """TTL 지난 항목 + max_entries 초과분을 오래 안 쓰인 순으로 삭제."""
+        self._writes_since_prune = 0
+        expired = [k for k, e in self._entries.items() if e.accessed_at + self.ttl_seconds <= now]
+        overflow = len(self._entries) - len(expired) - self.max_entries
+        if overflow > 0:
+            alive = sorted(
+                (e.accessed_at, k)
+                for k, e in self._entries.items()
+                if e.accessed_at + self.ttl_seconds > now
+            )
+            expired += [k for _, k in alive[:overflow]]
+        for key in expired:
+            self._unindex(key)
+        self._conn.executemany("DELETE FROM project_cache WHERE key = ?", [(k,) for k in expired])
+        self.stats.evictions += len(expired)
+
+
+_cache: Optional[ProjectCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_project_cache() -> ProjectCache:
+    """프로세스 공용 ProjectCache (ORCHESTRATOR_DATA_DIR/project_cache.sqlite3)."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = ProjectCache()
+        return _cache
+
+
+def _collect() -> Iterable[Sample]:
+    if _cache is None:
+        return
+    stats = _cache.stats
+    for name, kind, help, value in (
+        ("hits_total", "counter", "Project cache hits (similar gap found)", stats.hits),
+        ("misses_total", "counter", "Project cache misses", stats.misses),
+        ("writes_total", "counter", "Generated project outputs stored", stats.writes),
+        ("evictions_total", "counter", "Project cache evictions (TTL / max entries)",
+         stats.evictions),
+        ("entries", "gauge", "Project cache entries", len(_cache)),
+    ):
+        yield Sample(f"orchestrator_project_cache_{name}", kind, help, (), value)
+
+
+register_collector(_collect)
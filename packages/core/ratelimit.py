@@ -0,0 +1,478 @@
+# packages/core/ratelimit.py
+"""
+프로세스 공용 LLM 호출 scheduler (provider RPM / TPM 한도).
+
+llm.py의 시도(attempt) 1번마다 acquire / aacquire로 permit을 받은 뒤에 요청을 보낸다
+(packages/tools, packages/agents의 모든 LLM 호출이 llm.py를 거치므로 전부 여기로 모인다).
+
+- 모델별 token bucket 두 개: 분당 요청 수(RPM), 분당 token 수(TPM).
+  TPM 비용은 보내기 전에 prompt token 수(tokens.count_message_tokens) + 예상 completion
+  (LLM_COMPLETION_TOKENS_ESTIMATE)으로 잡고, 응답 후 실제 usage로 정산한다.
+  bucket 크기는 LLM_RATE_LIMIT_BURST_SECONDS초 분량 (provider는 분당 한도를 초 단위로 나눠서
+  적용하므로 1분치를 한꺼번에 보내면 429가 난다).
+- priority class: interactive(/analyze 등) → batch 순서로 엄격하게 먼저 보낸다.
+- 같은 class 안에서는 tenant별 start-time fair queuing (token 비용 기준):
+  요청이 많은 tenant가 큐를 채워도 다른 tenant의 요청이 차례대로 끼어든다.
+- 429를 받으면 그 모델의 bucket을 Retry-After(없으면 1초) 동안 멈춘다
+  → 동시에 돌던 요청들이 한꺼번에 재시도해서 다시 부딪히지 않고 큐에서 순서대로 나간다.
+
+한도(LLM_RPM_LIMIT / LLM_TPM_LIMIT / LLM_RATE_LIMITS)가 없는 모델은 큐 없이 바로 통과한다.
+대기 시간은 시도 timeout(resilience.attempt_timeout)에 포함된다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, Iterator, Literal, Optional, cast
+
+from .metrics import Counter, Histogram, Sample, register_collector
+from .resilience import AttemptTimeout, attempt_timeout, failure_reason, retry_after
+from .tokens import count_message_tokens
+from .tracing import annotate
+
+Priority = Literal["interactive", "batch"]
+# 앞에 있을수록 먼저 나간다
+PRIORITIES: tuple[Priority, ...] = ("interactive", "batch")
+
+# 환경변수 설정값 (0이면 한도 없음)
+LLM_RPM_LIMIT = int(os.getenv("LLM_RPM_LIMIT", "0"))
+LLM_TPM_LIMIT = int(os.getenv("LLM_TPM_LIMIT", "0"))
+# 모델별 한도: "gpt-4o-mini=500:200000,gpt-4.1-mini=500:30000" (rpm:tpm)
+LLM_RATE_LIMITS = os.getenv("LLM_RATE_LIMITS", "")
+# 한도의 이 비율까지만 쓴다 (다른 프로세스 / 추정 오차 여유)
+LLM_RATE_LIMIT_HEADROOM = float(os.getenv("LLM_RATE_LIMIT_HEADROOM", "0.9"))
+LLM_RATE_LIMIT_BURST_SECONDS = float(os.getenv("LLM_RATE_LIMIT_BURST_SECONDS", "1"))
+LLM_COMPLETION_TOKENS_ESTIMATE = int(os.getenv("LLM_COMPLETION_TOKENS_ESTIMATE", "512"))
+# 429에 Retry-After가 없을 때 bucket을 멈추는 시간 (초)
+LLM_RATE_LIMIT_PAUSE = float(os.getenv("LLM_RATE_LIMIT_PAUSE", "1"))
+
+DEFAULT_TENANT = "default"
+
+# --------- 메트릭 ---------
+
+LLM_QUEUE_WAIT = Histogram(
+    "orchestrator_llm_queue_wait_seconds",
+    "Time an LLM attempt waited for RPM/TPM budget",
+    ("priority",),
+)
+LLM_RATE_PAUSES = Counter(
+    "orchestrator_llm_rate_limit_pauses_total",
+    "Times a model's buckets were paused after a 429",
+    ("model",),
+)
+LLM_RATE_TOKENS = Counter(
+    "orchestrator_llm_rate_limit_tokens_total",
+    "TPM tokens charged before the call (estimated) and after it (actual)",
+    ("model", "kind"),
+)
+
+# --------- 요청 context (priority / tenant) ---------
+
+_priority: ContextVar[Priority] = ContextVar("llm_priority", default="interactive")
+_tenant: ContextVar[str] = ContextVar("llm_tenant", default=DEFAULT_TENANT)
+
+
+@contextmanager
+def llm_scheduling(
+    tenant: Optional[str] = None, priority: Optional[Priority] = None
+) -> Iterator[None]:
+    """이 context 안의 LLM 호출을 tenant / priority class로 큐에 넣는다 (None이면 그대로)."""
+    tokens = []
+    if tenant is not None:
+        tokens.append((_tenant, _tenant.set(tenant or DEFAULT_TENANT)))
+    if priority is not None:
+        if priority not in PRIORITIES:
+            raise ValueError(f"unknown priority: {priority}")
+        tokens.append((_priority, _priority.set(priority)))
+    try:
+        yield
+    finally:
+        for var, token in reversed(tokens):
+            var.reset(token)
+
+
+def current_priority() -> Priority:
+    return _priority.get()
+
+
+def current_tenant() -> str:
+    return _tenant.get()
+
+
+# --------- token bucket ---------
+
+
+class _Bucket:
+    """초당 rate만큼 차오르는 bucket (정산으로 음수가 될 수 있다 = 빚)."""
+
+    def __init__(self, per_minute: float) -> None:
+        self.rate = per_minute / 60.0
+        self.capacity = max(1.0, self.rate * LLM_RATE_LIMIT_BURST_SECONDS)
+        self.level = self.capacity
+        self.updated = time.monotonic()
+
+    def refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_for(self, amount: float) -> float:
+        """amount를 꺼낼 수 있을 때까지 남은 시간 (bucket보다 큰 요청은 가득 찼을 때)."""
+        need = min(amount, self.capacity) - self.level
+        return 0.0 if need <= 0 else need / self.rate
+
+    def take(self, amount: float) -> None:
+        self.level -= min(amount, self.capacity)
+
+    def give(self, amount: float) -> None:
+        self.level = min(self.capacity, self.level + amount)
+
+
+@dataclass(eq=False)
+class _Waiter:
+    model: str
+    priority: Priority
+    tenant: str
+    cost: float
+    notify: Optional[Callable[[], None]] = None
+    start_tag: float = 0.0
+    enqueued_at: float = field(default_factory=time.monotonic)
+    granted: bool = False
+    cancelled: bool = False
+    event: threading.Event = field(default_factory=threading.Event)
+
+    def grant(self) -> None:
+        self.granted = True
+        LLM_QUEUE_WAIT.observe(time.monotonic() - self.enqueued_at, priority=self.priority)
+        self.event.set()
+        if self.notify is not None:
+            self.notify()
+
+
+class _Limiter:
+    """모델 1개의 RPM / TPM bucket + priority class별 fair queue."""
+
+    def __init__(self, model: str, rpm: int, tpm: int) -> None:
+        self.model = model
+        self.requests = _Bucket(rpm * LLM_RATE_LIMIT_HEADROOM) if rpm > 0 else None
+        self.tokens = _Bucket(tpm * LLM_RATE_LIMIT_HEADROOM) if tpm > 0 else None
+        self.paused_until = 0.0
+        self._seq = itertools.count()
+        # class별 (start tag, seq, waiter) heap
+        self._queues: dict[Priority, list[tuple[float, int, _Waiter]]] = {
+            p: [] for p in PRIORITIES
+        }
+        # start-time fair queuing: class별 virtual time과 tenant별 마지막 finish tag
+        self._vtime: dict[Priority, float] = {p: 0.0 for p in PRIORITIES}
+        self._finish: dict[Priority, dict[str, float]] = {p: {} for p in PRIORITIES}
+
+    def _buckets(self) -> list[_Bucket]:
+        return [b for b in (self.requests, self.tokens) if b is not None]
+
+    def enqueue(self, waiter: _Waiter) -> None:
+        p = waiter.priority
+        finish = self._finish[p]
+        waiter.start_tag = max(self._vtime[p], finish.get(waiter.tenant, 0.0))
+        finish[waiter.tenant] = waiter.start_tag + waiter.cost
+        heapq.heappush(self._queues[p], (waiter.start_tag, next(self._seq), waiter))
+
+    def _head(self) -> Optional[_Waiter]:
+        for p in PRIORITIES:
+            queue = self._queues[p]
+            while queue and queue[0][2].cancelled:
+                heapq.heappop(queue)
+            if queue:
+                return queue[0][2]
+        return None
+
+    def _wait_for(self, waiter: _Waiter, now: float) -> float:
+        wait = max(0.0, self.paused_until - now)
+        if self.requests is not None:
+            wait = max(wait, self.requests.wait_for(1))
+        if self.tokens is not None:
+            wait = max(wait, self.tokens.wait_for(waiter.cost))
+        return wait
+
+    def dispatch(self, now: float) -> float:
+        """보낼 수 있는 만큼 head부터 grant. 다음 head까지 남은 시간 (큐가 비면 inf)."""
+        for bucket in self._buckets():
+            # 멈춘 동안에는 차오르지 않는다 (재개 직후 한꺼번에 나가지 않도록)
+            bucket.updated = max(bucket.updated, min(now, self.paused_until))
+            bucket.refill(now)
+        while True:
+            head = self._head()
+            if head is None:
+                return math.inf
+            wait = self._wait_for(head, now)
+            if wait > 0:
+                return wait
+            heapq.heappop(self._queues[head.priority])
+            if self.requests is not None:
+                self.requests.take(1)
+            if self.tokens is not None:
+                self.tokens.take(head.cost)
+            p = head.priority
+            self._vtime[p] = head.start_tag
+            # virtual time을 지난 tenant는 밀린 요청이 없다 → 기록 삭제
+            finish = self._finish[p]
+            for tenant in [t for t, tag in finish.items() if tag <= head.start_tag]:
+                del finish[tenant]
+            head.grant()
+
+    def refund(self, waiter: _Waiter) -> None:
+        """grant 받고 보내지 않은 요청."""
+        if self.requests is not None:
+            self.requests.give(1)
+        if self.tokens is not None:
+            self.tokens.give(waiter.cost)
+
+    def settle(self, waiter: _Waiter, used_tokens: int) -> None:
+        """추정 비용과 실제 token 수의 차이를 정산."""
+        if self.tokens is not None and used_tokens > 0:
+            self.tokens.give(min(waiter.cost, self.tokens.capacity) - used_tokens)
+
+    def pause(self, seconds: float) -> None:
+        """429: 남은 몫을 비우고 seconds 동안 아무것도 내보내지 않는다."""
+        now = time.monotonic()
+        self.paused_until = max(self.paused_until, now + seconds)
+        for bucket in self._buckets():
+            bucket.refill(now)
+            bucket.level = min(bucket.level, 0.0)
+
+    def depth(self) -> dict[Priority, int]:
+        return {
+            p: sum(1 for _, _, w in self._queues[p] if not w.cancelled) for p in PRIORITIES
+        }
+
+
+def _parse_limits(spec: str) -> dict[str, tuple[int, int]]:
+    """'model=rpm:tpm,...' → {model: (rpm, tpm)}."""
+    limits: dict[str, tuple[int, int]] = {}
+    for item in spec.split(","):
+        model, sep, values = item.strip().partition("=")
+        if not sep:
+            continue
+        rpm, _, tpm = values.partition(":")
+        limits[model.strip()] = (int(rpm or 0), int(tpm or 0))
+    return limits
+
+
+class Permit:
+    """acquire가 돌려주는 허가 1장. 호출이 끝나면 settle로 실제 token 수를 알려준다."""
+
+    def __init__(self, scheduler: "RateScheduler", waiter: Optional[_Waiter]) -> None:
+        self._scheduler = scheduler
+        self._waiter = waiter
+
+    def settle(self, used_tokens: int, error: Optional[BaseException] = None) -> None:
+        waiter = self._waiter
+        if waiter is None:
+            return
+        self._waiter = None
+        self._scheduler._settle(waiter, used_tokens, error)
+
+
+class RateScheduler:
+    """모델별 _Limiter + 대기 중인 요청을 시간이 되면 내보내는 dispatcher thread."""
+
+    def __init__(
+        self,
+        limits: Optional[dict[str, tuple[int, int]]] = None,
+        default: tuple[int, int] = (0, 0),
+    ) -> None:
+        self.limits = dict(limits or {})
+        self.default = default
+        self._limiters: dict[str, Optional[_Limiter]] = {}
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def _limiter(self, model: str) -> Optional[_Limiter]:
+        if model not in self._limiters:
+            rpm, tpm = self.limits.get(model, self.default)
+            self._limiters[model] = _Limiter(model, rpm, tpm) if rpm > 0 or tpm > 0 else None
+        return self._limiters[model]
+
+    def limited(self, model: str) -> bool:
+        with self._cond:
+            return self._limiter(model) is not None
+
+    def _submit(
+        self, model: str, cost: float, notify: Optional[Callable[[], None]] = None
+    ) -> _Waiter:
+        waiter = _Waiter(model, current_priority(), current_tenant(), cost, notify)
+        with self._cond:
+            limiter = self._limiter(model)
+            assert limiter is not None
+            limiter.enqueue(waiter)
+            limiter.dispatch(time.monotonic())
+            if not waiter.granted:
+                self._ensure_thread()
+                self._cond.notify()
+        LLM_RATE_TOKENS.inc(cost, model=model, kind="estimated")
+        return waiter
+
+    def _cancel(self, waiter: _Waiter) -> None:
+        with self._cond:
+            limiter = self._limiter(waiter.model)
+            if limiter is None:
+                return
+            if waiter.granted:
+                limiter.refund(waiter)
+            else:
+                waiter.cancelled = True
+            self._cond.notify()
+
+    def _settle(
+        self, waiter: _Waiter, used_tokens: int, error: Optional[BaseException]
+    ) -> None:
+        with self._cond:
+            limiter = self._limiter(waiter.model)
+            if limiter is None:
+                return
+            if error is not None and failure_reason(error) == "429":
+                limiter.pause(retry_after(error) or LLM_RATE_LIMIT_PAUSE)
+                LLM_RATE_PAUSES.inc(model=waiter.model)
+            elif error is None:
+                limiter.settle(waiter, used_tokens)
+            self._cond.notify()
+        if error is None and used_tokens > 0:
+            LLM_RATE_TOKENS.inc(used_tokens, model=waiter.model, kind="actual")
+
+    def _ensure_thread(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run, name="llm-rate-scheduler", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                waits = [
+                    limiter.dispatch(now) for limiter in self._limiters.values() if limiter
+                ]
+                wait = min(waits, default=math.inf)
+                self._cond.wait(None if math.isinf(wait) else wait)
+
+    def _estimate(self, model: str, messages: list[dict]) -> float:
+        return count_message_tokens(messages, model) + LLM_COMPLETION_TOKENS_ESTIMATE
+
+    def acquire(self, model: str, messages: list[dict]) -> Permit:
+        """sync: RPM / TPM 여유가 생길 때까지 기다린다 (시도 timeout을 넘기면 AttemptTimeout)."""
+        if not self.limited(model):
+            return Permit(self, None)
+        waiter = self._submit(model, self._estimate(model, messages))
+        if not waiter.granted:
+            timeout = attempt_timeout()
+            if not waiter.event.wait(timeout or 0):
+                self._cancel(waiter)
+                if not waiter.granted:
+                    raise AttemptTimeout(f"rate limit queue for {model} exceeded {timeout}s")
+        annotate(queue_wait_ms=round((time.monotonic() - waiter.enqueued_at) * 1000, 1))
+        return Permit(self, waiter)
+
+    async def aacquire(self, model: str, messages: list[dict]) -> Permit:
+        """async: RPM / TPM 여유가 생길 때까지 기다린다 (취소되면 큐에서 빠진다)."""
+        if not self.limited(model):
+            return Permit(self, None)
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+
+        def wake() -> None:
+            if not future.done():
+                future.set_result(None)
+
+        waiter = self._submit(
+            model,
+            self._estimate(model, messages),
+            notify=lambda: loop.call_soon_threadsafe(wake),
+        )
+        if not waiter.granted:
+            try:
+                await future
+            except BaseException:
+                # 취소 (hedge에서 짐 / 시도 timeout)
+                self._cancel(waiter)
+                raise
+        annotate(queue_wait_ms=round((time.monotonic() - waiter.enqueued_at) * 1000, 1))
+        return Permit(self, waiter)
+
+    def stats(self) -> dict:
+        """모델별 큐 길이 / bucket 잔량."""
+        with self._cond:
+            limiters = [limiter for limiter in self._limiters.values() if limiter]
+            now = time.monotonic()
+            out = {}
+            for limiter in limiters:
+                for bucket in limiter._buckets():
+                    bucket.refill(now)
+                out[limiter.model] = {
+                    "queued": limiter.depth(),
+                    "requests_available": _level(limiter.requests),
+                    "tokens_available": _level(limiter.tokens),
+                    "paused_for": round(max(0.0, limiter.paused_until - now), 3),
+                }
+            return out
+
+
+def _level(bucket: Optional[_Bucket]) -> Optional[int]:
+    return None if bucket is None else int(bucket.level)
+
+
+_scheduler: Optional[RateScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler() -> RateScheduler:
+    """환경변수 한도로 만든 프로세스 공용 scheduler."""
+    global _scheduler
+    if _scheduler is None:
+        with _scheduler_lock:
+            if _scheduler is None:
+                _scheduler = RateScheduler(
+                    _parse_limits(LLM_RATE_LIMITS), (LLM_RPM_LIMIT, LLM_TPM_LIMIT)
+                )
+    return _scheduler
+
+
+def set_scheduler(scheduler: Optional[RateScheduler]) -> None:
+    """scheduler 교체 (None이면 다음 get_scheduler가 환경변수로 다시 만든다)."""
+    global _scheduler
+    with _scheduler_lock:
+        _scheduler = scheduler
+
+
+def _collect() -> Iterable[Sample]:
+    if _scheduler is None:
+        return
+    for model, stats in _scheduler.stats().items():
+        for priority, depth in stats["queued"].items():
+            yield Sample(
+                "orchestrator_llm_queue_depth",
+                "gauge",
+                "LLM attempts waiting for RPM/TPM budget",
+                (("model", model), ("priority", cast(str, priority))),
+                depth,
+            )
+        for kind in ("requests", "tokens"):
+            level = stats[f"{kind}_available"]
+            if level is not None:
+                yield Sample(
+                    "orchestrator_llm_bucket_available",
+                    "gauge",
+                    "Requests / tokens left in the rate-limit bucket",
+                    (("model", model), ("kind", kind)),
+                    level,
+                )
+
+
+register_collector(_collect)
@@ -0,0 +1,608 @@
+# packages/core/resilience.py
+"""
+LLM 호출 resilience layer (llm.invoke_structured / ainvoke_structured가 사용).
+
+- deadline: 요청 전체 예산(request_deadline)에서 남은 시간과 LLM_CALL_TIMEOUT 중 작은 값이
+  시도(attempt) 1번의 timeout이 된다. 예산이 바닥나면 더 시도하지 않는다.
+- hedged request: (model, schema)별 최근 성공 latency의 p95(LLM_HEDGE_QUANTILE)가 지나도
+  응답이 없으면 같은 요청을 하나 더 보내고 먼저 끝난 쪽을 쓴다 (진 쪽은 취소).
+  hedge 비율은 LLM_HEDGE_MAX_RATIO로 제한한다 (전체가 느려질 때 부하를 두 배로 만들지 않도록).
+- retry: 429 / 5xx / timeout / 연결 오류만 full-jitter exponential backoff로 다시 시도한다
+  (Retry-After가 남은 예산 안이면 따른다). 그 외 오류(validation 등)는 그대로 올린다.
+- circuit breaker: 모델별로 연속 transient 실패가 LLM_BREAKER_FAILURES번이면 open,
+  LLM_BREAKER_COOLDOWN 뒤 probe 1번(half-open)으로 닫을지 정한다.
+  open이거나 재시도가 다 실패하면 LLM_FALLBACK_MODEL로 넘어가고,
+  그것도 안 되면 LLMUnavailable — parse tool은 lexicon 추출(degraded)로 응답한다.
+  track_degraded 안에서는 degraded로 대신한 호출을 모아 호출자(작업 재시도 등)가 알 수 있다.
+
+OpenAI SDK 자체 재시도는 끄고(max_retries=0) 이 모듈이 재시도를 맡는다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import os
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Awaitable, Callable, Iterable, Iterator, Literal, Optional, TypeVar
+
+import httpx
+
+from .metrics import Counter, Sample, register_collector
+
+T = TypeVar("T")
+
+BreakerState = Literal["closed", "open", "half_open"]
+
+# 환경변수 설정값
+# 시도 1번의 최대 시간 (초)
+LLM_CALL_TIMEOUT = float(os.getenv("LLM_CALL_TIMEOUT", "30"))
+# API 요청 1개의 기본 예산 (초, apps/api가 request_deadline으로 건다)
+REQUEST_BUDGET_SECONDS = float(os.getenv("REQUEST_BUDGET_SECONDS", "60"))
+LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "2"))
+LLM_RETRY_BASE_DELAY = float(os.getenv("LLM_RETRY_BASE_DELAY", "0.25"))
+LLM_RETRY_MAX_DELAY = float(os.getenv("LLM_RETRY_MAX_DELAY", "4"))
+LLM_HEDGE = os.getenv("LLM_HEDGE", "1") != "0"
+LLM_HEDGE_QUANTILE = float(os.getenv("LLM_HEDGE_QUANTILE", "0.95"))
+# 이만큼 성공 sample이 모이기 전에는 hedge하지 않는다
+LLM_HEDGE_MIN_SAMPLES = int(os.getenv("LLM_HEDGE_MIN_SAMPLES", "20"))
+LLM_HEDGE_MAX_RATIO = float(os.getenv("LLM_HEDGE_MAX_RATIO", "0.1"))
+LLM_BREAKER_FAILURES = int(os.getenv("LLM_BREAKER_FAILURES", "5"))
+LLM_BREAKER_COOLDOWN = float(os.getenv("LLM_BREAKER_COOLDOWN", "30"))
+# primary 모델이 안 될 때 쓸 모델 (비우면 fallback 모델 없음 → degraded)
+LLM_FALLBACK_MODEL = os.getenv("LLM_FALLBACK_MODEL", "")
+# sync 시도(hedge 포함)를 돌리는 thread 수
+LLM_ATTEMPT_THREADS = int(os.getenv("LLM_ATTEMPT_THREADS", "64"))
+
+# latency window 크기 (key별 최근 성공 수)
+_WINDOW = 256
+_TRANSIENT_STATUS = frozenset({408, 409, 429, 500, 502, 503, 504})
+
+# --------- 메트릭 ---------
+
+LLM_ATTEMPT_RETRIES = Counter(
+    "orchestrator_llm_retries_total",
+    "LLM attempts retried after a transient error (reason=status code|timeout|connection)",
+    ("model", "reason"),
+)
+LLM_HEDGES = Counter(
+    "orchestrator_llm_hedges_total",
+    "Hedged duplicate LLM requests (outcome=launched|won)",
+    ("model", "outcome"),
+)
+LLM_FALLBACKS = Counter(
+    "orchestrator_llm_fallbacks_total",
+    "Calls served without the primary model (kind=model|local)",
+    ("kind",),
+)
+LLM_BREAKER_TRANSITIONS = Counter(
+    "orchestrator_llm_breaker_transitions_total",
+    "Circuit breaker state changes",
+    ("model", "state"),
+)
+
+
+class LLMUnavailable(RuntimeError):
+    """primary / fallback 모델 모두 호출할 수 없음 (circuit open, 재시도 소진, deadline 초과)."""
+
+
+class AttemptTimeout(TimeoutError):
+    """시도 1번이 timeout(LLM_CALL_TIMEOUT 또는 남은 예산) 안에 끝나지 않음."""
+
+
+# --------- deadline ---------
+
+# time.monotonic() 기준 요청 deadline (None이면 예산 없음)
+_deadline: ContextVar[Optional[float]] = ContextVar("llm_deadline", default=None)
+# 진행 중인 시도 1번의 deadline (HTTP 요청 timeout이 이걸 넘지 않게 llm.py가 읽는다)
+_attempt_deadline: ContextVar[Optional[float]] = ContextVar("llm_attempt_deadline", default=None)
+# track_degraded 블록의 degraded 기록 (블록 밖이면 None)
+_degraded: ContextVar[Optional[list[str]]] = ContextVar("llm_degraded", default=None)
+
+
+@contextmanager
+def request_deadline(budget: Optional[float]) -> Iterator[None]:
+    """이 context 안의 LLM 호출은 budget초 안에 끝나야 한다 (바깥 deadline이 더 짧으면 그쪽)."""
+    if budget is None or budget <= 0:
+        yield
+        return
+    deadline = time.monotonic() + budget
+    outer = _deadline.get()
+    token = _deadline.set(deadline if outer is None else min(outer, deadline))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> Optional[float]:
+    """남은 요청 예산 (초, deadline이 없으면 None)."""
+    deadline = _deadline.get()
+    return None if deadline is None else deadline - time.monotonic()
+
+
+def attempt_timeout() -> Optional[float]:
+    """이번 시도에 줄 timeout. 예산이 바닥났으면 None."""
+    left = remaining()
+    if left is None:
+        return LLM_CALL_TIMEOUT
+    return min(LLM_CALL_TIMEOUT, left) if left > 0 else None
+
+
+def attempt_time_left() -> Optional[float]:
+    """진행 중인 시도의 남은 시간 (시도 밖이면 None)."""
+    deadline = _attempt_deadline.get()
+    return None if deadline is None else deadline - time.monotonic()
+
+
+# --------- 오류 분류 / backoff ---------
+
+
+def _status_code(error: BaseException) -> Optional[int]:
+    status = getattr(error, "status_code", None)
+    if status is None:
+        response = getattr(error, "response", None)
+        status = getattr(response, "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def failure_reason(error: BaseException) -> Optional[str]:
+    """다시 시도할 만한 오류면 이유(status code / timeout / connection), 아니면 None."""
+    if isinstance(error, (TimeoutError, httpx.TimeoutException)):
+        return "timeout"
+    status = _status_code(error)
+    if status is not None:
+        return str(status) if status in _TRANSIENT_STATUS else None
+    if isinstance(error, httpx.TransportError):
+        return "connection"
+    # openai.APIConnectionError / APITimeoutError (status 없이 request만 있는 SDK 오류)
+    name = type(error).__name__
+    if name in ("APIConnectionError", "APITimeoutError"):
+        return "timeout" if "Timeout" in name else "connection"
+    return None
+
+
+def retry_after(error: BaseException) -> Optional[float]:
+    """응답의 Retry-After (초)."""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    value = headers.get("retry-after") if headers is not None else None
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff(attempt: int, error: BaseException) -> float:
+    """attempt번째(0부터) 실패 뒤 기다릴 시간: full jitter, Retry-After가 있으면 그 이상."""
+    ceiling = min(LLM_RETRY_MAX_DELAY, LLM_RETRY_BASE_DELAY * 2**attempt)
+    delay = random.uniform(0, ceiling)
+    hint = retry_after(error)
+    return max(delay, hint) if hint is not None else delay
+
+
+# --------- latency / hedge ---------
+
+
+class _LatencyWindow:
+    """key 하나의 최근 성공 latency와 hedge 여부."""
+
+    def __init__(self) -> None:
+        self.samples: deque[float] = deque(maxlen=_WINDOW)
+        self.hedged: deque[bool] = deque(maxlen=_WINDOW)
+
+
+_windows: dict[tuple[str, str], _LatencyWindow] = {}
+_windows_lock = threading.Lock()
+
+
+def _window(model: str, name: str) -> _LatencyWindow:
+    key = (model, name)
+    window = _windows.get(key)
+    if window is None:
+        with _windows_lock:
+            window = _windows.setdefault(key, _LatencyWindow())
+    return window
+
+
+def observe_latency(model: str, name: str, seconds: float, hedged: bool) -> None:
+    window = _window(model, name)
+    with _windows_lock:
+        window.samples.append(seconds)
+        window.hedged.append(hedged)
+
+
+def hedge_delay(model: str, name: str) -> Optional[float]:
+    """hedge를 보낼 시점 (시도 시작 후 초). hedge하지 않으면 None."""
+    if not LLM_HEDGE:
+        return None
+    window = _window(model, name)
+    with _windows_lock:
+        if len(window.samples) < LLM_HEDGE_MIN_SAMPLES:
+            return None
+        if sum(window.hedged) >= LLM_HEDGE_MAX_RATIO * len(window.hedged):
+            return None
+        ordered = sorted(window.samples)
+    index = min(len(ordered) - 1, math.ceil(LLM_HEDGE_QUANTILE * len(ordered)) - 1)
+    return ordered[max(index, 0)]
+
+
+# --------- circuit breaker ---------
+
+
+class CircuitBreaker:
+    """
+    모델 1개의 circuit breaker.
+    closed → (연속 transient 실패 failures번) → open → (cooldown) → half_open(probe 1번)
+    → 성공이면 closed, 실패면 다시 open.
+    """
+
+    def __init__(
+        self,
+        model: str,
+        failures: int = LLM_BREAKER_FAILURES,
+        cooldown: float = LLM_BREAKER_COOLDOWN,
+    ) -> None:
+        self.model = model
+        self.failures = failures
+        self.cooldown = cooldown
+        self._state: BreakerState = "closed"
+        self._consecutive = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> BreakerState:
+        with self._lock:
+            if self._state == "open" and time.monotonic() - self._opened_at >= self.cooldown:
+                return "half_open"
+            return self._state
+
+    def _set(self, state: BreakerState) -> None:
+        if state != self._state:
+            self._state = state
+            LLM_BREAKER_TRANSITIONS.inc(model=self.model, state=state)
+
+    def allow(self) -> bool:
+        """지금 이 모델로 시도해도 되는지 (half_open이면 probe 1개만 허용)."""
+        with self._lock:
+            if self._state == "closed":
+                return True
+            if self._state == "open":
+                if time.monotonic() - self._opened_at < self.cooldown:
+                    return False
+                self._set("half_open")
+            if self._probing:
+                return False
+            self._probing = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._consecutive = 0
+            self._probing = False
+            self._set("closed")
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._consecutive += 1
+            if self._state == "half_open" or self._consecutive >= self.failures:
+                self._probing = False
+                self._opened_at = time.monotonic()
+                self._set("open")
+
+    def release(self) -> None:
+        """transient가 아닌 오류로 끝난 probe: 상태는 그대로 두고 다음 probe를 허용한다."""
+        with self._lock:
+            self._probing = False
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(model: str) -> CircuitBreaker:
+    breaker = _breakers.get(model)
+    if breaker is None:
+        with _breakers_lock:
+            breaker = _breakers.setdefault(model, CircuitBreaker(model))
+    return breaker
+
+
+def reset_resilience() -> None:
+    """breaker / latency window 초기화 (벤치마크 backend 전환 등)."""
+    with _breakers_lock:
+        _breakers.clear()
+    with _windows_lock:
+        _windows.clear()
+
+
+def candidate_models(model: str) -> list[str]:
+    """시도할 모델 순서: primary, 그다음 LLM_FALLBACK_MODEL."""
+    if LLM_FALLBACK_MODEL and LLM_FALLBACK_MODEL != model:
+        return [model, LLM_FALLBACK_MODEL]
+    return [model]
+
+
+@dataclass
+class _Plan:
+    """한 모델로 시도하는 동안의 상태."""
+
+    model: str
+    breaker: CircuitBreaker
+    attempt: int = 0
+
+
+def _next_delay(plan: _Plan, error: BaseException) -> Optional[float]:
+    """transient 실패 뒤 같은 모델로 다시 시도하기 전 기다릴 시간 (다시 안 하면 None)."""
+    plan.breaker.record_failure()
+    reason = failure_reason(error) or "error"
+    if plan.attempt >= LLM_MAX_RETRIES:
+        return None
+    delay = backoff(plan.attempt, error)
+    left = remaining()
+    if left is not None and delay >= left:
+        return None
+    plan.attempt += 1
+    LLM_ATTEMPT_RETRIES.inc(model=plan.model, reason=reason)
+    return delay
+
+
+def _unavailable(name: str, models: list[str], last: Optional[BaseException]) -> LLMUnavailable:
+    detail = f": {type(last).__name__}: {last}" if last is not None else ": circuit open"
+    return LLMUnavailable(f"{name} unavailable on {', '.join(models)}{detail}")
+
+
+# --------- sync ---------
+
+# hedge / timeout을 위해 sync 시도를 돌리는 pool. 진 시도는 취소할 수 없어서 끝날 때까지
+# 여기서 돌지만, HTTP 요청 timeout이 시도 deadline으로 잘리므로 timeout 뒤에는 끝난다.
+_pool: Optional[ThreadPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _executor() -> ThreadPoolExecutor:
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ThreadPoolExecutor(
+                    max_workers=LLM_ATTEMPT_THREADS, thread_name_prefix="llm-attempt"
+                )
+    return _pool
+
+
+def _submit(fn: Callable[[str], T], model: str, deadline: float) -> Future:
+    def attempt() -> T:
+        _attempt_deadline.set(deadline)
+        return fn(model)
+
+    return _executor().submit(copy_context().run, attempt)
+
+
+def _hedged(fn: Callable[[str], T], model: str, name: str, timeout: float) -> T:
+    """sync 시도 1번 (+ hedge 1개). timeout 안에 성공한 첫 결과."""
+    start = time.monotonic()
+    delay = hedge_delay(model, name)
+    futures: list[Future] = [_submit(fn, model, start + timeout)]
+    pending = set(futures)
+    hedged = False
+    last: Optional[BaseException] = None
+    while pending:
+        left = timeout - (time.monotonic() - start)
+        if left <= 0:
+            break
+        wait_for = left
+        if not hedged and delay is not None:
+            wait_for = min(left, max(delay - (time.monotonic() - start), 0))
+        done, pending = wait(pending, timeout=wait_for, return_when=FIRST_COMPLETED)
+        for future in done:
+            error = future.exception()
+            if error is None:
+                if hedged and future is futures[-1]:
+                    LLM_HEDGES.inc(model=model, outcome="won")
+                observe_latency(model, name, time.monotonic() - start, hedged)
+                return future.result()
+            if failure_reason(error) is None:
+                raise error
+            last = error
+        if not done and not hedged and delay is not None:
+            hedged = True
+            LLM_HEDGES.inc(model=model, outcome="launched")
+            hedge = _submit(fn, model, start + timeout)
+            futures.append(hedge)
+            pending.add(hedge)
+    if pending or last is None:
+        # 진 시도는 시도 deadline에 HTTP timeout으로 끝나고 (slot / permit 반납) 버려진다
+        raise AttemptTimeout(f"{name} on {model} exceeded {timeout:.1f}s")
+    raise last
+
+
+def call_with_resilience(fn: Callable[[str], T], model: str, name: str) -> T:
+    """
+    fn(model)을 deadline / hedge / retry / circuit breaker / fallback model로 감싸서 호출.
+    모든 모델이 실패하면 LLMUnavailable.
+    """
+    models = candidate_models(model)
+    last: Optional[BaseException] = None
+    for i, candidate in enumerate(models):
+        plan = _Plan(candidate, get_breaker(candidate))
+        while plan.breaker.allow():
+            timeout = attempt_timeout()
+            if timeout is None:
+                plan.breaker.release()
+                raise _unavailable(name, models, last or AttemptTimeout("request budget spent"))
+            try:
+                result = _hedged(fn, candidate, name, timeout)
+            except BaseException as e:
+                if not isinstance(e, Exception):
+                    plan.breaker.release()
+                    raise
+                if failure_reason(e) is None:
+                    plan.breaker.release()
+                    raise
+                last = e
+                delay = _next_delay(plan, e)
+                if delay is None:
+                    break
+                time.sleep(delay)
+                continue
+            plan.breaker.record_success()
+            if i > 0:
+                LLM_FALLBACKS.inc(kind="model")
+            return result
+    raise _unavailable(name, models, last) from last
+
+
+# --------- async ---------
+
+
+async def _ahedged(
+    fn: Callable[[str], Awaitable[T]], model: str, name: str, timeout: float, hedge: bool
+) -> T:
+    """async 시도 1번 (+ hedge 1개). 진 시도는 취소한다."""
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    delay = hedge_delay(model, name) if hedge else None
+    primary = asyncio.ensure_future(fn(model))
+    pending = {primary}
+    hedged_task: Optional[asyncio.Future] = None
+    last: Optional[BaseException] = None
+    try:
+        while pending:
+            left = timeout - (loop.time() - start)
+            if left <= 0:
+                break
+            wait_for = left
+            if hedged_task is None and delay is not None:
+                wait_for = min(left, max(delay - (loop.time() - start), 0))
+            done, pending = await asyncio.wait(
+                pending, timeout=wait_for, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                error = task.exception()
+                if error is None:
+                    if task is hedged_task:
+                        LLM_HEDGES.inc(model=model, outcome="won")
+                    observe_latency(model, name, loop.time() - start, hedged_task is not None)
+                    return task.result()
+                if failure_reason(error) is None:
+                    raise error
+                last = error
+            if not done and hedged_task is None and delay is not None:
+                LLM_HEDGES.inc(model=model, outcome="launched")
+                hedged_task = asyncio.ensure_future(fn(model))
+                pending.add(hedged_task)
+        if pending or last is None:
+            raise AttemptTimeout(f"{name} on {model} exceeded {timeout:.1f}s")
+        raise last
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+
+async def acall_with_resilience(
+    fn: Callable[[str], Awaitable[T]],
+    model: str,
+    name: str,
+    *,
+    hedge: bool = True,
+    can_retry: Callable[[], bool] = lambda: True,
+) -> T:
+    """
+    call_with_resilience의 async 버전.
+    hedge=False: 중복 요청을 보내지 않는다 (스트리밍처럼 시도 중에 부수효과가 있는 호출).
+    can_retry()가 False면 transient 실패라도 다시 시도하거나 다른 모델로 넘어가지 않는다.
+    """
+    models = candidate_models(model)
+    last: Optional[BaseException] = None
+    for i, candidate in enumerate(models):
+        plan = _Plan(candidate, get_breaker(candidate))
+        while plan.breaker.allow():
+            timeout = attempt_timeout()
+            if timeout is None:
+                plan.breaker.release()
+                raise _unavailable(name, models, last or AttemptTimeout("request budget spent"))
+            try:
+                result = await _ahedged(fn, candidate, name, timeout, hedge)
+            except BaseException as e:
+                # 취소(CancelledError) 등: probe 자리만 돌려놓고 그대로 올린다
+                if not isinstance(e, Exception):
+                    plan.breaker.release()
+                    raise
+                if failure_reason(e) is None:
+                    plan.breaker.release()
+                    raise
+                last = e
+                if not can_retry():
+                    plan.breaker.record_failure()
+                    raise _unavailable(name, models, e) from e
+                delay = _next_delay(plan, e)
+                if delay is None:
+                    break
+                await asyncio.sleep(delay)
+                continue
+            plan.breaker.record_success()
+            if i > 0:
+                LLM_FALLBACKS.inc(kind="model")
+            return result
+    raise _unavailable(name, models, last) from last
+
+
+def record_degraded(error: Optional[BaseException] = None) -> None:
+    """LLM 없이 로컬 추출로 응답했음을 남긴다 (parse tool의 degraded 경로)."""
+    LLM_FALLBACKS.inc(kind="local")
+    errors = _degraded.get()
+    if errors is not None:
+        errors.append(str(error) if error is not None else "LLM unavailable")
+
+
+@contextmanager
+def track_degraded() -> Iterator[list[str]]:
+    """블록 안(하위 task / context를 복사한 스레드 포함)의 degraded 응답 → LLM 오류 목록."""
+    errors: list[str] = []
+    token = _degraded.set(errors)
+    try:
+        yield errors
+    finally:
+        _degraded.reset(token)
+
+
+def breaker_states() -> dict[str, BreakerState]:
+    with _breakers_lock:
+        breakers = list(_breakers.values())
+    return {breaker.model: breaker.state for breaker in breakers}
+
+
+_STATE_VALUE = {"closed": 0, "half_open": 1, "open": 2}
+
+
+def _collect() -> Iterable[Sample]:
+    for model, state in breaker_states().items():
+        yield Sample(
+            "orchestrator_llm_breaker_state",
+            "gauge",
+            "Circuit breaker state (0=closed, 1=half_open, 2=open)",
+            (("model", model),),
+            _STATE_VALUE[state],
+        )
+
+
+register_collector(_collect)
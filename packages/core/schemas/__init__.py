@@ -1,13 +1,19 @@
+from .document import DocRef
 from .keyword_base import BaseKeyword
 from .resume import ResumeProfile, ResumeKeyword
 from .jd import JDProfile, JDKeyword
 from .gap import GapSummary, KeywordMatch
-from .project import ProjectOutput, ProjectPlan, ProjectIdea, ArchitectureSpec, DayPlan
+from .project import (
+    ProjectOutput, ProjectPlan, ProjectIdea, ProjectIdeas, ArchitectureSpec, DayPlan, SprintPlan,
+    Preferences,
+)
 
 __all__ = [
     "BaseKeyword",
+    "DocRef",
     "ResumeProfile", "ResumeKeyword",
     "JDProfile", "JDKeyword",
     "GapSummary", "KeywordMatch",
-    "ProjectOutput", "ProjectPlan", "ProjectIdea", "ArchitectureSpec", "DayPlan",
+    "ProjectOutput", "ProjectPlan", "ProjectIdea", "ProjectIdeas", "ArchitectureSpec", "DayPlan",
+    "SprintPlan", "Preferences",
 ]
\ No newline at end of file
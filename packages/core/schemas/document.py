@@ -0,0 +1,24 @@
+# packages/core/schemas/document.py
+from __future__ import annotations
+
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class DocRef(BaseModel):
+    """
+    문서 저장소(DocStore)에 있는 원문 구간 참조.
+    원문을 profile에 싣는 대신 content hash + 문자 offset [start, end)만 들고 다닌다.
+    """
+
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    doc_id: str = Field(..., description="원문 sha256 (content-addressed)")
+    start: int = Field(default=0, ge=0, description="문자 offset 시작")
+    end: int = Field(..., ge=0, description="문자 offset 끝 (exclusive)")
+    section: Optional[str] = Field(default=None, description="JD 섹션 category (Resume는 None)")
+
+    @property
+    def length(self) -> int:
+        return self.end - self.start
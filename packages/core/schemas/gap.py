@@ -31,7 +31,7 @@ class GapSummary(BaseModel):
     """
     model_config = ConfigDict(extra="forbid")
 
-    match_score: int = Field(..., ge=0, le=100)
+    match_score: float = Field(..., ge=0, le=100, description="0~100, 소수점 1자리")
 
     # 분류 결과
     keyword_matches: list[KeywordMatch] = Field(default_factory=list, description="매칭된 키워드 목록")
@@ -3,6 +3,9 @@ from __future__ import annotations
 
 from typing import Optional, Literal
 from pydantic import BaseModel, Field, ConfigDict, field_validator
+from pydantic.json_schema import SkipJsonSchema
+
+from .document import DocRef
 
 from .keyword_base import BaseKeyword
 from .utils import dedupe_jd_keywords
@@ -40,8 +43,13 @@ class JDProfile(BaseModel):
 
     model_config = ConfigDict(extra="forbid")
 
-    raw_text: Optional[str] = Field(
-        default=None, description="사용자가 붙여넣은 원문 JD(선택)"
+    # 원문 보관 방식은 RAW_TEXT_RETENTION(full / reference / none)을 따른다.
+    # LLM structured output schema에는 노출하지 않는다.
+    raw_text: SkipJsonSchema[Optional[dict[str, str]]] = Field(
+        default=None, description="사용자가 붙여넣은 원문 JD {category: text} (retention=full)"
+    )
+    sources: SkipJsonSchema[list[DocRef]] = Field(
+        default_factory=list, description="DocStore의 섹션별 원문 참조 (retention=reference)"
     )
     role_title: Optional[str] = Field(
         default=None, description="직무 타이틀(추출 가능하면)"
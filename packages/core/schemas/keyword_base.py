@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import Optional
 
 from pydantic import BaseModel, ConfigDict, Field
+from pydantic.json_schema import SkipJsonSchema
 
 
 class BaseKeyword(BaseModel):
@@ -17,3 +18,9 @@ class BaseKeyword(BaseModel):
     evidence: Optional[str] = Field(
         default=None, description="키워드가 등장한 근거 문장(선택)"
     )
+
+    # 원문에서 키워드가 등장한 위치 [start, end) - 로컬 추출기가 채움.
+    # LLM structured output schema에는 노출하지 않는다.
+    source_span: SkipJsonSchema[Optional[tuple[int, int]]] = Field(
+        default=None, description="원문 내 키워드 위치 (start, end)"
+    )
@@ -8,6 +8,15 @@ from .utils import norm_text
 from .jd import JDKeyword
 
 
+class Preferences(BaseModel):
+    """User Interrupt 단계에서 유저가 입력하는 프로젝트 선호 조건."""
+    model_config = ConfigDict(extra="forbid")
+
+    stack: list[str] = Field(default_factory=list, description="선호 기술 스택 (예: AWS, Python)")
+    constraints: list[str] = Field(default_factory=list, description="예: 1주일, 혼자, 비용 0")
+    role: Optional[str] = Field(default=None, description="목표 직무 (예: DevOps Engineer)")
+
+
 class DayPlan(BaseModel):
     """D1~D7 하루 단위 계획."""
     model_config = ConfigDict(extra="forbid")
@@ -44,6 +53,29 @@ class ProjectIdea(BaseModel):
     tech_stack: list[str] = Field(default_factory=list, description="예: FastAPI, LangGraph, Next.js 등")
 
 
+class ProjectIdeas(BaseModel):
+    """project_ideation 산출물: 아키텍처 / 스프린트 계획 전의 아이디어 2개."""
+    model_config = ConfigDict(extra="forbid")
+
+    # 제목 중복은 여기서 막지 않는다 (파이프라인이 겹친 안 하나만 다시 만든다)
+    ideas: list[ProjectIdea] = Field(..., min_length=2, max_length=2, description="정확히 2개의 아이디어")
+    notes: Optional[str] = Field(default=None, description="두 안의 차이/추천 기준 등 간단 메모")
+
+
+class SprintPlan(BaseModel):
+    """sprint_plan 산출물: 아이디어 1개의 7일 계획 + 리스크."""
+    model_config = ConfigDict(extra="forbid")
+
+    weekly_plan: list[DayPlan] = Field(default_factory=list, max_length=7, description="D1~D7 계획")
+    downside: list[str] = Field(default_factory=list, description="현실적인 리스크")
+    workaround: list[str] = Field(default_factory=list, description="리스크 완화 방법")
+
+
+def title_key(title: str) -> str:
+    """제목 비교용 key (ensure_two_distinct_projects와 같은 기준)."""
+    return norm_text(title).lower()
+
+
 class ProjectPlan(BaseModel):
     """아이디어 + 구조 + 7일 계획까지 포함한 완성된 프로젝트 1안."""
     model_config = ConfigDict(extra="forbid")
@@ -77,8 +109,6 @@ class ProjectOutput(BaseModel):
     def ensure_two_distinct_projects(cls, v: list[ProjectPlan]) -> list[ProjectPlan]:
         # 제목이 완전히 같은 두 안이 들어오면 퀄리티가 낮으니 방지(완벽 검증은 아님)
         if len(v) == 2:
-            t0 = norm_text(v[0].idea.title).lower()
-            t1 = norm_text(v[1].idea.title).lower()
-            if t0 == t1:
+            if title_key(v[0].idea.title) == title_key(v[1].idea.title):
                 raise ValueError("project_ideas must contain two distinct project titles")
         return v
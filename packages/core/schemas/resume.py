@@ -3,7 +3,9 @@ from __future__ import annotations  # For Version < 3.10
 from typing import Optional
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic.json_schema import SkipJsonSchema
 
+from .document import DocRef
 from .keyword_base import BaseKeyword
 from .utils import dedupe_resume_keywords
 
@@ -59,9 +61,13 @@ class ResumeProfile(BaseModel):
 
     model_config = ConfigDict(extra="forbid")
 
-    # 원문(디버깅/추적용)
-    raw_text: Optional[str] = Field(
-        default=None, description="사용자가 붙여넣은 원문 레주메(선택)"
+    # 원문(디버깅/추적용). 보관 방식은 RAW_TEXT_RETENTION(full / reference / none)을 따른다.
+    # LLM structured output schema에는 노출하지 않는다.
+    raw_text: SkipJsonSchema[Optional[str]] = Field(
+        default=None, description="사용자가 붙여넣은 원문 레주메 (retention=full)"
+    )
+    source: SkipJsonSchema[Optional[DocRef]] = Field(
+        default=None, description="DocStore의 원문 참조 (retention=reference)"
     )
 
     keywords: list[ResumeKeyword] = Field(
@@ -5,17 +5,27 @@ from __future__ import annotations
 
 from typing import TypeVar
 
+from ..canonical import canonicalize
 from .keyword_base import BaseKeyword
 
 
 def norm_text(s: str) -> str:
     """
     텍스트 최소 정규화(공백 정리).
-    키워드 표준화는 normalize_keywords_tool에서 더 강하게 처리.
+    키워드 표준화(alias → canonical)는 normalize_keyword에서 처리.
     """
     return " ".join(s.strip().split())
 
 
+def normalize_keyword(s: str) -> str:
+    """
+    키워드 정규화: 공백 정리 + 소문자 + alias/오타 → canonical.
+    예: "K8s" → "kubernetes", "Postgres" → "postgresql", "scikit learn" → "scikit-learn"
+    """
+    normalized = norm_text(s).lower()
+    return canonicalize(normalized) if normalized else normalized
+
+
 TKeyword = TypeVar("TKeyword", bound=BaseKeyword)
 
 
@@ -24,14 +34,14 @@ def _dedupe_keywords_by_priority(
     category_priority: dict[str, int],
 ) -> list[TKeyword]:
     """
-    대소문자 구분 없이 중복 제거하고 소문자로 저장.
+    canonical 기준으로 중복 제거하고 canonical(소문자)로 저장.
     동일 키워드 충돌 시 category_priority가 높은 항목을 유지.
     """
     chosen: dict[str, TKeyword] = {}
     for item in items:
         if not isinstance(item.keyword_text, str):
             continue
-        normalized = norm_text(item.keyword_text).lower()
+        normalized = normalize_keyword(item.keyword_text)
         if not normalized:
             continue
         item.keyword_text = normalized
@@ -48,15 +58,15 @@ def _dedupe_keywords_by_priority(
 
 def dedupe_resume_keywords(items: list[TKeyword]) -> list[TKeyword]:
     """
-    대소문자 구분 없이 중복 제거.
-    소문자로 저장. 먼저 나온 키워드를 유지.
+    canonical 기준으로 중복 제거 (k8s/kubernetes는 같은 키워드).
+    canonical(소문자)로 저장. 먼저 나온 키워드를 유지.
     카테고리 구분 없이 단순 중복 제거만 수행.
     """
     chosen: dict[str, TKeyword] = {}
     for item in items:
         if not isinstance(item.keyword_text, str):
             continue
-        normalized = norm_text(item.keyword_text).lower()
+        normalized = normalize_keyword(item.keyword_text)
         if not normalized:
             continue
         item.keyword_text = normalized
@@ -67,8 +77,8 @@ def dedupe_resume_keywords(items: list[TKeyword]) -> list[TKeyword]:
 
 def dedupe_jd_keywords(items: list[TKeyword]) -> list[TKeyword]:
     """
-    대소문자 구분 없이 중복 제거.
-    소문자로 저장.
+    canonical 기준으로 중복 제거.
+    canonical(소문자)로 저장.
     """
     # 동일 키워드 충돌 시 context < preferred < responsibility < required 순으로 버림
     return _dedupe_keywords_by_priority(
@@ -0,0 +1,185 @@
+# packages/core/singleflight.py
+"""
+In-flight 요청 합치기 (single-flight).
+
+같은 key(정규화 텍스트 기반 content key)의 파싱이 이미 진행 중이면
+새 LLM 호출을 만들지 않고 진행 중인 호출의 결과를 함께 기다린다.
+캐시가 채워지기 전에 같은 JD가 동시에 수백 번 들어오는 경우를 위한 것.
+
+- 에러: 진행 중인 호출이 실패하면 기다리던 모든 caller에게 같은 예외가 전달되고,
+  다음 호출은 새로 실행된다 (실패 결과는 공유하지 않음).
+- 취소: caller 하나가 취소되어도 공유 호출은 계속된다.
+  기다리는 caller가 모두 사라지면 그때 공유 호출을 취소한다.
+- sync(threading)와 async(asyncio) 호출은 각각 따로 합쳐진다.
+- scope: 공유 호출은 처음 호출한 caller의 context(scheduling priority / tenant / deadline)로
+  돈다. scope(예: ratelimit.current_priority)가 다른 caller끼리는 합치지 않는다
+  (interactive 요청이 batch 작업의 호출을 기다리거나 그 반대가 되지 않도록).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import weakref
+from dataclasses import asdict, dataclass, field
+from typing import Awaitable, Callable, Generic, Iterable, Optional, TypeVar
+
+from .metrics import Sample, register_collector
+
+T = TypeVar("T")
+
+
+@dataclass
+class SingleFlightStats:
+    executions: int = 0  # 실제로 실행된 호출
+    coalesced: int = 0  # 진행 중인 호출에 합쳐진 호출 (= 절약한 호출 수)
+    errors: int = 0
+    cancelled: int = 0  # 기다리는 caller가 없어 취소된 공유 호출
+
+    @property
+    def saved_rate(self) -> float:
+        total = self.executions + self.coalesced
+        return self.coalesced / total if total else 0.0
+
+    def as_dict(self) -> dict:
+        return {**asdict(self), "saved_rate": round(self.saved_rate, 4)}
+
+
+@dataclass
+class _AsyncFlight(Generic[T]):
+    task: asyncio.Task[T]
+    waiters: int = 0
+
+
+@dataclass
+class _SyncFlight(Generic[T]):
+    done: threading.Event = field(default_factory=threading.Event)
+    result: Optional[T] = None
+    error: Optional[BaseException] = None
+
+
+class SingleFlight(Generic[T]):
+    """key별로 동시에 하나의 호출만 실행하고, 나머지 caller는 그 결과를 공유한다."""
+
+    def __init__(self, name: str = "", scope: Optional[Callable[[], str]] = None) -> None:
+        self.name = name
+        self.scope = scope
+        self.stats = SingleFlightStats()
+        self._lock = threading.Lock()
+        self._sync: dict[str, _SyncFlight[T]] = {}
+        # asyncio.Task는 event loop에 묶이므로 loop별로 관리한다
+        self._async: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[str, _AsyncFlight[T]]
+        ] = weakref.WeakKeyDictionary()
+        if name:
+            _instances.add(self)
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._sync) + sum(len(f) for f in self._async.values())
+
+    def _key(self, key: str) -> str:
+        return key if self.scope is None else f"{self.scope()}:{key}"
+
+    # --------- sync ---------
+
+    def do(self, key: str, fn: Callable[[], T]) -> T:
+        """key의 호출이 진행 중이면 그 결과를, 아니면 fn()을 실행해서 반환."""
+        key = self._key(key)
+        with self._lock:
+            flight = self._sync.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._sync[key] = _SyncFlight()
+                self.stats.executions += 1
+            else:
+                self.stats.coalesced += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result  # type: ignore[return-value]
+
+        try:
+            flight.result = fn()
+            return flight.result
+        except BaseException as e:
+            flight.error = e
+            with self._lock:
+                self.stats.errors += 1
+            raise
+        finally:
+            with self._lock:
+                self._sync.pop(key, None)
+            flight.done.set()
+
+    # --------- async ---------
+
+    async def ado(self, key: str, factory: Callable[[], Awaitable[T]]) -> T:
+        """key의 호출이 진행 중이면 그 결과를, 아니면 factory()를 실행해서 반환."""
+        key = self._key(key)
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            flights = self._async.get(loop)
+            if flights is None:
+                flights = self._async[loop] = {}
+            flight = flights.get(key)
+            if flight is None:
+                flight = flights[key] = _AsyncFlight(task=loop.create_task(factory()))
+                flight.task.add_done_callback(lambda task: self._finish(flights, key, task))
+                self.stats.executions += 1
+            else:
+                self.stats.coalesced += 1
+            flight.waiters += 1
+
+        try:
+            # shield: 이 caller가 취소돼도 공유 task는 취소되지 않는다
+            return await asyncio.shield(flight.task)
+        finally:
+            with self._lock:
+                flight.waiters -= 1
+                abandoned = flight.waiters == 0 and not flight.task.done()
+                if abandoned:
+                    # 새 caller가 취소 중인 task에 합쳐지지 않도록 먼저 제거
+                    if flights.get(key) is flight:
+                        del flights[key]
+                    self.stats.cancelled += 1
+            if abandoned:
+                flight.task.cancel()
+
+    def _finish(self, flights: dict[str, _AsyncFlight[T]], key: str, task: asyncio.Task) -> None:
+        with self._lock:
+            flight = flights.get(key)
+            if flight is not None and flight.task is task:
+                del flights[key]
+            if not task.cancelled() and task.exception() is not None:
+                self.stats.errors += 1
+
+
+# /metrics: 이름이 있는 SingleFlight들의 카운터를 scrape 시점에 읽는다
+_instances: "weakref.WeakSet[SingleFlight]" = weakref.WeakSet()
+
+
+def _collect() -> Iterable[Sample]:
+    for flight in list(_instances):
+        labels = (("name", flight.name),)
+        stats = flight.stats
+        for field_name in ("executions", "coalesced", "errors", "cancelled"):
+            yield Sample(
+                f"orchestrator_single_flight_{field_name}_total",
+                "counter",
+                f"Single-flight {field_name}",
+                labels,
+                getattr(stats, field_name),
+            )
+        yield Sample(
+            "orchestrator_single_flight_in_flight",
+            "gauge",
+            "Shared calls currently in flight",
+            labels,
+            flight.in_flight(),
+        )
+
+
+register_collector(_collect)
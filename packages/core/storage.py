@@ -0,0 +1,22 @@
+# packages/core/storage.py
+"""로컬 저장소 경로 유틸리티 (SQLite 캐시/인덱스 파일 위치)."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+
+def data_dir() -> Path:
+    """
+    로컬 상태 파일을 저장할 디렉토리.
+    ORCHESTRATOR_DATA_DIR 환경변수로 변경 가능 (기본: ./.orchestrator).
+    """
+    path = Path(os.getenv("ORCHESTRATOR_DATA_DIR", ".orchestrator"))
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def data_path(filename: str) -> Path:
+    """data_dir() 아래의 파일 경로."""
+    return data_dir() / filename
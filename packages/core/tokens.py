@@ -0,0 +1,72 @@
+# packages/core/tokens.py
+"""
+프롬프트 토큰 수 계산.
+
+tiktoken encoding이 있으면 정확한 값을, 없으면(미설치/오프라인에서 BPE 파일을 못 받음)
+글자 수 기반 근사값(약 4자 = 1토큰)을 쓴다.
+"""
+
+from __future__ import annotations
+
+import logging
+from functools import lru_cache
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+# chat message 하나당 role/구분자 오버헤드 (OpenAI chat format 기준)
+MESSAGE_OVERHEAD_TOKENS = 4
+REPLY_PRIMING_TOKENS = 3
+CHARS_PER_TOKEN = 4
+
+
+@lru_cache(maxsize=None)
+def _encoding(model: str) -> Optional[Any]:
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding("o200k_base")
+    except Exception as e:
+        logger.warning("tiktoken encoding unavailable (%s); using character estimate", e)
+        return None
+
+
+def tokens_exact(model: str = "gpt-4o-mini") -> bool:
+    """count_tokens가 tiktoken 값인지 (False면 근사값)."""
+    return _encoding(model) is not None
+
+
+def count_tokens(text: str, model: str = "gpt-4o-mini") -> int:
+    encoding = _encoding(model)
+    if encoding is None:
+        return -(-len(text) // CHARS_PER_TOKEN)
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def count_message_tokens(messages: list[dict], model: str = "gpt-4o-mini") -> int:
+    """chat messages의 prompt 토큰 수 (content + message 오버헤드)."""
+    total = REPLY_PRIMING_TOKENS
+    for message in messages:
+        total += MESSAGE_OVERHEAD_TOKENS + count_tokens(str(message.get("content", "")), model)
+    return total
+
+
+# USD per 1M tokens (prompt, completion). 목록에 없는 모델은 비용 0으로 집계한다.
+MODEL_PRICES_PER_1M: dict[str, tuple[float, float]] = {
+    "gpt-4o-mini": (0.15, 0.60),
+    "gpt-4o": (2.50, 10.00),
+    "gpt-4.1-mini": (0.40, 1.60),
+    "gpt-4.1": (2.00, 8.00),
+}
+
+
+def estimate_cost_usd(model: str, prompt_tokens: int, completion_tokens: int) -> float:
+    prompt_price, completion_price = MODEL_PRICES_PER_1M.get(
+        model.removeprefix("openai:"), (0.0, 0.0)
+    )
+    return (prompt_tokens * prompt_price + completion_tokens * completion_price) / 1_000_000
@@ -0,0 +1,217 @@
+# packages/core/tracing.py
+"""
+Stage 계측 + 요청 단위 trace span (로컬 JSONL).
+
+- stage(kind, name): latency histogram(orchestrator_stage_duration_seconds)에 기록하고,
+  trace 중이면 span도 남긴다. instrumented(kind, name)은 같은 일을 하는 decorator
+  (sync / async 함수 모두).
+- trace(name): 요청 하나의 root span. TRACE_ENABLED=1이거나 force=True일 때만 만들어진다.
+  root 밖에서 열린 stage는 span을 만들지 않는다 (metric만 기록).
+- root span이 끝나면 그 trace의 span 전체를 TRACE_PATH(JSONL)에 한 줄씩 쓴다.
+  TRACE_MIN_DURATION_MS보다 빨리 끝난 trace는 버린다 (느린 요청만 남기기).
+- span 부모 관계는 contextvars로 전달되므로 asyncio task / LangGraph 노드로도 이어진다.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import functools
+import inspect
+import json
+import logging
+import os
+import secrets
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional, TypeVar
+
+from .metrics import Histogram
+from .storage import data_path
+
+logger = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# 환경변수 설정값
+TRACE_ENABLED = os.getenv("TRACE_ENABLED", "0") == "1"
+TRACE_PATH = os.getenv("TRACE_PATH", "")
+TRACE_MIN_DURATION_MS = float(os.getenv("TRACE_MIN_DURATION_MS", "0"))
+
+STAGE_SECONDS = Histogram(
+    "orchestrator_stage_duration_seconds",
+    "Latency of instrumented stages (tool, node, llm, validate, compute)",
+    ("kind", "stage"),
+)
+
+
+@dataclass
+class _Trace:
+    trace_id: str
+    spans: list[dict] = field(default_factory=list)
+    finished: bool = False
+
+
+@dataclass
+class Span:
+    trace: _Trace
+    name: str
+    span_id: str
+    parent_id: Optional[str]
+    attrs: dict[str, Any]
+    start: float = field(default_factory=time.time)
+    _perf: float = field(default_factory=time.perf_counter)
+
+    @property
+    def trace_id(self) -> str:
+        return self.trace.trace_id
+
+    def set(self, **attrs: Any) -> None:
+        self.attrs.update(attrs)
+
+
+_current: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar(
+    "trace_span", default=None
+)
+_write_lock = threading.Lock()
+
+
+def _trace_path() -> Path:
+    return Path(TRACE_PATH) if TRACE_PATH else data_path("traces.jsonl")
+
+
+def _new_id(nbytes: int = 8) -> str:
+    return secrets.token_hex(nbytes)
+
+
+def _write(records: list[dict]) -> None:
+    try:
+        lines = "".join(json.dumps(r, ensure_ascii=False, default=str) + "\n" for r in records)
+        with _write_lock, _trace_path().open("a", encoding="utf-8") as f:
+            f.write(lines)
+    except OSError as e:
+        logger.warning("trace write failed: %s", e)
+
+
+def _finish(span: Span, error: Optional[BaseException]) -> None:
+    duration_ms = (time.perf_counter() - span._perf) * 1000.0
+    record = {
+        "trace_id": span.trace_id,
+        "span_id": span.span_id,
+        "parent_id": span.parent_id,
+        "name": span.name,
+        "start": round(span.start, 6),
+        "duration_ms": round(duration_ms, 3),
+        "status": "error" if error else "ok",
+        **({"error": f"{type(error).__name__}: {error}"} if error else {}),
+        "attrs": span.attrs,
+    }
+    trace = span.trace
+    if trace.finished:
+        # root가 끝난 뒤에 끝난 span (공유 task 등)은 바로 쓴다
+        _write([record])
+        return
+    trace.spans.append(record)
+    if span.parent_id is None:
+        trace.finished = True
+        if duration_ms >= TRACE_MIN_DURATION_MS:
+            _write(trace.spans)
+        trace.spans = []
+
+
+@contextmanager
+def _open_span(name: str, parent: Optional[Span], attrs: dict[str, Any]) -> Iterator[Span]:
+    span = Span(
+        trace=parent.trace if parent else _Trace(trace_id=_new_id(16)),
+        name=name,
+        span_id=_new_id(),
+        parent_id=parent.span_id if parent else None,
+        attrs=attrs,
+    )
+    token = _current.set(span)
+    error: Optional[BaseException] = None
+    try:
+        yield span
+    except BaseException as e:
+        error = e
+        raise
+    finally:
+        _current.reset(token)
+        _finish(span, error)
+
+
+@contextmanager
+def trace(name: str, *, force: bool = False, **attrs: Any) -> Iterator[Optional[Span]]:
+    """root span. 이미 trace 중이면 child span이 된다. 비활성이면 None."""
+    parent = _current.get()
+    if parent is None and not (TRACE_ENABLED or force):
+        yield None
+        return
+    with _open_span(name, parent, attrs) as span:
+        yield span
+
+
+@contextmanager
+def span(name: str, **attrs: Any) -> Iterator[Optional[Span]]:
+    """child span (trace 중이 아니면 None)."""
+    parent = _current.get()
+    if parent is None:
+        yield None
+        return
+    with _open_span(name, parent, attrs) as child:
+        yield child
+
+
+def current_span() -> Optional[Span]:
+    return _current.get()
+
+
+def annotate(**attrs: Any) -> None:
+    """현재 span에 attribute 추가 (trace 중이 아니면 무시)."""
+    current = _current.get()
+    if current is not None:
+        current.set(**attrs)
+
+
+@contextmanager
+def stage(kind: str, name: str, **attrs: Any) -> Iterator[Optional[Span]]:
+    """latency histogram 기록 + (trace 중이면) span."""
+    start = time.perf_counter()
+    try:
+        with span(f"{kind}:{name}", **attrs) as current:
+            yield current
+    finally:
+        STAGE_SECONDS.observe(time.perf_counter() - start, kind=kind, stage=name)
+
+
+def instrumented(kind: str, name: str) -> Callable[[F], F]:
+    """함수 호출 전체를 stage(kind, name)으로 감싸는 decorator (sync / async)."""
+    observe = STAGE_SECONDS.labels(kind=kind, stage=name)
+
+    def decorator(fn: F) -> F:
+        if inspect.iscoroutinefunction(fn):
+
+            @functools.wraps(fn)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                with stage(kind, name):
+                    return await fn(*args, **kwargs)
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if _current.get() is not None:
+                with stage(kind, name):
+                    return fn(*args, **kwargs)
+            # trace 중이 아니면 context manager 없이 시간만 잰다 (compute_gap 등 µs 단위 함수)
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                observe(time.perf_counter() - start)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
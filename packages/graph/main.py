@@ -1,25 +1,101 @@
 # packages/graph/main.py
 """LangGraph 메인 워크플로우.
 
-StateGraph + MessagesState를 사용한 최소 사이클 구현.
-START -> resume_agent -> END
+오케스트레이션용 LLM 호출 없이 고정된 순서로 실행되는 StateGraph.
+
+START ─┬─ resume_parse ───────────────┬─> normalize -> gap_compute -> END
+       └─ jd_parse (섹션마다 Send) ────┘
+
+checkpointer를 주면 (리뷰 세션) gap_compute 뒤에 project_generate가 붙고, 그 앞에서 멈춘다
+(interrupt_before). 유저 키워드 토글 / Preferences는 apply_review로 gap만 다시 계산해서
+update_state로 넣고, 같은 thread_id로 다시 실행하면 파싱 없이 project_generate부터 이어진다.
+
+    ... -> gap_compute -> ⏸ (User Interrupt) -> project_generate -> END
+
+project_generate는 아이디어 / 완성된 plan을 stream_mode="custom"으로 하나씩 흘려보낸다
+({"event": "idea" | "plan", "index": ..., ...}).
+
+입력을 고친 세션은 reanalyze_updates / areanalyze_updates로 바뀐 줄만 다시 파싱한다
+(packages.tools.incremental).
+
+state(= checkpoint)에는 입력 원문 대신 DocRef(resume_source / jd_sources)만 넣는다.
+session_input 블록 안에서 실행하면 노드는 메모리에 잡아 둔 원문을 읽는다
+(RAW_TEXT_RETENTION=none이면 원문은 checkpoint에도 DocStore에도 남지 않는다).
+
+- resume_parse와 섹션별 jd_parse는 같은 superstep에서 병렬 실행된다.
+- jd_parse_mode="single_call"이면 jd_parse는 모든 섹션을 한 번에 파싱한다 (Send 1개).
+- LLM 호출은 최대 1 + (JD 섹션 수)번 (fast path / 캐시 hit이면 더 적음).
+- 파싱 결과(ResumeKeyword / JDKeyword 객체)는 dict로 바꾸지 않고 state로 바로 전달된다.
+- 노드마다 stage latency(kind="node")가 기록되고, trace 중이면 span이 남는다.
 """
 
 from __future__ import annotations
 
-from typing import Optional
+import operator
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Annotated, Iterator, Optional, TypedDict, cast
 
+from langchain_core.runnables import RunnableLambda
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.config import get_stream_writer
 from langgraph.graph import END, START, StateGraph
 from langgraph.graph.message import MessagesState
+from langgraph.types import Send
+
+from packages.agents.project_agent import agenerate_projects, generate_projects
+from packages.core.docstore import hold_texts, input_ref, read_input
+from packages.core.schemas import (
+    DocRef,
+    GapSummary,
+    JDKeyword,
+    JDProfile,
+    Preferences,
+    ProjectOutput,
+    ResumeKeyword,
+    ResumeProfile,
+)
+from packages.core.schemas.utils import normalize_keyword
+from packages.core.tracing import instrumented
+from packages.tools.gap_compute import compute_gap
+from packages.tools.incremental import IncrementalStats, areparse, plan_changes, reparse
+from packages.tools.jd_parse import (
+    JD_PARSE_MODE,
+    aparse_jd,
+    parse_jd,
+    to_original,
+    with_category,
+)
+from packages.tools.preprocess import Pruned, prune_jd_mapped
+from packages.tools.resume_parse import aparse_resume, parse_resume
+
+
+class JDParseInput(TypedDict):
+    """
+    jd_parse 노드 입력 (Send payload, checkpoint에 남으므로 원문 대신 DocRef).
+    categories: 이 노드가 파싱할 섹션 (1개 또는 전체)
+    """
 
-from packages.agents.resume_agent import create_resume_agent
-from packages.core.schemas import GapSummary, JDProfile, ProjectOutput, ResumeProfile
+    jd_sources: dict[str, DocRef]
+    categories: list[str]
 
 
 class ProjectState(MessagesState):
-    resume_text: str
-    jd_text: str
-    # preferences: Optional[Preferences]
+    # 입력 원문 참조 (packages.core.docstore.input_ref)
+    resume_source: DocRef
+    # category(required/preferred/...) → 섹션 원문 참조
+    jd_sources: dict[str, DocRef]
+    # per_section | single_call (None이면 JD_PARSE_MODE)
+    jd_parse_mode: Optional[str]
+    preferences: Optional[Preferences]
+    # User Interrupt에서 유저가 "이미 안다"고 체크 해제한 키워드 (canonical)
+    known_keywords: Optional[list[str]]
+
+    # 섹션별 jd_parse 결과 ({"category", "keywords": list[JDKeyword]}), 병렬 노드들이 append
+    jd_sections: Annotated[list[dict], operator.add]
+    resume_keywords: Optional[list[ResumeKeyword]]
+    # category → 섹션 간 중복 제거 전 JD 키워드 (normalize가 채움, 증분 재분석의 기준)
+    jd_section_keywords: Optional[dict[str, list[JDKeyword]]]
 
     jd_profile: Optional[JDProfile]
     resume_profile: Optional[ResumeProfile]
@@ -31,27 +107,335 @@ class ProjectState(MessagesState):
     current_step: Optional[str]
 
 
-def build_graph():
+@contextmanager
+def session_input(resume_text: str, jd_text: dict[str, str]) -> Iterator[dict]:
+    """
+    graph 입력 {"resume_source", "jd_sources"}. 블록 안에서 invoke해야 노드가 원문을 읽는다
+    (보관 정책에 따라 DocStore에도 저장, none이면 실행이 끝나면 원문은 사라진다).
+    """
+    with hold_texts([resume_text, *jd_text.values()]):
+        yield {
+            "resume_source": input_ref(resume_text),
+            "jd_sources": {c: input_ref(t, section=c) for c, t in jd_text.items()},
+        }
+
+
+def _read(ref: Optional[DocRef]) -> str:
+    text = read_input(ref)
+    if text is None:
+        raise ValueError("input text is not available (run the graph inside session_input)")
+    return text
+
+
+def _jd_sections(sources: dict[str, DocRef]) -> dict[str, str]:
+    sections = {c: t for c, t in ((c, _read(ref)) for c, ref in sources.items()) if t.strip()}
+    if not sections:
+        raise ValueError("jd_text must contain at least one non-empty section")
+    return sections
+
+
+@lru_cache(maxsize=16)
+def _pruned(keys: tuple[tuple[str, str, int, int], ...]) -> dict[str, Pruned]:
+    # fan-out과 섹션별 jd_parse 노드가 같은 prune 결과를 나눠 쓴다 (key는 content hash)
+    sources = {c: DocRef(doc_id=d, start=start, end=end) for c, d, start, end in keys}
+    return prune_jd_mapped(_jd_sections(sources))[0]
+
+
+def _pruned_jd(sources: dict[str, DocRef]) -> dict[str, Pruned]:
+    """boilerplate 제거 + JD 전체 토큰 예산 (다 지워진 섹션은 빠진다)."""
+    return _pruned(tuple((c, ref.doc_id, ref.start, ref.end) for c, ref in sources.items()))
+
+
+# --------- Nodes ---------
+
+
+@instrumented("node", "resume_parse")
+def _resume_parse(state: ProjectState) -> dict:
+    return {"resume_keywords": parse_resume(_read(state["resume_source"])).keywords}
+
+
+@instrumented("node", "resume_parse")
+async def _aresume_parse(state: ProjectState) -> dict:
+    return {"resume_keywords": (await aparse_resume(_read(state["resume_source"]))).keywords}
+
+
+def _jd_parse_input(node_input: JDParseInput) -> dict[str, Pruned]:
+    pruned = _pruned_jd(node_input["jd_sources"])
+    return {c: pruned[c] for c in node_input["categories"]}
+
+
+def _section_output(sections: dict[str, Pruned], result: JDProfile) -> dict:
+    """섹션별 키워드 (source_span은 전처리 전 섹션 원문 기준, 증분 재분석이 그 원문과 비교한다)."""
+    if len(sections) == 1:
+        # 섹션 1개면 키워드 category는 섹션 category로 덮어쓴다 (/analyze와 동일)
+        ((category, pruned),) = sections.items()
+        return {"jd_sections": [{"category": category, "keywords": [
+            to_original(with_category(kw, category), pruned) for kw in result.keywords
+        ]}]}
+    # 여러 섹션을 한 번에 파싱한 경우 jd_parse가 섹션 category로 귀속시켜 돌려준다
+    by_category: dict[str, list[JDKeyword]] = {}
+    for kw in result.keywords:
+        if kw.category in sections:
+            kw = to_original(kw, sections[kw.category])
+        by_category.setdefault(kw.category, []).append(kw)
+    return {"jd_sections": [{"category": c, "keywords": kws} for c, kws in by_category.items()]}
+
+
+def _texts(sections: dict[str, Pruned]) -> dict[str, str]:
+    return {category: pruned.text for category, pruned in sections.items()}
+
+
+@instrumented("node", "jd_parse")
+def _jd_parse(node_input: JDParseInput) -> dict:
+    sections = _jd_parse_input(node_input)
+    return _section_output(sections, parse_jd(_texts(sections)))
+
+
+@instrumented("node", "jd_parse")
+async def _ajd_parse(node_input: JDParseInput) -> dict:
+    sections = _jd_parse_input(node_input)
+    return _section_output(sections, await aparse_jd(_texts(sections)))
+
+
+@instrumented("node", "normalize")
+def _normalize(state: ProjectState) -> dict:
+    """파싱 결과를 Profile로 합친다 (validator에서 canonical 변환 + 중복 제거)."""
+    # 병렬 노드의 append 순서와 무관하게 입력 섹션 순서로 합친다
+    order = {category: i for i, category in enumerate(state["jd_sources"])}
+    sections = sorted(state["jd_sections"], key=lambda s: order.get(s["category"], len(order)))
+    by_category: dict[str, list[JDKeyword]] = {}
+    for section in sections:
+        by_category.setdefault(section["category"], []).extend(section["keywords"])
+    return {
+        **_profiles(state["resume_keywords"] or [], by_category),
+        "current_step": "normalize",
+    }
+
+
+def _profiles(
+    resume_keywords: list[ResumeKeyword], jd_section_keywords: dict[str, list[JDKeyword]]
+) -> dict:
+    return {
+        "jd_section_keywords": jd_section_keywords,
+        "resume_profile": ResumeProfile(keywords=resume_keywords),
+        "jd_profile": JDProfile(
+            keywords=[kw for keywords in jd_section_keywords.values() for kw in keywords]
+        ),
+    }
+
+
+@instrumented("node", "gap_compute")
+def _gap_compute(state: ProjectState) -> dict:
+    """갭 분류 + match score (GapSummary.match_score)."""
+    return {
+        "gap_summary": compute_gap(state["resume_profile"], state["jd_profile"]),
+        "current_step": "gap_compute",
+    }
+
+
+def _project_callbacks() -> dict:
+    """아이디어 / 완성된 plan을 stream_mode="custom"으로 흘려보내는 callback."""
+    writer = get_stream_writer()
+    return {
+        "on_idea": lambda index, idea: writer({"event": "idea", "index": index, "idea": idea}),
+        "on_plan": lambda index, plan: writer({"event": "plan", "index": index, "plan": plan}),
+    }
+
+
+@instrumented("node", "project_generate")
+def _project_generate(state: ProjectState) -> dict:
+    return {
+        "project_output": generate_projects(
+            state["gap_summary"], state.get("preferences"), **_project_callbacks()
+        ),
+        "current_step": "project_generate",
+    }
+
+
+@instrumented("node", "project_generate")
+async def _aproject_generate(state: ProjectState) -> dict:
+    return {
+        "project_output": await agenerate_projects(
+            state["gap_summary"], state.get("preferences"), **_project_callbacks()
+        ),
+        "current_step": "project_generate",
+    }
+
+
+# 유저가 체크 해제한 키워드를 Resume 키워드로 넣을 때의 evidence
+USER_CONFIRMED_EVIDENCE = "confirmed by user during keyword review"
+
+
+@instrumented("compute", "apply_review")
+def apply_review(
+    state: ProjectState,
+    keyword_toggles: Optional[dict[str, bool]] = None,
+    preferences: Optional[Preferences] = None,
+) -> dict:
+    """
+    User Interrupt 결과를 state update로 바꾼다 (LLM 호출 없음, gap / score만 다시 계산).
+
+    keyword_toggles: {keyword: checked}. False(체크 해제)면 유저가 이미 아는 키워드로 보고
+    Resume 키워드에 추가해서 매칭시키고, True면 다시 missing으로 되돌린다.
+    """
+    known = dict.fromkeys(state.get("known_keywords") or [])
+    for keyword, checked in (keyword_toggles or {}).items():
+        canonical = normalize_keyword(keyword)
+        if not canonical:
+            continue
+        if checked:
+            known.pop(canonical, None)
+        else:
+            known[canonical] = None
+
+    resume = state["resume_profile"]
+    if known:
+        resume = ResumeProfile(
+            keywords=[
+                *resume.keywords,
+                *(ResumeKeyword(keyword_text=k, evidence=USER_CONFIRMED_EVIDENCE) for k in known),
+            ]
+        )
+    update: dict = {
+        "known_keywords": list(known),
+        "gap_summary": compute_gap(resume, state["jd_profile"]),
+        "current_step": "review",
+    }
+    if preferences is not None:
+        update["preferences"] = preferences
+    return update
+
+
+def _previous_jd_keywords(state: ProjectState) -> dict[str, list[JDKeyword]]:
+    previous = state.get("jd_section_keywords")
+    if previous is not None:
+        return previous
+    # jd_section_keywords가 없던 세션: 중복 제거된 jd_profile로 대신한다
+    by_category: dict[str, list[JDKeyword]] = {}
+    for kw in state["jd_profile"].keywords:
+        by_category.setdefault(kw.category, []).append(kw)
+    return by_category
+
+
+def _previous_inputs(state: ProjectState) -> Optional[tuple[str, dict[str, str]]]:
+    """이전 입력 원문 (DocStore에서 다시 읽는다, 남아 있지 않으면 None)."""
+    resume_text = read_input(state.get("resume_source"))
+    jd_text = {c: read_input(ref) for c, ref in (state.get("jd_sources") or {}).items()}
+    if resume_text is None or any(text is None for text in jd_text.values()):
+        return None
+    return resume_text, cast(dict[str, str], jd_text)
+
+
+def _plan_reanalysis(state: ProjectState, resume_text: str, jd_text: dict[str, str]):
+    sections = {c: t for c, t in jd_text.items() if t and t.strip()}
+    if not sections:
+        raise ValueError("jd_text must contain at least one non-empty section")
+    previous = _previous_inputs(state)
+    if previous is None:
+        # 비교할 원문이 없으면 (RAW_TEXT_RETENTION=none, evict) 빈 입력에서 고친 것으로 본다
+        return sections, plan_changes("", [], resume_text, {}, {}, sections)
+    old_resume_text, old_jd_text = previous
+    return sections, plan_changes(
+        old_resume_text,
+        state.get("resume_keywords") or [],
+        resume_text,
+        old_jd_text,
+        _previous_jd_keywords(state),
+        sections,
+    )
+
+
+def _reanalysis_update(
+    state: ProjectState,
+    resume_text: str,
+    jd_text: dict[str, str],
+    resume_keywords: list[ResumeKeyword],
+    jd_section_keywords: dict[str, list[JDKeyword]],
+) -> dict:
+    update = {
+        "resume_source": input_ref(resume_text),
+        "jd_sources": {c: input_ref(t, section=c) for c, t in jd_text.items()},
+        "resume_keywords": resume_keywords,
+        **_profiles(resume_keywords, jd_section_keywords),
+        # 입력이 바뀌었으므로 이전 프로젝트 안은 버린다
+        "project_output": None,
+    }
+    # 유저가 체크 해제한 키워드(known_keywords)는 새 profile에도 그대로 적용
+    return {**update, **apply_review({**state, **update})}
+
+
+def reanalyze_updates(
+    state: ProjectState, resume_text: str, jd_text: dict[str, str]
+) -> tuple[dict, IncrementalStats]:
+    """
+    이전 분석 state + 새 입력 → state update (바뀐 줄만 다시 파싱, gap / score 재계산).
+    update_state(..., as_node="gap_compute")로 넣으면 다음 노드는 다시 project_generate.
+    """
+    sections, plan = _plan_reanalysis(state, resume_text, jd_text)
+    resume_keywords, jd_section_keywords = reparse(plan)
+    update = _reanalysis_update(state, resume_text, sections, resume_keywords, jd_section_keywords)
+    return update, plan.stats
+
+
+async def areanalyze_updates(
+    state: ProjectState, resume_text: str, jd_text: dict[str, str]
+) -> tuple[dict, IncrementalStats]:
+    """reanalyze_updates의 async 버전."""
+    sections, plan = _plan_reanalysis(state, resume_text, jd_text)
+    resume_keywords, jd_section_keywords = await areparse(plan)
+    update = _reanalysis_update(state, resume_text, sections, resume_keywords, jd_section_keywords)
+    return update, plan.stats
+
+
+def _fan_out_jd(state: ProjectState) -> list[Send]:
+    sources = state.get("jd_sources") or {}
+    # 다 지워진 섹션은 파싱하지 않는다 (jd_parse 노드는 같은 prune 결과를 캐시에서 읽는다)
+    categories = list(_pruned_jd(sources))
+    if (state.get("jd_parse_mode") or JD_PARSE_MODE) == "single_call":
+        return [Send("jd_parse", JDParseInput(jd_sources=sources, categories=categories))]
+    return [
+        Send("jd_parse", JDParseInput(jd_sources=sources, categories=[c])) for c in categories
+    ]
+
+
+def build_graph(checkpointer: Optional[BaseCheckpointSaver] = None):
     """
     Build the main LangGraph workflow.
 
-    Flow: START -> resume_agent -> END
+    Flow: START -> [resume_parse ∥ jd_parse × sections] -> normalize -> gap_compute -> END
+    With a checkpointer: ... -> gap_compute -> (interrupt) -> project_generate -> END
+
+    Args:
+        checkpointer: 세션 저장소 (예: packages.core.checkpoint.get_checkpointer()).
+            주면 config={"configurable": {"thread_id": session_id}}로 실행해야 한다.
 
     Returns:
-        CompiledGraph: A compiled LangGraph that can be invoked with MessagesState
+        CompiledGraph: `with session_input(resume_text, jd_text) as inputs:` 안에서
+            invoke/ainvoke(inputs)
     """
-    # Create the agent
-    agent = create_resume_agent()
-
-    # Build the graph
     builder = StateGraph(ProjectState)
 
-    # Add nodes
-    builder.add_node("resume_agent", agent)
+    # sync(invoke)와 async(ainvoke) 모두 지원
+    builder.add_node("resume_parse", RunnableLambda(_resume_parse, afunc=_aresume_parse))
+    builder.add_node("jd_parse", RunnableLambda(_jd_parse, afunc=_ajd_parse))
+    builder.add_node("normalize", _normalize)
+    builder.add_node("gap_compute", _gap_compute)
+
+    # fan-out: resume 1개 + JD 섹션별 Send
+    builder.add_edge(START, "resume_parse")
+    builder.add_conditional_edges(START, _fan_out_jd, ["jd_parse"])
 
-    # Add edges
-    builder.add_edge(START, "resume_agent")
-    builder.add_edge("resume_agent", END)
+    # fan-in: 모든 parse가 끝나야 normalize
+    builder.add_edge(["resume_parse", "jd_parse"], "normalize")
+    builder.add_edge("normalize", "gap_compute")
+    if checkpointer is None:
+        builder.add_edge("gap_compute", END)
+        return builder.compile()
 
-    # Compile and return
-    return builder.compile()
+    # 리뷰 세션: project_generate 앞에서 멈추고 User Interrupt를 기다린다
+    builder.add_node(
+        "project_generate", RunnableLambda(_project_generate, afunc=_aproject_generate)
+    )
+    builder.add_edge("gap_compute", "project_generate")
+    builder.add_edge("project_generate", END)
+    return builder.compile(checkpointer=checkpointer, interrupt_before=["project_generate"])
@@ -1,10 +1,24 @@
 # packages/tools/__init__.py
 """LangGraph Tools."""
 
+from .architecture import architecture_tool
+from .gap_compute import gap_compute_tool
 from .jd_parse import jd_parse_tool
+from .job_match import job_match_tool
+from .keyword_normalize import normalize_keywords_tool
+from .project_ideation import project_ideation_tool
 from .resume_parse import resume_parse_tool
+from .score import score_tool
+from .sprint_plan import sprint_plan_tool
 
 __all__ = [
+    "architecture_tool",
+    "gap_compute_tool",
     "jd_parse_tool",
+    "job_match_tool",
+    "normalize_keywords_tool",
+    "project_ideation_tool",
     "resume_parse_tool",
+    "score_tool",
+    "sprint_plan_tool",
 ]
@@ -1,2 +1,96 @@
 # packages/tools/architecture.py
-"""아키텍처 설계 Tool."""
+"""
+아키텍처 설계 Tool.
+
+ProjectIdea 1개 → ArchitectureSpec (structured output 1회).
+sprint_plan과 서로의 결과를 쓰지 않으므로 project_agent가 두 호출을 동시에 돌린다.
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from langchain_core.tools import StructuredTool
+
+from packages.core.llm import ainvoke_structured, invoke_structured
+from packages.core.schemas import ArchitectureSpec, Preferences, ProjectIdea
+from packages.core.tracing import instrumented
+from packages.tools.project_ideation import describe_idea, describe_preferences
+
+MODEL_NAME = "gpt-4o-mini"
+# 아이디어는 이미 정해졌으므로 ideation보다 낮게 (일관된 구성 위주)
+TEMPERATURE = 0.4
+
+SYSTEM_PROMPT = """You are a software architect helping a job seeker build a portfolio project.
+
+Design the architecture for the given project idea:
+- summary: one sentence describing the overall shape of the system
+- components: services, databases, queues, agents, external APIs (each with a short role)
+- data_flow: how a request / data moves through the components
+- mermaid: optionally a Mermaid flowchart of the components
+
+Rules:
+- Use the idea's tech stack and make every covered keyword visible in the design
+- Keep it buildable by the candidate within the stated constraints (default: 1 week, solo,
+  zero cost); prefer managed free tiers and local containers over heavy infrastructure"""
+
+
+def _build_messages(idea: ProjectIdea, preferences: Optional[Preferences]) -> list[dict]:
+    return [
+        {"role": "system", "content": SYSTEM_PROMPT},
+        {
+            "role": "user",
+            "content": describe_idea(idea) + "\n\n" + describe_preferences(preferences),
+        },
+    ]
+
+
+@instrumented("tool", "architecture")
+def design_architecture(
+    idea: ProjectIdea, preferences: Optional[Preferences] = None
+) -> ArchitectureSpec:
+    """아이디어 1개 → 아키텍처."""
+    return invoke_structured(
+        ArchitectureSpec,
+        _build_messages(idea, preferences),
+        model=MODEL_NAME,
+        temperature=TEMPERATURE,
+    )
+
+
+@instrumented("tool", "architecture")
+async def adesign_architecture(
+    idea: ProjectIdea, preferences: Optional[Preferences] = None
+) -> ArchitectureSpec:
+    """design_architecture의 async 버전."""
+    return await ainvoke_structured(
+        ArchitectureSpec,
+        _build_messages(idea, preferences),
+        model=MODEL_NAME,
+        temperature=TEMPERATURE,
+    )
+
+
+def _architecture(idea: ProjectIdea, preferences: Optional[Preferences] = None) -> dict:
+    """
+    Design the architecture of one portfolio project idea.
+
+    Args:
+        idea: ProjectIdea (title, covered keywords, tech stack, constraints)
+        preferences: Preferred stack / constraints / role
+
+    Returns:
+        ArchitectureSpec as a dictionary (summary, components, data_flow, mermaid)
+    """
+    return design_architecture(idea, preferences).model_dump()
+
+
+async def _aarchitecture(idea: ProjectIdea, preferences: Optional[Preferences] = None) -> dict:
+    return (await adesign_architecture(idea, preferences)).model_dump()
+
+
+architecture_tool = StructuredTool.from_function(
+    func=_architecture,
+    coroutine=_aarchitecture,
+    name="architecture_tool",
+)
@@ -1,2 +1,153 @@
 # packages/tools/gap_compute.py
-"""갭 분석 Tool."""
+"""
+갭 분석 Tool.
+
+Resume 키워드와 JD 키워드를 비교해 strong/partial/missing으로 분류한다.
+- 키워드는 분석마다 정수 ID로 intern하고, Resume 보유 여부는 int bitmask로 표현한다.
+- JDKeyword.gap_instruction의 OR 그룹("Match group: [python, java] - ...")은
+  한 번만 파싱해서 그룹 ID + 멤버 bitmask로 바꾼다.
+  그룹 멤버 중 하나라도 Resume에 있으면 그룹의 나머지 키워드는 partial match로 본다.
+전체 비용은 키워드 수에 선형.
+"""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import Optional
+
+from langchain_core.tools import tool
+
+from packages.core.schemas import (
+    GapSummary,
+    JDKeyword,
+    JDProfile,
+    KeywordMatch,
+    ResumeKeyword,
+    ResumeProfile,
+)
+from packages.core.schemas.utils import normalize_keyword
+from packages.core.tracing import instrumented
+from packages.tools.score import weighted_match_score
+
+_MATCH_GROUP_RE = re.compile(r"match\s+group\s*:\s*\[([^\]]*)\]", re.IGNORECASE)
+
+
+@lru_cache(maxsize=4096)
+def parse_match_group(instruction: Optional[str]) -> tuple[str, ...]:
+    """
+    gap_instruction → OR 그룹 멤버(canonical) 목록. OR 그룹이 아니면 빈 tuple.
+    같은 instruction 문자열은 한 번만 파싱된다.
+    """
+    if not instruction:
+        return ()
+    match = _MATCH_GROUP_RE.search(instruction)
+    if match is None:
+        return ()
+    members = (normalize_keyword(m.strip(" '\"")) for m in match.group(1).split(","))
+    return tuple(dict.fromkeys(m for m in members if m))
+
+
+def _lowest_bit(mask: int) -> int:
+    return (mask & -mask).bit_length() - 1
+
+
+@instrumented("compute", "compute_gap")
+def compute_gap(resume: ResumeProfile, jd: JDProfile) -> GapSummary:
+    """
+    Resume vs JD 갭 분석.
+
+    - strong: JD 키워드가 Resume에 그대로 있음
+    - partial: JD 키워드는 없지만 같은 OR 그룹의 다른 키워드가 Resume에 있음
+    - missing: 둘 다 아님
+
+    Returns:
+        GapSummary (match_score는 required 0.7 / preferred 0.3 가중치)
+    """
+    # 1) intern: keyword_text → id (validator에서 이미 canonical로 정규화됨)
+    ids: dict[str, int] = {}
+    resume_by_id: dict[int, ResumeKeyword] = {}
+    resume_mask = 0
+    for rk in resume.keywords:
+        kid = ids.setdefault(rk.keyword_text, len(ids))
+        resume_by_id.setdefault(kid, rk)
+        resume_mask |= 1 << kid
+
+    # 2) OR 그룹: 멤버 bitmask → group id
+    group_of: list[int] = []
+    group_ids: dict[int, int] = {}
+    group_masks: list[int] = []
+    for jk in jd.keywords:
+        kid = ids.setdefault(jk.keyword_text, len(ids))
+        members = parse_match_group(jk.gap_instruction)
+        if not members:
+            group_of.append(-1)
+            continue
+        mask = 1 << kid
+        for member in members:
+            mask |= 1 << ids.setdefault(member, len(ids))
+        gid = group_ids.get(mask)
+        if gid is None:
+            gid = group_ids[mask] = len(group_masks)
+            group_masks.append(mask)
+        group_of.append(gid)
+    group_hits = [mask & resume_mask for mask in group_masks]
+
+    # 3) 분류 + 점수 집계
+    keyword_matches: list[KeywordMatch] = []
+    missing: list[JDKeyword] = []
+    totals = {"required": 0, "preferred": 0}
+    matched = {"required": 0, "preferred": 0}
+    for jk, gid in zip(jd.keywords, group_of):
+        kid = ids[jk.keyword_text]
+        if resume_mask >> kid & 1:
+            match_type, resume_kid = "strong", kid
+        elif gid >= 0 and group_hits[gid]:
+            match_type, resume_kid = "partial", _lowest_bit(group_hits[gid])
+        else:
+            match_type, resume_kid = "missing", -1
+
+        if jk.category in totals:
+            totals[jk.category] += 1
+            if match_type != "missing":
+                matched[jk.category] += 1
+
+        if match_type == "missing":
+            missing.append(jk)
+        else:
+            keyword_matches.append(
+                KeywordMatch(keyword_pair=(resume_by_id[resume_kid], jk), match_type=match_type)
+            )
+
+    match_score = weighted_match_score(
+        matched["required"], totals["required"], matched["preferred"], totals["preferred"]
+    )
+    return GapSummary(
+        match_score=match_score,
+        keyword_matches=keyword_matches,
+        missing_keywords=missing,
+        validated_missing_keywords=list(missing),
+        notes=(
+            f"Found {len(resume.keywords)} resume keywords. "
+            f"Missing {len(missing)} JD keywords."
+        ),
+    )
+
+
+@tool
+@instrumented("tool", "gap_compute_tool")
+def gap_compute_tool(resume_profile: dict, jd_profile: dict) -> dict:
+    """
+    Compare a parsed Resume against a parsed JD and classify every JD keyword.
+
+    Args:
+        resume_profile: ResumeProfile dictionary (output of resume_parse_tool)
+        jd_profile: JDProfile dictionary (output of jd_parse_tool)
+
+    Returns:
+        GapSummary as a dictionary with match_score, keyword_matches and missing keywords
+    """
+    # 키워드만 사용 (raw_text 등 부가 필드는 무시)
+    resume = ResumeProfile(keywords=resume_profile.get("keywords", []))
+    jd = JDProfile(keywords=jd_profile.get("keywords", []))
+    return compute_gap(resume, jd).model_dump()
@@ -0,0 +1,306 @@
+# packages/tools/incremental.py
+"""
+증분 재분석: 이전 분석의 입력 / 키워드와 새 입력을 비교해서 바뀐 부분만 다시 파싱한다.
+
+- JD는 섹션(category) 단위로 먼저 비교하고, 바뀐 섹션은 줄 단위로 비교한다.
+  Resume는 줄(= bullet / 문단의 한 줄) 단위로 비교한다.
+- 이전 키워드는 원문 위치(source_span, 없으면 evidence / 키워드 텍스트 위치)로 줄에 귀속시킨다.
+  JD source_span도 전처리(prune_jd) 후가 아니라 섹션 원문 기준이어야 한다 (graph가 되돌려 둔다).
+  바뀌지 않은 줄의 키워드는 새 원문 offset으로 옮겨서 그대로 쓰고,
+  바뀐 줄의 키워드는 버린다 (같은 키워드가 안 바뀐 다른 줄에도 있으면 그 위치로 옮겨서 유지).
+  위치를 찾을 수 없는 키워드(LLM이 바꿔 쓴 evidence 등)는 유지한다.
+- Resume의 바뀐 구간들은 이어 붙여 전체 파싱과 같은 전처리(RESUME_TOKEN_BUDGET) / 청크 분할을
+  거쳐 파싱하고, JD의 바뀐 조각은 조각마다 파싱한다 (fast path → 캐시 → LLM, 모두 동시에).
+- 결과는 원문 순서로 이어 붙여 ResumeProfile / JDProfile validator의
+  dedupe_resume_keywords / dedupe_jd_keywords(category 우선순위)로 다시 중복 제거한다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import re
+from bisect import bisect_right
+from dataclasses import asdict, dataclass, field
+from difflib import SequenceMatcher
+from typing import Optional, TypeVar
+
+from packages.core.schemas import BaseKeyword, JDKeyword, JDProfile, ResumeKeyword
+from packages.core.tracing import annotate, instrumented
+from packages.tools.jd_parse import aparse_jd, parse_jd, to_original, with_category
+from packages.tools.preprocess import Pruned, prune_sections_mapped
+from packages.tools.resume_parse import aparse_resume_spans, parse_resume_spans
+
+TKeyword = TypeVar("TKeyword", bound=BaseKeyword)
+
+
+@dataclass
+class LineDiff:
+    """
+    old → new 줄 단위 diff.
+    equal: 안 바뀐 구간 (old_start, new_start, length), old_start 순.
+    changed: 새 원문에서 다시 파싱할 구간 [start, end) (공백만 있는 구간 제외).
+    """
+
+    equal: list[tuple[int, int, int]] = field(default_factory=list)
+    changed: list[tuple[int, int]] = field(default_factory=list)
+
+    def to_new(self, start: int, end: int) -> Optional[tuple[int, int]]:
+        """old [start, end)가 안 바뀐 구간 하나 안에 있으면 새 offset, 아니면 None."""
+        i = bisect_right(self.equal, (start, float("inf"), 0)) - 1
+        if i < 0:
+            return None
+        old_start, new_start, length = self.equal[i]
+        if end > old_start + length:
+            return None
+        return new_start + (start - old_start), new_start + (end - old_start)
+
+    def is_unchanged(self, new_start: int, new_end: int) -> bool:
+        return any(n <= new_start and new_end <= n + length for _, n, length in self.equal)
+
+
+def _lines(text: str) -> tuple[list[str], list[int]]:
+    lines = text.splitlines(keepends=True)
+    offsets = [0]
+    for line in lines:
+        offsets.append(offsets[-1] + len(line))
+    return lines, offsets
+
+
+def diff_lines(old: str, new: str) -> LineDiff:
+    """줄 단위 diff (줄바꿈 문자를 뺀 줄 내용이 정확히 같아야 같은 줄)."""
+    old_lines, old_offsets = _lines(old)
+    new_lines, new_offsets = _lines(new)
+    diff = LineDiff()
+    # 마지막 줄 뒤에 줄을 덧붙이면 그 줄에 "\n"만 생기므로 줄바꿈은 비교에서 뺀다
+    matcher = SequenceMatcher(
+        None,
+        [line.rstrip("\r\n") for line in old_lines],
+        [line.rstrip("\r\n") for line in new_lines],
+        autojunk=False,
+    )
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            start = old_offsets[i1]
+            diff.equal.append((start, new_offsets[j1], old_offsets[i2] - start))
+        elif j2 > j1 and "".join(new_lines[j1:j2]).strip():
+            diff.changed.append((new_offsets[j1], new_offsets[j2]))
+    return diff
+
+
+def _anchor(keyword: BaseKeyword, text: str) -> Optional[tuple[int, int]]:
+    """원문에서 키워드 위치: source_span → evidence → 키워드 텍스트 순."""
+    if keyword.source_span is not None:
+        return keyword.source_span
+    lowered = text.lower()
+    for needle in (keyword.evidence, keyword.keyword_text):
+        if not needle:
+            continue
+        at = text.find(needle)
+        if at < 0:
+            at = lowered.find(needle.lower())
+        if at >= 0:
+            return at, at + len(needle)
+    return None
+
+
+def _relocate(keyword: TKeyword, new_text: str, diff: LineDiff) -> Optional[TKeyword]:
+    """바뀐 줄에서 나온 키워드가 안 바뀐 다른 줄에도 있으면 그 위치로 옮긴다."""
+    pattern = re.compile(rf"(?<!\w){re.escape(keyword.keyword_text)}(?!\w)", re.IGNORECASE)
+    for m in pattern.finditer(new_text):
+        if not diff.is_unchanged(m.start(), m.end()):
+            continue
+        line_start = new_text.rfind("\n", 0, m.start()) + 1
+        line_end = new_text.find("\n", m.end())
+        line = new_text[line_start : line_end if line_end >= 0 else len(new_text)]
+        update: dict = {"evidence": line.strip()}
+        if keyword.source_span is not None:
+            update["source_span"] = (m.start(), m.end())
+        return keyword.model_copy(update=update)
+    return None
+
+
+def carry_over(
+    keywords: list[TKeyword], old_text: str, new_text: str, diff: LineDiff
+) -> list[TKeyword]:
+    """이전 키워드 중 안 바뀐 줄에 있는 것만 새 원문 기준으로 옮긴다 (이전 순서 유지)."""
+    kept: list[TKeyword] = []
+    for keyword in keywords:
+        anchor = _anchor(keyword, old_text)
+        if anchor is None:
+            kept.append(keyword)
+            continue
+        moved = diff.to_new(*anchor)
+        if moved is not None:
+            if keyword.source_span is not None and moved != keyword.source_span:
+                keyword = keyword.model_copy(update={"source_span": moved})
+            kept.append(keyword)
+            continue
+        relocated = _relocate(keyword, new_text, diff)
+        if relocated is not None:
+            kept.append(relocated)
+    return kept
+
+
+def _by_position(keywords: list[TKeyword]) -> list[TKeyword]:
+    # 원문 순서 (dedupe가 먼저 나온 evidence를 유지하므로 전체 파싱과 같은 순서로 맞춘다)
+    return sorted(
+        keywords,
+        key=lambda kw: kw.source_span[0] if kw.source_span is not None else float("inf"),
+    )
+
+
+@dataclass
+class IncrementalStats:
+    resume_changed_spans: int = 0
+    resume_changed_chars: int = 0
+    jd_changed_spans: int = 0
+    jd_changed_chars: int = 0
+    # 섹션 전체를 새로 파싱한 category (새로 생긴 섹션)
+    jd_new_sections: list[str] = field(default_factory=list)
+    jd_removed_sections: list[str] = field(default_factory=list)
+    keywords_kept: int = 0
+    keywords_dropped: int = 0
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+@dataclass
+class IncrementalPlan:
+    """파싱 전 단계: 옮겨 쓸 키워드 + 다시 파싱할 구간."""
+
+    resume_text: str
+    resume_keywords: list[ResumeKeyword]
+    resume_spans: list[tuple[int, int]]
+    jd_text: dict[str, str]
+    # category → (옮겨 쓴 키워드, 다시 파싱할 구간들 [start, end))
+    jd_sections: dict[str, tuple[list[JDKeyword], list[tuple[int, int]]]]
+    stats: IncrementalStats
+
+
+def plan_changes(
+    old_resume_text: str,
+    old_resume_keywords: list[ResumeKeyword],
+    new_resume_text: str,
+    old_jd_text: dict[str, str],
+    old_jd_keywords: dict[str, list[JDKeyword]],
+    new_jd_text: dict[str, str],
+) -> IncrementalPlan:
+    """
+    이전 입력 / 키워드와 새 입력을 비교한다 (LLM 호출 없음).
+    old_jd_keywords는 category별 중복 제거 전 키워드 (섹션 간 dedupe로 사라진 것까지 있어야
+    우선순위가 높은 섹션에서 키워드가 빠졌을 때 낮은 섹션의 것이 되살아난다).
+    """
+    stats = IncrementalStats()
+
+    resume_diff = diff_lines(old_resume_text, new_resume_text)
+    resume_keywords = carry_over(old_resume_keywords, old_resume_text, new_resume_text, resume_diff)
+    stats.resume_changed_spans = len(resume_diff.changed)
+    stats.resume_changed_chars = sum(end - start for start, end in resume_diff.changed)
+    stats.keywords_kept += len(resume_keywords)
+    stats.keywords_dropped += len(old_resume_keywords) - len(resume_keywords)
+
+    jd_sections: dict[str, tuple[list[JDKeyword], list[tuple[int, int]]]] = {}
+    for category, new_text in new_jd_text.items():
+        old_text = old_jd_text.get(category)
+        previous = old_jd_keywords.get(category, [])
+        if old_text is None:
+            stats.jd_new_sections.append(category)
+            jd_sections[category] = ([], [(0, len(new_text))] if new_text.strip() else [])
+            stats.jd_changed_spans += 1
+            stats.jd_changed_chars += len(new_text)
+            continue
+        diff = diff_lines(old_text, new_text)
+        kept = carry_over(previous, old_text, new_text, diff)
+        jd_sections[category] = (kept, diff.changed)
+        stats.jd_changed_spans += len(diff.changed)
+        stats.jd_changed_chars += sum(end - start for start, end in diff.changed)
+        stats.keywords_kept += len(kept)
+        stats.keywords_dropped += len(previous) - len(kept)
+    stats.jd_removed_sections = [c for c in old_jd_text if c not in new_jd_text]
+
+    return IncrementalPlan(
+        resume_text=new_resume_text,
+        resume_keywords=resume_keywords,
+        resume_spans=resume_diff.changed,
+        jd_text=new_jd_text,
+        jd_sections=jd_sections,
+        stats=stats,
+    )
+
+
+@dataclass
+class _JDPiece:
+    category: str
+    # 새 섹션 원문에서 조각이 시작하는 위치
+    start: int
+    pruned: Pruned
+
+
+def _jd_pieces(plan: IncrementalPlan) -> list[_JDPiece]:
+    """다시 파싱할 JD 조각 (boilerplate 제거 후 빈 조각은 제외)."""
+    items = [
+        (category, start, plan.jd_text[category][start:end])
+        for category, (_, spans) in plan.jd_sections.items()
+        for start, end in spans
+    ]
+    pruned, _ = prune_sections_mapped((category, text) for category, _, text in items)
+    return [
+        _JDPiece(category, start, piece)
+        for (category, start, _), (_, piece) in zip(items, pruned)
+        if piece.text.strip()
+    ]
+
+
+def _piece_keywords(piece: _JDPiece, result: JDProfile) -> tuple[str, list[JDKeyword]]:
+    # source_span은 조각 기준 → 새 섹션 원문 기준 (다음 재분석이 이 원문과 비교한다)
+    return piece.category, [
+        to_original(with_category(kw, piece.category), piece.pruned, piece.start)
+        for kw in result.keywords
+    ]
+
+
+def _assemble(
+    plan: IncrementalPlan,
+    resume_new: list[ResumeKeyword],
+    jd_new: list[tuple[str, list[JDKeyword]]],
+) -> tuple[list[ResumeKeyword], dict[str, list[JDKeyword]]]:
+    resume_keywords = _by_position([*plan.resume_keywords, *resume_new])
+    jd_keywords = {category: list(kept) for category, (kept, _) in plan.jd_sections.items()}
+    for category, keywords in jd_new:
+        jd_keywords[category].extend(keywords)
+    return resume_keywords, jd_keywords
+
+
+@instrumented("tool", "incremental_parse")
+def reparse(plan: IncrementalPlan) -> tuple[list[ResumeKeyword], dict[str, list[JDKeyword]]]:
+    """plan의 바뀐 구간만 파싱해서 옮겨 쓴 키워드와 합친다 → (Resume 키워드, category별 JD 키워드)."""
+    annotate(**plan.stats.as_dict())
+    resume_new = (
+        parse_resume_spans(plan.resume_text, plan.resume_spans) if plan.resume_spans else []
+    )
+    jd_new = [
+        _piece_keywords(piece, parse_jd({piece.category: piece.pruned.text}))
+        for piece in _jd_pieces(plan)
+    ]
+    return _assemble(plan, resume_new, jd_new)
+
+
+@instrumented("tool", "incremental_parse")
+async def areparse(
+    plan: IncrementalPlan,
+) -> tuple[list[ResumeKeyword], dict[str, list[JDKeyword]]]:
+    """reparse의 async 버전 (Resume 구간 / JD 조각을 모두 동시에 파싱)."""
+    annotate(**plan.stats.as_dict())
+    pieces = _jd_pieces(plan)
+
+    async def resume() -> list[ResumeKeyword]:
+        if not plan.resume_spans:
+            return []
+        return await aparse_resume_spans(plan.resume_text, plan.resume_spans)
+
+    async def jd(piece: _JDPiece) -> tuple[str, list[JDKeyword]]:
+        return _piece_keywords(piece, await aparse_jd({piece.category: piece.pruned.text}))
+
+    resume_new, *jd_new = await asyncio.gather(resume(), *(jd(piece) for piece in pieces))
+    return _assemble(plan, resume_new, list(jd_new))
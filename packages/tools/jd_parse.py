@@ -3,10 +3,30 @@
 
 from __future__ import annotations
 
-from langchain.chat_models import init_chat_model
-from langchain_core.tools import tool
-
-from packages.core.schemas import JDProfile
+import os
+from typing import Callable, Iterable, Literal, Optional
+
+from langchain_core.tools import StructuredTool
+
+from packages.core.cache import ParseCache, content_key, prompt_fingerprint
+from packages.core.docstore import retain_sections
+from packages.core.llm import ainvoke_structured, completed_items, invoke_structured
+from packages.core.ratelimit import current_priority
+from packages.core.resilience import LLMUnavailable, record_degraded
+from packages.core.schemas import JDKeyword, JDProfile
+from packages.core.singleflight import SingleFlight
+from packages.core.tokens import count_message_tokens
+from packages.core.tracing import annotate, instrumented
+from packages.tools.keyword_normalize import JD_CATEGORIES, fast_path_jd, lexicon_jd
+from packages.tools.preprocess import Pruned
+
+MODEL_NAME = "gpt-4o-mini"
+
+# 여러 JD 섹션을 파싱하는 방식
+# - per_section: 섹션마다 LLM 호출 (병렬, 지연 최소)
+# - single_call: 모든 섹션을 category 태그를 붙여 한 번에 호출 (SYSTEM_PROMPT 1회, 왕복 1회)
+JDParseMode = Literal["per_section", "single_call"]
+JD_PARSE_MODE: JDParseMode = os.getenv("JD_PARSE_MODE", "per_section")  # type: ignore[assignment]
 
 SYSTEM_PROMPT = """You are a Job Description (JD) parser that extracts technical keywords AGGRESSIVELY.
 
@@ -113,9 +133,225 @@ Extract:
 
 **EXTRACT ALL TECHNICAL KEYWORDS AGGRESSIVELY. EXCLUDE SOFT SKILLS, EDUCATION, AND WORK AUTHORIZATION.**"""
 
+SECTION_INSTRUCTION = (
+    "Each section below is tagged with its category. "
+    "Set every keyword's `category` to the category of the section it appears in."
+)
+
+# 프롬프트(SYSTEM_PROMPT + 섹션 지시문)가 바뀌면 캐시 key도 바뀐다
+PROMPT_VERSION = prompt_fingerprint(SYSTEM_PROMPT + SECTION_INSTRUCTION)
+
+_cache: ParseCache[JDProfile] = ParseCache(JDProfile, namespace="jd_parse")
+# 같은 입력의 동시 파싱은 LLM 호출 1번으로 합친다 (캐시가 채워지기 전 구간)
+_inflight: SingleFlight[JDProfile] = SingleFlight("jd_parse", scope=current_priority)
+
+
+def _cache_key(jd_text: dict) -> str:
+    return content_key(jd_text, prompt_version=PROMPT_VERSION, model=MODEL_NAME)
+
+
+def _finalize(result: JDProfile, jd_text: dict) -> JDProfile:
+    # 캐시된 객체는 공유되므로 복사본에 원문(또는 DocStore 참조)을 채운다
+    return result.model_copy(update=retain_sections(jd_text))
+
+
+def _render_sections(jd_text: dict) -> str:
+    return "\n\n".join(
+        f'<section category="{category}">\n{str(text).strip()}\n</section>'
+        for category, text in jd_text.items()
+    )
+
+
+def _build_messages(jd_text: dict) -> list[dict]:
+    return [
+        {"role": "system", "content": SYSTEM_PROMPT},
+        {
+            "role": "user",
+            "content": (
+                f"Parse this Job Description.\n{SECTION_INSTRUCTION}\n\n"
+                f"{_render_sections(jd_text)}"
+            ),
+        },
+    ]
+
+
+def _section_texts(jd_text: dict) -> dict[str, str]:
+    return {k: str(v).lower() for k, v in jd_text.items() if k in JD_CATEGORIES}
+
+
+def _section_category(
+    category: Optional[str], evidence: Optional[str], sections: dict[str, str]
+) -> Optional[str]:
+    # evidence가 들어있는 섹션을 우선하고, 못 찾으면 LLM이 붙인 category를 쓴다
+    evidence = (evidence or "").lower()
+    found = [c for c, text in sections.items() if evidence and evidence in text]
+    if category in found or (not found and category in sections):
+        return category
+    if found:
+        return found[0]
+    return next(iter(sections)) if len(sections) == 1 else category
+
+
+def attribute_category(
+    category: Optional[str], evidence: Optional[str], jd_text: dict
+) -> Optional[str]:
+    """키워드 하나(스트리밍 중 raw dict 등)의 섹션 category."""
+    return _section_category(category, evidence, _section_texts(jd_text))
+
 
-@tool
-def jd_parse_tool(jd_text: dict) -> dict:
+def _attribute_sections(result: JDProfile, jd_text: dict) -> JDProfile:
+    """섹션 key가 JD 카테고리면 모든 키워드를 자기 섹션의 category로 맞춘다."""
+    sections = _section_texts(jd_text)
+    if not sections:
+        return result
+    keywords = []
+    for kw in result.keywords:
+        category = _section_category(kw.category, kw.evidence, sections)
+        if category != kw.category:
+            kw = kw.model_copy(update={"category": category})
+        keywords.append(kw)
+    return result.model_copy(update={"keywords": keywords})
+
+
+def with_category(keyword: JDKeyword, category: str) -> JDKeyword:
+    """키워드 category를 섹션 category로 맞춘다 (이미 같으면 복사하지 않음)."""
+    if keyword.category == category:
+        return keyword
+    return keyword.model_copy(update={"category": category})
+
+
+def to_original(keyword: JDKeyword, pruned: Pruned, base: int = 0) -> JDKeyword:
+    """
+    전처리된 섹션 기준 source_span → 원문 섹션 기준 (base: 원문 섹션 안에서 조각이 시작하는 위치).
+    span이 없으면(LLM 결과) 그대로.
+    """
+    if keyword.source_span is None:
+        return keyword
+    start, end = keyword.source_span
+    span = (base + pruned.to_original(start), base + pruned.to_original(end - 1) + 1)
+    if span == keyword.source_span:
+        return keyword
+    return keyword.model_copy(update={"source_span": span})
+
+
+def merge_sections(items: Iterable[tuple[str, str]]) -> dict[str, str]:
+    """(category, text) 목록 → single_call 입력 {category: text}. 같은 category는 이어 붙인다."""
+    merged: dict[str, list[str]] = {}
+    for category, text in items:
+        merged.setdefault(category, []).append(text)
+    return {category: "\n\n".join(texts) for category, texts in merged.items()}
+
+
+def estimate_prompt_tokens(
+    items: Iterable[tuple[str, str]], mode: JDParseMode = JD_PARSE_MODE
+) -> dict:
+    """
+    JD 섹션들을 mode로 파싱할 때의 LLM 호출 수 / prompt 토큰 수 (캐시·fast path 미반영).
+    """
+    items = list(items)
+    if mode == "single_call":
+        requests = [merge_sections(items)]
+    else:
+        requests = [{category: text} for category, text in items]
+    return {
+        "mode": mode,
+        "calls": len(requests),
+        "prompt_tokens": sum(
+            count_message_tokens(_build_messages(r), MODEL_NAME) for r in requests
+        ),
+    }
+
+
+def _degraded(jd_text: dict, error: LLMUnavailable) -> JDProfile:
+    """LLM을 쓸 수 없을 때: lexicon 결과 (일시적인 결과라 캐시하지 않는다)."""
+    annotate(path="degraded", llm_error=str(error))
+    record_degraded(error)
+    return lexicon_jd(jd_text)
+
+
+def _call_llm(jd_text: dict, key: str) -> JDProfile:
+    result = invoke_structured(
+        JDProfile, _build_messages(jd_text), model=MODEL_NAME, temperature=0.0
+    )
+    result = _attribute_sections(result, jd_text).model_copy(update={"raw_text": None})
+    _cache.set(key, result)
+    return result
+
+
+async def _acall_llm(
+    jd_text: dict, key: str, on_keyword: Optional[Callable[[dict], None]]
+) -> JDProfile:
+    result = await ainvoke_structured(
+        JDProfile,
+        _build_messages(jd_text),
+        model=MODEL_NAME,
+        temperature=0.0,
+        on_partial=completed_items("keywords", on_keyword) if on_keyword else None,
+    )
+    result = _attribute_sections(result, jd_text).model_copy(update={"raw_text": None})
+    _cache.set(key, result)
+    return result
+
+
+@instrumented("tool", "jd_parse_tool")
+def parse_jd(jd_text: dict) -> JDProfile:
+    """JD 섹션 {category: text} → JDProfile (원문은 retention 정책대로)."""
+    # lexicon coverage가 높으면 LLM 호출 생략
+    annotate(sections=list(jd_text))
+    fast = fast_path_jd(jd_text)
+    if fast is not None:
+        annotate(path="fast_path")
+        return _finalize(fast, jd_text)
+
+    key = _cache_key(jd_text)
+    result = _cache.get(key)
+    annotate(path="cache" if result is not None else "llm")
+    if result is None:
+        try:
+            result = _inflight.do(key, lambda: _call_llm(jd_text, key))
+        except LLMUnavailable as e:
+            # 합쳐진 caller도 각자 자기 context에 degraded를 남긴다 (작업 재시도 판단)
+            result = _degraded(jd_text, e)
+
+    return _finalize(result, jd_text)
+
+
+@instrumented("tool", "jd_parse_tool")
+async def aparse_jd(
+    jd_text: dict, on_keyword: Optional[Callable[[dict], None]] = None
+) -> JDProfile:
+    """
+    Async variant of `parse_jd` (event loop를 막지 않음).
+
+    on_keyword: LLM 토큰 스트리밍 중 키워드 하나가 완성될 때마다 호출 (raw dict).
+    fast path나 캐시 hit이면 호출되지 않는다.
+    """
+    # lexicon coverage가 높으면 LLM 호출 생략
+    annotate(sections=list(jd_text))
+    fast = fast_path_jd(jd_text)
+    if fast is not None:
+        annotate(path="fast_path")
+        return _finalize(fast, jd_text)
+
+    key = _cache_key(jd_text)
+    result = _cache.get(key)
+    annotate(path="cache" if result is not None else "llm")
+    if result is None:
+        # 합쳐진 caller에게는 on_keyword 스트리밍 없이 최종 결과만 전달된다
+        try:
+            result = await _inflight.ado(key, lambda: _acall_llm(jd_text, key, on_keyword))
+        except LLMUnavailable as e:
+            result = _degraded(jd_text, e)
+
+    return _finalize(result, jd_text)
+
+
+def parse_stats() -> dict:
+    """캐시 / single-flight 카운터."""
+    return {"cache": _cache.stats.as_dict(), "single_flight": _inflight.stats.as_dict()}
+
+
+def _parse_jd(jd_text: dict) -> dict:
     """
     Parse a Job Description dictionary and extract structured information.
 
@@ -125,16 +361,17 @@ def jd_parse_tool(jd_text: dict) -> dict:
     Returns:
         JDProfile as a dictionary containing role_title, company, and extracted keywords
     """
-    llm = init_chat_model("gpt-4o-mini", temperature=0.0)
-    structured_llm = llm.with_structured_output(JDProfile)
+    return parse_jd(jd_text).model_dump()
 
-    messages = [
-        {"role": "system", "content": SYSTEM_PROMPT},
-        {"role": "user", "content": f"Parse this Job Description:\n\n{jd_text}"},
-    ]
 
-    result: JDProfile = structured_llm.invoke(messages)
-    # Store raw text for reference
-    result.raw_text = jd_text
+async def _aparse_jd(jd_text: dict) -> dict:
+    return (await aparse_jd(jd_text)).model_dump()
+
 
-    return result.model_dump()
+# sync(invoke)와 async(ainvoke) 모두 지원하는 Tool (agent용 dict 출력).
+# 파이프라인 내부(graph / API)는 parse_jd / aparse_jd의 JDProfile을 그대로 쓴다.
+jd_parse_tool = StructuredTool.from_function(
+    func=_parse_jd,
+    coroutine=_aparse_jd,
+    name="jd_parse_tool",
+)
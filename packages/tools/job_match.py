@@ -0,0 +1,335 @@
+# packages/tools/job_match.py
+"""
+JD 검색 Tool - "이 Resume에 가장 잘 맞는 JD는?"
+
+파싱된 JDProfile들의 inverted index (canonical keyword → posting 목록) + MaxScore top-k.
+
+- 점수는 match_score와 같은 가중합을 term별로 분해해서 저장한다.
+    required 키워드 1개 = REQUIRED_WEIGHT / (JD의 required 키워드 수)
+    preferred 키워드 1개 = PREFERRED_WEIGHT / (JD의 preferred 키워드 수)
+    해당 카테고리 키워드가 없는 JD는 그 가중치를 constant로 받는다.
+- OR 그룹("Match group: [...]")은 멤버 키워드 대신 그룹 term 하나로 색인하고,
+  검색 시 Resume 키워드 중 하나라도 멤버면 그 그룹 term을 query에 넣는다.
+- 검색은 term-at-a-time MaxScore: upper bound가 큰 term부터 누적하다가
+  남은 term으로는 새 JD가 top-k에 들 수 없으면, 이미 후보인 JD만 갱신한다.
+  query term의 posting만 보므로 전체 JD를 스캔하지 않는다.
+- 색인은 로컬 SQLite에 저장되고, JD 추가/삭제는 증분 반영된다.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, Optional
+
+import numpy as np
+from langchain_core.tools import tool
+
+from packages.core.schemas import JDProfile
+from packages.core.storage import data_path
+from packages.core.tracing import instrumented
+from packages.tools.gap_compute import parse_match_group
+from packages.tools.score import PREFERRED_WEIGHT, REQUIRED_WEIGHT
+
+DEFAULT_CATEGORY_WEIGHTS = {"required": REQUIRED_WEIGHT, "preferred": PREFERRED_WEIGHT}
+GROUP_PREFIX = "group:"
+
+
+def group_term(members: Iterable[str]) -> str:
+    """OR 그룹의 index term (멤버 순서와 무관)."""
+    return GROUP_PREFIX + "|".join(sorted(set(members)))
+
+
+def jd_postings(
+    jd: JDProfile, category_weights: dict[str, float] = DEFAULT_CATEGORY_WEIGHTS
+) -> tuple[dict[str, float], float]:
+    """
+    JDProfile → ({term: weight}, constant).
+    sum(weight of matched terms) + constant == match_score / 100.
+    """
+    counts = {category: 0 for category in category_weights}
+    for jk in jd.keywords:
+        if jk.category in counts:
+            counts[jk.category] += 1
+
+    constant = sum(w for category, w in category_weights.items() if counts[category] == 0)
+    weights: dict[str, float] = {}
+    for jk in jd.keywords:
+        if jk.category not in counts:
+            continue
+        members = parse_match_group(jk.gap_instruction)
+        term = group_term([jk.keyword_text, *members]) if members else jk.keyword_text
+        weights[term] = weights.get(term, 0.0) + category_weights[jk.category] / counts[jk.category]
+    return weights, constant
+
+
+class _Postings:
+    """term 하나의 posting 목록. 추가는 list에, 검색 시 numpy 배열로 한 번 변환."""
+
+    __slots__ = ("docs", "weights", "_arrays", "upper_bound")
+
+    def __init__(self) -> None:
+        self.docs: list[int] = []
+        self.weights: list[float] = []
+        self._arrays: Optional[tuple[np.ndarray, np.ndarray]] = None
+        self.upper_bound = 0.0
+
+    def add(self, doc: int, weight: float) -> None:
+        self.docs.append(doc)
+        self.weights.append(weight)
+        self.upper_bound = max(self.upper_bound, weight)
+        self._arrays = None
+
+    def arrays(self) -> tuple[np.ndarray, np.ndarray]:
+        if self._arrays is None:
+            self._arrays = (
+                np.asarray(self.docs, dtype=np.int64),
+                np.asarray(self.weights, dtype=np.float64),
+            )
+        return self._arrays
+
+
+class JobIndex:
+    """
+    JD inverted index (메모리 + SQLite 영속화).
+
+    내부 doc 번호는 0부터 증가하는 dense int. 삭제된 JD는 tombstone 처리 후
+    일정 비율 이상 쌓이면 메모리 색인을 다시 만든다.
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[Path | str] = None,
+        category_weights: Optional[dict[str, float]] = None,
+    ) -> None:
+        self.category_weights = category_weights or dict(DEFAULT_CATEGORY_WEIGHTS)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(
+            str(db_path or data_path("job_index.sqlite3")), check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS job_postings (
+                job_id TEXT PRIMARY KEY,
+                constant REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS job_terms (
+                job_id TEXT NOT NULL,
+                term TEXT NOT NULL,
+                weight REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_job_terms_job ON job_terms (job_id);
+            """
+        )
+        self._conn.commit()
+        self._load()
+
+    # --------- 메모리 색인 ---------
+
+    def _reset_memory(self) -> None:
+        self._postings: dict[str, _Postings] = {}
+        self._groups_of: dict[str, set[str]] = {}  # 멤버 keyword → 그룹 term들
+        self._doc_ids: list[str] = []
+        self._constants: list[float] = []
+        self._constants_cache: Optional[np.ndarray] = None
+        self._doc_of: dict[str, int] = {}
+        self._dead = 0
+        self._max_constant = 0.0
+
+    def _add_memory(self, job_id: str, weights: dict[str, float], constant: float) -> None:
+        doc = len(self._doc_ids)
+        self._doc_ids.append(job_id)
+        self._constants.append(constant)
+        self._constants_cache = None
+        self._doc_of[job_id] = doc
+        self._max_constant = max(self._max_constant, constant)
+        for term, weight in weights.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = _Postings()
+                if term.startswith(GROUP_PREFIX):
+                    for member in term[len(GROUP_PREFIX):].split("|"):
+                        self._groups_of.setdefault(member, set()).add(term)
+            postings.add(doc, weight)
+
+    def _load(self) -> None:
+        with self._lock:
+            self._reset_memory()
+            constants = dict(self._conn.execute("SELECT job_id, constant FROM job_postings"))
+            terms: dict[str, dict[str, float]] = {job_id: {} for job_id in constants}
+            for job_id, term, weight in self._conn.execute(
+                "SELECT job_id, term, weight FROM job_terms"
+            ):
+                terms[job_id][term] = weight
+            for job_id, constant in constants.items():
+                self._add_memory(job_id, terms[job_id], constant)
+
+    # --------- public API ---------
+
+    def __len__(self) -> int:
+        return len(self._doc_of)
+
+    def __contains__(self, job_id: str) -> bool:
+        return job_id in self._doc_of
+
+    def add(self, job_id: str, jd: JDProfile) -> None:
+        """JD 추가 (같은 job_id가 있으면 교체)."""
+        self.add_many([(job_id, jd)])
+
+    def add_many(self, items: Iterable[tuple[str, JDProfile]]) -> None:
+        """여러 JD를 한 트랜잭션으로 추가 (같은 job_id가 있으면 교체)."""
+        prepared = [(job_id, *jd_postings(jd, self.category_weights)) for job_id, jd in items]
+        with self._lock:
+            for job_id, weights, constant in prepared:
+                if job_id in self._doc_of:
+                    self._remove_memory(job_id)
+                self._conn.execute("DELETE FROM job_terms WHERE job_id = ?", (job_id,))
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO job_postings (job_id, constant) VALUES (?, ?)",
+                    (job_id, constant),
+                )
+                self._conn.executemany(
+                    "INSERT INTO job_terms (job_id, term, weight) VALUES (?, ?, ?)",
+                    [(job_id, term, weight) for term, weight in weights.items()],
+                )
+                self._add_memory(job_id, weights, constant)
+            self._conn.commit()
+            self._maybe_compact()
+
+    def remove(self, job_id: str) -> bool:
+        """JD 삭제. 없던 job_id면 False."""
+        with self._lock:
+            if job_id not in self._doc_of:
+                return False
+            self._conn.execute("DELETE FROM job_terms WHERE job_id = ?", (job_id,))
+            self._conn.execute("DELETE FROM job_postings WHERE job_id = ?", (job_id,))
+            self._conn.commit()
+            self._remove_memory(job_id)
+            self._maybe_compact()
+            return True
+
+    def _remove_memory(self, job_id: str) -> None:
+        doc = self._doc_of.pop(job_id)
+        self._constants[doc] = float("-inf")
+        self._constants_cache = None
+        self._dead += 1
+
+    def _maybe_compact(self) -> None:
+        # tombstone이 25%를 넘으면 SQLite에서 다시 로드 (upper bound도 다시 타이트해짐)
+        if self._dead > 64 and self._dead * 4 > len(self._doc_ids):
+            self._load()
+
+    @instrumented("compute", "job_index_search")
+    def search(self, keywords: Iterable[str], k: int = 10) -> list[tuple[str, float]]:
+        """
+        Resume 키워드(canonical) → 상위 k개 (job_id, match_score 0~100).
+        키워드가 하나도 겹치지 않는 JD는 결과에 포함되지 않는다.
+        """
+        resume_terms = set(keywords)
+        with self._lock:
+            if not self._doc_of or k <= 0:
+                return []
+            terms = {t for t in resume_terms if t in self._postings}
+            for t in resume_terms:
+                terms.update(self._groups_of.get(t, ()))
+            query = [self._postings[t] for t in terms]
+            arrays = [p.arrays() for p in query]
+            bounds = [p.upper_bound for p in query]
+            constants = self._constants_array()
+            doc_ids = self._doc_ids
+            max_constant = self._max_constant
+        if not arrays:
+            return []
+
+        order = sorted(range(len(arrays)), key=lambda i: bounds[i], reverse=True)
+        # remaining[pos] = order[pos:]의 upper bound 합
+        remaining = np.cumsum([bounds[i] for i in order][::-1])[::-1].tolist() + [0.0]
+
+        acc = np.zeros(len(constants), dtype=np.float64)
+        touched = np.zeros(len(constants), dtype=bool)
+        threshold = -1.0
+        pending = 0  # 마지막 threshold 갱신 이후 처리한 posting 수
+        pos = 0
+
+        # 1) 모든 posting 누적: 남은 term만으로 새 JD가 top-k에 들 수 있는 동안
+        while pos < len(order) and max_constant + remaining[pos] > threshold:
+            docs, weights = arrays[order[pos]]
+            acc[docs] += weights
+            touched[docs] = True
+            pending += len(docs)
+            pos += 1
+            # threshold 계산은 O(후보 수)라서 처리한 posting 양에 비례할 때만 갱신
+            if pending * 4 >= len(constants) or pos == len(order):
+                candidates = np.flatnonzero(touched)
+                threshold = _kth_largest(acc[candidates] + constants[candidates], k, threshold)
+                pending = 0
+
+        # 2) 후보만 갱신: 남은 upper bound를 더해도 threshold를 못 넘는 JD는 제외
+        candidates = np.flatnonzero(touched)
+        if pos < len(order):
+            scores = acc[candidates] + constants[candidates]
+            candidates = candidates[scores + remaining[pos] > threshold]
+            is_candidate = np.zeros(len(constants), dtype=bool)
+            is_candidate[candidates] = True
+            while pos < len(order) and len(candidates):
+                docs, weights = arrays[order[pos]]
+                keep = is_candidate[docs]
+                acc[docs[keep]] += weights[keep]
+                pending += len(docs)
+                pos += 1
+                if pending >= len(candidates):
+                    scores = acc[candidates] + constants[candidates]
+                    threshold = _kth_largest(scores, k, threshold)
+                    viable = scores + remaining[pos] > threshold
+                    is_candidate[candidates[~viable]] = False
+                    candidates = candidates[viable]
+                    pending = 0
+
+        scores = np.round((acc[candidates] + constants[candidates]) * 100, 1)
+        valid = np.isfinite(scores)  # 삭제된 JD (constant = -inf)
+        candidates, scores = candidates[valid], scores[valid]
+        if len(candidates) > k:
+            part = np.argpartition(-scores, k - 1)[:k]
+            candidates, scores = candidates[part], scores[part]
+        ranked = np.lexsort((candidates, -scores))
+        return [(doc_ids[candidates[i]], float(scores[i])) for i in ranked]
+
+    def _constants_array(self) -> np.ndarray:
+        if self._constants_cache is None:
+            self._constants_cache = np.asarray(self._constants, dtype=np.float64)
+        return self._constants_cache
+
+
+def _kth_largest(scores: np.ndarray, k: int, current: float) -> float:
+    """scores의 k번째 큰 값 (k개 미만이면 current 유지)."""
+    if len(scores) < k:
+        return current
+    return max(current, float(np.partition(scores, len(scores) - k)[len(scores) - k]))
+
+
+@lru_cache(maxsize=1)
+def get_job_index() -> JobIndex:
+    """프로세스 공용 JobIndex (ORCHESTRATOR_DATA_DIR/job_index.sqlite3)."""
+    return JobIndex()
+
+
+@tool
+@instrumented("tool", "job_match_tool")
+def job_match_tool(resume_keywords: list[str], top_k: int = 10) -> list[dict]:
+    """
+    Find the indexed job postings that best fit a resume.
+
+    Args:
+        resume_keywords: Canonical resume keywords (from resume_parse_tool)
+        top_k: Number of postings to return
+
+    Returns:
+        List of {"job_id", "match_score"} sorted by match_score (0-100) descending
+    """
+    return [
+        {"job_id": job_id, "match_score": score}
+        for job_id, score in get_job_index().search(resume_keywords, top_k)
+    ]
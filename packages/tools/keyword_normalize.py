@@ -1,2 +1,335 @@
 # packages/tools/keyword_normalize.py
-"""키워드 정규화 Tool."""
+"""
+키워드 정규화 Tool.
+
+Lexicon 기반 로컬 키워드 추출기 (LLM fast path).
+- Aho-Corasick automaton으로 lexicon의 모든 표기를 한 번의 스캔으로 찾는다.
+- 단어 경계 처리: "java"는 "javascript" 안에서 매칭되지 않고, "c++", "ci/cd", "node.js"처럼
+  기호가 포함된 키워드도 그대로 매칭된다.
+- 섹션의 lexicon coverage가 충분히 높으면 LLM 호출 없이 결과를 반환한다.
+- LLM을 쓸 수 없을 때(resilience.LLMUnavailable)는 coverage와 상관없이 lexicon 결과로 응답한다
+  (lexicon_resume / lexicon_jd, degraded).
+- normalize_keywords_tool: alias/표기 변형/오타 → canonical keyword.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from functools import lru_cache
+from typing import Iterable, Iterator, Optional
+
+from langchain_core.tools import tool
+
+from packages.core.lexicon import iter_surface_forms
+from packages.core.schemas import JDKeyword, JDProfile, ResumeKeyword, ResumeProfile
+from packages.core.schemas.utils import normalize_keyword
+from packages.core.tracing import instrumented
+
+# auto: coverage가 높을 때만 LLM 생략 / off: 항상 LLM / always: LLM 없이 lexicon만 사용
+FAST_PATH_MODE = os.getenv("KEYWORD_FAST_PATH", "auto")
+FAST_PATH_MIN_COVERAGE = float(os.getenv("KEYWORD_FAST_PATH_MIN_COVERAGE", "0.85"))
+
+JD_CATEGORIES = ("required", "preferred", "responsibility", "context")
+
+# coverage 계산 시 무시하는 단어 (JD/Resume에 흔한 비기술 단어)
+STOPWORDS = frozenset(
+    """
+    a an and or the of in on at to for with by from as is are be been using use used
+    experience experienced years year yrs required requirements require preferred plus
+    nice bonus must should have has having skills skill knowledge familiarity familiar
+    proficiency proficient strong solid working hands-on etc e.g i.e including include
+    such like similar one more least tools tool languages language frameworks framework
+    tech stack technologies technology platforms platform libraries library related
+    other understanding good excellent ability
+    """.split()
+)
+
+_TOKEN_RE = re.compile(r"[A-Za-z][A-Za-z0-9+#./-]*")
+# OR 그룹 판별: 두 키워드 사이가 구분자만으로 이루어져 있는지
+_SEPARATOR_GAP_RE = re.compile(r"^\s*(?:,|/|\||or|,\s*or|and/or)\s*$", re.IGNORECASE)
+_COMMA_GAP_RE = re.compile(r"^\s*,\s*$")
+_OR_GAP_RE = re.compile(r"^\s*,?\s*(?:or|and/or)\s*$", re.IGNORECASE)
+# "Python, Java, or related language" 처럼 목록 뒤에 오는 OR 표현
+_OR_TAIL_RE = re.compile(
+    r"^\s*,?\s*or\s+(?:related|similar|equivalent|other|comparable)\b", re.IGNORECASE
+)
+
+
+class AhoCorasick:
+    """
+    Multi-pattern 문자열 매칭 automaton.
+    텍스트 길이에 선형, 패턴 수와 무관한 속도로 모든 (start, end, pattern_id)를 찾는다.
+    """
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        self.patterns: list[str] = list(patterns)
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[tuple[int, ...]] = [()]
+
+        for pid, pattern in enumerate(self.patterns):
+            state = 0
+            for ch in pattern:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(())
+                state = nxt
+            self._out[state] = self._out[state] + (pid,)
+
+        # BFS로 failure link 계산 + output 병합
+        queue = list(self._goto[0].values())
+        for state in queue:
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def iter_matches(self, text: str) -> Iterator[tuple[int, int, int]]:
+        goto, fail, out, patterns = self._goto, self._fail, self._out, self.patterns
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for pid in out[state]:
+                yield i + 1 - len(patterns[pid]), i + 1, pid
+
+
+class LexiconMatcher:
+    """lexicon 표기 → canonical keyword 매칭기 (단어 경계/대소문자 규칙 포함)."""
+
+    def __init__(self, forms: list[tuple[str, str, bool]]) -> None:
+        # 같은 소문자 표기가 여러 개면(예: "restful"/"RESTful") 하나의 패턴으로 합친다
+        by_pattern: dict[str, list[tuple[str, str, bool]]] = {}
+        for form, canonical, case_sensitive in forms:
+            by_pattern.setdefault(form.lower(), []).append((form, canonical, case_sensitive))
+        self._variants = list(by_pattern.values())
+        self._automaton = AhoCorasick(by_pattern.keys())
+
+    def find(self, text: str) -> list[tuple[int, int, str]]:
+        """leftmost-longest 규칙으로 겹치지 않는 (start, end, canonical) 목록."""
+        lowered = text.lower()
+        candidates: list[tuple[int, int, str]] = []
+        for start, end, pid in self._automaton.iter_matches(lowered):
+            if not _is_boundary(text, start, end):
+                continue
+            for form, canonical, case_sensitive in self._variants[pid]:
+                if not case_sensitive or text[start:end] == form:
+                    candidates.append((start, end, canonical))
+                    break
+
+        candidates.sort(key=lambda m: (m[0], m[0] - m[1]))
+        selected: list[tuple[int, int, str]] = []
+        last_end = -1
+        for start, end, canonical in candidates:
+            if start >= last_end:
+                selected.append((start, end, canonical))
+                last_end = end
+        return selected
+
+
+def _is_boundary(text: str, start: int, end: int) -> bool:
+    if start > 0 and text[start - 1].isalnum():
+        return False
+    if end < len(text):
+        nxt = text[end]
+        # "c" 뒤의 "++"처럼 기호가 이어지면 더 긴 토큰의 일부
+        if nxt.isalnum() or (text[end - 1].isalnum() and nxt in "+#"):
+            return False
+    return True
+
+
+@lru_cache(maxsize=1)
+def get_matcher() -> LexiconMatcher:
+    """프로세스당 한 번만 automaton을 빌드."""
+    return LexiconMatcher(iter_surface_forms())
+
+
+def _line_at(text: str, start: int, end: int) -> str:
+    line_start = text.rfind("\n", 0, start) + 1
+    line_end = text.find("\n", end)
+    if line_end == -1:
+        line_end = len(text)
+    return text[line_start:line_end].strip()
+
+
+def lexicon_coverage(text: str, matches: Optional[list[tuple[int, int, str]]] = None) -> float:
+    """
+    섹션의 (stopword 제외) 토큰 중 lexicon 매칭에 포함된 비율 (0.0 ~ 1.0).
+    토큰이 하나도 없으면 추출할 것이 없으므로 1.0.
+    """
+    if matches is None:
+        matches = get_matcher().find(text)
+    tokens = [
+        m.span()
+        for m in _TOKEN_RE.finditer(text)
+        if m.group().lower().rstrip(".") not in STOPWORDS
+    ]
+    if not tokens:
+        return 1.0
+    covered = 0
+    idx = 0
+    for start, end in tokens:
+        while idx < len(matches) and matches[idx][1] <= start:
+            idx += 1
+        if idx < len(matches) and matches[idx][0] < end:
+            covered += 1
+    return covered / len(tokens)
+
+
+def _or_groups(text: str, matches: list[tuple[int, int, str]]) -> dict[int, list[str]]:
+    """
+    "Python OR Java", "React/Vue/Angular", "Python, Java, or Go" 같은 OR 그룹 탐지.
+    구분자로만 이어진 키워드 run을 찾고,
+    - "a, b, or c" / "a, b, or related ..." 형태면 run 전체를 하나의 그룹으로,
+    - 아니면 쉼표에서 나누고 "/", "|", "or"로 이어진 부분만 그룹으로 본다.
+
+    Returns: match index → 그룹 멤버(canonical) 목록
+    """
+    groups: dict[int, list[str]] = {}
+
+    def add_group(indices: list[int]) -> None:
+        members = list(dict.fromkeys(matches[i][2] for i in indices))
+        if len(members) >= 2:
+            for i in indices:
+                groups[i] = members
+
+    def flush(run: list[int], gaps: list[str]) -> None:
+        if len(run) < 2:
+            return
+        tail = text[matches[run[-1]][1] :]
+        if all(_COMMA_GAP_RE.match(g) for g in gaps[:-1]) and (
+            _OR_GAP_RE.match(gaps[-1])
+            or (_COMMA_GAP_RE.match(gaps[-1]) and _OR_TAIL_RE.match(tail))
+        ):
+            add_group(run)
+            return
+        sub = [run[0]]
+        for idx, gap in zip(run[1:], gaps):
+            if _COMMA_GAP_RE.match(gap):
+                add_group(sub)
+                sub = [idx]
+            else:
+                sub.append(idx)
+        add_group(sub)
+
+    run: list[int] = [0] if matches else []
+    gaps: list[str] = []
+    for i in range(1, len(matches)):
+        gap = text[matches[i - 1][1] : matches[i][0]]
+        if _SEPARATOR_GAP_RE.match(gap):
+            run.append(i)
+            gaps.append(gap)
+            continue
+        flush(run, gaps)
+        run, gaps = [i], []
+    flush(run, gaps)
+    return groups
+
+
+def _gap_instruction(members: list[str]) -> str:
+    # jd_parse.py SYSTEM_PROMPT의 형식과 동일
+    return (
+        f"Match group: [{', '.join(members)}] - "
+        "if any exists in resume, this keyword is considered matched"
+    )
+
+
+def extract_resume_keywords(text: str) -> list[ResumeKeyword]:
+    """Resume 텍스트에서 lexicon 키워드 추출."""
+    return [
+        ResumeKeyword(
+            keyword_text=canonical,
+            evidence=_line_at(text, start, end),
+            source_span=(start, end),
+        )
+        for start, end, canonical in get_matcher().find(text)
+    ]
+
+
+def extract_jd_keywords(text: str, category: str = "context") -> list[JDKeyword]:
+    """JD 섹션 텍스트에서 lexicon 키워드 추출 (OR 그룹은 gap_instruction으로 연결)."""
+    matches = get_matcher().find(text)
+    groups = _or_groups(text, matches)
+    return [
+        JDKeyword(
+            keyword_text=canonical,
+            category=category,
+            evidence=_line_at(text, start, end),
+            gap_instruction=_gap_instruction(groups[i]) if i in groups else None,
+            source_span=(start, end),
+        )
+        for i, (start, end, canonical) in enumerate(matches)
+    ]
+
+
+def _fast_path_enabled(coverage: float) -> bool:
+    if FAST_PATH_MODE == "always":
+        return True
+    if FAST_PATH_MODE == "off":
+        return False
+    return coverage >= FAST_PATH_MIN_COVERAGE
+
+
+def fast_path_resume(resume_text: str) -> Optional[ResumeProfile]:
+    """coverage가 충분하면 LLM 없이 ResumeProfile 반환, 아니면 None."""
+    if FAST_PATH_MODE == "off":
+        return None
+    matches = get_matcher().find(resume_text)
+    if not _fast_path_enabled(lexicon_coverage(resume_text, matches)):
+        return None
+    return lexicon_resume(resume_text)
+
+
+def fast_path_jd(jd_text: dict) -> Optional[JDProfile]:
+    """
+    모든 섹션의 coverage가 충분하면 LLM 없이 JDProfile 반환, 아니면 None.
+    섹션 key가 JD 카테고리면 그 카테고리를 사용한다.
+    """
+    if FAST_PATH_MODE == "off":
+        return None
+    sections = [(str(k), str(v)) for k, v in jd_text.items()]
+    if not all(_fast_path_enabled(lexicon_coverage(text)) for _, text in sections):
+        return None
+    return lexicon_jd(jd_text)
+
+
+def lexicon_resume(resume_text: str) -> ResumeProfile:
+    """lexicon만으로 만든 ResumeProfile (coverage 검사 없음)."""
+    return ResumeProfile(keywords=extract_resume_keywords(resume_text))
+
+
+def lexicon_jd(jd_text: dict) -> JDProfile:
+    """lexicon만으로 만든 JDProfile (섹션 key가 JD 카테고리면 그 카테고리, 아니면 context)."""
+    keywords: list[JDKeyword] = []
+    for key, text in jd_text.items():
+        category = str(key) if key in JD_CATEGORIES else "context"
+        keywords.extend(extract_jd_keywords(str(text), category))
+    return JDProfile(keywords=keywords)
+
+
+@tool
+@instrumented("tool", "normalize_keywords_tool")
+def normalize_keywords_tool(keywords: list[str]) -> dict[str, str]:
+    """
+    Normalize technical keywords to their canonical form.
+
+    Handles aliases (k8s -> kubernetes, postgres -> postgresql), spelling variants
+    (scikit learn -> scikit-learn) and small typos. Unknown keywords are returned lowercased.
+
+    Args:
+        keywords: Keyword strings to normalize
+
+    Returns:
+        Mapping of each input keyword to its canonical keyword
+    """
+    return {kw: normalize_keyword(kw) for kw in keywords}
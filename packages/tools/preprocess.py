@@ -0,0 +1,352 @@
+# packages/tools/preprocess.py
+"""
+LLM 호출 전 입력 전처리 (결정적, LLM 없음).
+
+JD의 context 섹션은 EEO 문구 / 복리후생 / 회사 소개처럼 기술 키워드가 거의 없는 긴 문단이
+대부분이라 prompt 토큰만 늘린다. 여기서는 문단 단위로:
+
+1. 같은 문단(공백/대소문자 무시)이 반복되면 처음 것만 남긴다 (섹션 간에도).
+2. 기술 밀도(lexicon_coverage: stopword 제외 토큰 중 lexicon 매칭 비율)를 매기고,
+   context 섹션의 boilerplate 문단은 버리거나 키워드가 있는 줄/문장만 남긴다.
+   required / preferred / responsibility는 요구사항 자체라 문단을 지우지 않는다
+   ("equity research", "compensation analytics"처럼 boilerplate 단어가 업무 설명일 수 있음).
+3. 토큰 예산(count_tokens)을 넘으면 밀도가 낮은 문단부터 버리고, 그래도 넘으면 잘라낸다.
+
+남긴 텍스트는 원문 조각을 그대로 이어 붙인 것이므로 Pruned.to_original로
+전처리 후 offset을 원문 offset으로 되돌릴 수 있다 (Resume / JD 섹션 source_span).
+절감한 토큰은 orchestrator_preprocess_tokens_total metric과 trace span에 남는다.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import threading
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from typing import Iterable, Optional
+
+from packages.core.metrics import Counter
+from packages.core.tokens import CHARS_PER_TOKEN, count_tokens
+from packages.core.tracing import annotate
+from packages.tools.keyword_normalize import get_matcher, lexicon_coverage
+
+# 환경변수 설정값 (예산 0이면 예산 검사 안 함)
+PREPROCESS_ENABLED = os.getenv("PREPROCESS_ENABLED", "1") == "1"
+RESUME_TOKEN_BUDGET = int(os.getenv("RESUME_TOKEN_BUDGET", "8000"))
+JD_TOKEN_BUDGET = int(os.getenv("JD_TOKEN_BUDGET", "4000"))
+# 이 밀도 미만인 boilerplate 문단은 통째로 버린다 (이상이면 키워드가 있는 줄/문장만 남김)
+BOILERPLATE_MAX_DENSITY = float(os.getenv("PREPROCESS_BOILERPLATE_MAX_DENSITY", "0.05"))
+# context 섹션에서 키워드가 하나도 없는 문단은 이 길이(문자)를 넘으면 버린다 (회사 소개 등)
+CONTEXT_DROP_MIN_CHARS = 200
+
+TOKENS = Counter(
+    "orchestrator_preprocess_tokens_total",
+    "Tokens before (input) and after (output) boilerplate stripping / budget",
+    ("kind", "stage"),
+)
+PARAGRAPHS = Counter(
+    "orchestrator_preprocess_paragraphs_total",
+    "Paragraphs removed or compressed by preprocessing",
+    ("kind", "action"),
+)
+
+_PARAGRAPH_RE = re.compile(r"\n[ \t]*\n\s*")
+_SENTENCE_RE = re.compile(r"[^\n.!?]+(?:[.!?]+|$)")
+_SPACE_RE = re.compile(r"\s+")
+_BOILERPLATE_RE = re.compile(
+    r"equal (?:employment )?opportunit|affirmative action|\beeo\b"
+    r"|discrimination|not discriminate|race, (?:color|religion)|sexual orientation|gender identity|veteran status"
+    r"|reasonable accommodation|disabilit|e-verify|background check|drug[- ]free"
+    r"|\bbenefits\b|401\(?k\)?|health insurance|dental|paid time off|\bpto\b|parental leave"
+    r"|compensation|salary range|base (?:hourly )?(?:pay|salary)|bonus|equity"
+    r"|privacy (?:policy|notice)|applicant privacy|about (?:us|the company)|our mission"
+    r"|we are proud|committed to (?:diversity|providing)|references available",
+    re.IGNORECASE,
+)
+
+
+@dataclass
+class PruneReport:
+    """전처리 결과 요약 (문서 1개 기준, preprocess_stats는 누적)."""
+
+    tokens_in: int = 0
+    tokens_out: int = 0
+    duplicates: int = 0
+    boilerplate: int = 0
+    compressed: int = 0
+    over_budget: int = 0
+    truncated: bool = False
+
+    @property
+    def tokens_saved(self) -> int:
+        return self.tokens_in - self.tokens_out
+
+    def as_dict(self) -> dict:
+        return {
+            "tokens_in": self.tokens_in,
+            "tokens_out": self.tokens_out,
+            "tokens_saved": self.tokens_saved,
+            "duplicates": self.duplicates,
+            "boilerplate": self.boilerplate,
+            "compressed": self.compressed,
+            "over_budget": self.over_budget,
+            "truncated": self.truncated,
+        }
+
+
+@dataclass
+class Pruned:
+    """전처리된 텍스트 + 원문 offset 매핑."""
+
+    text: str
+    # (전처리 텍스트 start, 원문 start) — 각 조각은 원문을 그대로 복사한 것
+    segments: list[tuple[int, int]] = field(default_factory=list)
+
+    def to_original(self, pos: int) -> int:
+        if not self.segments:
+            return pos
+        i = max(bisect_right(self.segments, (pos, float("inf"))) - 1, 0)
+        pruned_start, original_start = self.segments[i]
+        return original_start + (pos - pruned_start)
+
+
+@dataclass
+class _Paragraph:
+    section: int
+    order: int
+    start: int
+    end: int
+    density: float
+    # 남길 원문 구간 (compress되면 키워드가 있는 줄/문장만)
+    pieces: list[tuple[int, int]]
+    tokens: int = 0
+
+
+def _paragraph_spans(text: str) -> list[tuple[int, int]]:
+    spans = []
+    start = 0
+    for m in _PARAGRAPH_RE.finditer(text):
+        spans.append((start, m.start()))
+        start = m.end()
+    spans.append((start, len(text)))
+    # 앞뒤 공백 제거, 빈 문단 제외
+    result = []
+    for s, e in spans:
+        chunk = text[s:e]
+        stripped = chunk.strip()
+        if stripped:
+            s += len(chunk) - len(chunk.lstrip())
+            result.append((s, s + len(stripped)))
+    return result
+
+
+def _keyword_sentences(text: str, start: int, end: int) -> list[tuple[int, int]]:
+    """문단 안에서 lexicon 키워드가 있는 줄(없으면 문장) 구간."""
+    matcher = get_matcher()
+    pieces = []
+    for m in _SENTENCE_RE.finditer(text, start, end):
+        sentence = m.group()
+        if sentence.strip() and matcher.find(sentence):
+            lead = len(sentence) - len(sentence.lstrip())
+            pieces.append((m.start() + lead, m.start() + len(sentence.rstrip())))
+    return pieces
+
+
+def _scan(
+    sections: list[tuple[str, str]], report: PruneReport, *, strip_boilerplate: bool = True
+) -> list[_Paragraph]:
+    seen: set[str] = set()
+    paragraphs: list[_Paragraph] = []
+    for index, (category, text) in enumerate(sections):
+        for start, end in _paragraph_spans(text):
+            body = text[start:end]
+            key = _SPACE_RE.sub(" ", body).lower()
+            if key in seen:
+                report.duplicates += 1
+                continue
+            seen.add(key)
+
+            matches = get_matcher().find(body)
+            density = lexicon_coverage(body, matches) if matches else 0.0
+            pieces = [(start, end)]
+            if not strip_boilerplate or category != "context":
+                paragraphs.append(_Paragraph(index, len(paragraphs), start, end, density, pieces))
+                continue
+            if _BOILERPLATE_RE.search(body) and density < BOILERPLATE_MAX_DENSITY * 4:
+                if density < BOILERPLATE_MAX_DENSITY:
+                    report.boilerplate += 1
+                    continue
+                # 키워드가 조금 섞인 boilerplate 문단은 키워드가 있는 문장만 남긴다
+                compressed = _keyword_sentences(text, start, end)
+                if compressed and compressed != pieces:
+                    pieces = compressed
+                    report.compressed += 1
+            elif not matches and end - start > CONTEXT_DROP_MIN_CHARS:
+                report.boilerplate += 1
+                continue
+            paragraphs.append(_Paragraph(index, len(paragraphs), start, end, density, pieces))
+    return paragraphs
+
+
+def _render(text: str, paragraph: _Paragraph) -> str:
+    return "\n".join(text[s:e] for s, e in paragraph.pieces)
+
+
+def _truncate(text: str, paragraph: _Paragraph, budget: int) -> None:
+    """문단 하나가 예산을 넘으면 줄 경계(없으면 글자)에서 자른다."""
+    s, e = paragraph.pieces[0]
+    limit = min(e, s + max(budget, 1) * CHARS_PER_TOKEN)
+    while count_tokens(text[s:limit]) > budget and limit > s + 1:
+        limit = s + (limit - s) * 9 // 10
+    cut = text.rfind("\n", s, limit)
+    paragraph.pieces = [(s, cut if cut > s + (limit - s) // 2 else limit)]
+
+
+def _apply_budget(
+    sections: list[tuple[str, str]], paragraphs: list[_Paragraph], budget: int,
+    report: PruneReport,
+) -> list[_Paragraph]:
+    for paragraph in paragraphs:
+        paragraph.tokens = count_tokens(_render(sections[paragraph.section][1], paragraph))
+    total = sum(p.tokens for p in paragraphs)
+    if budget <= 0 or total <= budget:
+        return paragraphs
+
+    # context → preferred → 나머지 순, 같은 카테고리면 밀도가 낮은(뒤쪽) 문단부터 버린다
+    def drop_order(p: _Paragraph) -> tuple:
+        category = sections[p.section][0]
+        rank = {"context": 0, "preferred": 1}.get(category, 2)
+        return (rank, p.density, -p.order)
+
+    kept = set(range(len(paragraphs)))
+    for paragraph in sorted(paragraphs, key=drop_order):
+        if total <= budget or len(kept) == 1:
+            break
+        kept.discard(paragraph.order)
+        total -= paragraph.tokens
+        report.over_budget += 1
+    remaining = [p for p in paragraphs if p.order in kept]
+    if total > budget:
+        # 문단 하나가 예산보다 큰 경우
+        _truncate(sections[remaining[0].section][1], remaining[0], budget)
+        report.truncated = True
+    return remaining
+
+
+def _record(kind: str, report: PruneReport) -> None:
+    TOKENS.inc(report.tokens_in, kind=kind, stage="input")
+    TOKENS.inc(report.tokens_out, kind=kind, stage="output")
+    for action in ("duplicates", "boilerplate", "compressed", "over_budget"):
+        count = getattr(report, action)
+        if count:
+            PARAGRAPHS.inc(count, kind=kind, action=action)
+    with _totals_lock:
+        totals = _totals.setdefault(kind, PruneReport())
+        totals.tokens_in += report.tokens_in
+        totals.tokens_out += report.tokens_out
+        totals.duplicates += report.duplicates
+        totals.boilerplate += report.boilerplate
+        totals.compressed += report.compressed
+        totals.over_budget += report.over_budget
+    annotate(tokens_in=report.tokens_in, tokens_saved=report.tokens_saved)
+
+
+_totals: dict[str, PruneReport] = {}
+_totals_lock = threading.Lock()
+
+
+def _join(text: str, paragraphs: list[_Paragraph]) -> Pruned:
+    """남긴 문단을 이어 붙인다 (조각은 "\n", 문단은 "\n\n") + 원문 offset 매핑."""
+    parts: list[str] = []
+    segments: list[tuple[int, int]] = []
+    pos = 0
+    for paragraph in paragraphs:
+        for i, (s, e) in enumerate(paragraph.pieces):
+            if parts:
+                sep = "\n" if i else "\n\n"
+                parts.append(sep)
+                pos += len(sep)
+            segments.append((pos, s))
+            parts.append(text[s:e])
+            pos += e - s
+    return Pruned("".join(parts), segments)
+
+
+def prune_sections_mapped(
+    sections: Iterable[tuple[str, str]], budget: Optional[int] = None, *, kind: str = "jd"
+) -> tuple[list[tuple[str, Pruned]], PruneReport]:
+    """prune_sections + 섹션마다 원문 offset 매핑 (Pruned.to_original은 그 섹션 원문 기준)."""
+    sections = [(str(category), str(text)) for category, text in sections]
+    report = PruneReport(tokens_in=sum(count_tokens(text) for _, text in sections))
+    if not PREPROCESS_ENABLED:
+        report.tokens_out = report.tokens_in
+        return [(category, Pruned(text)) for category, text in sections], report
+
+    paragraphs = _scan(sections, report)
+    budget = JD_TOKEN_BUDGET if budget is None else budget
+    paragraphs = _apply_budget(sections, paragraphs, budget, report)
+
+    kept: dict[int, list[_Paragraph]] = {}
+    for paragraph in paragraphs:
+        kept.setdefault(paragraph.section, []).append(paragraph)
+    result = [
+        (category, _join(text, kept.get(i, []))) for i, (category, text) in enumerate(sections)
+    ]
+    report.tokens_out = sum(count_tokens(pruned.text) for _, pruned in result)
+    _record(kind, report)
+    return result, report
+
+
+def prune_sections(
+    sections: Iterable[tuple[str, str]], budget: Optional[int] = None, *, kind: str = "jd"
+) -> tuple[list[tuple[str, str]], PruneReport]:
+    """
+    (category, text) 목록 전처리. 입력과 같은 길이 / 순서로 돌려주고, 다 지워진 섹션은 빈 문자열.
+    budget은 섹션 전체 합계 (None이면 JD_TOKEN_BUDGET).
+    """
+    result, report = prune_sections_mapped(sections, budget, kind=kind)
+    return [(category, pruned.text) for category, pruned in result], report
+
+
+def prune_jd_mapped(
+    jd_text: dict, budget: Optional[int] = None
+) -> tuple[dict[str, Pruned], PruneReport]:
+    """{category: text} → {category: Pruned}. 빈 섹션은 빠지고, 전부 지워지면 원본을 그대로 쓴다."""
+    sections, report = prune_sections_mapped(jd_text.items(), budget, kind="jd")
+    pruned = {category: p for category, p in sections if p.text}
+    return (pruned or {c: Pruned(str(t)) for c, t in jd_text.items()}), report
+
+
+def prune_jd(jd_text: dict, budget: Optional[int] = None) -> tuple[dict, PruneReport]:
+    """{category: text} 전처리. 빈 섹션은 빠지고, 전부 지워지면 원본을 그대로 쓴다."""
+    pruned, report = prune_jd_mapped(jd_text, budget)
+    return {category: p.text for category, p in pruned.items()}, report
+
+
+def prune_resume(resume_text: str, budget: Optional[int] = None) -> tuple[Pruned, PruneReport]:
+    """Resume 전처리. 결과 텍스트의 offset은 Pruned.to_original로 원문 offset이 된다."""
+    report = PruneReport(tokens_in=count_tokens(resume_text))
+    if not PREPROCESS_ENABLED:
+        report.tokens_out = report.tokens_in
+        return Pruned(resume_text), report
+
+    # Resume는 거의 전부 기술 내용이라 boilerplate 제거 없이 중복 제거 + 예산만 적용
+    sections = [("resume", resume_text)]
+    paragraphs = _scan(sections, report, strip_boilerplate=False)
+    budget = RESUME_TOKEN_BUDGET if budget is None else budget
+    paragraphs = _apply_budget(sections, paragraphs, budget, report)
+    if not paragraphs:
+        report.tokens_out = report.tokens_in
+        return Pruned(resume_text), report
+
+    pruned = _join(resume_text, paragraphs)
+    report.tokens_out = count_tokens(pruned.text)
+    _record("resume", report)
+    return pruned, report
+
+
+def preprocess_stats() -> dict:
+    """kind(resume / jd)별 누적 전처리 결과."""
+    with _totals_lock:
+        return {kind: report.as_dict() for kind, report in _totals.items()}
@@ -1,2 +1,231 @@
 # packages/tools/project_ideation.py
-"""프로젝트 아이디어 생성 Tool."""
+"""
+프로젝트 아이디어 생성 Tool.
+
+검증된 missing keyword(GapSummary.validated_missing_keywords) + Preferences → 아이디어 2개
+(ProjectIdeas, structured output 1회). 아키텍처 / 스프린트 계획은 architecture.py,
+sprint_plan.py가 아이디어별로 따로 만든다 (project_agent가 병렬로 호출).
+
+regenerate_idea는 제목이 겹친 안 하나만 다시 만든다 (나머지 안은 그대로).
+example을 주면 비슷한 gap에 대해 예전에 만든 아이디어를 few-shot 예시로 앞에 넣는다
+(packages.core.project_cache의 seed 모드).
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, Optional
+
+from langchain_core.tools import StructuredTool
+
+from packages.core.llm import ainvoke_structured, invoke_structured
+from packages.core.schemas import GapSummary, Preferences, ProjectIdea, ProjectIdeas
+from packages.core.tracing import instrumented
+
+MODEL_NAME = "gpt-4o-mini"
+TEMPERATURE = 0.8
+
+SYSTEM_PROMPT = """You are a Project Planner that designs portfolio projects for job seekers.
+
+Given the JD keywords the candidate is MISSING and their preferences, propose exactly TWO
+distinct portfolio project ideas that would let the candidate prove those keywords.
+
+For each idea:
+- title: specific and different from the other idea
+- one_liner and reasoning: what it is and why it proves the missing keywords
+- covers_keywords: only keywords from the missing list, keep their category
+- constraints and tech_stack: respect the candidate's preferred stack and constraints
+
+Rules:
+- The two ideas must have different titles and should cover different keyword subsets
+  when there are enough missing keywords
+- Prefer required keywords over preferred ones
+- Keep the scope achievable within the stated constraints (default: 1 week, solo, zero cost)
+- Use notes to briefly explain how the two options differ and which to pick when
+- Do NOT design the architecture or the day-by-day plan; later steps do that"""
+
+REGENERATE_PROMPT = """You are a Project Planner that designs portfolio projects for job seekers.
+
+Propose exactly ONE portfolio project idea that proves the given missing keywords.
+Its title MUST be clearly different from every title listed as already taken.
+covers_keywords may only use keywords from the missing list (keep their category).
+Respect the candidate's preferred stack and constraints."""
+
+
+def describe_preferences(preferences: Optional[Preferences]) -> str:
+    prefs = preferences or Preferences()
+    return (
+        "Preferences:\n"
+        f"- Stack: {', '.join(prefs.stack) or 'any'}\n"
+        f"- Constraints: {', '.join(prefs.constraints) or '1 week, solo, zero cost'}\n"
+        f"- Role: {prefs.role or 'not specified'}"
+    )
+
+
+def describe_idea(idea: ProjectIdea) -> str:
+    """architecture / sprint_plan prompt에 넣을 아이디어 요약."""
+    covers = ", ".join(f"{kw.keyword_text} ({kw.category})" for kw in idea.covers_keywords)
+    return (
+        f"Project: {idea.title}\n"
+        f"One-liner: {idea.one_liner}\n"
+        f"Why: {idea.reasoning}\n"
+        f"Covers keywords: {covers or '(none)'}\n"
+        f"Tech stack: {', '.join(idea.tech_stack) or 'any'}\n"
+        f"Constraints: {', '.join(idea.constraints) or 'none'}"
+    )
+
+
+def _missing_lines(gap: GapSummary) -> str:
+    lines = [f"- {kw.keyword_text} ({kw.category})" for kw in gap.validated_missing_keywords]
+    return "Missing keywords:\n" + "\n".join(lines or ["- (none)"])
+
+
+def _build_messages(
+    gap: GapSummary,
+    preferences: Optional[Preferences],
+    example: Optional[ProjectIdeas] = None,
+    example_keywords: Iterable[str] = (),
+) -> list[dict]:
+    messages = [{"role": "system", "content": SYSTEM_PROMPT}]
+    if example is not None:
+        # few-shot: 비슷한 gap에 대해 예전에 만든 아이디어를 user / assistant 한 쌍으로
+        lines = [f"- {kw}" for kw in example_keywords] or ["- (none)"]
+        messages += [
+            {
+                "role": "user",
+                "content": (
+                    "Missing keywords:\n" + "\n".join(lines) + "\n\n"
+                    + describe_preferences(preferences)
+                ),
+            },
+            {"role": "assistant", "content": example.model_dump_json(exclude_none=True)},
+        ]
+    return messages + [
+        {
+            "role": "user",
+            "content": (
+                _missing_lines(gap)
+                + "\n\n"
+                + describe_preferences(preferences)
+                + f"\n\nCurrent match score: {gap.match_score}"
+                + ("\n\nPropose fresh ideas; do not reuse the example titles." if example else "")
+            ),
+        },
+    ]
+
+
+def _regenerate_messages(
+    gap: GapSummary,
+    preferences: Optional[Preferences],
+    previous: ProjectIdea,
+    taken_titles: list[str],
+) -> list[dict]:
+    # 겹친 안이 맡았던 키워드를 그대로 맡기면 두 안의 coverage 분담이 유지된다
+    focus = previous.covers_keywords or gap.validated_missing_keywords
+    lines = [f"- {kw.keyword_text} ({kw.category})" for kw in focus]
+    return [
+        {"role": "system", "content": REGENERATE_PROMPT},
+        {
+            "role": "user",
+            "content": (
+                _missing_lines(gap)
+                + "\n\nFocus on:\n"
+                + "\n".join(lines or ["- (any)"])
+                + "\n\nTitles already taken:\n"
+                + "\n".join(f"- {title}" for title in taken_titles)
+                + "\n\n"
+                + describe_preferences(preferences)
+            ),
+        },
+    ]
+
+
+@instrumented("tool", "project_ideation")
+def ideate_projects(
+    gap: GapSummary,
+    preferences: Optional[Preferences] = None,
+    *,
+    example: Optional[ProjectIdeas] = None,
+    example_keywords: Iterable[str] = (),
+) -> ProjectIdeas:
+    """missing keyword + Preferences → 아이디어 2개 (example: 비슷한 gap의 few-shot 예시)."""
+    return invoke_structured(
+        ProjectIdeas,
+        _build_messages(gap, preferences, example, example_keywords),
+        model=MODEL_NAME,
+        temperature=TEMPERATURE,
+    )
+
+
+@instrumented("tool", "project_ideation")
+async def aideate_projects(
+    gap: GapSummary,
+    preferences: Optional[Preferences] = None,
+    *,
+    example: Optional[ProjectIdeas] = None,
+    example_keywords: Iterable[str] = (),
+) -> ProjectIdeas:
+    """ideate_projects의 async 버전."""
+    return await ainvoke_structured(
+        ProjectIdeas,
+        _build_messages(gap, preferences, example, example_keywords),
+        model=MODEL_NAME,
+        temperature=TEMPERATURE,
+    )
+
+
+@instrumented("tool", "project_ideation_retry")
+def regenerate_idea(
+    gap: GapSummary,
+    preferences: Optional[Preferences],
+    previous: ProjectIdea,
+    taken_titles: list[str],
+) -> ProjectIdea:
+    """previous와 같은 키워드를 맡되 taken_titles와 다른 제목의 아이디어 1개."""
+    return invoke_structured(
+        ProjectIdea,
+        _regenerate_messages(gap, preferences, previous, taken_titles),
+        model=MODEL_NAME,
+        temperature=TEMPERATURE,
+    )
+
+
+@instrumented("tool", "project_ideation_retry")
+async def aregenerate_idea(
+    gap: GapSummary,
+    preferences: Optional[Preferences],
+    previous: ProjectIdea,
+    taken_titles: list[str],
+) -> ProjectIdea:
+    """regenerate_idea의 async 버전."""
+    return await ainvoke_structured(
+        ProjectIdea,
+        _regenerate_messages(gap, preferences, previous, taken_titles),
+        model=MODEL_NAME,
+        temperature=TEMPERATURE,
+    )
+
+
+def _project_ideation(gap: GapSummary, preferences: Optional[Preferences] = None) -> dict:
+    """
+    Propose two portfolio project ideas for the missing keywords of a gap analysis.
+
+    Args:
+        gap: GapSummary (validated_missing_keywords are used)
+        preferences: Preferred stack / constraints / role
+
+    Returns:
+        ProjectIdeas as a dictionary (two ideas + notes)
+    """
+    return ideate_projects(gap, preferences).model_dump()
+
+
+async def _aproject_ideation(gap: GapSummary, preferences: Optional[Preferences] = None) -> dict:
+    return (await aideate_projects(gap, preferences)).model_dump()
+
+
+# agent용 dict 출력 Tool. 파이프라인(project_agent)은 ideate_projects를 그대로 쓴다.
+project_ideation_tool = StructuredTool.from_function(
+    func=_project_ideation,
+    coroutine=_aproject_ideation,
+    name="project_ideation_tool",
+)
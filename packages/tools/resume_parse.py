@@ -1,12 +1,45 @@
 # packages/tools/resume_parse.py
-"""Resume 파싱 Tool - LLM을 사용하여 Resume 텍스트에서 키워드 추출."""
+"""
+Resume 파싱 Tool - LLM을 사용하여 Resume 텍스트에서 키워드 추출.
+
+긴 Resume(RESUME_CHUNK_MIN_CHARS 이상)는 섹션(Skills / Experience / Projects ...) 청크로 나눠
+동시에 파싱하고, 원문 순서대로 합쳐 dedupe_resume_keywords(ResumeProfile validator)로 중복을 없앤다.
+청크마다 캐시 / single-flight / lexicon fast path가 따로 적용된다.
+
+LLM에 보내기 전에 중복 문단 제거 + RESUME_TOKEN_BUDGET 예산을 적용한다 (preprocess.prune_resume).
+source_span은 전처리 전 원문 기준으로 되돌려서 돌려준다.
+원문 자체는 RAW_TEXT_RETENTION에 따라 raw_text / source(DocRef)로 남긴다 (core.docstore).
+LLM을 쓸 수 없으면(core.resilience.LLMUnavailable) lexicon 추출로 응답한다 (degraded, 캐시하지 않음).
+"""
 
 from __future__ import annotations
 
-from langchain.chat_models import init_chat_model
-from langchain_core.tools import tool
+import asyncio
+import contextvars
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+from langchain_core.tools import StructuredTool
+
+from packages.core.cache import ParseCache, content_key, prompt_fingerprint
+from packages.core.docstore import retain_text
+from packages.core.llm import ainvoke_structured, completed_items, invoke_structured
+from packages.core.ratelimit import current_priority
+from packages.core.resilience import LLMUnavailable, record_degraded
+from packages.core.schemas import ResumeKeyword, ResumeProfile
+from packages.core.singleflight import SingleFlight
+from packages.core.tracing import annotate, instrumented, stage
+from packages.tools.keyword_normalize import fast_path_resume, lexicon_resume
+from packages.tools.preprocess import Pruned, prune_resume
+from packages.tools.resume_sections import ResumeChunk, split_resume
+
+# 이 길이(문자) 이상인 Resume는 섹션 청크로 나눠 병렬 파싱 (0이면 항상 한 번에)
+RESUME_CHUNK_MIN_CHARS = int(os.getenv("RESUME_CHUNK_MIN_CHARS", "6000"))
+# 청크 하나의 최대 길이 (긴 섹션은 줄 경계에서 더 나눈다)
+RESUME_CHUNK_MAX_CHARS = int(os.getenv("RESUME_CHUNK_MAX_CHARS", "6000"))
 
-from packages.core.schemas import ResumeProfile
+MODEL_NAME = "gpt-4o-mini"
 
 SYSTEM_PROMPT = """You are a Resume parser that extracts **technical keywords** from resumes.
 
@@ -61,9 +94,268 @@ Note: "REST APIs" is excluded (concept, not a tool). "Developed" is excluded (ve
 
 Populate `keywords` field with extracted technical keywords only."""
 
+# SYSTEM_PROMPT가 바뀌면 캐시 key도 바뀐다
+PROMPT_VERSION = prompt_fingerprint(SYSTEM_PROMPT)
+
+_cache: ParseCache[ResumeProfile] = ParseCache(ResumeProfile, namespace="resume_parse")
+# 같은 입력의 동시 파싱은 LLM 호출 1번으로 합친다 (캐시가 채워지기 전 구간)
+_inflight: SingleFlight[ResumeProfile] = SingleFlight("resume_parse", scope=current_priority)
+
+
+def _cache_key(resume_text: str) -> str:
+    return content_key(resume_text, prompt_version=PROMPT_VERSION, model=MODEL_NAME)
+
+
+def _locate(keyword: ResumeKeyword, text: str, base: int, pruned: Pruned) -> ResumeKeyword:
+    """
+    source_span을 원문 offset으로 맞춘다.
+    lexicon 결과는 청크 기준 span을 base만큼 옮기고, LLM 결과는 evidence 위치
+    (evidence 안에서 키워드가 보이면 그 위치)를 span으로 쓴다. 마지막으로 전처리 전 offset으로 되돌린다.
+    """
+    if keyword.source_span is not None:
+        start, end = keyword.source_span
+        span: Optional[tuple[int, int]] = (base + start, base + end)
+    else:
+        span = None
+        evidence = keyword.evidence or ""
+        at = text.find(evidence) if evidence else -1
+        if at < 0 and evidence:
+            # LLM이 대소문자를 바꿔서 옮긴 evidence
+            at = text.lower().find(evidence.lower())
+        if at >= 0:
+            inner = evidence.lower().find(keyword.keyword_text)
+            if inner >= 0:
+                span = (base + at + inner, base + at + inner + len(keyword.keyword_text))
+            else:
+                span = (base + at, base + at + len(evidence))
+    if span is not None:
+        span = (pruned.to_original(span[0]), pruned.to_original(span[1] - 1) + 1)
+    if span == keyword.source_span:
+        return keyword
+    return keyword.model_copy(update={"source_span": span})
+
+
+def _merge_chunks(
+    chunks: list[ResumeChunk], results: list[ResumeProfile], pruned: Pruned, resume_text: str
+) -> ResumeProfile:
+    """
+    청크 결과를 원문 순서로 합친다 (validator의 dedupe_resume_keywords가 먼저 나온 것을 유지).
+    캐시된 객체는 공유되므로 새 ResumeProfile에 원문(또는 DocStore 참조)을 채운다.
+    """
+    return ResumeProfile(
+        **retain_text(resume_text),
+        keywords=[
+            _locate(kw, chunk.text, chunk.start, pruned)
+            for chunk, result in zip(chunks, results)
+            for kw in result.keywords
+        ],
+    )
+
+
+def _chunks(resume_text: str) -> list[ResumeChunk]:
+    """파싱 단위 목록. 짧은 Resume는 전체가 청크 1개."""
+    whole = [ResumeChunk("all", 0, len(resume_text), resume_text)]
+    if RESUME_CHUNK_MIN_CHARS <= 0 or len(resume_text) < RESUME_CHUNK_MIN_CHARS:
+        return whole
+    chunks = split_resume(resume_text, max_chars=RESUME_CHUNK_MAX_CHARS)
+    return chunks if len(chunks) > 1 else whole
+
+
+def _build_messages(resume_text: str) -> list[dict]:
+    return [
+        {"role": "system", "content": SYSTEM_PROMPT},
+        {"role": "user", "content": f"Parse this Resume:\n\n{resume_text}"},
+    ]
+
+
+def _degraded(resume_text: str, error: LLMUnavailable) -> ResumeProfile:
+    """LLM을 쓸 수 없을 때: lexicon 결과 (일시적인 결과라 캐시하지 않는다)."""
+    annotate(path="degraded", llm_error=str(error))
+    record_degraded(error)
+    return lexicon_resume(resume_text)
+
+
+def _call_llm(resume_text: str, key: str) -> ResumeProfile:
+    result = invoke_structured(
+        ResumeProfile, _build_messages(resume_text), model=MODEL_NAME, temperature=0.0
+    )
+    result = result.model_copy(update={"raw_text": None})
+    _cache.set(key, result)
+    return result
+
+
+async def _acall_llm(
+    resume_text: str, key: str, on_keyword: Optional[Callable[[dict], None]]
+) -> ResumeProfile:
+    result = await ainvoke_structured(
+        ResumeProfile,
+        _build_messages(resume_text),
+        model=MODEL_NAME,
+        temperature=0.0,
+        on_partial=completed_items("keywords", on_keyword) if on_keyword else None,
+    )
+    result = result.model_copy(update={"raw_text": None})
+    _cache.set(key, result)
+    return result
+
+
+def _parse_text(resume_text: str) -> ResumeProfile:
+    """텍스트 1개(전체 또는 청크) 파싱: fast path → 캐시 → LLM (raw_text 없음)."""
+    # lexicon coverage가 높으면 LLM 호출 생략
+    fast = fast_path_resume(resume_text)
+    if fast is not None:
+        annotate(path="fast_path")
+        return fast
+
+    key = _cache_key(resume_text)
+    result = _cache.get(key)
+    annotate(path="cache" if result is not None else "llm")
+    if result is None:
+        try:
+            result = _inflight.do(key, lambda: _call_llm(resume_text, key))
+        except LLMUnavailable as e:
+            # 합쳐진 caller도 각자 자기 context에 degraded를 남긴다 (작업 재시도 판단)
+            result = _degraded(resume_text, e)
+    return result
+
+
+async def _aparse_text(
+    resume_text: str, on_keyword: Optional[Callable[[dict], None]]
+) -> ResumeProfile:
+    # lexicon coverage가 높으면 LLM 호출 생략
+    fast = fast_path_resume(resume_text)
+    if fast is not None:
+        annotate(path="fast_path")
+        return fast
+
+    key = _cache_key(resume_text)
+    result = _cache.get(key)
+    annotate(path="cache" if result is not None else "llm")
+    if result is None:
+        # 합쳐진 caller에게는 on_keyword 스트리밍 없이 최종 결과만 전달된다
+        try:
+            result = await _inflight.ado(key, lambda: _acall_llm(resume_text, key, on_keyword))
+        except LLMUnavailable as e:
+            result = _degraded(resume_text, e)
+    return result
 
-@tool
-def resume_parse_tool(resume_text: str) -> dict:
+
+def _parse_chunk(chunk: ResumeChunk) -> ResumeProfile:
+    with stage("resume_chunk", chunk.section, start=chunk.start, end=chunk.end):
+        return _parse_text(chunk.text)
+
+
+async def _aparse_chunk(
+    chunk: ResumeChunk, on_keyword: Optional[Callable[[dict], None]]
+) -> ResumeProfile:
+    with stage("resume_chunk", chunk.section, start=chunk.start, end=chunk.end):
+        return await _aparse_text(chunk.text, on_keyword)
+
+
+def _parse_chunks(chunks: list[ResumeChunk], text: str) -> list[ResumeProfile]:
+    if len(chunks) == 1:
+        return [_parse_text(text)]
+    annotate(chunks=len(chunks))
+    with ThreadPoolExecutor(max_workers=len(chunks)) as pool:
+        # 스레드에서도 trace span 부모가 이어지도록 context를 복사해서 넘긴다
+        futures = [
+            pool.submit(contextvars.copy_context().run, _parse_chunk, chunk) for chunk in chunks
+        ]
+        return [future.result() for future in futures]
+
+
+async def _aparse_chunks(
+    chunks: list[ResumeChunk], text: str, on_keyword: Optional[Callable[[dict], None]]
+) -> list[ResumeProfile]:
+    if len(chunks) == 1:
+        return [await _aparse_text(text, on_keyword)]
+    annotate(chunks=len(chunks))
+    return list(await asyncio.gather(*(_aparse_chunk(chunk, on_keyword) for chunk in chunks)))
+
+
+@instrumented("tool", "resume_parse_tool")
+def parse_resume(resume_text: str) -> ResumeProfile:
+    """Resume 텍스트 → ResumeProfile (원문은 retention 정책대로, source_span은 원문 기준)."""
+    pruned, _ = prune_resume(resume_text)
+    chunks = _chunks(pruned.text)
+    return _merge_chunks(chunks, _parse_chunks(chunks, pruned.text), pruned, resume_text)
+
+
+@instrumented("tool", "resume_parse_tool")
+async def aparse_resume(
+    resume_text: str, on_keyword: Optional[Callable[[dict], None]] = None
+) -> ResumeProfile:
+    """
+    Async variant of `parse_resume` (event loop를 막지 않음).
+
+    on_keyword: LLM 토큰 스트리밍 중 키워드 하나가 완성될 때마다 호출 (raw dict).
+    fast path나 캐시 hit이면 호출되지 않는다. 청크로 나뉘면 청크들의 키워드가 섞여서 온다.
+    """
+    pruned, _ = prune_resume(resume_text)
+    chunks = _chunks(pruned.text)
+    results = await _aparse_chunks(chunks, pruned.text, on_keyword)
+    return _merge_chunks(chunks, results, pruned, resume_text)
+
+
+def _prune_spans(resume_text: str, spans: list[tuple[int, int]]) -> Pruned:
+    """
+    바뀐 구간들을 문단 경계("\n\n")로 이어 붙여 전체 Resume와 같은 전처리(prune_resume)를 한다.
+    돌려주는 Pruned.to_original은 resume_text 기준 offset.
+    """
+    parts: list[str] = []
+    segments: list[tuple[int, int]] = []
+    pos = 0
+    for start, end in spans:
+        if parts:
+            parts.append("\n\n")
+            pos += 2
+        segments.append((pos, start))
+        parts.append(resume_text[start:end])
+        pos += end - start
+    joined = Pruned("".join(parts), segments)
+    pruned, _ = prune_resume(joined.text)
+    if not pruned.segments:
+        return Pruned(pruned.text, joined.segments)
+    # 전처리 조각은 문단 안에서만 잘리므로 구간 경계를 넘지 않는다
+    return Pruned(pruned.text, [(p, joined.to_original(j)) for p, j in pruned.segments])
+
+
+def _span_keywords(
+    chunks: list[ResumeChunk], results: list[ResumeProfile], pruned: Pruned
+) -> list[ResumeKeyword]:
+    return [
+        _locate(kw, chunk.text, chunk.start, pruned)
+        for chunk, result in zip(chunks, results)
+        for kw in result.keywords
+    ]
+
+
+def parse_resume_spans(resume_text: str, spans: list[tuple[int, int]]) -> list[ResumeKeyword]:
+    """
+    원문의 일부 구간만 파싱 (증분 재분석: 바뀐 줄만).
+    구간들을 이어 붙여 전체 파싱과 같은 전처리 / 청크 분할 / fast path → 캐시 → LLM을 거친다.
+    source_span은 원문 기준. 중복 제거는 호출한 쪽에서 한다.
+    """
+    pruned = _prune_spans(resume_text, spans)
+    chunks = _chunks(pruned.text)
+    return _span_keywords(chunks, _parse_chunks(chunks, pruned.text), pruned)
+
+
+async def aparse_resume_spans(
+    resume_text: str, spans: list[tuple[int, int]]
+) -> list[ResumeKeyword]:
+    """parse_resume_spans의 async 버전."""
+    pruned = _prune_spans(resume_text, spans)
+    chunks = _chunks(pruned.text)
+    return _span_keywords(chunks, await _aparse_chunks(chunks, pruned.text, None), pruned)
+
+
+def parse_stats() -> dict:
+    """캐시 / single-flight 카운터."""
+    return {"cache": _cache.stats.as_dict(), "single_flight": _inflight.stats.as_dict()}
+
+
+def _parse_resume(resume_text: str) -> dict:
     """
     Parse a Resume text and extract technical keywords.
 
@@ -73,16 +365,17 @@ def resume_parse_tool(resume_text: str) -> dict:
     Returns:
         ResumeProfile as a dictionary containing extracted technical keywords
     """
-    llm = init_chat_model("gpt-4o-mini", temperature=0.0)
-    structured_llm = llm.with_structured_output(ResumeProfile)
+    return parse_resume(resume_text).model_dump()
 
-    messages = [
-        {"role": "system", "content": SYSTEM_PROMPT},
-        {"role": "user", "content": f"Parse this Resume:\n\n{resume_text}"},
-    ]
 
-    result: ResumeProfile = structured_llm.invoke(messages)
-    # Store raw text for reference
-    result.raw_text = resume_text
+async def _aparse_resume(resume_text: str) -> dict:
+    return (await aparse_resume(resume_text)).model_dump()
+
 
-    return result.model_dump()
+# sync(invoke)와 async(ainvoke) 모두 지원하는 Tool (agent용 dict 출력).
+# 파이프라인 내부(graph / API)는 parse_resume / aparse_resume의 ResumeProfile을 그대로 쓴다.
+resume_parse_tool = StructuredTool.from_function(
+    func=_parse_resume,
+    coroutine=_aparse_resume,
+    name="resume_parse_tool",
+)
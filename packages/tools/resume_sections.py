@@ -0,0 +1,109 @@
+# packages/tools/resume_sections.py
+"""
+Resume 섹션 분할 (긴 Resume의 청크 병렬 파싱용).
+
+헤딩 줄(EDUCATION, PROJECTS, EXPERIENCE / RESEARCH, Technical Skills: ...)을 기준으로
+원문을 연속 구간으로 나눈다. 각 청크는 원문 offset [start, end)를 가지므로
+청크 안에서 찾은 위치를 원문 위치로 되돌릴 수 있다.
+
+- 너무 짧은 섹션은 앞 섹션에 붙인다 (호출 수 / system prompt 반복 비용 절약).
+- 너무 긴 섹션은 빈 줄 → 줄 경계에서 max_chars 이하로 자른다
+  (wall-clock이 가장 긴 청크 하나에 맞춰지도록).
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+
+# 헤딩 텍스트 → 섹션 종류 (resume_parse SYSTEM_PROMPT의 "Sections to Check"와 같은 구분)
+_SECTION_PATTERNS = (
+    ("skills", re.compile(r"skills|technologies|tech(nical)?\s+stack|competenc|toolkit", re.I)),
+    ("experience", re.compile(r"experience|employment|work\s+history|research", re.I)),
+    ("projects", re.compile(r"projects?\b", re.I)),
+    ("education", re.compile(r"education|academic\s+background|coursework", re.I)),
+)
+_HEADING_MAX_CHARS = 48
+_BULLET_PREFIXES = ("*", "-", "•", "·", "◦", "‣", "–")
+
+
+@dataclass(frozen=True)
+class ResumeChunk:
+    section: str  # skills | experience | projects | education | other
+    start: int
+    end: int
+    text: str
+
+
+def _heading_section(line: str) -> str | None:
+    """헤딩 줄이면 섹션 종류, 아니면 None."""
+    heading = line.strip().rstrip(":").strip()
+    if not heading or len(heading) > _HEADING_MAX_CHARS or heading.startswith(_BULLET_PREFIXES):
+        return None
+    letters = [c for c in heading if c.isalpha()]
+    if not letters:
+        return None
+    for section, pattern in _SECTION_PATTERNS:
+        # "Technical Skills", "EXPERIENCE / RESEARCH" 처럼 헤딩 전체가 섹션 이름인 경우
+        if pattern.search(heading) and len(heading.split()) <= 4:
+            return section
+    # 이름을 모르는 대문자 헤딩 (LEADERSHIP, PUBLICATIONS ...)
+    if all(c.isupper() for c in letters) and len(letters) >= 4 and len(heading.split()) <= 4:
+        return "other"
+    return None
+
+
+def _split_long(chunk: ResumeChunk, max_chars: int) -> list[ResumeChunk]:
+    if len(chunk.text) <= max_chars:
+        return [chunk]
+    pieces: list[ResumeChunk] = []
+    start = chunk.start
+    text = chunk.text
+    offset = 0
+    while len(text) - offset > max_chars:
+        window = text[offset : offset + max_chars]
+        # 빈 줄 > 줄바꿈 > 강제 자르기 순으로 경계를 고른다
+        cut = window.rfind("\n\n")
+        if cut < max_chars // 2:
+            cut = window.rfind("\n")
+        if cut < max_chars // 2:
+            cut = max_chars
+        else:
+            cut += 1
+        pieces.append(
+            ResumeChunk(chunk.section, start + offset, start + offset + cut, window[:cut])
+        )
+        offset += cut
+    pieces.append(ResumeChunk(chunk.section, start + offset, chunk.end, text[offset:]))
+    return pieces
+
+
+def split_resume(text: str, *, min_chars: int = 300, max_chars: int = 6000) -> list[ResumeChunk]:
+    """
+    Resume 원문 → 연속 청크 목록 (원문 순서, 빈 청크 없음).
+    헤딩이 없으면 전체가 청크 1개 (max_chars 초과 시 줄 경계로 분할).
+    """
+    bounds: list[tuple[str, int]] = [("other", 0)]
+    pos = 0
+    for line in text.splitlines(keepends=True):
+        section = _heading_section(line)
+        if section is not None and pos > 0:
+            bounds.append((section, pos))
+        elif section is not None:
+            bounds[0] = (section, 0)
+        pos += len(line)
+
+    chunks: list[ResumeChunk] = []
+    for i, (section, start) in enumerate(bounds):
+        end = bounds[i + 1][1] if i + 1 < len(bounds) else len(text)
+        if not text[start:end].strip():
+            continue
+        if chunks and (end - start < min_chars or len(chunks[-1].text) < min_chars):
+            # 짧은 섹션은 앞 청크에 붙인다 (앞 청크가 짧아도 마찬가지)
+            prev = chunks[-1]
+            kind = prev.section if end - start < min_chars else section
+            chunks[-1] = ResumeChunk(kind, prev.start, end, text[prev.start : end])
+            continue
+        chunks.append(ResumeChunk(section, start, end, text[start:end]))
+
+    return [piece for chunk in chunks for piece in _split_long(chunk, max_chars)]
@@ -1,2 +1,174 @@
 # packages/tools/score.py
-"""점수 계산 Tool."""
+"""
+점수 계산 Tool.
+
+- weighted_match_score: 단일 Resume vs JD 점수 (gap_compute에서 사용)
+- score_matrix: N개 Resume × M개 JD 점수를 NumPy 행렬곱 한 번으로 계산 (batch)
+  키워드 집합을 공유 vocabulary 위의 0/1 행렬로 인코딩하고,
+  OR 그룹은 "그룹 컬럼"(멤버 중 하나라도 있으면 1)으로 확장해서 gap_compute와 같은 점수를 낸다.
+"""
+
+from __future__ import annotations
+
+from typing import Literal
+
+import numpy as np
+from langchain_core.tools import tool
+
+from packages.core.schemas import JDProfile, ResumeProfile
+from packages.core.tracing import instrumented
+
+# JD 카테고리 가중치 (README: Matching Score Algorithm)
+REQUIRED_WEIGHT = 0.7
+PREFERRED_WEIGHT = 0.3
+
+
+def weighted_match_score(
+    matched_required: int,
+    total_required: int,
+    matched_preferred: int,
+    total_preferred: int,
+) -> float:
+    """
+    Required/Preferred 매칭 비율의 가중합 (0 ~ 100, 소수점 1자리).
+    해당 카테고리 키워드가 없으면 그 카테고리는 만점으로 본다.
+    """
+    required_score = (
+        matched_required / total_required * REQUIRED_WEIGHT
+        if total_required > 0
+        else REQUIRED_WEIGHT
+    )
+    preferred_score = (
+        matched_preferred / total_preferred * PREFERRED_WEIGHT
+        if total_preferred > 0
+        else PREFERRED_WEIGHT
+    )
+    return round((required_score + preferred_score) * 100, 1)
+
+
+@instrumented("compute", "score_matrix")
+def score_matrix(resumes: list[ResumeProfile], jds: list[JDProfile]) -> np.ndarray:
+    """
+    모든 (resume, jd) 쌍의 match score 행렬 (N × M, 0 ~ 100, 소수점 1자리).
+    compute_gap(resume, jd).match_score와 같은 값.
+    """
+    # 순환 import 방지 (gap_compute가 weighted_match_score를 import)
+    from packages.tools.gap_compute import parse_match_group
+
+    # 1) vocabulary: JD 쪽 키워드 + OR 그룹 멤버만 (Resume에만 있는 키워드는 점수에 무관)
+    vocab: dict[str, int] = {}
+    group_ids: dict[frozenset[int], int] = {}
+    # jd index별 (column key, category) 목록. column key: ("kw", id) 또는 ("group", gid)
+    jd_columns: list[list[tuple[tuple[str, int], str]]] = []
+    for jd in jds:
+        columns = []
+        for jk in jd.keywords:
+            if jk.category not in ("required", "preferred"):
+                continue
+            kid = vocab.setdefault(jk.keyword_text, len(vocab))
+            members = parse_match_group(jk.gap_instruction)
+            if members:
+                member_ids = frozenset(
+                    [kid, *(vocab.setdefault(m, len(vocab)) for m in members)]
+                )
+                gid = group_ids.setdefault(member_ids, len(group_ids))
+                columns.append((("group", gid), jk.category))
+            else:
+                columns.append((("kw", kid), jk.category))
+        jd_columns.append(columns)
+
+    n_vocab, n_groups = len(vocab), len(group_ids)
+    n_cols = n_vocab + n_groups
+
+    # 2) Resume 행렬 R (N × V), 그룹 컬럼 = R @ membership > 0
+    resume_matrix = np.zeros((len(resumes), n_cols), dtype=np.float32)
+    for i, resume in enumerate(resumes):
+        cols = [vocab[k.keyword_text] for k in resume.keywords if k.keyword_text in vocab]
+        resume_matrix[i, cols] = 1.0
+    if n_groups:
+        membership = np.zeros((n_vocab, n_groups), dtype=np.float32)
+        for member_ids, gid in group_ids.items():
+            membership[list(member_ids), gid] = 1.0
+        resume_matrix[:, n_vocab:] = (resume_matrix[:, :n_vocab] @ membership) > 0
+
+    # 3) JD 행렬 (M × C): 컬럼별 required/preferred 키워드 개수
+    required = np.zeros((len(jds), n_cols), dtype=np.float32)
+    preferred = np.zeros((len(jds), n_cols), dtype=np.float32)
+    for j, columns in enumerate(jd_columns):
+        for (kind, idx), category in columns:
+            col = idx if kind == "kw" else n_vocab + idx
+            target = required if category == "required" else preferred
+            target[j, col] += 1.0
+
+    # 4) 매칭 개수 = R @ Q^T, 가중합
+    return _weighted_scores(
+        resume_matrix @ required.T,
+        required.sum(axis=1),
+        resume_matrix @ preferred.T,
+        preferred.sum(axis=1),
+    )
+
+
+def _weighted_scores(
+    matched_required: np.ndarray,
+    total_required: np.ndarray,
+    matched_preferred: np.ndarray,
+    total_preferred: np.ndarray,
+) -> np.ndarray:
+    """weighted_match_score의 행렬 버전 (float64로 계산해서 rounding 결과를 맞춘다)."""
+    matched_required = matched_required.astype(np.float64)
+    matched_preferred = matched_preferred.astype(np.float64)
+    total_required = total_required.astype(np.float64)
+    total_preferred = total_preferred.astype(np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        required_score = np.where(
+            total_required > 0,
+            matched_required / total_required * REQUIRED_WEIGHT,
+            REQUIRED_WEIGHT,
+        )
+        preferred_score = np.where(
+            total_preferred > 0,
+            matched_preferred / total_preferred * PREFERRED_WEIGHT,
+            PREFERRED_WEIGHT,
+        )
+    return np.round((required_score + preferred_score) * 100, 1)
+
+
+def top_k(
+    scores: np.ndarray, k: int, by: Literal["resume", "jd"] = "resume"
+) -> list[list[tuple[int, float]]]:
+    """
+    Resume별(행) 또는 JD별(열) 상위 k개 (index, score), 점수 내림차순.
+    argpartition으로 전체 정렬 없이 O(N × M).
+    """
+    matrix = scores if by == "resume" else scores.T
+    k = min(k, matrix.shape[1])
+    if k <= 0:
+        return [[] for _ in range(matrix.shape[0])]
+    part = np.argpartition(-matrix, k - 1, axis=1)[:, :k]
+    part_scores = np.take_along_axis(matrix, part, axis=1)
+    order = np.argsort(-part_scores, axis=1, kind="stable")
+    best = np.take_along_axis(part, order, axis=1)
+    best_scores = np.take_along_axis(part_scores, order, axis=1)
+    return [
+        [(int(idx), float(score)) for idx, score in zip(row_idx, row_scores)]
+        for row_idx, row_scores in zip(best, best_scores)
+    ]
+
+
+@tool
+@instrumented("tool", "score_tool")
+def score_tool(resume_profiles: list[dict], jd_profiles: list[dict]) -> list[list[float]]:
+    """
+    Score every parsed Resume against every parsed JD.
+
+    Args:
+        resume_profiles: ResumeProfile dictionaries (output of resume_parse_tool)
+        jd_profiles: JDProfile dictionaries (output of jd_parse_tool)
+
+    Returns:
+        Score matrix (rows: resumes, columns: JDs), each score in 0-100
+    """
+    resumes = [ResumeProfile(keywords=p.get("keywords", [])) for p in resume_profiles]
+    jds = [JDProfile(keywords=p.get("keywords", [])) for p in jd_profiles]
+    return score_matrix(resumes, jds).tolist()
@@ -1,2 +1,90 @@
 # packages/tools/sprint_plan.py
-"""7일 스프린트 계획 Tool."""
+"""
+7일 스프린트 계획 Tool.
+
+ProjectIdea 1개 → SprintPlan (D1~D7 계획 + downside / workaround, structured output 1회).
+아키텍처 결과를 기다리지 않고 아이디어만으로 만든다 (architecture와 동시에 호출).
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from langchain_core.tools import StructuredTool
+
+from packages.core.llm import ainvoke_structured, invoke_structured
+from packages.core.schemas import Preferences, ProjectIdea, SprintPlan
+from packages.core.tracing import instrumented
+from packages.tools.project_ideation import describe_idea, describe_preferences
+
+MODEL_NAME = "gpt-4o-mini"
+TEMPERATURE = 0.4
+
+SYSTEM_PROMPT = """You are a tech lead planning a 7-day sprint for a job seeker's portfolio project.
+
+For the given project idea, write:
+- weekly_plan: days 1..7, each with goals, concrete tasks and deliverables
+  (code, docs, demo); every covered keyword must be exercised on at least one day
+- downside: realistic risks of the plan (scope, cost, unfamiliar tools)
+- workaround: how to mitigate each risk
+
+Rules:
+- Day 1 sets up the repo and environment; day 7 is for polishing, README and a demo
+- Keep each day achievable within the stated constraints (default: 1 week, solo, zero cost)"""
+
+
+def _build_messages(idea: ProjectIdea, preferences: Optional[Preferences]) -> list[dict]:
+    return [
+        {"role": "system", "content": SYSTEM_PROMPT},
+        {
+            "role": "user",
+            "content": describe_idea(idea) + "\n\n" + describe_preferences(preferences),
+        },
+    ]
+
+
+@instrumented("tool", "sprint_plan")
+def plan_sprint(idea: ProjectIdea, preferences: Optional[Preferences] = None) -> SprintPlan:
+    """아이디어 1개 → 7일 계획."""
+    return invoke_structured(
+        SprintPlan,
+        _build_messages(idea, preferences),
+        model=MODEL_NAME,
+        temperature=TEMPERATURE,
+    )
+
+
+@instrumented("tool", "sprint_plan")
+async def aplan_sprint(idea: ProjectIdea, preferences: Optional[Preferences] = None) -> SprintPlan:
+    """plan_sprint의 async 버전."""
+    return await ainvoke_structured(
+        SprintPlan,
+        _build_messages(idea, preferences),
+        model=MODEL_NAME,
+        temperature=TEMPERATURE,
+    )
+
+
+def _sprint_plan(idea: ProjectIdea, preferences: Optional[Preferences] = None) -> dict:
+    """
+    Plan a 7-day sprint for one portfolio project idea.
+
+    Args:
+        idea: ProjectIdea (title, covered keywords, tech stack, constraints)
+        preferences: Preferred stack / constraints / role
+
+    Returns:
+        SprintPlan as a dictionary (weekly_plan, downside, workaround)
+    """
+    return plan_sprint(idea, preferences).model_dump()
+
+
+async def _asprint_plan(idea: ProjectIdea, preferences: Optional[Preferences] = None) -> dict:
+    return (await aplan_sprint(idea, preferences)).model_dump()
+
+
+sprint_plan_tool = StructuredTool.from_function(
+    func=_sprint_plan,
+    coroutine=_asprint_plan,
+    name="sprint_plan_tool",
+)
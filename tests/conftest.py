@@ -0,0 +1,12 @@
+# tests/conftest.py
+"""공용 설정: 로컬 상태 파일(SQLite 캐시 / 세션 / 작업 큐)은 테스트마다 임시 디렉토리에 둔다."""
+
+from __future__ import annotations
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def data_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("ORCHESTRATOR_DATA_DIR", str(tmp_path / "data"))
+    return tmp_path / "data"
@@ -0,0 +1,70 @@
+# tests/test_agents.py
+"""Agent의 chat model 호출도 scheduler permit / resilience를 거친다."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+from packages.agents import create_resume_agent
+from packages.core.llm import chat_model_factory
+from packages.core.ratelimit import RateScheduler, set_scheduler
+
+
+class _RecordingScheduler(RateScheduler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.acquired: list[str] = []
+
+    def acquire(self, model, messages):
+        self.acquired.append(model)
+        return super().acquire(model, messages)
+
+    async def aacquire(self, model, messages):
+        self.acquired.append(model)
+        return await super().aacquire(model, messages)
+
+
+class _ToolModel(BaseChatModel):
+    """bind_tools를 지원하는 최소 fake (받은 tool 이름을 기록)."""
+
+    seen_tools: list = []
+
+    @property
+    def _llm_type(self) -> str:
+        return "tool-fake"
+
+    def bind_tools(self, tools: Any, **kwargs: Any):
+        return self.bind(tools=[tool.name for tool in tools])
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        self.seen_tools.append(kwargs.get("tools"))
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content="done"))])
+
+
+@pytest.fixture
+def scheduler():
+    recording = _RecordingScheduler()
+    set_scheduler(recording)
+    yield recording
+    set_scheduler(None)
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+async def test_agent_steps_take_a_permit(scheduler, use_async):
+    fake = _ToolModel()
+    with chat_model_factory(lambda model, temperature: fake):
+        agent = create_resume_agent()
+        inputs = {"messages": [("user", "Parse this JD: Python, Kafka")]}
+        if use_async:
+            result = await agent.ainvoke(inputs)
+        else:
+            result = agent.invoke(inputs)
+
+    assert result["messages"][-1].content == "done"
+    assert scheduler.acquired == ["gpt-4o-mini"]
+    assert fake.seen_tools == [["jd_parse_tool", "resume_parse_tool"]]
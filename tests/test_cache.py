@@ -0,0 +1,96 @@
+# tests/test_cache.py
+"""파싱 결과 캐시: 메모리 / SQLite tier hit, 승격, LRU / TTL evict, content key, bypass."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from packages.core.cache import ParseCache, bypass_cache, content_key
+from packages.core.schemas import ResumeKeyword, ResumeProfile
+
+PROFILE = ResumeProfile(keywords=[ResumeKeyword(keyword_text="python", evidence="Python APIs")])
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return tmp_path / "parse_cache.sqlite3"
+
+
+def _cache(db_path, **kwargs) -> ParseCache[ResumeProfile]:
+    return ParseCache(ResumeProfile, "test", db_path=db_path, **kwargs)
+
+
+def test_memory_tier_hit_returns_same_object(db_path):
+    cache = _cache(db_path)
+    cache.set("k", PROFILE)
+
+    assert cache.get("k") is PROFILE
+    assert (cache.stats.memory_hits, cache.stats.disk_hits, cache.stats.misses) == (1, 0, 0)
+
+
+def test_disk_tier_hit_across_instances_is_promoted(db_path):
+    _cache(db_path).set("k", PROFILE)
+    # 새 프로세스 / 다른 worker: 메모리는 비어 있고 SQLite에만 있다
+    cache = _cache(db_path)
+
+    first = cache.get("k")
+    assert first == PROFILE and first is not PROFILE
+    assert (cache.stats.memory_hits, cache.stats.disk_hits) == (0, 1)
+    # 디스크 hit은 메모리 tier로 올라간다
+    assert cache.get("k") is first
+    assert (cache.stats.memory_hits, cache.stats.disk_hits) == (1, 1)
+
+
+def test_memory_lru_eviction_falls_back_to_disk(db_path):
+    cache = _cache(db_path, max_entries=2)
+    for key in ("a", "b", "c"):
+        cache.set(key, PROFILE)
+
+    assert cache.get("a") == PROFILE
+    assert cache.stats.disk_hits == 1
+    assert cache.stats.evictions >= 1
+
+
+def test_namespaces_do_not_share_entries(db_path):
+    _cache(db_path).set("k", PROFILE)
+    other = ParseCache(ResumeProfile, "other", db_path=db_path)
+    assert other.get("k") is None
+    assert other.stats.misses == 1
+
+
+def test_expired_entries_miss_in_both_tiers(db_path):
+    cache = _cache(db_path, ttl_seconds=0.05)
+    cache.set("k", PROFILE)
+    time.sleep(0.06)
+
+    assert cache.get("k") is None
+    assert _cache(db_path, ttl_seconds=0.05).get("k") is None
+
+
+def test_disk_disabled_keeps_memory_only(db_path):
+    cache = _cache(db_path, disk_enabled=False)
+    cache.set("k", PROFILE)
+    assert cache.get("k") is PROFILE
+    assert not db_path.exists()
+
+
+def test_bypass_skips_reads_and_writes(db_path):
+    cache = _cache(db_path)
+    with bypass_cache():
+        cache.set("k", PROFILE)
+        assert cache.get("k") is None
+    assert cache.get("k") is None
+    cache.set("k", PROFILE)
+    with bypass_cache():
+        assert cache.get("k") is None
+
+
+def test_content_key_normalizes_whitespace_and_section_order():
+    key = content_key("Python  and\n FastAPI", prompt_version="v1", model="m")
+    assert key == content_key("Python and FastAPI", prompt_version="v1", model="m")
+    assert key != content_key("Python and FastAPI", prompt_version="v2", model="m")
+    assert content_key({"a": "x", "b": "y"}, prompt_version="v1", model="m") == content_key(
+        {"b": "y", "a": "x"}, prompt_version="v1", model="m"
+    )
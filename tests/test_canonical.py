@@ -0,0 +1,83 @@
+# tests/test_canonical.py
+"""keyword canonicalization: 별칭 / 표기 변형 / 오타 보정, 그리고 보정하면 안 되는 별개 기술."""
+
+from __future__ import annotations
+
+import pytest
+
+from packages.core.canonical import CanonicalIndex, canonicalize
+from packages.core.schemas import ResumeKeyword, ResumeProfile
+
+
+@pytest.mark.parametrize(
+    "term, expected",
+    [
+        ("k8s", "kubernetes"),
+        ("postgres", "postgresql"),
+        ("scikit learn", "scikit-learn"),
+        ("nextjs", "next.js"),
+        ("angular.js", "angularjs"),
+        ("kuberentes", "kubernetes"),
+        ("pytroch", "pytorch"),
+        ("terrafrom", "terraform"),
+        ("kubernetse", "kubernetes"),
+    ],
+)
+def test_aliases_and_typos(term, expected):
+    assert canonicalize(term) == expected
+
+
+@pytest.mark.parametrize(
+    "term, near_miss",
+    [
+        ("openapi", "openai"),
+        ("nuxt.js", "next.js"),
+        ("nuxtjs", "next.js"),
+        ("opencl", "opencv"),
+        ("vitess", "vite"),
+        ("angularjs", "angular"),
+    ],
+)
+def test_distinct_technologies_are_not_fuzz_corrected(term, near_miss):
+    assert canonicalize(term) == term
+    assert canonicalize(term) != near_miss
+
+
+@pytest.mark.parametrize(
+    "term, near_miss",
+    [
+        ("fastai", "fastapi"),
+        ("pydantic-ai", "pydantic"),
+        ("terraformer", "terraform"),
+        ("jenkinsx", "jenkins"),
+        ("mysqlx", "mysql"),
+        ("langchainjs", "langchain"),
+        ("tensorflowjs", "tensorflow"),
+    ],
+)
+def test_prefixed_or_suffixed_names_are_not_fuzz_corrected(term, near_miss):
+    assert canonicalize(term) == term
+    assert canonicalize(term) != near_miss
+
+
+def test_profile_validators_keep_distinct_technologies():
+    profile = ResumeProfile(
+        keywords=[ResumeKeyword(keyword_text="fastai", evidence="Trained models with fastai")]
+    )
+    assert [kw.keyword_text for kw in profile.keywords] == ["fastai"]
+
+
+def test_short_terms_are_not_fuzzed():
+    assert canonicalize("lava") == "lava"
+
+
+def test_ambiguous_distance_is_not_corrected():
+    index = CanonicalIndex(["abcdefg", "abcdefh"], {})
+    assert index.lookup("abcdefx") is None
+
+
+def test_distinct_terms_argument():
+    index = CanonicalIndex(["openai"], {}, distinct=["openapi"])
+    assert index.lookup("openapi") is None
+    assert index.lookup("opnai") is None  # MIN_FUZZY_LENGTH 미만
+    assert index.lookup("openia") == "openai"
@@ -0,0 +1,105 @@
+# tests/test_gap_compute.py
+"""갭 분석: OR 그룹(gap_instruction) bitmask 매칭을 키워드별 직접 판정과 비교."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from packages.core.schemas import JDKeyword, JDProfile, ResumeKeyword, ResumeProfile
+from packages.tools.gap_compute import compute_gap, parse_match_group
+from packages.tools.score import weighted_match_score
+
+VOCAB = (
+    "python", "java", "go", "rust", "kotlin", "kubernetes", "docker", "terraform",
+    "aws", "gcp", "azure", "postgresql", "mysql", "redis", "kafka", "react", "vue",
+)
+
+
+def _group(*members: str) -> str:
+    return f"Match group: [{', '.join(members)}] - if any exists in resume, this keyword is matched"
+
+
+def random_profiles(seed: int) -> tuple[ResumeProfile, JDProfile]:
+    rng = random.Random(seed)
+    resume = ResumeProfile(
+        keywords=[ResumeKeyword(keyword_text=t) for t in rng.sample(VOCAB, rng.randint(0, 8))]
+    )
+    keywords = []
+    for term in rng.sample(VOCAB, rng.randint(1, 10)):
+        instruction = None
+        if rng.random() < 0.4:
+            instruction = _group(term, *rng.sample(VOCAB, rng.randint(1, 3)))
+        keywords.append(
+            JDKeyword(
+                keyword_text=term,
+                category=rng.choice(["required", "preferred", "context"]),
+                gap_instruction=instruction,
+            )
+        )
+    return resume, JDProfile(keywords=keywords)
+
+
+def expected_types(resume: ResumeProfile, jd: JDProfile) -> list[str]:
+    """키워드마다 Resume 집합과 직접 비교한 strong / partial / missing."""
+    have = {kw.keyword_text for kw in resume.keywords}
+    types = []
+    for kw in jd.keywords:
+        if kw.keyword_text in have:
+            types.append("strong")
+        elif set(parse_match_group(kw.gap_instruction)) & have:
+            types.append("partial")
+        else:
+            types.append("missing")
+    return types
+
+
+def expected_score(resume: ResumeProfile, jd: JDProfile) -> float:
+    counts = {"required": [0, 0], "preferred": [0, 0]}
+    for kw, match_type in zip(jd.keywords, expected_types(resume, jd)):
+        if kw.category in counts:
+            counts[kw.category][1] += 1
+            counts[kw.category][0] += match_type != "missing"
+    return weighted_match_score(*counts["required"], *counts["preferred"])
+
+
+def test_or_group_partial_match():
+    resume = ResumeProfile(keywords=[ResumeKeyword(keyword_text="java")])
+    jd = JDProfile(
+        keywords=[
+            JDKeyword(
+                keyword_text="python",
+                category="required",
+                gap_instruction=_group("python", "java"),
+            ),
+            JDKeyword(keyword_text="go", category="required"),
+            JDKeyword(keyword_text="java", category="preferred"),
+        ]
+    )
+    gap = compute_gap(resume, jd)
+
+    types = {m.keyword_pair[1].keyword_text: m.match_type for m in gap.keyword_matches}
+    assert types == {"python": "partial", "java": "strong"}
+    partial = next(m for m in gap.keyword_matches if m.match_type == "partial")
+    # partial의 근거는 그룹에서 Resume에 있는 키워드
+    assert partial.keyword_pair[0].keyword_text == "java"
+    assert [kw.keyword_text for kw in gap.missing_keywords] == ["go"]
+    assert gap.match_score == weighted_match_score(1, 2, 1, 1)
+
+
+def test_parse_match_group_canonicalizes_members():
+    assert parse_match_group(_group("K8s", "'Postgres'")) == ("kubernetes", "postgresql")
+    assert parse_match_group("Required for backend work") == ()
+    assert parse_match_group(None) == ()
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_matches_per_keyword_reference(seed):
+    resume, jd = random_profiles(seed)
+    gap = compute_gap(resume, jd)
+
+    by_keyword = {m.keyword_pair[1].keyword_text: m.match_type for m in gap.keyword_matches}
+    by_keyword.update({kw.keyword_text: "missing" for kw in gap.missing_keywords})
+    assert [by_keyword[kw.keyword_text] for kw in jd.keywords] == expected_types(resume, jd)
+    assert gap.match_score == expected_score(resume, jd)
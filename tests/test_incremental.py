@@ -0,0 +1,90 @@
+# tests/test_incremental.py
+"""증분 재분석: 바뀐 구간 파싱(전처리 / 청크 분할, 원문 offset)과 이전 키워드 carry-over."""
+
+from __future__ import annotations
+
+import pytest
+
+from benchmarks.fake_llm import LatencyModel, use_fake_llm
+from packages.tools import preprocess, resume_parse
+from packages.tools.incremental import diff_lines, plan_changes
+from packages.tools.resume_parse import aparse_resume_spans, parse_resume_spans
+
+BASE = """Experience
+- Built REST APIs with Python and FastAPI
+- Ran PostgreSQL on AWS
+"""
+ADDED = """- Deployed services with Docker and Kubernetes
+- Wrote Terraform modules for Redis clusters
+"""
+
+
+@pytest.fixture
+def parsed_texts(monkeypatch):
+    """파싱 단위(청크) 텍스트 기록."""
+    texts: list[str] = []
+    parse_text, aparse_text = resume_parse._parse_text, resume_parse._aparse_text
+
+    def record(text):
+        texts.append(text)
+        return parse_text(text)
+
+    async def arecord(text, on_keyword):
+        texts.append(text)
+        return await aparse_text(text, on_keyword)
+
+    monkeypatch.setattr(resume_parse, "_parse_text", record)
+    monkeypatch.setattr(resume_parse, "_aparse_text", arecord)
+    with use_fake_llm(LatencyModel.parse("fixed:0")):
+        yield texts
+
+
+def _assert_spans(keywords, text):
+    assert keywords
+    for kw in keywords:
+        start, end = kw.source_span
+        assert text[start:end].lower() == kw.keyword_text
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+async def test_changed_spans_map_to_original_offsets(parsed_texts, use_async):
+    new = BASE + ADDED + "Education\n- BSc Computer Science\n- Built tools in Go\n"
+    spans = diff_lines(BASE, new).changed
+    if use_async:
+        keywords = await aparse_resume_spans(new, spans)
+    else:
+        keywords = parse_resume_spans(new, spans)
+    _assert_spans(keywords, new)
+    assert {"docker", "kubernetes", "terraform", "redis", "go"} <= {
+        kw.keyword_text for kw in keywords
+    }
+    assert "python" not in {kw.keyword_text for kw in keywords}
+
+
+async def test_changed_spans_are_pruned_and_chunked(parsed_texts, monkeypatch):
+    monkeypatch.setattr(resume_parse, "RESUME_CHUNK_MIN_CHARS", 100)
+    monkeypatch.setattr(resume_parse, "RESUME_CHUNK_MAX_CHARS", 80)
+    monkeypatch.setattr(preprocess, "RESUME_TOKEN_BUDGET", 10_000)
+    # 같은 문단을 반복한 편집: 전처리에서 한 번만 남는다
+    new = BASE + f"\nProjects\n\n{ADDED}\n{ADDED}\nSkills\n- Kafka, Spark, Airflow\n"
+    spans = diff_lines(BASE, new).changed
+
+    keywords = await aparse_resume_spans(new, spans)
+
+    assert len(parsed_texts) > 1
+    assert sum(text.count("Terraform modules") for text in parsed_texts) == 1
+    _assert_spans(keywords, new)
+
+
+def test_carry_over_keeps_unchanged_lines():
+    old = BASE
+    new = BASE.replace("PostgreSQL", "MySQL")
+    with use_fake_llm(LatencyModel.parse("fixed:0")):
+        keywords = resume_parse.parse_resume(old).keywords
+    plan = plan_changes(old, keywords, new, {}, {}, {})
+
+    kept = {kw.keyword_text for kw in plan.resume_keywords}
+    assert {"python", "fastapi"} <= kept
+    assert "postgresql" not in kept
+    assert plan.resume_spans == [(new.index("- Ran"), len(new))]
+    _assert_spans(plan.resume_keywords, new)
@@ -0,0 +1,94 @@
+# tests/test_job_match.py
+"""JD inverted index: MaxScore top-k를 전체 JD brute-force 점수와 비교 (삭제 / compaction / 재로드 포함)."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from packages.core.schemas import JDProfile, ResumeProfile
+from packages.tools.gap_compute import compute_gap, parse_match_group
+from packages.tools.job_match import JobIndex
+from tests.test_gap_compute import random_profiles
+
+
+def _overlaps(resume: ResumeProfile, jd: JDProfile) -> bool:
+    """색인이 후보로 보는 JD: required / preferred 키워드나 그 OR 그룹이 Resume와 겹친다."""
+    have = {kw.keyword_text for kw in resume.keywords}
+    return any(
+        kw.category in ("required", "preferred")
+        and ({kw.keyword_text, *parse_match_group(kw.gap_instruction)} & have)
+        for kw in jd.keywords
+    )
+
+
+def _assert_top_k(index: JobIndex, jds: dict[str, JDProfile], resume: ResumeProfile, k: int):
+    expected = {
+        job_id: compute_gap(resume, jd).match_score
+        for job_id, jd in jds.items()
+        if _overlaps(resume, jd)
+    }
+    results = index.search([kw.keyword_text for kw in resume.keywords], k=k)
+
+    assert [score for _, score in results] == sorted(expected.values(), reverse=True)[:k]
+    for job_id, score in results:
+        assert expected[job_id] == score
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    jds = {f"job-{i}": random_profiles(i)[1] for i in range(300)}
+    index = JobIndex(tmp_path / "job_index.sqlite3")
+    index.add_many(jds.items())
+    resumes = [random_profiles(10_000 + i)[0] for i in range(20)]
+    return index, jds, resumes, tmp_path / "job_index.sqlite3"
+
+
+@pytest.mark.parametrize("k", [1, 5, 50])
+def test_search_matches_brute_force(corpus, k):
+    index, jds, resumes, _ = corpus
+    for resume in resumes:
+        _assert_top_k(index, jds, resume, k)
+
+
+def test_search_after_delete_replace_and_compaction(corpus):
+    index, jds, resumes, path = corpus
+    rng = random.Random(7)
+
+    # tombstone만 (compaction 전)
+    for job_id in rng.sample(sorted(jds), 40):
+        assert index.remove(job_id)
+        del jds[job_id]
+    assert index._dead == 40
+    # 같은 job_id로 다시 넣으면 교체
+    for job_id in rng.sample(sorted(jds), 10):
+        jds[job_id] = random_profiles(rng.randint(20_000, 30_000))[1]
+        index.add(job_id, jds[job_id])
+    assert not index.remove("job-unknown")
+    for resume in resumes:
+        _assert_top_k(index, jds, resume, 5)
+
+    # tombstone이 25%를 넘으면 SQLite에서 다시 만든다
+    compacted = False
+    for job_id in rng.sample(sorted(jds), 60):
+        dead = index._dead
+        index.remove(job_id)
+        del jds[job_id]
+        compacted |= index._dead < dead
+    assert compacted
+    assert len(index) == len(jds)
+    for resume in resumes:
+        _assert_top_k(index, jds, resume, 5)
+
+    # 영속화: 새 index가 같은 결과
+    reopened = JobIndex(path)
+    assert len(reopened) == len(jds)
+    for resume in resumes:
+        _assert_top_k(reopened, jds, resume, 5)
+
+
+def test_no_overlap_returns_nothing(corpus):
+    index, *_ = corpus
+    assert index.search(["cobol"], k=5) == []
+    assert index.search(["python"], k=0) == []
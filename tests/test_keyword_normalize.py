@@ -0,0 +1,60 @@
+# tests/test_keyword_normalize.py
+"""Lexicon 추출기(Aho-Corasick): 단어 경계, 대소문자 규칙, leftmost-longest, 원문 offset."""
+
+from __future__ import annotations
+
+import pytest
+
+from packages.tools.keyword_normalize import (
+    AhoCorasick,
+    LexiconMatcher,
+    extract_jd_keywords,
+    get_matcher,
+)
+
+
+def _found(text: str) -> list[tuple[str, str]]:
+    return [(text[start:end], canonical) for start, end, canonical in get_matcher().find(text)]
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        # 단어 안쪽은 매칭하지 않는다
+        ("gopher pythonic reactive", []),
+        ("Javascript and Java", [("Javascript", "javascript"), ("Java", "java")]),
+        # 기호가 이어지는 언어 이름
+        ("C++ and C#, C", [("C++", "c++"), ("C#", "c#")]),
+        # leftmost-longest: 더 긴 표기가 이긴다
+        ("Spring Boot services", [("Spring Boot", "spring boot")]),
+        ("node.js and scikit-learn", [("node.js", "node.js"), ("scikit-learn", "scikit-learn")]),
+        # 일반 영어 단어와 겹치는 용어는 대문자 표기일 때만
+        ("Go developer", [("Go", "go")]),
+        ("I go home in spring", []),
+        ("R and Rust", [("R", "r"), ("Rust", "rust")]),
+        ("golang, k8s", [("golang", "go"), ("k8s", "kubernetes")]),
+    ],
+)
+def test_word_boundaries_and_case_rules(text, expected):
+    assert _found(text) == expected
+
+
+def test_custom_forms():
+    matcher = LexiconMatcher([("ab", "ab", False), ("abc", "abc", False), ("Xy", "xy", True)])
+    assert matcher.find("abc ab xab") == [(0, 3, "abc"), (4, 6, "ab")]
+    assert matcher.find("Xy xy") == [(0, 2, "xy")]
+
+
+def test_automaton_reports_overlapping_matches():
+    automaton = AhoCorasick(["he", "she", "hers"])
+    matches = sorted(automaton.iter_matches("ushers"))
+    assert matches == [(1, 4, 1), (2, 4, 0), (2, 6, 2)]
+
+
+def test_source_spans_point_into_original_text():
+    text = "Required: Python 3 and PostgreSQL on AWS.\nNice: Kubernetes (k8s)."
+    keywords = extract_jd_keywords(text, "required")
+    assert keywords
+    for kw in keywords:
+        start, end = kw.source_span
+        assert text[start:end].lower() in (kw.keyword_text, "k8s")
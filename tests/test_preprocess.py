@@ -0,0 +1,59 @@
+# tests/test_preprocess.py
+"""입력 전처리: boilerplate 제거는 context 섹션만, 중복 제거 / 예산 / 원문 offset 매핑."""
+
+from __future__ import annotations
+
+import pytest
+
+from packages.tools.preprocess import prune_resume, prune_sections
+
+EEO = (
+    "We are an equal opportunity employer and value diversity. All qualified applicants will "
+    "receive consideration without regard to race, color, religion, sexual orientation, gender "
+    "identity or veteran status. We offer competitive compensation, equity and great benefits."
+)
+WORK = (
+    "You will design and own our equity research data platform, building pipelines that "
+    "compute compensation analytics and bonus forecasts for portfolio managers."
+)
+
+
+@pytest.mark.parametrize("category", ["required", "preferred", "responsibility"])
+def test_requirement_sections_keep_boilerplate_words(category):
+    text = WORK + "\n\nMust have 5+ years building Python and Kafka systems."
+    [(_, pruned)], report = prune_sections([(category, text)], budget=0)
+    assert pruned == text
+    assert report.boilerplate == 0
+
+
+def test_context_boilerplate_is_dropped():
+    sections = [("context", EEO + "\n\nWe also use Terraform."), ("required", "Python")]
+    result, report = prune_sections(sections, budget=0)
+    assert result[0] == ("context", "We also use Terraform.")
+    assert result[1] == ("required", "Python")
+    assert report.boilerplate == 1
+
+
+def test_duplicate_paragraphs_across_sections():
+    sections = [("required", "Python and Docker."), ("preferred", "python  and docker.")]
+    result, report = prune_sections(sections, budget=0)
+    assert result == [("required", "Python and Docker."), ("preferred", "")]
+    assert report.duplicates == 1
+
+
+def test_budget_drops_context_first():
+    context = "\n\n".join(f"Team note {i}: we like Kubernetes and Helm." for i in range(40))
+    sections = [("context", context), ("required", "Python, AWS and Terraform.")]
+    result, report = prune_sections(sections, budget=50)
+    assert result[1][1] == "Python, AWS and Terraform."
+    assert report.over_budget > 0
+    assert report.tokens_out <= 50
+
+
+def test_resume_offsets_map_back_to_original():
+    resume = "Skills: Python, Docker\n\nSkills: Python, Docker\n\nBuilt Kafka pipelines on AWS."
+    pruned, report = prune_resume(resume, budget=0)
+    assert report.duplicates == 1
+    start = pruned.text.index("Kafka")
+    original = pruned.to_original(start)
+    assert resume[original : original + len("Kafka")] == "Kafka"
@@ -0,0 +1,104 @@
+# tests/test_project_cache.py
+"""프로젝트 유사도 캐시: 이웃 조회, serve / seed 판단 (현재 missing keyword를 다 다루는지)."""
+
+from __future__ import annotations
+
+import pytest
+
+from packages.agents import project_agent
+from packages.core.project_cache import ProjectCache, project_cache_mode
+from packages.core.schemas import (
+    GapSummary,
+    JDKeyword,
+    Preferences,
+    ProjectIdea,
+    ProjectOutput,
+    ProjectPlan,
+)
+
+PREFS = Preferences(stack=["Python"])
+
+
+def _keywords(*names: str) -> list[JDKeyword]:
+    return [JDKeyword(keyword_text=name, category="required") for name in names]
+
+
+def _output(*covers: tuple[str, ...]) -> ProjectOutput:
+    return ProjectOutput(
+        project_ideas=[
+            ProjectPlan(
+                idea=ProjectIdea(
+                    title=f"Project {i}",
+                    one_liner="one liner",
+                    reasoning="reasoning",
+                    covers_keywords=_keywords(*names),
+                )
+            )
+            for i, names in enumerate(covers)
+        ]
+    )
+
+
+def _gap(*missing: str) -> GapSummary:
+    return GapSummary(match_score=50.0, validated_missing_keywords=_keywords(*missing))
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    cache = ProjectCache(tmp_path / "project_cache.sqlite3", threshold=0.6)
+    monkeypatch.setattr(project_agent, "get_project_cache", lambda: cache)
+    return cache
+
+
+def test_lookup_finds_similar_keyword_set_with_same_preferences(cache):
+    cached = ["python", "docker", "kubernetes", "terraform", "fastapi"]
+    cache.put(cached, PREFS, _output(("python", "docker"), ("kubernetes",)))
+
+    hit = cache.lookup(cached[:4], Preferences(stack=[" python "]))
+    assert hit is not None and hit.similarity == pytest.approx(0.8)
+    assert cache.lookup(cached[:4], Preferences(stack=["Go"])) is None
+    assert cache.lookup(["python", "redis", "kafka"], PREFS) is None
+
+
+def test_same_keyword_set_is_served(cache):
+    missing = ("python", "docker", "kubernetes")
+    cache.put(missing, PREFS, _output(("python",), ("docker",)))
+
+    with project_cache_mode("serve"):
+        mode, hit = project_agent._cache_lookup(_gap(*missing), PREFS)
+    assert mode == "serve" and hit is not None
+
+
+@pytest.mark.parametrize(
+    "cached, covers, missing",
+    [
+        # 현재 missing인 kafka를 다루는 안이 없다
+        (
+            ("python", "docker", "kubernetes", "terraform"),
+            (("python", "docker"), ("kubernetes", "terraform")),
+            ("python", "docker", "kubernetes", "terraform", "kafka"),
+        ),
+        # 이제 missing이 아닌 terraform을 전제로 만든 안
+        (
+            ("python", "docker", "kubernetes", "terraform", "kafka"),
+            (("python", "docker", "kafka"), ("kubernetes", "terraform")),
+            ("python", "docker", "kubernetes", "kafka"),
+        ),
+    ],
+)
+def test_partial_coverage_falls_back_to_seed(cache, cached, covers, missing):
+    cache.put(cached, PREFS, _output(*covers))
+
+    with project_cache_mode("serve"):
+        mode, hit = project_agent._cache_lookup(_gap(*missing), PREFS)
+    assert mode == "seed" and hit is not None
+    assert project_agent._seed(hit)["example_keywords"] == sorted(cached)
+
+
+def test_off_mode_skips_lookup(cache):
+    missing = ("python", "docker")
+    cache.put(missing, PREFS, _output(("python",), ("docker",)))
+
+    with project_cache_mode("off"):
+        assert project_agent._cache_lookup(_gap(*missing), PREFS) == ("off", None)
+    assert cache.stats.hits == 0
@@ -0,0 +1,89 @@
+# tests/test_ratelimit.py
+"""LLM rate scheduler: priority class 순서, tenant fair queuing, 취소 / 환불."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from packages.core import ratelimit
+from packages.core.ratelimit import RateScheduler, llm_scheduling
+
+MESSAGES = [{"role": "user", "content": "hi"}]
+
+
+@pytest.fixture(autouse=True)
+def exact_limits(monkeypatch):
+    # bucket = 1초 분량 그대로 (rpm 60 → 요청 1개, 1초마다 1개)
+    monkeypatch.setattr(ratelimit, "LLM_RATE_LIMIT_HEADROOM", 1.0)
+    monkeypatch.setattr(ratelimit, "LLM_RATE_LIMIT_BURST_SECONDS", 1.0)
+
+
+def _grant_order(waiters: list[tuple[str, str, str]]) -> list[str]:
+    """빈 bucket(rpm 60)에 (이름, priority, tenant) 순으로 넣고 1초씩 흘려서 grant 순서."""
+    limiter = ratelimit._Limiter("m", rpm=60, tpm=0)
+    assert limiter.requests is not None
+    limiter.requests.level = 0.0
+    now = limiter.requests.updated
+    order: list[str] = []
+    for name, priority, tenant in waiters:
+        limiter.enqueue(
+            ratelimit._Waiter(
+                "m", priority, tenant, 1.0, notify=lambda name=name: order.append(name)
+            )
+        )
+    for _ in waiters:
+        now += 1.0
+        limiter.dispatch(now)
+    return order
+
+
+def test_interactive_goes_before_batch():
+    order = _grant_order(
+        [
+            ("batch-1", "batch", "a"),
+            ("batch-2", "batch", "a"),
+            ("interactive", "interactive", "a"),
+        ]
+    )
+    assert order == ["interactive", "batch-1", "batch-2"]
+
+
+def test_tenants_share_a_class_fairly():
+    order = _grant_order(
+        [
+            ("a-1", "batch", "a"),
+            ("a-2", "batch", "a"),
+            ("a-3", "batch", "a"),
+            ("b-1", "batch", "b"),
+        ]
+    )
+    # a가 먼저 3개를 넣어도 b의 첫 요청은 a의 두 번째보다 먼저 나간다
+    assert order.index("b-1") < order.index("a-2")
+    assert order[0] == "a-1"
+
+
+async def test_cancelled_waiter_leaves_queue():
+    scheduler = RateScheduler({"m": (60, 0)})
+    first = await scheduler.aacquire("m", MESSAGES)
+    with llm_scheduling("a", "batch"):
+        waiting = asyncio.create_task(scheduler.aacquire("m", MESSAGES))
+        await asyncio.sleep(0.05)
+    assert scheduler.stats()["m"]["queued"] == {"interactive": 0, "batch": 1}
+
+    waiting.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+    assert scheduler.stats()["m"]["queued"] == {"interactive": 0, "batch": 0}
+    first.settle(0)
+
+
+def test_granted_but_unsent_permit_is_refunded():
+    scheduler = RateScheduler({"m": (60, 0)})
+    waiter = scheduler._submit("m", 1.0)
+    assert waiter.granted
+    assert scheduler.stats()["m"]["requests_available"] == 0
+    # hedge에서 진 시도처럼 grant 뒤 보내지 않고 취소
+    scheduler._cancel(waiter)
+    assert scheduler.stats()["m"]["requests_available"] == 1
@@ -0,0 +1,137 @@
+# tests/test_resilience.py
+"""LLM resilience layer: 시도 deadline, hedge, retry, circuit breaker."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import httpx
+import pytest
+
+from packages.core import llm, resilience
+from packages.core.resilience import (
+    CircuitBreaker,
+    LLMUnavailable,
+    acall_with_resilience,
+    call_with_resilience,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_state(monkeypatch):
+    monkeypatch.setattr(resilience, "LLM_FALLBACK_MODEL", "")
+    monkeypatch.setattr(resilience, "LLM_RETRY_BASE_DELAY", 0.0)
+    resilience.reset_resilience()
+    yield
+    resilience.reset_resilience()
+
+
+def _request_timeout() -> dict:
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    llm._on_request(request)
+    return request.extensions.get("timeout", {})
+
+
+def test_http_timeout_is_capped_by_attempt_deadline(monkeypatch):
+    monkeypatch.setattr(resilience, "LLM_CALL_TIMEOUT", 2.0)
+    timeout = call_with_resilience(lambda model: _request_timeout(), "gpt-test", "Probe")
+    assert set(timeout) == {"connect", "read", "write", "pool"}
+    assert all(0 < value <= 2.0 for value in timeout.values())
+    # 시도 밖의 요청은 client 기본값 그대로
+    assert _request_timeout() == {}
+
+
+def test_abandoned_sync_attempt_ends_at_attempt_deadline(monkeypatch):
+    monkeypatch.setattr(resilience, "LLM_CALL_TIMEOUT", 0.2)
+    monkeypatch.setattr(resilience, "LLM_MAX_RETRIES", 0)
+    ended = threading.Event()
+
+    def slow(model: str) -> None:
+        # HTTP client처럼 요청 timeout(= 남은 시도 시간)이 지나면 끝난다
+        time.sleep(resilience.attempt_time_left() + 0.05)
+        ended.set()
+        raise httpx.ReadTimeout("timed out")
+
+    with pytest.raises(LLMUnavailable):
+        call_with_resilience(slow, "gpt-test", "Probe")
+    assert ended.wait(0.5)
+
+
+def _flaky(failures: int, error: Exception):
+    """처음 failures번은 error, 그다음부터는 모델 이름을 돌려주는 fn (호출 모델 기록)."""
+    calls: list[str] = []
+
+    def fn(model: str) -> str:
+        calls.append(model)
+        if len(calls) <= failures:
+            raise error
+        return model
+
+    return fn, calls
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+async def test_transient_errors_are_retried(monkeypatch, use_async):
+    monkeypatch.setattr(resilience, "LLM_MAX_RETRIES", 2)
+    fn, calls = _flaky(2, httpx.ConnectError("refused"))
+    if use_async:
+
+        async def afn(model: str) -> str:
+            return fn(model)
+
+        result = await acall_with_resilience(afn, "gpt-test", "Probe")
+    else:
+        result = call_with_resilience(fn, "gpt-test", "Probe")
+    assert result == "gpt-test"
+    assert calls == ["gpt-test"] * 3
+    assert resilience.get_breaker("gpt-test").state == "closed"
+
+
+def test_non_transient_errors_are_not_retried():
+    fn, calls = _flaky(1, ValueError("bad schema"))
+    with pytest.raises(ValueError):
+        call_with_resilience(fn, "gpt-test", "Probe")
+    assert calls == ["gpt-test"]
+    assert resilience.get_breaker("gpt-test").state == "closed"
+
+
+def test_breaker_opens_then_probes_after_cooldown(monkeypatch):
+    monkeypatch.setattr(resilience, "LLM_MAX_RETRIES", 0)
+    resilience._breakers["gpt-test"] = CircuitBreaker("gpt-test", failures=2, cooldown=0.1)
+    fn, calls = _flaky(2, httpx.ConnectError("refused"))
+
+    for _ in range(2):
+        with pytest.raises(LLMUnavailable):
+            call_with_resilience(fn, "gpt-test", "Probe")
+    assert resilience.get_breaker("gpt-test").state == "open"
+    # open 동안에는 호출하지 않는다
+    with pytest.raises(LLMUnavailable, match="circuit open"):
+        call_with_resilience(fn, "gpt-test", "Probe")
+    assert len(calls) == 2
+
+    time.sleep(0.15)
+    assert resilience.get_breaker("gpt-test").state == "half_open"
+    assert call_with_resilience(fn, "gpt-test", "Probe") == "gpt-test"
+    assert resilience.get_breaker("gpt-test").state == "closed"
+
+
+def test_failed_probe_reopens_breaker():
+    breaker = CircuitBreaker("gpt-test", failures=1, cooldown=0.05)
+    breaker.record_failure()
+    assert not breaker.allow()
+    time.sleep(0.08)
+    assert breaker.allow()
+    # probe는 1개만
+    assert not breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+
+def test_falls_back_to_fallback_model(monkeypatch):
+    monkeypatch.setattr(resilience, "LLM_MAX_RETRIES", 1)
+    monkeypatch.setattr(resilience, "LLM_FALLBACK_MODEL", "gpt-fallback")
+    fn, calls = _flaky(2, httpx.ReadTimeout("timed out"))
+
+    assert call_with_resilience(fn, "gpt-test", "Probe") == "gpt-fallback"
+    assert calls == ["gpt-test", "gpt-test", "gpt-fallback"]
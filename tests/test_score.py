@@ -0,0 +1,46 @@
+# tests/test_score.py
+"""N × M batch scoring: score_matrix의 모든 칸이 쌍별 compute_gap / weighted_match_score와 같다."""
+
+from __future__ import annotations
+
+import numpy as np
+
+from packages.tools.gap_compute import compute_gap
+from packages.tools.score import score_matrix, top_k
+from tests.test_gap_compute import expected_score, random_profiles
+
+
+def _profiles(n: int, seed: int) -> tuple[list, list]:
+    pairs = [random_profiles(seed * 1000 + i) for i in range(n)]
+    return [resume for resume, _ in pairs], [jd for _, jd in pairs]
+
+
+def test_score_matrix_matches_pairwise_gap():
+    resumes, _ = _profiles(12, 1)
+    _, jds = _profiles(9, 2)
+    scores = score_matrix(resumes, jds)
+
+    assert scores.shape == (12, 9)
+    for j, jd in enumerate(jds):
+        column = [compute_gap(resume, jd).match_score for resume in resumes]
+        assert scores[:, j].tolist() == column
+        assert column == [expected_score(resume, jd) for resume in resumes]
+
+
+def test_empty_inputs():
+    resumes, jds = _profiles(3, 3)
+    assert score_matrix(resumes, []).shape == (3, 0)
+    assert score_matrix([], jds).shape == (0, 3)
+
+
+def test_top_k_matches_full_sort():
+    rng = np.random.default_rng(0)
+    # 동점이 많도록 정수 점수
+    scores = rng.integers(0, 5, size=(6, 8)).astype(np.float64)
+    for by, matrix in (("resume", scores), ("jd", scores.T)):
+        best = top_k(scores, 3, by=by)
+        for row, picked in zip(matrix, best):
+            assert [score for _, score in picked] == sorted(row, reverse=True)[:3]
+            assert all(row[idx] == score for idx, score in picked)
+    assert top_k(scores, 0) == [[] for _ in range(6)]
+    assert len(top_k(scores, 20)[0]) == 8
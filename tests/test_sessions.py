@@ -0,0 +1,118 @@
+from pathlib import Path
+
+import pytest
+
+from benchmarks.fake_llm import LatencyModel, use_fake_llm
+from packages.core import docstore
+from packages.core.checkpoint import SqliteCheckpointSaver
+from packages.graph.main import areanalyze_updates, build_graph, session_input
+from packages.tools import keyword_normalize
+
+MARKER = "Zyxwvut Community Shelter"
+RESUME = f"""Backend engineer.
+- Built REST APIs with Python and FastAPI on AWS
+- Ran PostgreSQL with Docker
+- Volunteered weekends at {MARKER}
+"""
+JD = {
+    "required": "Python and Kubernetes experience.\nOperate PostgreSQL in production.",
+    "preferred": "Terraform on AWS.",
+}
+
+
+@pytest.fixture
+def session(tmp_path):
+    saver = SqliteCheckpointSaver(tmp_path / "sessions.sqlite3")
+    return build_graph(checkpointer=saver), {"configurable": {"thread_id": "s1"}}
+
+
+async def _run(graph, config) -> dict:
+    with use_fake_llm(LatencyModel.parse("fixed:0")):
+        with session_input(RESUME, JD) as inputs:
+            await graph.ainvoke(inputs, config)
+    return (await graph.aget_state(config)).values
+
+
+def _contains(path: Path, text: str) -> bool:
+    return path.exists() and text.encode() in path.read_bytes()
+
+
+@pytest.mark.parametrize("mode", ["none", "reference"])
+async def test_checkpoint_keeps_references_not_raw_text(session, tmp_path, monkeypatch, mode):
+    monkeypatch.setattr(docstore, "RAW_TEXT_RETENTION", mode)
+    monkeypatch.setattr(docstore, "_store", None)
+    graph, config = session
+    values = await _run(graph, config)
+
+    assert values["gap_summary"] is not None
+    assert values["resume_source"].doc_id == docstore.doc_id(RESUME)
+    assert set(values["jd_sources"]) == set(JD)
+    assert not _contains(tmp_path / "sessions.sqlite3", MARKER)
+    stored = docstore.read_input(values["resume_source"])
+    assert stored == (RESUME if mode == "reference" else None)
+
+
+async def test_reanalyze_without_retained_text_parses_everything(session, monkeypatch):
+    monkeypatch.setattr(docstore, "RAW_TEXT_RETENTION", "none")
+    graph, config = session
+    values = await _run(graph, config)
+
+    new_resume = RESUME.replace("Docker", "Docker and Kubernetes")
+    with use_fake_llm(LatencyModel.parse("fixed:0")):
+        update, stats = await areanalyze_updates(values, new_resume, JD)
+
+    assert stats.resume_changed_chars == len(new_resume)
+    assert sorted(stats.jd_new_sections) == sorted(JD)
+    texts = {kw.keyword_text for kw in update["resume_keywords"]}
+    assert "kubernetes" in texts
+
+
+async def test_reanalyze_diffs_against_stored_text(session, monkeypatch):
+    monkeypatch.setattr(docstore, "RAW_TEXT_RETENTION", "reference")
+    monkeypatch.setattr(docstore, "_store", None)
+    graph, config = session
+    values = await _run(graph, config)
+
+    new_resume = RESUME + "- Wrote Terraform modules\n"
+    with use_fake_llm(LatencyModel.parse("fixed:0")):
+        update, stats = await areanalyze_updates(values, new_resume, JD)
+
+    assert stats.resume_changed_spans == 1
+    assert stats.jd_changed_spans == 0
+    assert stats.keywords_dropped == 0
+    assert update["resume_source"].doc_id == docstore.doc_id(new_resume)
+
+
+async def test_jd_spans_survive_boilerplate_pruning(session, monkeypatch):
+    monkeypatch.setattr(docstore, "RAW_TEXT_RETENTION", "reference")
+    monkeypatch.setattr(docstore, "_store", None)
+    # lexicon fast path: 키워드에 source_span이 붙는다
+    monkeypatch.setattr(keyword_normalize, "FAST_PATH_MODE", "always")
+    eeo = (
+        "We are an equal opportunity employer. All qualified applicants will receive "
+        "consideration without regard to race, color, religion or veteran status. We are "
+        "proud to be offering competitive benefits."
+    )
+    jd = {**JD, "context": f"{eeo}\n\nOur platform runs Terraform and Kafka."}
+    graph, config = session
+    with use_fake_llm(LatencyModel.parse("fixed:0")):
+        with session_input(RESUME, jd) as inputs:
+            await graph.ainvoke(inputs, config)
+    values = (await graph.aget_state(config)).values
+
+    for category, keywords in values["jd_section_keywords"].items():
+        for kw in keywords:
+            start, end = kw.source_span
+            assert jd[category][start:end].lower() == kw.keyword_text
+
+    edited = {**jd, "required": jd["required"] + "\nGo services."}
+    with use_fake_llm(LatencyModel.parse("fixed:0")):
+        update, stats = await areanalyze_updates(values, RESUME, edited)
+
+    assert stats.keywords_dropped == 0
+    context = {kw.keyword_text for kw in update["jd_section_keywords"]["context"]}
+    assert {"terraform", "kafka"} <= context
+    for category, keywords in update["jd_section_keywords"].items():
+        for kw in keywords:
+            start, end = kw.source_span
+            assert edited[category][start:end].lower() == kw.keyword_text
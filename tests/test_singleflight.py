@@ -0,0 +1,145 @@
+# tests/test_singleflight.py
+"""Single-flight: 같은 key 호출 합치기, 취소 격리, 에러 전파, scope 분리."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from packages.core.singleflight import SingleFlight
+
+
+class _Call:
+    """실행 횟수를 세고, release 전까지 끝나지 않는 factory."""
+
+    def __init__(self, result: str = "ok", error: Exception | None = None) -> None:
+        self.runs = 0
+        self.cancelled = False
+        self.release = asyncio.Event()
+        self.result = result
+        self.error = error
+
+    async def __call__(self) -> str:
+        self.runs += 1
+        try:
+            await self.release.wait()
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+async def test_concurrent_callers_share_one_call():
+    flight: SingleFlight[str] = SingleFlight()
+    call = _Call()
+    waiters = [asyncio.create_task(flight.ado("k", call)) for _ in range(5)]
+    await asyncio.sleep(0)
+    call.release.set()
+
+    assert await asyncio.gather(*waiters) == ["ok"] * 5
+    assert call.runs == 1
+    assert (flight.stats.executions, flight.stats.coalesced) == (1, 4)
+    assert flight.in_flight() == 0
+
+
+async def test_cancelled_waiter_does_not_cancel_the_others():
+    flight: SingleFlight[str] = SingleFlight()
+    call = _Call()
+    leader = asyncio.create_task(flight.ado("k", call))
+    follower = asyncio.create_task(flight.ado("k", call))
+    await asyncio.sleep(0)
+
+    # 공유 호출을 시작한 caller가 취소돼도 나머지는 결과를 받는다
+    leader.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+    call.release.set()
+
+    assert await follower == "ok"
+    assert not call.cancelled and call.runs == 1
+    assert flight.stats.cancelled == 0
+
+
+async def test_shared_call_is_cancelled_when_every_waiter_leaves():
+    flight: SingleFlight[str] = SingleFlight()
+    call = _Call()
+    waiters = [asyncio.create_task(flight.ado("k", call)) for _ in range(2)]
+    await asyncio.sleep(0)
+    for waiter in waiters:
+        waiter.cancel()
+    await asyncio.gather(*waiters, return_exceptions=True)
+    await asyncio.sleep(0)
+
+    assert call.cancelled
+    assert flight.stats.cancelled == 1
+    # 다음 호출은 새로 실행된다
+    again = _Call()
+    again.release.set()
+    assert await flight.ado("k", again) == "ok"
+
+
+async def test_error_reaches_every_waiter_and_is_not_shared_afterwards():
+    flight: SingleFlight[str] = SingleFlight()
+    call = _Call(error=RuntimeError("boom"))
+    waiters = [asyncio.create_task(flight.ado("k", call)) for _ in range(3)]
+    await asyncio.sleep(0)
+    call.release.set()
+
+    results = await asyncio.gather(*waiters, return_exceptions=True)
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert flight.stats.errors == 1
+    retry = _Call(result="fresh")
+    retry.release.set()
+    assert await flight.ado("k", retry) == "fresh"
+
+
+async def test_scope_keeps_callers_apart():
+    scope = {"value": "interactive"}
+    flight: SingleFlight[str] = SingleFlight(scope=lambda: scope["value"])
+    calls = [_Call("a"), _Call("b")]
+    first = asyncio.create_task(flight.ado("k", calls[0]))
+    await asyncio.sleep(0)
+    scope["value"] = "batch"
+    second = asyncio.create_task(flight.ado("k", calls[1]))
+    await asyncio.sleep(0)
+    for call in calls:
+        call.release.set()
+
+    assert (await first, await second) == ("a", "b")
+    assert [call.runs for call in calls] == [1, 1]
+
+
+def test_sync_callers_share_one_call():
+    flight: SingleFlight[str] = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+    runs: list[int] = []
+
+    def fn() -> str:
+        runs.append(1)
+        started.set()
+        release.wait(5)
+        return "ok"
+
+    results: list[str] = []
+    leader = threading.Thread(target=lambda: results.append(flight.do("k", fn)))
+    leader.start()
+    assert started.wait(5)
+    followers = [
+        threading.Thread(target=lambda: results.append(flight.do("k", fn))) for _ in range(3)
+    ]
+    for thread in followers:
+        thread.start()
+    deadline = time.monotonic() + 5
+    while flight.stats.coalesced < 3 and time.monotonic() < deadline:
+        time.sleep(0.001)
+    release.set()
+    for thread in [leader, *followers]:
+        thread.join(5)
+
+    assert results == ["ok"] * 4
+    assert len(runs) == 1